@@ -0,0 +1,8 @@
+# coding=utf-8
+# Runner for daemon
+from tracim_backend.lib.preview_pregeneration.daemon import PreviewGeneratorDaemon
+from tracim_backend.lib.utils.daemon import initialize_config_from_environment
+
+app_config = initialize_config_from_environment()
+daemon = PreviewGeneratorDaemon(app_config, burst=False)
+daemon.run()
@@ -0,0 +1,98 @@
+"""
+This script replays pushpin stats messages through UserConnectionStateMonitor and compares
+the time needed to write connection statuses:
+- one transaction per status change, as before the batched writes (flush interval 0),
+- status changes gathered during user.connection_status.flush_interval.
+
+Statuses are written in the database of the configuration given by TRACIM_CONF_PATH.
+
+Usage (from the backend directory):
+    # record messages of the pushpin stats socket (live_messages.stats_zmq_uri) in a file
+    python load_tests/connection_status_replay_benchmark.py record messages.tnet [count]
+    # replay recorded messages
+    python load_tests/connection_status_replay_benchmark.py replay messages.tnet
+    # replay generated messages: each user connects and disconnects
+    python load_tests/connection_status_replay_benchmark.py generate [user_count]
+"""
+import sys
+import time
+
+import tnetstring
+import zmq
+
+from tracim_backend.lib.user_connection_state_monitor.monitor import UserConnectionStateMonitor
+from tracim_backend.lib.utils.daemon import initialize_config_from_environment
+
+app_config = initialize_config_from_environment()
+command = sys.argv[1] if len(sys.argv) > 1 else "generate"
+
+
+def record_messages(path, count):
+    ctx = zmq.Context()
+    sock = ctx.socket(zmq.SUB)
+    sock.connect(app_config.LIVE_MESSAGES__STATS_ZMQ_URI)
+    sock.setsockopt(zmq.SUBSCRIBE, b"")
+    with open(path, "wb") as messages_file:
+        for _ in range(count):
+            messages_file.write(tnetstring.dumps(sock.recv()))
+    sock.close()
+    ctx.term()
+
+
+def load_messages(path):
+    with open(path, "rb") as messages_file:
+        data = messages_file.read()
+    messages = []
+    while data:
+        message, data = tnetstring.pop(data)
+        messages.append(message)
+    return messages
+
+
+def generate_messages(user_count):
+    messages = []
+    for subscribers in (1, 0):
+        for user_id in range(1, user_count + 1):
+            stats = {b"channel": b"user_%d" % user_id, b"subscribers": subscribers}
+            messages.append(b"sub T" + tnetstring.dumps(stats))
+    return messages
+
+
+def replay_messages(messages, flush_interval):
+    monitor = UserConnectionStateMonitor(app_config)
+    monitor.flush_interval = flush_interval
+    start_time = time.monotonic()
+    for index, message in enumerate(messages):
+        monitor.handle_stats_message(message)
+        # INFO - 2026-10-18 - as done by UserConnectionStateMonitor.run() after each poll
+        if index % monitor.MAX_MESSAGES_PER_POLL == 0:
+            monitor.handle_pending_offline_users(online_timeout=0)
+            monitor.flush_pending_statuses(force=False)
+    monitor.handle_pending_offline_users(online_timeout=0)
+    monitor.flush_pending_statuses()
+    replay_time = time.monotonic() - start_time
+    print(
+        "flush interval {}s: {} messages in {:.2f}s ({:.0f} messages/s), "
+        "{} statuses written in {} batches, batch size max {}, lag max {:.3f}s".format(
+            flush_interval,
+            len(messages),
+            replay_time,
+            len(messages) / replay_time,
+            monitor.stats.written_status_count,
+            monitor.stats.flush_count,
+            monitor.stats.max_batch_size,
+            monitor.stats.max_lag,
+        )
+    )
+
+
+if command == "record":
+    record_messages(sys.argv[2], int(sys.argv[3]) if len(sys.argv) > 3 else 10000)
+    sys.exit(0)
+elif command == "replay":
+    messages = load_messages(sys.argv[2])
+else:
+    messages = generate_messages(int(sys.argv[2]) if len(sys.argv) > 2 else 1000)
+
+replay_messages(messages, flush_interval=0)
+replay_messages(messages, flush_interval=app_config.USER__CONNECTION_STATUS__FLUSH_INTERVAL)
@@ -0,0 +1,93 @@
+"""
+This script compares the time needed to send many emails to a local SMTP server (aiosmtpd):
+- with EmailSender as before the SMTP connection pool: one connection per email,
+- with SmtpConnectionPool, as done by the mail sender daemon.
+
+Usage (from the backend directory):
+    python load_tests/smtp_sender_benchmark.py [email_count] [pool_size] [max_rate]
+"""
+from email.mime.text import MIMEText
+import sys
+import threading
+import time
+
+from aiosmtpd.controller import Controller
+
+from tracim_backend.lib.mail_notifier.sender import open_smtp_connection
+from tracim_backend.lib.mail_notifier.smtp_pool import SmtpConnectionPool
+from tracim_backend.lib.mail_notifier.utils import SmtpConfiguration
+from tracim_backend.lib.mail_notifier.utils import SmtpEncryption
+
+email_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+pool_size = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+max_rate = float(sys.argv[3]) if len(sys.argv) > 3 else 0
+
+
+class CountingHandler:
+    received_count = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        CountingHandler.received_count += 1
+        return "250 Message accepted for delivery"
+
+
+def new_message(index):
+    message = MIMEText("benchmark email {}".format(index))
+    message["From"] = "benchmark@localhost"
+    message["To"] = "user{}@localhost".format(index)
+    message["Subject"] = "Benchmark {}".format(index)
+    return message
+
+
+controller = Controller(CountingHandler(), hostname="127.0.0.1", port=8025)
+controller.start()
+smtp_config = SmtpConfiguration(
+    "127.0.0.1", 8025, None, None, SmtpEncryption.UNSECURE, authentication=False
+)
+
+start_time = time.monotonic()
+for index in range(email_count):
+    connection = open_smtp_connection(smtp_config)
+    connection.send_message(new_message(index))
+    connection.quit()
+one_connection_per_email_time = time.monotonic() - start_time
+
+smtp_pool = SmtpConnectionPool(smtp_config, size=pool_size, max_rate=max_rate)
+indexes = iter(range(email_count))
+indexes_lock = threading.Lock()
+
+
+def send_emails():
+    while True:
+        with indexes_lock:
+            index = next(indexes, None)
+        if index is None:
+            return
+        smtp_pool.send_message(new_message(index))
+
+
+threads = [threading.Thread(target=send_emails) for _ in range(pool_size)]
+start_time = time.monotonic()
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+pool_time = time.monotonic() - start_time
+smtp_pool.close()
+controller.stop()
+
+print("{} emails received".format(CountingHandler.received_count))
+print(
+    "one connection per email: {:.2f}s ({:.0f} emails/s)".format(
+        one_connection_per_email_time, email_count / one_connection_per_email_time
+    )
+)
+print(
+    "pool of {} connections: {:.2f}s ({:.0f} emails/s), send time average {:.4f}s max {:.4f}s".format(
+        pool_size,
+        pool_time,
+        email_count / pool_time,
+        smtp_pool.stats.average_send_time,
+        smtp_pool.stats.max_send_time,
+    )
+)
@@ -140,6 +140,7 @@
         "tracimcli": [
             # workspace
             "space_move = tracim_backend.command.space:MoveSpaceCommand",
+            "space usage reconcile = tracim_backend.command.space:ReconcileSpaceUsageCommand",
             # user
             "user_create = tracim_backend.command.user:CreateUserCommand",
             "user_update = tracim_backend.command.user:UpdateUserCommand",
@@ -151,6 +152,13 @@
             "db update-naming-conventions = tracim_backend.command.database:UpdateNamingConventionsV1ToV2Command",
             "db migrate-mysql-charset = tracim_backend.command.database:MigrateMysqlCharsetCommand",
             "db migrate-storage = tracim_backend.command.database:MigrateStorageCommand",
+            "db hierarchy-index backfill = tracim_backend.command.database:BackfillHierarchyIndexCommand",
+            "db hierarchy-index verify = tracim_backend.command.database:VerifyHierarchyIndexCommand",
+            "db preview-metadata backfill = tracim_backend.command.database:BackfillPreviewMetadataCommand",
+            # preview
+            "preview cache warm = tracim_backend.command.preview:PreviewCacheWarmCommand",
+            "preview cache stats = tracim_backend.command.preview:PreviewCacheStatsCommand",
+            "preview cache prune = tracim_backend.command.preview:PreviewCachePruneCommand",
             # periodically
             "periodic send-summary-mails = tracim_backend.command.periodic:SendMailSummariesCommand",
             # search
@@ -158,6 +166,7 @@
             "search index-populate = tracim_backend.command.search:SearchIndexIndexCommand",
             "search index-upgrade-experimental = tracim_backend.command.search:SearchIndexUpgradeCommand",
             "search index-drop = tracim_backend.command.search:SearchIndexDeleteCommand",
+            "search catch-up = tracim_backend.command.search:SearchIndexCatchUpCommand",
             # webdav
             "webdav start = tracim_backend.command.webdav:WebdavRunnerCommand",
             # caldav
@@ -167,6 +176,8 @@
             "dev parameters list = tracim_backend.command.devtools:ParametersListCommand",
             "dev parameters value = tracim_backend.command.devtools:ParametersValueCommand",
             "dev test live-messages = tracim_backend.command.devtools:LiveMessageTesterCommand",
+            "dev benchmark live-messages-fanout = tracim_backend.command.devtools:LiveMessagesFanoutBenchmarkCommand",
+            "dev benchmark webdav-upload = tracim_backend.command.devtools:WebdavUploadBenchmarkCommand",
             "dev test smtp = tracim_backend.command.devtools:SMTPMailCheckerCommand",
             "dev custom-properties extract-translation-source = tracim_backend.command.devtools:ExtractCustomPropertiesTranslationsCommand",
             "dev custom-properties checker = tracim_backend.command.devtools:CustomPropertiesCheckerCommand",
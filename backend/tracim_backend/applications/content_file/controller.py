@@ -34,6 +34,9 @@
 from tracim_backend.lib.utils.authorization import check_right
 from tracim_backend.lib.utils.authorization import is_contributor
 from tracim_backend.lib.utils.authorization import is_reader
+from tracim_backend.lib.utils.http_cache import HttpCachePolicy
+from tracim_backend.lib.utils.http_cache import get_revision_etag
+from tracim_backend.lib.utils.http_cache import use_http_cache
 from tracim_backend.lib.utils.request import TracimRequest
 from tracim_backend.lib.utils.utils import generate_documentation_swagger_tag
 from tracim_backend.models.context_models import ContentInContext
@@ -221,6 +224,14 @@ def download_file(self, context, request: TracimRequest, hapic_data=None):
             config=app_config,
         )
         content = api.get_one(hapic_data.path.content_id, content_type=ContentTypeSlug.ANY.value)
+        not_modified_response = use_http_cache(
+            request,
+            HttpCachePolicy.REVALIDATE,
+            etag=get_revision_etag(content.revision, "raw"),
+            last_modified=content.updated,
+        )
+        if not_modified_response:
+            return not_modified_response
         try:
             return StorageLib(request.app_config).get_raw_file(
                 depot_file=content.depot_file,
@@ -265,6 +276,14 @@ def download_revisions_file(self, context, request: TracimRequest, hapic_data=No
             revision_id=revision.revision_id,
             file_extension=revision.file_extension,
         )
+        not_modified_response = use_http_cache(
+            request,
+            HttpCachePolicy.IMMUTABLE,
+            etag=get_revision_etag(revision, "raw"),
+            last_modified=revision.updated,
+        )
+        if not_modified_response:
+            return not_modified_response
         try:
             return StorageLib(request.app_config).get_raw_file(
                 depot_file=revision.depot_file,
@@ -309,6 +328,14 @@ def preview_pdf(self, context, request: TracimRequest, hapic_data=None):
         default_filename = "{label}_page_{page_number}.pdf".format(
             label=content.label, page_number=hapic_data.query.page
         )
+        not_modified_response = use_http_cache(
+            request,
+            HttpCachePolicy.REVALIDATE,
+            etag=get_revision_etag(content.revision, "pdf", hapic_data.query.page),
+            last_modified=content.updated,
+        )
+        if not_modified_response:
+            return not_modified_response
         return api.get_one_page_pdf_preview(
             revision=content.revision,
             filename=hapic_data.path.filename,
@@ -341,6 +368,14 @@ def preview_pdf_full(self, context, request: TracimRequest, hapic_data=None):
         )
         content = api.get_one(hapic_data.path.content_id, content_type=ContentTypeSlug.ANY.value)
         default_filename = "{label}.pdf".format(label=content.label)
+        not_modified_response = use_http_cache(
+            request,
+            HttpCachePolicy.REVALIDATE,
+            etag=get_revision_etag(content.revision, "pdf"),
+            last_modified=content.updated,
+        )
+        if not_modified_response:
+            return not_modified_response
         return api.get_full_pdf_preview(
             revision=content.revision,
             filename=hapic_data.path.filename,
@@ -375,6 +410,14 @@ def preview_pdf_full_revision(self, context, request: TracimRequest, hapic_data=
         default_filename = "{label}_r{revision_id}.pdf".format(
             revision_id=revision.revision_id, label=revision.label
         )
+        not_modified_response = use_http_cache(
+            request,
+            HttpCachePolicy.IMMUTABLE,
+            etag=get_revision_etag(revision, "pdf"),
+            last_modified=revision.updated,
+        )
+        if not_modified_response:
+            return not_modified_response
         return api.get_full_pdf_preview(
             revision=revision,
             filename=hapic_data.path.filename,
@@ -409,6 +452,14 @@ def preview_pdf_revision(self, context, request: TracimRequest, hapic_data=None)
         default_filename = "{label}_page_{page_number}.pdf".format(
             label=content.label, page_number=hapic_data.query.page
         )
+        not_modified_response = use_http_cache(
+            request,
+            HttpCachePolicy.IMMUTABLE,
+            etag=get_revision_etag(revision, "pdf", hapic_data.query.page),
+            last_modified=revision.updated,
+        )
+        if not_modified_response:
+            return not_modified_response
         return api.get_one_page_pdf_preview(
             revision=revision,
             filename=hapic_data.path.filename,
@@ -445,6 +496,20 @@ def preview_jpg(self, context, request: TracimRequest, hapic_data=None):
         default_filename = "{label}_page_{page_number}.jpg".format(
             label=content.label, page_number=hapic_data.query.page
         )
+        not_modified_response = use_http_cache(
+            request,
+            HttpCachePolicy.REVALIDATE,
+            etag=get_revision_etag(
+                content.revision,
+                "jpg",
+                hapic_data.query.page,
+                allowed_dim.dimensions[0].width,
+                allowed_dim.dimensions[0].height,
+            ),
+            last_modified=content.updated,
+        )
+        if not_modified_response:
+            return not_modified_response
         return api.get_jpeg_preview(
             revision=content.revision,
             filename=hapic_data.path.filename,
@@ -485,6 +550,20 @@ def sized_preview_jpg(self, context, request: TracimRequest, hapic_data=None):
             width=hapic_data.path.width,
             height=hapic_data.path.height,
         )
+        not_modified_response = use_http_cache(
+            request,
+            HttpCachePolicy.REVALIDATE,
+            etag=get_revision_etag(
+                content.revision,
+                "jpg",
+                hapic_data.query.page,
+                hapic_data.path.width,
+                hapic_data.path.height,
+            ),
+            last_modified=content.updated,
+        )
+        if not_modified_response:
+            return not_modified_response
         return api.get_jpeg_preview(
             revision=content.revision,
             filename=hapic_data.path.filename,
@@ -527,6 +606,20 @@ def sized_preview_jpg_revision(self, context, request: TracimRequest, hapic_data
             width=hapic_data.path.width,
             height=hapic_data.path.height,
         )
+        not_modified_response = use_http_cache(
+            request,
+            HttpCachePolicy.IMMUTABLE,
+            etag=get_revision_etag(
+                revision,
+                "jpg",
+                hapic_data.query.page,
+                hapic_data.path.width,
+                hapic_data.path.height,
+            ),
+            last_modified=revision.updated,
+        )
+        if not_modified_response:
+            return not_modified_response
         return api.get_jpeg_preview(
             revision=revision,
             filename=hapic_data.path.filename,
@@ -64,11 +64,7 @@ def get_user_todos(
             content_type_slug=content_type_list.Todo.slug, assignee_id=hapic_data.path["user_id"]
         )
 
-        todos_in_context = []
-        for todo in todos:
-            todos_in_context.append(content_api.get_content_in_context(todo))
-
-        return todos_in_context
+        return content_api.get_contents_in_context(todos)
 
     @hapic.with_api_doc(tags=[SWAGGER_TAG__CONTENT_TODO_ENDPOINTS])
     @hapic.handle_exception(UserNotMemberOfWorkspace, HTTPStatus.BAD_REQUEST)
@@ -93,11 +89,7 @@ def get_todos(
             parent_ids=[hapic_data.path.content_id], content_type=content_type_list.Todo.slug
         )
 
-        todos_in_context = []
-        for todo in todos:
-            todos_in_context.append(content_api.get_content_in_context(todo))
-
-        return todos_in_context
+        return content_api.get_contents_in_context(todos)
 
     @hapic.with_api_doc(tags=[SWAGGER_TAG__CONTENT_TODO_ENDPOINTS])
     @hapic.handle_exception(UserNotMemberOfWorkspace, HTTPStatus.BAD_REQUEST)
@@ -10,6 +10,7 @@
 from depot.manager import DepotManager
 import pluggy
 from pyramid.paster import get_appsettings
+from pyramid.scripting import AppEnvironment
 from sqlalchemy import text
 from sqlalchemy.engine import reflection
 from sqlalchemy.exc import IntegrityError
@@ -22,7 +23,9 @@
 from tracim_backend.exceptions import ForceArgumentNeeded
 from tracim_backend.fixtures import FixturesLoader
 from tracim_backend.fixtures.content import Content as ContentFixture
+from tracim_backend.lib.core.hierarchy import HierarchyIndexLib
 from tracim_backend.lib.core.plugins import init_plugin_manager
+from tracim_backend.lib.core.preview_metadata import PreviewMetadataLib
 from tracim_backend.lib.core.user import UserApi
 from tracim_backend.lib.utils.logger import logger
 from tracim_backend.lib.utils.request import TracimContext
@@ -128,6 +131,10 @@ def _populate_database(cls, app_config: CFG, add_test_data: bool) -> None:
                     fixtures_loader = FixturesLoader(dbsession, app_config)
                     fixtures = [ContentFixture]
                     fixtures_loader.loads(fixtures)
+                if app_config.HIERARCHY_INDEX__ENABLED:
+                    # INFO - 2026-10-18 - the index of a new database is complete,
+                    # it does not need to be filled later
+                    HierarchyIndexLib(dbsession).rebuild()
                 transaction.commit()
                 print("Database initialized.")
             except IntegrityError as exc:
@@ -434,3 +441,59 @@ def take_action(self, parsed_args: argparse.Namespace) -> None:
                 original_storage_name, original_storage_type, new_storage_name, new_storage_type
             )
         )
+
+
+class BackfillHierarchyIndexCommand(AppContextCommand):
+    def get_description(self) -> str:
+        return "Fill (or rebuild) the content and space hierarchy index (closure tables)"
+
+    def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvironment) -> None:
+        session = app_context["request"].dbsession
+        row_counts = HierarchyIndexLib(session).rebuild()
+        for table_name, row_count in row_counts.items():
+            print("{}: {} rows indexed".format(table_name, row_count))
+
+
+class BackfillPreviewMetadataCommand(AppContextCommand):
+    def get_parser(self, prog_name: str) -> argparse.ArgumentParser:
+        parser = super().get_parser(prog_name)
+        parser.add_argument(
+            "--all",
+            help="Compute again preview metadata of all revisions, not only the missing ones",
+            dest="all_revisions",
+            action="store_true",
+            default=False,
+        )
+        return parser
+
+    def get_description(self) -> str:
+        return "Compute and store preview metadata (preview types, page number, mimetype) of file revisions"
+
+    def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvironment) -> None:
+        session = app_context["request"].dbsession
+        app_config = app_context["registry"].settings["CFG"]
+        stored_count = PreviewMetadataLib(session, app_config).backfill(
+            only_missing=not parsed_args.all_revisions
+        )
+        print("{} revisions updated".format(stored_count))
+
+
+class VerifyHierarchyIndexCommand(AppContextCommand):
+    def get_description(self) -> str:
+        return "Check that the content and space hierarchy index (closure tables) is up to date"
+
+    def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvironment) -> None:
+        session = app_context["request"].dbsession
+        is_valid = True
+        for table_name, (missing_count, unexpected_count) in (
+            HierarchyIndexLib(session).verify().items()
+        ):
+            print(
+                "{}: {} missing rows, {} unexpected rows".format(
+                    table_name, missing_count, unexpected_count
+                )
+            )
+            is_valid = is_valid and not missing_count and not unexpected_count
+        if not is_valid:
+            print('Hierarchy index is not up to date, use "tracimcli db hierarchy-index backfill"')
+            exit(1)
@@ -1,11 +1,17 @@
 import argparse
 import json
+import tempfile
+import time
+import typing
 
+from depot.manager import DepotManager
 from pyramid.scripting import AppEnvironment
+import transaction
 
 from tracim_backend.command import AppContextCommand
 from tracim_backend.config import CFG
 from tracim_backend.config import ConfigParam
+from tracim_backend.lib.core.event import SyncLiveMessageBuilder
 from tracim_backend.lib.core.live_messages import LiveMessagesLib
 from tracim_backend.lib.core.user_custom_properties import UserCustomPropertiesApi
 from tracim_backend.lib.mail_notifier.sender import EmailSender
@@ -13,6 +19,11 @@
 from tracim_backend.lib.mail_notifier.utils import EmailNotificationMessage
 from tracim_backend.lib.mail_notifier.utils import SmtpConfiguration
 from tracim_backend.lib.utils.utils import CustomPropertiesValidator
+from tracim_backend.lib.webdav.utils import UploadStream
+from tracim_backend.models.auth import User
+from tracim_backend.models.event import EntityType
+from tracim_backend.models.event import Event
+from tracim_backend.models.event import OperationType
 
 
 class ParametersListCommand(AppContextCommand):
@@ -194,6 +205,147 @@ def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvir
         print("test message (id=-1) send to user {}".format(parsed_args.user_id))
 
 
+class LiveMessagesFanoutBenchmarkCommand(AppContextCommand):
+    """
+    Measure how many events per second can be turned into messages for a given number
+    of receivers, with one by one and bulk fan-out.
+    Every row created by the benchmark is rolled back at the end.
+    """
+
+    def get_description(self) -> str:
+        return "benchmark live messages fan-out (events/sec against receiver count)"
+
+    def get_parser(self, prog_name: str) -> argparse.ArgumentParser:
+        parser = super().get_parser(prog_name)
+        parser.add_argument(
+            "-r",
+            "--receivers",
+            help="receiver counts to benchmark",
+            dest="receivers",
+            nargs="+",
+            type=int,
+            default=[10, 100, 1000, 10000],
+        )
+        parser.add_argument(
+            "-e",
+            "--events",
+            help="number of events published for each receiver count",
+            dest="events",
+            type=int,
+            default=10,
+        )
+        return parser
+
+    def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvironment) -> None:
+        # TODO - G.M - 05-04-2018 -Refactor this in order
+        # to not setup object var outside of __init__ .
+        self._session = app_context["request"].dbsession
+        self._app_config = app_context["registry"].settings["CFG"]  # type: CFG
+        # INFO - 2026-10-18 - users are inserted without the ORM to avoid triggering user events
+        max_receivers = max(parsed_args.receivers)
+        self._session.execute(
+            User.__table__.insert(),
+            [
+                {"username": "fanout-benchmark-{}".format(index), "display_name": "Benchmark"}
+                for index in range(max_receivers)
+            ],
+        )
+        user_ids = [
+            user_id
+            for (user_id,) in self._session.query(User.user_id)
+            .filter(User.username.like("fanout-benchmark-%"))
+            .limit(max_receivers)
+        ]
+        message_builder = SyncLiveMessageBuilder(context=app_context["request"])
+        print("|{: >10}|{: >8}|{: >14}|".format("receivers", "mode", "events/sec"))
+        for receiver_count in parsed_args.receivers:
+            receiver_ids = user_ids[:receiver_count]
+            for mode, publish in (
+                ("single", message_builder._create_and_publish_messages),
+                ("bulk", message_builder._bulk_create_and_publish_messages),
+            ):
+                events = [
+                    Event(
+                        entity_type=EntityType.WORKSPACE,
+                        operation=OperationType.MODIFIED,
+                        fields={"workspace": {"workspace_id": 0, "label": "benchmark"}},
+                    )
+                    for _ in range(parsed_args.events)
+                ]
+                self._session.add_all(events)
+                self._session.flush()
+                start = time.perf_counter()
+                for event in events:
+                    publish(event, receiver_ids, self._session)
+                self._session.flush()
+                elapsed = time.perf_counter() - start
+                print(
+                    "|{: >10}|{: >8}|{: >14.2f}|".format(
+                        receiver_count, mode, parsed_args.events / elapsed
+                    )
+                )
+        transaction.doom()
+
+
+class WebdavUploadBenchmarkCommand(AppContextCommand):
+    """
+    Measure the upload throughput to the configured file storage when the request body is
+    first spooled to a temporary file (former WebDAV behaviour) and when it is streamed.
+    Every file stored by the benchmark is removed at the end.
+    """
+
+    def get_description(self) -> str:
+        return "benchmark WebDAV upload storage throughput (spooled against streamed)"
+
+    def get_parser(self, prog_name: str) -> argparse.ArgumentParser:
+        parser = super().get_parser(prog_name)
+        parser.add_argument(
+            "-s",
+            "--sizes",
+            help="file sizes to benchmark, in MB",
+            dest="sizes",
+            nargs="+",
+            type=int,
+            default=[1, 10, 100],
+        )
+        parser.add_argument(
+            "-c",
+            "--chunk-size",
+            help="size of the request body chunks, in KB",
+            dest="chunk_size",
+            type=int,
+            default=256,
+        )
+        return parser
+
+    def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvironment) -> None:
+        app_config = app_context["registry"].settings["CFG"]  # type: CFG
+        depot = DepotManager.get(app_config.UPLOADED_FILES__STORAGE__STORAGE_NAME)
+        chunk = b"x" * (parsed_args.chunk_size * 1024)
+        print("|{: >10}|{: >10}|{: >10}|".format("size (MB)", "mode", "MB/s"))
+        for size in parsed_args.sizes:
+            chunk_count = size * 1024 // parsed_args.chunk_size
+            for mode, store in (
+                ("spooled", self._store_spooled),
+                ("streamed", self._store_streamed),
+            ):
+                start = time.perf_counter()
+                file_id = store(depot, (chunk for _ in range(chunk_count)))
+                elapsed = time.perf_counter() - start
+                depot.delete(file_id)
+                print("|{: >10}|{: >10}|{: >10.2f}|".format(size, mode, size / elapsed))
+
+    def _store_spooled(self, depot, chunks: typing.Iterable[bytes]) -> str:
+        with tempfile.NamedTemporaryFile(suffix="tracim_webdav_upload_") as temp_file:
+            for chunk in chunks:
+                temp_file.write(chunk)
+            temp_file.seek(0)
+            return depot.create(temp_file, "benchmark.bin", "application/octet-stream")
+
+    def _store_streamed(self, depot, chunks: typing.Iterable[bytes]) -> str:
+        return depot.create(UploadStream(chunks), "benchmark.bin", "application/octet-stream")
+
+
 class SMTPMailCheckerCommand(AppContextCommand):
     """ Check SMTP configuration by sending test email to given email address"""
 
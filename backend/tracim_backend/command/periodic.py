@@ -114,8 +114,13 @@ def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvir
             notification_summary = event_api.get_unread_messages_summary(
                 user.user_id, created_after=created_after,
             )
+            content_updates = []
+            if config.EMAIL__NOTIFICATION__CONTENT_UPDATE__DIGEST:
+                content_updates = event_api.get_content_updates_digest(
+                    user.user_id, created_after=created_after
+                )
 
-            if len(mentions) == 0 and len(notification_summary) == 0:
+            if len(mentions) == 0 and len(notification_summary) == 0 and len(content_updates) == 0:
                 continue
 
             try:
@@ -123,6 +128,7 @@ def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvir
                     "user": user,
                     "mentions": mentions,
                     "notification_summary": notification_summary,
+                    "content_updates": content_updates,
                 }
                 translator = Translator(
                     app_config=config, default_lang=user.lang, fallback_lang=config.DEFAULT_LANG
@@ -0,0 +1,124 @@
+import argparse
+from datetime import datetime
+
+from pyramid.scripting import AppEnvironment
+
+from tracim_backend.command import AppContextCommand
+from tracim_backend.lib.core.preview_cache import PreviewCacheLib
+from tracim_backend.lib.preview_pregeneration.pregeneration import PreviewPregenerationLib
+
+
+class PreviewCacheWarmCommand(AppContextCommand):
+    def get_description(self) -> str:
+        return "Generate the previews of existing files (current revision of files neither deleted nor archived)"
+
+    def get_parser(self, prog_name: str) -> argparse.ArgumentParser:
+        parser = super().get_parser(prog_name)
+        parser.add_argument(
+            "-s",
+            "--space-id",
+            help="Id of the space whose files previews are generated (all spaces if not given), "
+            "can be repeated",
+            dest="space_ids",
+            action="append",
+            default=None,
+            type=int,
+        )
+        parser.add_argument(
+            "--enqueue",
+            help="Enqueue the generation for the preview generator daemon "
+            "instead of generating the previews in this command",
+            dest="enqueue",
+            action="store_true",
+            default=False,
+        )
+        return parser
+
+    def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvironment) -> None:
+        session = app_context["request"].dbsession
+        app_config = app_context["registry"].settings["CFG"]
+        revision_count, error_count = PreviewPregenerationLib(session, app_config).warm(
+            workspace_ids=parsed_args.space_ids, enqueue=parsed_args.enqueue
+        )
+        if parsed_args.enqueue:
+            print("Preview generation of {} files enqueued".format(revision_count))
+        else:
+            print(
+                "Previews of {} files generated, got {} error(s), relaunch the command with '-d' to see the errors".format(
+                    revision_count - error_count, error_count
+                )
+            )
+
+
+class PreviewCacheStatsCommand(AppContextCommand):
+    def get_description(self) -> str:
+        return "Show the usage of the preview cache"
+
+    def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvironment) -> None:
+        app_config = app_context["registry"].settings["CFG"]
+        stats = PreviewCacheLib(app_config).get_stats()
+        print("Preview cache: {}".format(app_config.PREVIEW_CACHE_DIR))
+        print("Files: {}".format(stats.file_count))
+        print(
+            "Size: {} bytes (budget: {})".format(
+                stats.size, app_config.PREVIEW__CACHE__MAX_SIZE or "none"
+            )
+        )
+        print(
+            "Oldest use: {} (budget: {})".format(
+                datetime.fromtimestamp(stats.oldest_access).isoformat()
+                if stats.oldest_access
+                else "-",
+                "{} seconds".format(app_config.PREVIEW__CACHE__MAX_AGE)
+                if app_config.PREVIEW__CACHE__MAX_AGE
+                else "none",
+            )
+        )
+
+
+class PreviewCachePruneCommand(AppContextCommand):
+    def get_description(self) -> str:
+        return (
+            "Remove the least recently used previews which do not fit in the preview cache budgets"
+        )
+
+    def get_parser(self, prog_name: str) -> argparse.ArgumentParser:
+        parser = super().get_parser(prog_name)
+        parser.add_argument(
+            "--max-size",
+            help="Size budget of the cache in bytes (preview.cache.max_size if not given)",
+            dest="max_size",
+            default=None,
+            type=int,
+        )
+        parser.add_argument(
+            "--max-age",
+            help="Remove previews not used for this number of seconds "
+            "(preview.cache.max_age if not given)",
+            dest="max_age",
+            default=None,
+            type=int,
+        )
+        parser.add_argument(
+            "--dry-run",
+            help="dry-run mode, simulate action to be done but do not modify anything",
+            dest="dry_run_mode",
+            default=False,
+            action="store_true",
+        )
+        return parser
+
+    def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvironment) -> None:
+        app_config = app_context["registry"].settings["CFG"]
+        if parsed_args.max_size is not None:
+            app_config.PREVIEW__CACHE__MAX_SIZE = parsed_args.max_size
+        if parsed_args.max_age is not None:
+            app_config.PREVIEW__CACHE__MAX_AGE = parsed_args.max_age
+        preview_cache_lib = PreviewCacheLib(app_config)
+        if not preview_cache_lib.has_budget:
+            print("No budget given for the preview cache, nothing to remove")
+            return
+        if parsed_args.dry_run_mode:
+            print("(!) Running in dry-run mode, no changes will be applied.")
+        removed = preview_cache_lib.prune(dry_run=parsed_args.dry_run_mode)
+        print("{} files removed ({} bytes)".format(removed.file_count, removed.size))
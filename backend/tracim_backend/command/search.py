@@ -1,18 +1,29 @@
 import argparse
+import sys
+import time
+import typing
 
 from pyramid.scripting import AppEnvironment
+from sqlalchemy.orm import Query
 
 from tracim_backend.app_models.contents import ContentTypeSlug
 from tracim_backend.command import AppContextCommand
+from tracim_backend.exceptions import IndexingError
 from tracim_backend.lib.core.content import ContentApi
 from tracim_backend.lib.core.user import UserApi
 from tracim_backend.lib.core.workspace import WorkspaceApi
+from tracim_backend.lib.search.database_search.database_search_api import DatabaseContentIndexer
+from tracim_backend.lib.search.elasticsearch_search.catch_up import ESIndexCatchUp
 from tracim_backend.lib.search.elasticsearch_search.elasticsearch_search import ESContentIndexer
 from tracim_backend.lib.search.elasticsearch_search.elasticsearch_search import ESUserIndexer
 from tracim_backend.lib.search.elasticsearch_search.elasticsearch_search import ESWorkspaceIndexer
+from tracim_backend.lib.search.search import IndexedContentsResults
+from tracim_backend.lib.search.search_factory import DATABASE__SEARCH_ENGINE_SLUG
+from tracim_backend.lib.search.search_factory import ELASTICSEARCH__SEARCH_ENGINE_SLUG
 from tracim_backend.lib.search.search_factory import SearchFactory
 from tracim_backend.lib.utils.logger import logger
 from tracim_backend.lib.utils.request import TracimContext
+from tracim_backend.models.data import Content
 
 
 class IndexingCommand(AppContextCommand):
@@ -24,27 +35,62 @@ def _index_one_content(self, content_id: int, context: TracimContext) -> None:
             current_user=None, session=context.dbsession, config=context.app_config
         )
         content = content_api.get_one(content_id=content_id, content_type=ContentTypeSlug.ANY.value)
-        ESContentIndexer().index_contents([content], context)
+        self._get_content_indexer(context).index_contents([content], context)
         print('content "{}" correctly indexed.'.format(content_id))
 
-    def _index_all_contents(self, context: TracimContext) -> None:
+    def _index_all_contents(
+        self, context: TracimContext, from_content_id: typing.Optional[int] = None
+    ) -> None:
         print("Indexing all contents")
         if context.app_config.SEARCH__ENGINE == "simple":
             return
         content_api = ContentApi(
             current_user=None, session=context.dbsession, config=context.app_config
         )
-        contents = content_api.get_all()
-        indexing_error_count = ESContentIndexer().sync_index_contents(contents, context)
+        query = content_api.get_all_query()
+        if from_content_id:
+            print("Resuming after content {}".format(from_content_id))
+            query = query.filter(Content.id > from_content_id)
+        progress = IndexingProgress(total_count=query.count())
+        indexing_error_count = self._get_content_indexer(context).sync_index_contents(
+            self._get_contents_by_id(
+                query, context.app_config.SEARCH__ELASTICSEARCH__BULK__CHUNK_SIZE
+            ),
+            context,
+            on_progress=progress.print_progress,
+        )
         print(
             "{} content(s) were indexed, got {} error(s), relaunch the command with '-d' to see the errors".format(
-                len(contents) - indexing_error_count, indexing_error_count
+                progress.indexed_count - indexing_error_count, indexing_error_count
             )
         )
 
+    def _get_content_indexer(
+        self, context: TracimContext
+    ) -> typing.Union[ESContentIndexer, DatabaseContentIndexer]:
+        if context.app_config.SEARCH__ENGINE == DATABASE__SEARCH_ENGINE_SLUG:
+            return DatabaseContentIndexer()
+        return ESContentIndexer()
+
+    def _get_contents_by_id(self, query: Query, batch_size: int) -> typing.Iterator[Content]:
+        """Iterate over contents of the query ordered by id, loading them batch by batch."""
+        last_content_id = 0
+        while True:
+            contents = (
+                query.filter(Content.id > last_content_id)
+                .order_by(Content.id)
+                .limit(max(batch_size, 1))
+                .all()
+            )
+            if not contents:
+                return
+            yield from contents
+            last_content_id = contents[-1].id
+
     def _index_all_users(self, context: TracimContext) -> None:
         print("Indexing all users")
-        if context.app_config.SEARCH__ENGINE == "simple":
+        # INFO - 2026-10-18 - only elasticsearch indexes users and spaces
+        if context.app_config.SEARCH__ENGINE != ELASTICSEARCH__SEARCH_ENGINE_SLUG:
             return
         user_api = UserApi(current_user=None, session=context.dbsession, config=context.app_config)
         indexed_user_count = 0
@@ -55,7 +101,8 @@ def _index_all_users(self, context: TracimContext) -> None:
 
     def _index_all_workspaces(self, context: TracimContext) -> None:
         print("Indexing all workspaces")
-        if context.app_config.SEARCH__ENGINE == "simple":
+        # INFO - 2026-10-18 - only elasticsearch indexes users and spaces
+        if context.app_config.SEARCH__ENGINE != ELASTICSEARCH__SEARCH_ENGINE_SLUG:
             return
         indexed_workspace_count = 0
         workspace_api = WorkspaceApi(
@@ -67,9 +114,39 @@ def _index_all_workspaces(self, context: TracimContext) -> None:
         print("{} space(s) were indexed".format(indexed_workspace_count))
 
     def _index_all(self, context: TracimContext) -> None:
+        catch_up = None
+        if context.app_config.SEARCH__ENGINE == ELASTICSEARCH__SEARCH_ENGINE_SLUG:
+            catch_up = ESIndexCatchUp(context.dbsession, context.app_config)
+            # INFO - 2026-10-18 - changes of events created while indexing are indexed again
+            # by the next catch-up
+            last_event_id = catch_up.get_last_event_id()
         self._index_all_users(context)
         self._index_all_workspaces(context)
         self._index_all_contents(context)
+        if catch_up:
+            catch_up.set_checkpoint(last_event_id)
+
+
+class IndexingProgress:
+    """Print the progress and the throughput of contents indexing."""
+
+    def __init__(self, total_count: int) -> None:
+        self.total_count = total_count
+        self.indexed_count = 0
+        self._start_time = time.monotonic()
+
+    def print_progress(self, results: IndexedContentsResults) -> None:
+        self.indexed_count = results.get_nb_contents_to_index()
+        elapsed_time = time.monotonic() - self._start_time
+        print(
+            "{}/{} content(s) processed, {} error(s), {:.1f} content(s)/s, last content id: {}".format(
+                self.indexed_count,
+                self.total_count,
+                results.get_nb_index_errors(),
+                self.indexed_count / elapsed_time if elapsed_time else 0,
+                results.content_ids_to_index[-1],
+            )
+        )
 
 
 class SearchIndexInitCommand(IndexingCommand):
@@ -132,6 +209,33 @@ def get_parser(self, prog_name: str) -> argparse.ArgumentParser:
             default=None,
             type=int,
         )
+        parser.add_argument(
+            "--from-content-id",
+            help="resume indexing: only index contents whose id is greater than the given one "
+            "(last content id printed by an interrupted indexing), users and spaces are not indexed",
+            dest="from_content_id",
+            required=False,
+            default=None,
+            type=int,
+        )
+        parser.add_argument(
+            "--chunk-size",
+            help="number of contents sent in one bulk request, "
+            "default to search.elasticsearch.bulk.chunk_size",
+            dest="chunk_size",
+            required=False,
+            default=None,
+            type=int,
+        )
+        parser.add_argument(
+            "--workers",
+            help="number of bulk requests sent in parallel, "
+            "default to search.elasticsearch.bulk.workers",
+            dest="workers",
+            required=False,
+            default=None,
+            type=int,
+        )
         return parser
 
     def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvironment) -> None:
@@ -146,8 +250,16 @@ def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvir
         self.search_api = SearchFactory.get_search_lib(
             current_user=None, session=self._session, config=self._app_config
         )
+        if parsed_args.chunk_size:
+            self._app_config.SEARCH__ELASTICSEARCH__BULK__CHUNK_SIZE = parsed_args.chunk_size
+        if parsed_args.workers:
+            self._app_config.SEARCH__ELASTICSEARCH__BULK__WORKERS = parsed_args.workers
         if parsed_args.content_id:
             self._index_one_content(parsed_args.content_id, app_context["request"])
+        elif parsed_args.from_content_id:
+            self._index_all_contents(
+                app_context["request"], from_content_id=parsed_args.from_content_id
+            )
         else:
             self._index_all(app_context["request"])
 
@@ -165,3 +277,77 @@ def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvir
         print("delete index")
         self.search_api.delete_indices()
         print("Indices were deleted")
+
+
+class SearchIndexCatchUpCommand(AppContextCommand):
+    def get_description(self) -> str:
+        return "index changes of events created since the last indexing (elasticsearch only)"
+
+    def get_parser(self, prog_name: str) -> argparse.ArgumentParser:
+        parser = super().get_parser(prog_name)
+        parser.add_argument(
+            "--daemon",
+            help="do not stop once changes are indexed, index new changes every "
+            "search.elasticsearch.catch_up.interval seconds",
+            dest="daemon",
+            required=False,
+            action="store_true",
+            default=False,
+        )
+        parser.add_argument(
+            "--from-event-id",
+            help="index changes of events whose id is greater than the given one "
+            "instead of the ones created since the last indexing",
+            dest="from_event_id",
+            required=False,
+            default=None,
+            type=int,
+        )
+        return parser
+
+    def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvironment) -> None:
+        context = app_context["request"]
+        if context.app_config.SEARCH__ENGINE != ELASTICSEARCH__SEARCH_ENGINE_SLUG:
+            print("Nothing to catch up: contents are indexed when they are modified")
+            return
+        catch_up = ESIndexCatchUp(context.dbsession, context.app_config)
+        if parsed_args.from_event_id is not None:
+            catch_up.set_checkpoint(parsed_args.from_event_id)
+        elif catch_up.get_checkpoint() is None:
+            print(
+                'No indexing checkpoint: index everything with "tracimcli search index-populate" '
+                "or give the first event to index with --from-event-id"
+            )
+            sys.exit(1)
+        while True:
+            try:
+                self._catch_up(catch_up, context)
+            except IndexingError as exc:
+                context.tm.abort()
+                context.tm.begin()
+                if not parsed_args.daemon:
+                    print("Catch-up stopped: {}".format(exc))
+                    sys.exit(1)
+                logger.exception(self, exc)
+            if not parsed_args.daemon:
+                return
+            time.sleep(context.app_config.SEARCH__ELASTICSEARCH__CATCH_UP__INTERVAL)
+
+    def _catch_up(self, catch_up: ESIndexCatchUp, context: TracimContext) -> None:
+        """Index changes batch by batch, each batch moves the checkpoint in its own transaction."""
+        while True:
+            result = catch_up.catch_up_batch()
+            context.tm.commit()
+            context.tm.begin()
+            if not result.event_count:
+                return
+            print(
+                "{} event(s) processed, {} content(s), {} user(s) and {} space(s) indexed, "
+                "last event id: {}".format(
+                    result.event_count,
+                    result.content_count,
+                    result.user_count,
+                    result.workspace_count,
+                    result.last_event_id,
+                )
+            )
@@ -5,6 +5,7 @@
 from tracim_backend.command import AppContextCommand
 from tracim_backend.exceptions import TracimException
 from tracim_backend.lib.core.workspace import WorkspaceApi
+from tracim_backend.lib.core.workspace_usage import WorkspaceUsageLib
 
 
 class MoveSpaceCommand(AppContextCommand):
@@ -70,3 +71,43 @@ def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvir
                     parent_workspace.label,
                 )
             )
+
+
+class ReconcileSpaceUsageCommand(AppContextCommand):
+    def get_parser(self, prog_name: str) -> argparse.ArgumentParser:
+        parser = super().get_parser(prog_name)
+        parser.add_argument(
+            "-s",
+            "--space-id",
+            help="Id of the space to reconcile (all spaces if not given), can be repeated",
+            dest="space_ids",
+            action="append",
+            default=None,
+            type=int,
+        )
+        parser.add_argument(
+            "--only-missing-file-sizes",
+            help="Only read from storage the file sizes which are not stored in database yet",
+            dest="only_missing_file_sizes",
+            action="store_true",
+            default=False,
+        )
+        return parser
+
+    def get_description(self) -> str:
+        return """Read file sizes from storage and compute again used space of spaces"""
+
+    def take_app_action(self, parsed_args: argparse.Namespace, app_context: AppEnvironment) -> None:
+        session = app_context["request"].dbsession
+        used_spaces = WorkspaceUsageLib(session).reconcile(
+            workspace_ids=parsed_args.space_ids,
+            only_missing_file_sizes=parsed_args.only_missing_file_sizes,
+        )
+        for workspace_id, (old_used_space, used_space) in used_spaces.items():
+            if old_used_space != used_space:
+                print(
+                    "Space {}: used space changed from {} to {} bytes".format(
+                        workspace_id, old_used_space, used_space
+                    )
+                )
+        print("{} spaces reconciled.".format(len(used_spaces)))
@@ -2,6 +2,7 @@
 from enum import Enum
 import json
 import os
+import tempfile
 import typing
 
 from depot.manager import DepotManager
@@ -52,14 +53,14 @@
 ID_SOURCE_DEFAULT = "SOURCE_DEFAULT"
 
 DEPOT_LOCAL_STORAGE_BACKEND = "depot.io.local.LocalFileStorage"
-DEPOT_S3_STORAGE_BACKEND = "depot.io.boto3.S3Storage"
+DEPOT_S3_STORAGE_BACKEND = "tracim_backend.lib.utils.s3_storage.StreamingS3Storage"
 DEPOT_MEMORY_STORAGE_BACKEND = "depot.io.memory.MemoryFileStorage"
 DEPOT_CONTENT_CONF_PREFIX = "uploaded_files"
 
 
 class DepotFileStorageType(Enum):
     LOCAL = ("local", "depot.io.local.LocalFileStorage")
-    S3 = ("s3", "depot.io.boto3.S3Storage")
+    S3 = ("s3", "tracim_backend.lib.utils.s3_storage.StreamingS3Storage")
     MEMORY = ("memory", "depot.io.memory.MemoryFileStorage")
 
     def __init__(self, slug: str, depot_storage_backend: str):
@@ -466,6 +467,9 @@ def _load_global_config(self) -> None:
             self.get_raw_config("user.self_registration.enabled", "False")
         )
         self.USER__ONLINE_TIMEOUT = int(self.get_raw_config("user.online_timeout", 10))
+        self.USER__CONNECTION_STATUS__FLUSH_INTERVAL = float(
+            self.get_raw_config("user.connection_status.flush_interval", "1")
+        )
         default_user_custom_properties_path = self.here_macro_replace(
             "%(here)s/tracim_backend/templates/user_custom_properties/default/"
         )
@@ -492,6 +496,9 @@ def _load_global_config(self) -> None:
         self.WORKSPACE__JOIN__MAX_MESSAGES_HISTORY_COUNT = int(
             self.get_raw_config("workspace.join.max_messages_history_count", "-1")
         )
+        self.HIERARCHY_INDEX__ENABLED = asbool(
+            self.get_raw_config("hierarchy_index.enabled", "False")
+        )
         self.KNOWN_MEMBERS__FILTER = asbool(self.get_raw_config("known_members.filter", "True"))
         self.DEBUG = asbool(self.get_raw_config("debug", "False"))
         self.BUILD_VERSION = self.get_raw_config("build_version", get_build_version())
@@ -503,6 +510,26 @@ def _load_global_config(self) -> None:
             cast_func=PreviewDim.from_string,
             separator=",",
         )
+        self.PREVIEW__PREGENERATION__ENABLED = asbool(
+            self.get_raw_config("preview.pregeneration.enabled", "False")
+        )
+        self.PREVIEW__PREGENERATION__WORKERS = int(
+            self.get_raw_config("preview.pregeneration.workers", "2")
+        )
+        self.PREVIEW__PREGENERATION__MAX_PAGES = int(
+            self.get_raw_config("preview.pregeneration.max_pages", "5")
+        )
+        self.PREVIEW__PREGENERATION__SMALL_FILE_SIZE = int(
+            self.get_raw_config("preview.pregeneration.small_file_size", "10485760")
+        )
+        self.PREVIEW__PREGENERATION__JOB_TIMEOUT = int(
+            self.get_raw_config("preview.pregeneration.job_timeout", "600")
+        )
+        self.PREVIEW__CACHE__MAX_SIZE = int(self.get_raw_config("preview.cache.max_size", "0"))
+        self.PREVIEW__CACHE__MAX_AGE = int(self.get_raw_config("preview.cache.max_age", "0"))
+        self.PREVIEW__CACHE__PRUNE_INTERVAL = int(
+            self.get_raw_config("preview.cache.prune_interval", "3600")
+        )
 
         self.FRONTEND__SERVE = asbool(self.get_raw_config("frontend.serve", "True"))
         # INFO - G.M - 2018-08-06 - we pretend that frontend_dist_folder
@@ -677,6 +704,17 @@ def __load_uploaded_files_config(self) -> None:
         self.UPLOADED_FILES__STORAGE__S3__STORAGE_CLASS = self.get_raw_config(
             "uploaded_files.storage.s3.storage_class"
         )
+        # Local cache of the files of non-local storages
+        self.UPLOADED_FILES__STORAGE__CACHE__PATH = self.get_raw_config(
+            "uploaded_files.storage.cache.path",
+            os.path.join(tempfile.gettempdir(), "tracim_file_cache"),
+        )
+        self.UPLOADED_FILES__STORAGE__CACHE__MAX_SIZE = int(
+            self.get_raw_config("uploaded_files.storage.cache.max_size", "1073741824")
+        )
+        self.UPLOADED_FILES__STORAGE__CACHE__MAX_COUNT = int(
+            self.get_raw_config("uploaded_files.storage.cache.max_count", "1000")
+        )
 
     def _load_live_messages_config(self) -> None:
         self.LIVE_MESSAGES__CONTROL_ZMQ_URI = self.get_raw_config(
@@ -689,6 +727,15 @@ def _load_live_messages_config(self) -> None:
         self.LIVE_MESSAGES__BLOCKING_PUBLISH = asbool(
             self.get_raw_config("live_messages.blocking_publish", async_processing)
         )
+        self.LIVE_MESSAGES__BULK_FANOUT_THRESHOLD = int(
+            self.get_raw_config("live_messages.bulk_fanout_threshold", "100")
+        )
+        self.LIVE_MESSAGES__RECEIVER_CACHE__ENABLED = asbool(
+            self.get_raw_config("live_messages.receiver_cache.enabled", async_processing)
+        )
+        self.LIVE_MESSAGES__RECEIVER_CACHE__TTL = int(
+            self.get_raw_config("live_messages.receiver_cache.ttl", "600")
+        )
 
     def _load_limitation_config(self) -> None:
         self.LIMITATION__SHAREDSPACE_PER_USER = int(
@@ -763,6 +810,9 @@ def _load_email_config(self) -> None:
             "email.notification.content_update.subject",
             _("[{website_title}] [{workspace_label}] {content_label} ({content_status_label})"),
         )
+        self.EMAIL__NOTIFICATION__CONTENT_UPDATE__DIGEST = asbool(
+            self.get_raw_config("email.notification.content_update.digest", "False")
+        )
         # Created account notification
         self.EMAIL__NOTIFICATION__CREATED_ACCOUNT__TEMPLATE__HTML = self.get_raw_config(
             "email.notification.created_account.template.html",
@@ -820,6 +870,12 @@ def _load_email_config(self) -> None:
         self.EMAIL__NOTIFICATION__SMTP__ENCRYPTION = self.get_raw_config(
             "email.notification.smtp.encryption", default_smtp_encryption
         )
+        self.EMAIL__NOTIFICATION__SMTP__POOL_SIZE = int(
+            self.get_raw_config("email.notification.smtp.pool_size", "1")
+        )
+        self.EMAIL__NOTIFICATION__SMTP__MAX_RATE = float(
+            self.get_raw_config("email.notification.smtp.max_rate", "0")
+        )
 
         self.EMAIL__REPLY__ACTIVATED = asbool(self.get_raw_config("email.reply.activated", "False"))
 
@@ -851,6 +907,13 @@ def _load_email_config(self) -> None:
         self.EMAIL__REPLY__LOCKFILE_PATH = self.get_raw_config(
             "email.reply.lockfile_path", self.here_macro_replace("%(here)s/email_fetcher.lock"),
         )
+        self.EMAIL__REPLY__FETCH_BATCH_SIZE = int(
+            self.get_raw_config("email.reply.fetch_batch_size", "100")
+        )
+        self.EMAIL__REPLY__WORKERS = int(self.get_raw_config("email.reply.workers", "4"))
+        self.EMAIL__REPLY__DIRECT_INGESTION = asbool(
+            self.get_raw_config("email.reply.direct_ingestion", "False")
+        )
         self.NEW_USER__INVITATION__DO_NOTIFY = asbool(
             self.get_raw_config("new_user.invitation.do_notify", "True")
         )
@@ -875,6 +938,7 @@ def _load_webdav_config(self) -> None:
         self.WEBDAV__VERBOSE__LEVEL = int(self.get_raw_config("webdav.verbose.level", "1"))
         self.WEBDAV__ROOT_PATH = self.get_raw_config("webdav.root_path", "/")
         self.WEBDAV__BLOCK_SIZE = int(self.get_raw_config("webdav.block_size", "8192"))
+        self.WEBDAV__PATH_CACHE__TTL = int(self.get_raw_config("webdav.path_cache.ttl", "0"))
         self.WEBDAV__DIR_BROWSER__ENABLED = asbool(
             self.get_raw_config("webdav.dir_browser.enabled", "True")
         )
@@ -930,6 +994,9 @@ def _load_ldap_config(self) -> None:
 
     def _load_search_config(self):
         self.SEARCH__ENGINE = self.get_raw_config("search.engine", "simple")
+        self.SEARCH__DATABASE__TEXT_SEARCH_CONFIG = self.get_raw_config(
+            "search.database.text_search_config", "simple"
+        )
         self.SEARCH__ELASTICSEARCH__INDEX_ALIAS_PREFIX = self.get_raw_config(
             "search.elasticsearch.index_alias_prefix"
         )
@@ -959,6 +1026,9 @@ def _load_search_config(self):
         self.SEARCH__ELASTICSEARCH__INGEST__SIZE_LIMIT = int(
             self.get_raw_config("search.elasticsearch.ingest.size_limit", "52428800")
         )
+        self.SEARCH__ELASTICSEARCH__INGEST__TEXT_SIZE_LIMIT = int(
+            self.get_raw_config("search.elasticsearch.ingest.text_size_limit", "100000")
+        )
         self.SEARCH__ELASTICSEARCH__HOST = self.get_raw_config(
             "search.elasticsearch.host", "localhost"
         )
@@ -968,12 +1038,33 @@ def _load_search_config(self):
         self.SEARCH__ELASTICSEARCH__REQUEST_TIMEOUT = int(
             self.get_raw_config("search.elasticsearch.request_timeout", "60")
         )
+        self.SEARCH__ELASTICSEARCH__BULK__CHUNK_SIZE = int(
+            self.get_raw_config("search.elasticsearch.bulk.chunk_size", "500")
+        )
+        self.SEARCH__ELASTICSEARCH__BULK__WORKERS = int(
+            self.get_raw_config("search.elasticsearch.bulk.workers", "2")
+        )
+        self.SEARCH__ELASTICSEARCH__BULK__MAX_RETRIES = int(
+            self.get_raw_config("search.elasticsearch.bulk.max_retries", "3")
+        )
+        self.SEARCH__ELASTICSEARCH__CATCH_UP__BATCH_SIZE = int(
+            self.get_raw_config("search.elasticsearch.catch_up.batch_size", "1000")
+        )
+        self.SEARCH__ELASTICSEARCH__CATCH_UP__SETTLE_DELAY = int(
+            self.get_raw_config("search.elasticsearch.catch_up.settle_delay", "10")
+        )
+        self.SEARCH__ELASTICSEARCH__CATCH_UP__INTERVAL = int(
+            self.get_raw_config("search.elasticsearch.catch_up.interval", "30")
+        )
 
     def _load_jobs_config(self) -> None:
         self.JOBS__PROCESSING_MODE = self.get_raw_config("jobs.processing_mode", "sync").upper()
         self.JOBS__ASYNC__REDIS__HOST = self.get_raw_config("jobs.async.redis.host", "localhost")
         self.JOBS__ASYNC__REDIS__PORT = int(self.get_raw_config("jobs.async.redis.port", "6379"))
         self.JOBS__ASYNC__REDIS__DB = int(self.get_raw_config("jobs.async.redis.db", "0"))
+        self.JOBS__ASYNC__EVENTS_BATCH_SIZE = int(
+            self.get_raw_config("jobs.async.events_batch_size", "100")
+        )
 
     def _load_content_security_policy_config(self) -> None:
         prefix = "content_security_policy"
@@ -1129,8 +1220,27 @@ def _check_global_config_validity(self) -> None:
                     )
                 ) from e
 
+        if self.USER__CONNECTION_STATUS__FLUSH_INTERVAL < 0:
+            raise ConfigurationError(
+                'ERROR  "{}" should be a positive value (currently "{}")'.format(
+                    "USER__CONNECTION_STATUS__FLUSH_INTERVAL",
+                    self.USER__CONNECTION_STATUS__FLUSH_INTERVAL,
+                )
+            )
+
         self.check_mandatory_param("PREVIEW_CACHE_DIR", self.PREVIEW_CACHE_DIR)
         self.check_directory_path_param("PREVIEW_CACHE_DIR", self.PREVIEW_CACHE_DIR, writable=True)
+        for param_name in (
+            "PREVIEW__CACHE__MAX_SIZE",
+            "PREVIEW__CACHE__MAX_AGE",
+            "PREVIEW__CACHE__PRUNE_INTERVAL",
+        ):
+            if getattr(self, param_name) < 0:
+                raise ConfigurationError(
+                    'ERROR  "{}" should be a positive value (currently "{}")'.format(
+                        param_name, getattr(self, param_name)
+                    )
+                )
 
         if AuthType.REMOTE is self.AUTH_TYPES:
             raise ConfigurationError(
@@ -1270,6 +1380,16 @@ def _check_uploaded_files_config_validity(self) -> None:
                     self.UPLOADED_FILES__STORAGE__STORAGE_TYPE
                 ),
             )
+        for param_name in (
+            "UPLOADED_FILES__STORAGE__CACHE__MAX_SIZE",
+            "UPLOADED_FILES__STORAGE__CACHE__MAX_COUNT",
+        ):
+            if getattr(self, param_name) < 0:
+                raise ConfigurationError(
+                    'ERROR  "{}" should be a positive value (currently "{}")'.format(
+                        param_name, getattr(self, param_name)
+                    )
+                )
 
     def _check_live_messages_config_validity(self) -> None:
         self.check_mandatory_param(
@@ -1299,6 +1419,19 @@ def _check_email_config_validity(self) -> None:
             )
 
         if self.EMAIL__REPLY__ACTIVATED:
+            if self.EMAIL__REPLY__FETCH_BATCH_SIZE < 1:
+                raise ConfigurationError(
+                    'ERROR  "{}" should be a strictly positive value (currently "{}")'.format(
+                        "EMAIL__REPLY__FETCH_BATCH_SIZE", self.EMAIL__REPLY__FETCH_BATCH_SIZE
+                    )
+                )
+            if self.EMAIL__REPLY__WORKERS < 1:
+                raise ConfigurationError(
+                    'ERROR  "{}" should be a strictly positive value (currently "{}")'.format(
+                        "EMAIL__REPLY__WORKERS", self.EMAIL__REPLY__WORKERS
+                    )
+                )
+
             # INFO - G.M - 2019-12-10 - check imap config provided
             self.check_mandatory_param(
                 "EMAIL__REPLY__IMAP__SERVER",
@@ -1364,6 +1497,21 @@ def _check_email_config_validity(self) -> None:
                     )
                 )
 
+            if self.EMAIL__NOTIFICATION__SMTP__POOL_SIZE < 1:
+                raise ConfigurationError(
+                    'ERROR  "{}" should be a strictly positive value (currently "{}")'.format(
+                        "EMAIL__NOTIFICATION__SMTP__POOL_SIZE",
+                        self.EMAIL__NOTIFICATION__SMTP__POOL_SIZE,
+                    )
+                )
+            if self.EMAIL__NOTIFICATION__SMTP__MAX_RATE < 0:
+                raise ConfigurationError(
+                    'ERROR  "{}" should be a positive value (currently "{}")'.format(
+                        "EMAIL__NOTIFICATION__SMTP__MAX_RATE",
+                        self.EMAIL__NOTIFICATION__SMTP__MAX_RATE,
+                    )
+                )
+
             # INFO - G.M - 2019-12-10 - check value provided for headers
             self.check_mandatory_param(
                 "EMAIL__NOTIFICATION__FROM__EMAIL",
@@ -1411,6 +1559,28 @@ def _check_jobs_config_validity(self) -> None:
                     self.CST.ASYNC, self.CST.SYNC, self.JOBS__PROCESSING_MODE
                 )
             )
+        if self.JOBS__ASYNC__EVENTS_BATCH_SIZE < 1:
+            raise ConfigurationError(
+                'ERROR  "{}" should be a strictly positive value (currently "{}")'.format(
+                    "JOBS__ASYNC__EVENTS_BATCH_SIZE", self.JOBS__ASYNC__EVENTS_BATCH_SIZE
+                )
+            )
+        if self.PREVIEW__PREGENERATION__ENABLED and self.JOBS__PROCESSING_MODE != self.CST.ASYNC:
+            raise ConfigurationError(
+                'ERROR  "PREVIEW__PREGENERATION__ENABLED" needs "JOBS__PROCESSING_MODE" '
+                'to be "{}"'.format(self.CST.ASYNC)
+            )
+        for param_name in (
+            "PREVIEW__PREGENERATION__WORKERS",
+            "PREVIEW__PREGENERATION__MAX_PAGES",
+            "PREVIEW__PREGENERATION__JOB_TIMEOUT",
+        ):
+            if getattr(self, param_name) < 1:
+                raise ConfigurationError(
+                    'ERROR  "{}" should be a strictly positive value (currently "{}")'.format(
+                        param_name, getattr(self, param_name)
+                    )
+                )
 
     def _check_ldap_config_validity(self):
         if AuthType.LDAP in self.AUTH_TYPES:
@@ -1445,7 +1615,7 @@ def _check_ldap_config_validity(self):
             )
 
     def _check_search_config_validity(self):
-        search_engine_valid = ["elasticsearch", "simple"]
+        search_engine_valid = ["elasticsearch", "simple", "database"]
         if self.SEARCH__ENGINE not in search_engine_valid:
 
             search_engine_list_str = ", ".join(
@@ -1463,6 +1633,13 @@ def _check_search_config_validity(self):
                 when_str="if elasticsearch search feature is enabled",
             )
 
+        if self.SEARCH__ENGINE == "database" and not self.SQLALCHEMY__URL.startswith(
+            ("postgresql", "sqlite")
+        ):
+            raise ConfigurationError(
+                'ERROR: "database" search engine is only available with PostgreSQL and SQLite'
+            )
+
     def _check_webdav_config_validity(self):
         self.check_mandatory_param("WEBDAV__BASE_URL", self.WEBDAV__BASE_URL)
         self.check_https_url_path("WEBDAV__BASE_URL", self.WEBDAV__BASE_URL)
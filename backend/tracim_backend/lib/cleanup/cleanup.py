@@ -13,6 +13,8 @@
 from tracim_backend.config import CFG
 from tracim_backend.exceptions import AgendaNotFoundError
 from tracim_backend.exceptions import CannotDeleteUniqueRevisionWithoutDeletingContent
+from tracim_backend.exceptions import CannotGetDepotFileDepotCorrupted
+from tracim_backend.lib.core.storage import StorageLib
 from tracim_backend.lib.core.workspace import WorkspaceApi
 from tracim_backend.lib.utils.logger import logger
 from tracim_backend.models.auth import User
@@ -60,6 +62,13 @@ def __init__(self, session: Session, app_config: CFG, dry_run_mode: bool = False
         self.session = session
         self.app_config = app_config
         self.dry_run_mode = dry_run_mode
+        self._storage_lib = None  # type: typing.Optional[StorageLib]
+
+    @property
+    def storage_lib(self) -> StorageLib:
+        if not self._storage_lib:
+            self._storage_lib = StorageLib(self.app_config)
+        return self._storage_lib
 
     def safe_update(self, object_to_update: DeclarativeBase) -> None:
         if not self.dry_run_mode:
@@ -140,6 +149,9 @@ def delete_revision(
             )
             self.safe_delete(read_status)
 
+        if revision.depot_file:
+            self.delete_revision_previews(revision)
+
         logger.info(
             self,
             "delete revision {} of content {}".format(revision.revision_id, revision.content_id),
@@ -148,6 +160,32 @@ def delete_revision(
         self.safe_delete(revision)
         return revision_id
 
+    def delete_revision_previews(self, revision: ContentRevisionRO) -> None:
+        """
+        Delete cached previews of revision file only if dry-run mode is disabled
+        """
+        if self.dry_run_mode:
+            logger.debug(
+                self, "fake deletion of previews of revision {}".format(revision.revision_id)
+            )
+            return
+        try:
+            deleted_count = self.storage_lib.delete_previews(
+                revision.depot_file, revision.file_extension
+            )
+        except CannotGetDepotFileDepotCorrupted:
+            logger.warning(
+                self,
+                "Cannot delete previews of revision {}, depot file is not accessible".format(
+                    revision.revision_id
+                ),
+            )
+            return
+        logger.debug(
+            self,
+            "delete {} preview files of revision {}".format(deleted_count, revision.revision_id),
+        )
+
     def delete_content(self, content: Content, recursively: bool = True) -> typing.List[str]:
         """
         Delete content and associated stuff:
@@ -8,7 +8,6 @@
 from depot.io.utils import FileIntent
 from hapic.data import HapicFile
 from importlib_metadata import metadata
-from preview_generator.exception import UnsupportedMimeType
 from preview_generator.manager import PreviewManager
 from sqlakeyset import Page
 from sqlakeyset import get_page
@@ -22,6 +21,7 @@
 from sqlalchemy.orm.attributes import QueryableAttribute
 from sqlalchemy.orm.attributes import get_history
 from sqlalchemy.orm.exc import NoResultFound
+from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.sql.elements import and_
 import transaction
 
@@ -29,7 +29,6 @@
 from tracim_backend.app_models.contents import content_status_list
 from tracim_backend.app_models.contents import content_type_list
 from tracim_backend.config import CFG
-from tracim_backend.exceptions import CannotGetDepotFileDepotCorrupted
 from tracim_backend.exceptions import ConflictingMoveInChild
 from tracim_backend.exceptions import ConflictingMoveInItself
 from tracim_backend.exceptions import ContentFilenameAlreadyUsedInFolder
@@ -48,11 +47,16 @@
 from tracim_backend.exceptions import SameValueError
 from tracim_backend.exceptions import UnallowedSubContent
 from tracim_backend.exceptions import WorkspacesDoNotMatch
+from tracim_backend.lib.core.hierarchy import HierarchyIndexLib
 from tracim_backend.lib.core.notifications import NotifierFactory
+from tracim_backend.lib.core.preview_metadata import PreviewMetadataLib
+from tracim_backend.lib.core.preview_metadata import RevisionPreviewMetadata
+from tracim_backend.lib.core.read_status import NewInformationCache
 from tracim_backend.lib.core.storage import StorageLib
 from tracim_backend.lib.core.tag import TagLib
 from tracim_backend.lib.core.userworkspace import RoleApi
 from tracim_backend.lib.core.workspace import WorkspaceApi
+from tracim_backend.lib.core.workspace_usage import WorkspaceUsageLib
 from tracim_backend.lib.rich_text_preview.html_preview import RichTextPreviewLib
 from tracim_backend.lib.utils.app import TracimContentType
 from tracim_backend.lib.utils.logger import logger
@@ -76,6 +80,7 @@
 from tracim_backend.models.data import RevisionReadStatus
 from tracim_backend.models.data import UserRoleInWorkspace
 from tracim_backend.models.data import Workspace
+from tracim_backend.models.data import is_hierarchy_index_enabled
 from tracim_backend.models.event import OperationType
 from tracim_backend.models.favorites import FavoriteContent
 from tracim_backend.models.revision_protection import new_revision
@@ -172,6 +177,34 @@ def show(
     def get_content_in_context(self, content: Content) -> ContentInContext:
         return ContentInContext(content, self._session, self._config, self._user)
 
+    def get_contents_in_context(
+        self, contents: typing.Iterable[Content]
+    ) -> typing.List[ContentInContext]:
+        """
+        Same as get_content_in_context() for several contents: read statuses of all the
+        contents are computed with one query, on first use.
+        """
+        contents = list(contents)
+        ids_with_new_information = []  # type: typing.List[typing.Set[int]]
+
+        def get_ids_with_new_information() -> typing.Set[int]:
+            if not ids_with_new_information:
+                ids_with_new_information.append(
+                    self.get_ids_with_new_information([content.content_id for content in contents])
+                )
+            return ids_with_new_information[0]
+
+        return [
+            ContentInContext(
+                content,
+                self._session,
+                self._config,
+                self._user,
+                get_ids_with_new_information=get_ids_with_new_information,
+            )
+            for content in contents
+        ]
+
     def get_revision_in_context(
         self, revision: ContentRevisionRO, version_number: typing.Optional[int] = None
     ) -> RevisionInContext:
@@ -616,6 +649,13 @@ def get_one(
             raise ContentNotFound('Content "{}" not found in database'.format(content_id)) from exc
         return content
 
+    def get_all_by_ids(
+        self, content_ids: typing.List[int], workspace: typing.Optional[Workspace] = None
+    ) -> typing.List[Content]:
+        """Same filters as get_one(), contents not found are not returned."""
+        workspaces = [workspace] if workspace else None
+        return self._base_query(workspaces).filter(Content.content_id.in_(content_ids)).all()
+
     def get_one_revision(
         self, revision_id: int = None, content: Content = None
     ) -> ContentRevisionRO:
@@ -736,6 +776,7 @@ def get_one_page_pdf_preview(
             page_number=page_number,
             original_file_extension=revision.file_extension,
             force_download=force_download,
+            page_nb=self._get_stored_preview_page_nb(revision),
         )
 
     def get_full_pdf_preview_from_html_raw_content(
@@ -874,8 +915,13 @@ def get_jpeg_preview(
             height=height,
             original_file_extension=revision.file_extension,
             force_download=force_download,
+            page_nb=self._get_stored_preview_page_nb(revision),
         )
 
+    def _get_stored_preview_page_nb(self, revision: ContentRevisionRO) -> typing.Optional[int]:
+        metadata = PreviewMetadataLib.get_stored(revision)
+        return metadata.page_nb if metadata else None
+
     def get_all_query(
         self,
         parent_ids: typing.Optional[typing.List[int]] = None,
@@ -915,12 +961,7 @@ def get_all_query(
             content = self.get_one(
                 complete_path_to_id, ContentTypeSlug.ANY.value, ignore_content_state_filter=True
             )
-            if content.parent_id:
-                content = content.parent
-                while content.parent_id:
-                    parent_ids.append(content.content_id)
-                    content = content.parent
-                parent_ids.append(content.content_id)
+            parent_ids.extend(parent.content_id for parent in content.recursive_parents)
             # TODO - G.M - 2018-11-12 - add workspace root to
             # parent_ids list when complete_path_to_id is set
             parent_ids.append(0)
@@ -1023,12 +1064,15 @@ def get_read_status(
         user: User,
         workspace: typing.Optional[Workspace] = None,
         content_ids: typing.Optional[typing.List[int]] = None,
+        ignore_content_state_filter: bool = False,
     ) -> typing.List[typing.Dict[str, typing.Any]]:
         """
         Return read status for a user of a content
         :param user: user concerned by these read status
         :param workspace: workspace to check for read status
         :param content_ids: list of content to check for read status
+        :param ignore_content_state_filter: ignore show_deleted, show_archived and show_active
+        filters
         :return: list of read status
 
         :warning: This method does not use standard security filter, so be careful with
@@ -1038,26 +1082,22 @@ def get_read_status(
         """
 
         optional_begin_filters = []
-        optional_end_filters = []
-        if content_ids:
-            optional_end_filters.append("root_id in :content_ids")
-
         if workspace:
             optional_begin_filters.append("cr.workspace_id = :workspace_id")
 
         # NOTE - G.M - 2022-06-21: Theses SQL boolean filters use a syntax especially chosen
         # to be compatible with both postgresql and sqlite, using some other similar syntax
         # may failed in one or the other database software.
-        if not self._show_deleted:
-            optional_begin_filters.append("not cr.is_deleted")
-        if not self._show_archived:
-            optional_begin_filters.append("not cr.is_archived")
-        if not self._show_active:
-            optional_begin_filters.append("(cr.is_archived or cr.is_deleted)")
-
-        statement = text(
-            """
-            with recursive content_read_status as (
+        content_state_filters = []
+        if not self._show_deleted and not ignore_content_state_filter:
+            content_state_filters.append("not cr.is_deleted")
+        if not self._show_archived and not ignore_content_state_filter:
+            content_state_filters.append("not cr.is_archived")
+        if not self._show_active and not ignore_content_state_filter:
+            content_state_filters.append("(cr.is_archived or cr.is_deleted)")
+        optional_begin_filters.extend(content_state_filters)
+
+        content_read_status_query = """
                 select c.id                                                      as content_id,
                        cr.parent_id                                              as parent_id,
                        rrs.view_datetime                                         as view_datetime,
@@ -1066,38 +1106,50 @@ def get_read_status(
                          join content_revisions cr on c.cached_revision_id = cr.revision_id
                          left outer join revision_read_status rrs on cr.revision_id = rrs.revision_id and rrs.user_id = :user_id
                 {optional_begin_filter}
-            ), temp_read_status as
-            (
-              select
-                  crs.content_id,
-                  crs.view_datetime,
-                  crs.read,
-                  crs.content_id as root_id
-              from content_read_status crs
-              union all
-              select crs.content_id,
-                     crs.view_datetime,
-                     crs.read,
-                     trs.root_id as root_id
-              from content_read_status crs
-                inner join temp_read_status trs
-                  on crs.parent_id = trs.content_id
-            )
-            select
-                   trs.root_id as root_id,
-                   max(trs.view_datetime) as last_view_datetime,
-                   min(trs.read) as read
-            from temp_read_status trs
-            group by root_id
-            {optional_end_filter}
-            ;
         """.format(
-                optional_begin_filter=self._text_filter_generator(optional_begin_filters),
-                optional_end_filter=self._text_filter_generator(
-                    prefix="having ", filters=optional_end_filters
-                ),
-            )
+            optional_begin_filter=self._text_filter_generator(optional_begin_filters)
         )
+        if is_hierarchy_index_enabled(self._session):
+            statement = self._get_indexed_read_status_statement(
+                content_read_status_query,
+                filter_content_ids=bool(content_ids),
+                filter_content_states=bool(content_state_filters),
+            )
+        elif content_ids:
+            statement = self._get_subtree_read_status_statement(optional_begin_filters)
+        else:
+            statement = text(
+                """
+                with recursive content_read_status as (
+                    {content_read_status_query}
+                ), temp_read_status as
+                (
+                  select
+                      crs.content_id,
+                      crs.view_datetime,
+                      crs.read,
+                      crs.content_id as root_id
+                  from content_read_status crs
+                  union all
+                  select crs.content_id,
+                         crs.view_datetime,
+                         crs.read,
+                         trs.root_id as root_id
+                  from content_read_status crs
+                    inner join temp_read_status trs
+                      on crs.parent_id = trs.content_id
+                )
+                select
+                       trs.root_id as root_id,
+                       max(trs.view_datetime) as last_view_datetime,
+                       min(trs.read) as read
+                from temp_read_status trs
+                group by root_id
+                ;
+            """.format(
+                    content_read_status_query=content_read_status_query
+                )
+            )
         if content_ids:
             statement = statement.bindparams(
                 bindparam("content_ids", expanding=True, type_=Integer())
@@ -1118,6 +1170,119 @@ def get_read_status(
             )
         return result
 
+    def get_ids_with_new_information(self, content_ids: typing.Iterable[int]) -> typing.Set[int]:
+        """
+        Return ids of given contents having new information for the current user: the content
+        or one of its descendants is not read, as Content.has_new_information_for().
+        Statuses are computed with one query and cached until the user marks contents as read
+        or unread, or until a content changes.
+
+        :warning: This method does not use standard security filter, so be careful with
+        access right.
+        """
+        if not self._user:
+            return set()
+        cache = NewInformationCache(self._session)
+        with_new_information, missing_ids = cache.get(self._user_id, content_ids)
+        if missing_ids:
+            read_statuses = self.get_read_status(
+                self._user, content_ids=missing_ids, ignore_content_state_filter=True
+            )
+            new_ids = {
+                read_status["content_id"]
+                for read_status in read_statuses
+                if not read_status["read_by_user"]
+            }
+            cache.set(self._user_id, missing_ids, new_ids)
+            with_new_information.update(new_ids)
+        return with_new_information
+
+    def _get_subtree_read_status_statement(self, content_filters: typing.List[str]) -> TextClause:
+        """
+        Same as the recursive read status query, but only walking down the subtrees of the
+        given contents instead of computing the subtree of every content of the database.
+        """
+        root_filters = ["c.id in :content_ids"] + content_filters
+        return text(
+            """
+            with recursive temp_read_status as
+            (
+              select c.id                                                      as content_id,
+                     rrs.view_datetime                                         as view_datetime,
+                     case when rrs.view_datetime is not NULL then 1 else 0 END as read,
+                     c.id                                                      as root_id
+              from content c
+                       join content_revisions cr on c.cached_revision_id = cr.revision_id
+                       left outer join revision_read_status rrs on cr.revision_id = rrs.revision_id and rrs.user_id = :user_id
+              {root_filter}
+              union all
+              select c.id                                                      as content_id,
+                     rrs.view_datetime                                         as view_datetime,
+                     case when rrs.view_datetime is not NULL then 1 else 0 END as read,
+                     trs.root_id                                               as root_id
+              from temp_read_status trs
+                       join content_revisions cr on cr.parent_id = trs.content_id
+                       join content c on c.cached_revision_id = cr.revision_id
+                       left outer join revision_read_status rrs on cr.revision_id = rrs.revision_id and rrs.user_id = :user_id
+              {content_filter}
+            )
+            select
+                   trs.root_id as root_id,
+                   max(trs.view_datetime) as last_view_datetime,
+                   min(trs.read) as read
+            from temp_read_status trs
+            group by root_id
+            ;
+        """.format(
+                root_filter=self._text_filter_generator(root_filters),
+                content_filter=self._text_filter_generator(content_filters),
+            )
+        )
+
+    def _get_indexed_read_status_statement(
+        self, content_read_status_query: str, filter_content_ids: bool, filter_content_states: bool
+    ) -> TextClause:
+        """
+        Same as the recursive read status query, but using the content hierarchy index
+        to get the subtree of each content.
+        """
+        filters = []
+        if filter_content_ids:
+            filters.append("cc.ancestor_id in :content_ids")
+        if filter_content_states:
+            # INFO - 2026-10-18 - as with the recursive query, a content is not part of
+            # the subtree of its ancestors if one of its intermediate parents is filtered out.
+            filters.append(
+                """
+                not exists (
+                    select 1 from content_closure path
+                    where path.descendant_id = cc.descendant_id
+                      and path.depth > 0 and path.depth < cc.depth
+                      and path.ancestor_id not in (select content_id from content_read_status)
+                )
+                """
+            )
+        return text(
+            """
+            with content_read_status as (
+                {content_read_status_query}
+            )
+            select
+                   cc.ancestor_id as root_id,
+                   max(crs.view_datetime) as last_view_datetime,
+                   min(crs.read) as read
+            from content_closure cc
+                join content_read_status crs on crs.content_id = cc.descendant_id
+                join content_read_status root_crs on root_crs.content_id = cc.ancestor_id
+            {optional_filter}
+            group by cc.ancestor_id
+            ;
+        """.format(
+                content_read_status_query=content_read_status_query,
+                optional_filter=self._text_filter_generator(filters),
+            )
+        )
+
     def _set_allowed_content(self, content: Content, allowed_content_dict: dict) -> Content:
         """
         :param content: the given content instance
@@ -1299,7 +1464,13 @@ def _check_move_conflicts(self, content: Content, new_parent: Content = None):
         if new_parent:
             if content.content_id == new_parent.content_id:
                 raise ConflictingMoveInItself("You can't move a content into itself")
-            if new_parent in content.get_children(recursively=True):
+            if is_hierarchy_index_enabled(self._session):
+                is_moved_in_child = HierarchyIndexLib(self._session).is_content_ancestor(
+                    content.content_id, new_parent.content_id
+                )
+            else:
+                is_moved_in_child = new_parent in content.get_children(recursively=True)
+            if is_moved_in_child:
                 raise ConflictingMoveInChild("You can't move a content into one of its children")
 
     def copy(
@@ -1751,7 +1922,7 @@ def check_workspace_size_limitation(self, content_length: int, workspace: Worksp
         # INFO - G.M - 2019-08-23 - 0 mean no size limit
         if self._config.LIMITATION__WORKSPACE_SIZE == 0:
             return
-        workspace_size = workspace.get_size()
+        workspace_size = WorkspaceUsageLib(self._session).get_workspace_used_space(workspace)
         if workspace_size > self._config.LIMITATION__WORKSPACE_SIZE:
             raise FileSizeOverWorkspaceEmptySpace(
                 'File cannot be added (size "{}") because workspace is full: "{}/{}"'.format(
@@ -1848,54 +2019,23 @@ def undelete(self, content: Content):
         content.is_deleted = False
         content.revision_type = ActionDescription.UNDELETION
 
+    def get_revision_preview_metadata(self, revision_id: int) -> RevisionPreviewMetadata:
+        """
+        Get preview metadata of the revision file, computed once per revision.
+        """
+        # INFO - 2026-10-18 - get() uses the session identity map: the revision is usually
+        # already loaded, with its preview metadata.
+        revision = self._session.query(ContentRevisionRO).get(revision_id)
+        return PreviewMetadataLib(self._session, self._config).get(revision)
+
     def get_preview_page_nb(self, revision_id: int, file_extension: str) -> typing.Optional[int]:
-        # TODO: - G.M - 2021-01-20 - Refactor this to use new StorageLib, see #4079
-        try:
-            with self.get_one_revision_filepath(revision_id) as file_path:
-                nb_pages = self.preview_manager.get_page_nb(file_path, file_ext=file_extension)
-        except UnsupportedMimeType:
-            return None
-        except CannotGetDepotFileDepotCorrupted:
-            logger.warning(
-                self, "Unable to get revision filepath, depot is corrupted", exc_info=True
-            )
-            return None
-        except Exception:
-            logger.warning(self, "Unknown Preview_Generator Exception Occured", exc_info=True)
-            return None
-        return nb_pages
+        return self.get_revision_preview_metadata(revision_id).page_nb
 
     def has_pdf_preview(self, revision_id: int, file_extension: str) -> bool:
-        # TODO: - G.M - 2021-01-20 - Refactor this to use new StorageLib, see #4079
-        try:
-            with self.get_one_revision_filepath(revision_id) as file_path:
-                return self.preview_manager.has_pdf_preview(file_path, file_ext=file_extension)
-        except UnsupportedMimeType:
-            return False
-        except CannotGetDepotFileDepotCorrupted:
-            logger.warning(
-                self, "Unable to get revision filepath, depot is corrupted", exc_info=True
-            )
-            return False
-        except Exception:
-            logger.warning(self, "Unknown Preview_Generator Exception Occured", exc_info=True)
-            return False
+        return self.get_revision_preview_metadata(revision_id).has_pdf
 
     def has_jpeg_preview(self, revision_id: int, file_extension: str) -> bool:
-        # TODO: - G.M - 2021-01-20 - Refactor this to use new StorageLib, see #4079
-        try:
-            with self.get_one_revision_filepath(revision_id) as file_path:
-                return self.preview_manager.has_jpeg_preview(file_path, file_ext=file_extension)
-        except UnsupportedMimeType:
-            return False
-        except CannotGetDepotFileDepotCorrupted:
-            logger.warning(
-                self, "Unable to get revision filepath, depot is corrupted", exc_info=True
-            )
-            return False
-        except Exception:
-            logger.warning(self, "Unknown Preview_Generator Exception Occured", exc_info=True)
-            return False
+        return self.get_revision_preview_metadata(revision_id).has_jpeg
 
     def mark_read__all(self, read_datetime: datetime = None, do_flush: bool = True) -> None:
         """
@@ -1978,6 +2118,7 @@ def mark_read(
 
         for revision in viewed_revisions:
             revision.read_by[self._user] = read_datetime
+        NewInformationCache(self._session).invalidate(self._user_id)
 
         if recursive:
             for child in content.recursive_children:
@@ -2002,6 +2143,7 @@ def mark_unread(self, content: Content, do_flush=True) -> Content:
                 del revision.read_by[self._user]
             except KeyError:
                 pass
+        NewInformationCache(self._session).invalidate(self._user_id)
 
         for child in content.get_valid_children():
             self.mark_unread(child, do_flush=False)
@@ -2162,12 +2304,18 @@ def get_user_favorite_contents(
         paged_favorites = self._get_user_favorite_contents(
             user_id=user_id, order_by_properties=[FavoriteContent.created],
         )
-        favorites = []
-        for favorite in paged_favorites:
-            content = None
-            if favorite.content_id in favorite_content_ids:
-                content = self.get_content_in_context(favorite.content)
-            favorites.append(FavoriteContentInContext(favorite, content))
+        contents_in_context = {
+            content_in_context.content_id: content_in_context
+            for content_in_context in self.get_contents_in_context(
+                favorite.content
+                for favorite in paged_favorites
+                if favorite.content_id in favorite_content_ids
+            )
+        }
+        favorites = [
+            FavoriteContentInContext(favorite, contents_in_context.get(favorite.content_id))
+            for favorite in paged_favorites
+        ]
         return PaginatedObject(paged_favorites, favorites)
 
     def _get_content_marked_as_favorite_query(self, user_id: int):
@@ -1,6 +1,7 @@
 import abc
 import contextlib
 from datetime import datetime
+import time
 import typing
 from typing import Any
 from typing import Callable
@@ -24,6 +25,7 @@
 from sqlalchemy.orm import Query
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.exc import NoResultFound
+import zope.sqlalchemy
 
 from tracim_backend.app_models.contents import ContentTypeSlug
 from tracim_backend.config import CFG
@@ -32,6 +34,7 @@
 from tracim_backend.lib.core.content import ContentApi
 from tracim_backend.lib.core.live_messages import LiveMessagesLib
 from tracim_backend.lib.core.plugins import hookimpl
+from tracim_backend.lib.core.receiver_cache import ReceiverIdsCache
 from tracim_backend.lib.core.user import UserApi
 from tracim_backend.lib.core.userworkspace import RoleApi
 from tracim_backend.lib.core.workspace import WorkspaceApi
@@ -82,6 +85,29 @@
 JsonDict = Dict[str, Any]
 
 
+class ContentUpdatesDigest:
+    """Unread updates of a content (and of its comments) merged in a digest email."""
+
+    def __init__(
+        self, content_id: int, label: str, workspace_id: int, workspace_label: str
+    ) -> None:
+        self.content_id = content_id
+        self.label = label
+        self.workspace_id = workspace_id
+        self.workspace_label = workspace_label
+        self.event_count = 0
+        self.author_names = []  # type: List[str]
+        self.last_update = None  # type: Optional[datetime]
+
+    def add_event(self, event: Event) -> None:
+        self.event_count += 1
+        author_name = event.author["public_name"] if event.author else None
+        if author_name and author_name not in self.author_names:
+            self.author_names.append(author_name)
+        if not self.last_update or event.created > self.last_update:
+            self.last_update = event.created
+
+
 class EventApi:
     """Api to query event & messages"""
 
@@ -386,6 +412,43 @@ def get_messages_count(
             related_to_content_ids=related_to_content_ids,
         ).count()
 
+    def get_content_updates_digest(
+        self, user_id: int, created_after: datetime
+    ) -> List[ContentUpdatesDigest]:
+        """
+        Unread content events of the spaces where the given user has individual email
+        notifications, merged by content (comments and todos with their parent), most recent
+        first.
+        """
+        messages = self.get_messages_for_user(
+            user_id,
+            created_after=created_after,
+            event_type=EventTypeDatabaseParameters(EntityType.CONTENT, None, None),
+            read_status=ReadStatus.UNREAD,
+            email_notification_type=EmailNotificationType.INDIVIDUAL,
+        )
+        digests = {}  # type: Dict[int, ContentUpdatesDigest]
+        for message in messages:
+            event = message.event
+            if event.content["content_type"] in (
+                ContentTypeSlug.COMMENT.value,
+                ContentTypeSlug.TODO.value,
+            ):
+                content_id = event.content["parent_id"]
+                label = event.content["parent_label"]
+            else:
+                content_id = event.content["content_id"]
+                label = event.content["label"]
+            if content_id not in digests:
+                digests[content_id] = ContentUpdatesDigest(
+                    content_id=content_id,
+                    label=label,
+                    workspace_id=event.workspace_id,
+                    workspace_label=event.workspace["label"],
+                )
+            digests[content_id].add_event(event)
+        return sorted(digests.values(), key=lambda digest: digest.last_update, reverse=True)
+
     def get_unread_messages_summary(
         self, user_id: int, created_after: datetime,
     ) -> List[typing.Tuple[int, str]]:
@@ -577,9 +640,12 @@ def publish(session: TracimSession, flush_context=None) -> None:
             message_builder = message_builder_class(
                 context=session.context
             )  # type: BaseLiveMessageBuilder
-            for event in session.context.pending_events:
-                message_builder.publish_messages_for_event(event.event_id)
+            pending_event_ids = [event.event_id for event in session.context.pending_events]
+            # INFO - 2026-10-18 - reset pending events before publishing them: messages are
+            # written in savepoints whose release also triggers the before_commit event.
             session.context.pending_events = []
+            if pending_event_ids:
+                message_builder.publish_messages_for_events(pending_event_ids)
 
         sqlalchemy_event.listen(db_session, commit_event, publish)
 
@@ -1011,6 +1077,37 @@ def get_event_user_id(session: TracimSession, event: Event) -> typing.Optional[i
     return user_id
 
 
+def _get_administrator_ids(session: TracimSession, config: CFG) -> List[int]:
+    user_api = UserApi(current_user=None, session=session, config=config)
+    return ReceiverIdsCache(config).get_or_fetch(
+        "administrators",
+        [ReceiverIdsCache.USERS_SCOPE],
+        lambda: user_api.get_user_ids_from_profile(Profile.ADMIN),
+    )
+
+
+def _get_all_user_ids(session: TracimSession, config: CFG) -> List[int]:
+    user_api = UserApi(current_user=None, session=session, config=config)
+    return ReceiverIdsCache(config).get_or_fetch(
+        "all_users", [ReceiverIdsCache.USERS_SCOPE], user_api.get_all_user_ids
+    )
+
+
+def _get_workspace_member_ids(
+    workspace_id: int,
+    session: TracimSession,
+    config: CFG,
+    min_role: Optional[WorkspaceRoles] = None,
+) -> List[int]:
+    role_api = RoleApi(current_user=None, session=session, config=config)
+    return ReceiverIdsCache(config).get_or_fetch(
+        "workspace_members({}, {})".format(workspace_id, min_role),
+        # INFO - 2026-10-18 - roles are deleted in cascade with users without calling role hooks
+        [ReceiverIdsCache.USERS_SCOPE, ReceiverIdsCache.workspace_scope(workspace_id)],
+        lambda: role_api.get_workspace_member_ids(workspace_id, min_role=min_role),
+    )
+
+
 def _get_user_event_receiver_ids(event: Event, session: TracimSession, config: CFG) -> Set[int]:
     """
     User event are received by :
@@ -1019,7 +1116,7 @@ def _get_user_event_receiver_ids(event: Event, session: TracimSession, config: C
     - users knowing the user (in same workspace)
     """
     user_api = UserApi(current_user=event.user, session=session, config=config)
-    receiver_ids = user_api.get_user_ids_from_profile(Profile.ADMIN)
+    receiver_ids = _get_administrator_ids(session, config)
     event_user_id = get_event_user_id(session, event)
     if event_user_id:
         receiver_ids.append(event_user_id)
@@ -1035,10 +1132,8 @@ def _get_members_and_administrators_ids(
     Return administrators + members of the event's workspace + user subject of the action if there\
         is one
     """
-    user_api = UserApi(current_user=None, session=session, config=config)
-    administrators = user_api.get_user_ids_from_profile(Profile.ADMIN)
-    role_api = RoleApi(current_user=None, session=session, config=config)
-    workspace_members = role_api.get_workspace_member_ids(event.workspace_id)
+    administrators = _get_administrator_ids(session, config)
+    workspace_members = _get_workspace_member_ids(event.workspace_id, session, config)
     receiver_ids = set(administrators + workspace_members)
     event_user_id = get_event_user_id(session, event)
     if event_user_id:
@@ -1058,8 +1153,7 @@ def _get_workspace_event_receiver_ids(
         # Spaces without access_type are necessarily CONFIDENTIAL
         access_type = WorkspaceAccessType.CONFIDENTIAL
     if access_type in Workspace.ACCESSIBLE_TYPES:
-        user_api = UserApi(current_user=None, session=session, config=config)
-        receiver_ids = set(user_api.get_all_user_ids())
+        receiver_ids = set(_get_all_user_ids(session, config))
     else:
         receiver_ids = _get_members_and_administrators_ids(event, session, config)
     return receiver_ids
@@ -1074,12 +1168,10 @@ def _get_workspace_subscription_event_receiver_ids(
     - administrators
     - workspace manager of the workspace the subscription took place
     """
-    user_api = UserApi(current_user=None, session=session, config=config)
-    administrators = user_api.get_user_ids_from_profile(Profile.ADMIN)
+    administrators = _get_administrator_ids(session, config)
     author = event.subscription["author"]["user_id"]
-    role_api = RoleApi(current_user=None, session=session, config=config)
-    workspace_managers = role_api.get_workspace_member_ids(
-        event.workspace_id, min_role=WorkspaceRoles.WORKSPACE_MANAGER
+    workspace_managers = _get_workspace_member_ids(
+        event.workspace_id, session, config, min_role=WorkspaceRoles.WORKSPACE_MANAGER
     )
     return set(administrators + workspace_managers + [author])
 
@@ -1096,8 +1188,7 @@ def _get_content_event_receiver_ids(event: Event, session: TracimSession, config
     Returns:
         Set[int]: List of user id that will receive the event
     """
-    role_api = RoleApi(current_user=None, session=session, config=config)
-    workspace_members = role_api.get_workspace_member_ids(event.workspace_id)
+    workspace_members = _get_workspace_member_ids(event.workspace_id, session, config)
     return set(workspace_members)
 
 
@@ -1116,6 +1207,9 @@ class BaseLiveMessageBuilder(abc.ABC):
 
     _event_schema = EventSchema()
 
+    # number of message rows given to a single executemany statement in bulk fan-out
+    BULK_INSERT_CHUNK_SIZE = 1000
+
     _get_receiver_ids_callables = {
         EntityType.CONTENT_TAG: _get_content_event_receiver_ids,
         EntityType.CONTENT: _get_content_event_receiver_ids,
@@ -1128,6 +1222,12 @@ class BaseLiveMessageBuilder(abc.ABC):
         EntityType.WORKSPACE: _get_workspace_event_receiver_ids,
     }  # type: Dict[str, GetReceiverIdsCallable]
 
+    # receivers given by those callables only depend on the workspace of the event,
+    # they are computed once per workspace when publishing several events at once.
+    _workspace_receiver_ids_callables = {
+        _get_content_event_receiver_ids
+    }  # type: Set[GetReceiverIdsCallable]
+
     def __init__(self, config: CFG) -> None:
         self._config = config
 
@@ -1156,25 +1256,136 @@ def context(self) -> Generator[TracimContext, None, None]:
     def publish_messages_for_event(self, event_id: int) -> None:
         pass
 
+    def publish_messages_for_events(self, event_ids: List[int]) -> None:
+        for event_id in event_ids:
+            self.publish_messages_for_event(event_id)
+
     def _publish_messages_for_event(self, event_id: int) -> None:
+        self._publish_messages_for_events([event_id])
+
+    def _publish_messages_for_events(self, event_ids: List[int]) -> None:
+        start_time = time.perf_counter()
+        message_count = 0
         with self.context() as context:
             session = context.dbsession
-            event = session.query(Event).filter(Event.event_id == event_id).one()
-            receiver_ids = self.get_receiver_ids(event, session, self._config)
-            logger.debug(self, f"Sending eventid: {event_id} to users: {receiver_ids}")
-            messages = [
-                Message(
-                    receiver_id=receiver_id,
-                    event=event,
-                    event_id=event.event_id,
-                    sent=datetime.utcnow(),
+            events = (
+                session.query(Event)
+                .filter(Event.event_id.in_(event_ids))
+                .order_by(Event.event_id)
+                .all()
+            )
+            if len(events) != len(event_ids):
+                logger.warning(
+                    self,
+                    "Events {} do not exist, no message published for them".format(
+                        set(event_ids) - {event.event_id for event in events}
+                    ),
+                )
+            workspace_receiver_ids = {}  # type: Dict[typing.Tuple[Callable, int], Set[int]]
+            bulk_fanout_threshold = self._config.LIVE_MESSAGES__BULK_FANOUT_THRESHOLD
+            failed_event_ids = []
+            for event in events:
+                # INFO - 2026-10-18 - an event which cannot be published (malformed fields,
+                # unreachable live messages server…) must not prevent publishing the
+                # other events of the batch. Its messages are written in a savepoint as a
+                # database error would otherwise abort the whole transaction.
+                try:
+                    with session.begin_nested():
+                        receiver_ids = self._get_batch_receiver_ids(
+                            event, session, workspace_receiver_ids
+                        )
+                        logger.debug(
+                            self, f"Sending eventid: {event.event_id} to users: {receiver_ids}"
+                        )
+                        if bulk_fanout_threshold and len(receiver_ids) >= bulk_fanout_threshold:
+                            self._bulk_create_and_publish_messages(event, receiver_ids, session)
+                        else:
+                            self._create_and_publish_messages(event, receiver_ids, session)
+                except Exception:
+                    logger.error(
+                        self,
+                        "Cannot publish messages of event {}, ignoring it".format(event.event_id),
+                        exc_info=True,
+                    )
+                    failed_event_ids.append(event.event_id)
+                    continue
+                message_count += len(receiver_ids)
+            if failed_event_ids:
+                logger.warning(
+                    self,
+                    "No message published for events {} of the batch".format(failed_event_ids),
                 )
-                for receiver_id in receiver_ids
-            ]
-            session.add_all(messages)
-            live_message_lib = LiveMessagesLib(self._config)
-            for message in messages:
-                live_message_lib.publish_message_to_user(message)
+        elapsed_time = time.perf_counter() - start_time
+        # INFO - 2026-10-18 - elapsed time can be zero with a frozen/coarse clock
+        events_per_second = len(events) / elapsed_time if elapsed_time > 0 else float("inf")
+        logger.info(
+            self,
+            "Published batch of {} events ({} messages) in {:.3f}s ({:.1f} events/s)".format(
+                len(events), message_count, elapsed_time, events_per_second
+            ),
+        )
+
+    def _get_batch_receiver_ids(
+        self,
+        event: Event,
+        session: TracimSession,
+        workspace_receiver_ids: Dict[typing.Tuple[Callable, int], Set[int]],
+    ) -> Set[int]:
+        """Get receivers of an event, reusing those of the already seen events of the same
+        workspace when they only depend on it."""
+        get_receiver_ids = self._get_receiver_ids_callables.get(event.entity_type)
+        if get_receiver_ids not in self._workspace_receiver_ids_callables:
+            return set(self.get_receiver_ids(event, session, self._config))
+        key = (get_receiver_ids, event.workspace_id)
+        if key not in workspace_receiver_ids:
+            workspace_receiver_ids[key] = set(get_receiver_ids(event, session, self._config))
+        return workspace_receiver_ids[key]
+
+    def _create_and_publish_messages(
+        self, event: Event, receiver_ids: Iterable[int], session: TracimSession
+    ) -> None:
+        messages = [
+            Message(
+                receiver_id=receiver_id,
+                event=event,
+                event_id=event.event_id,
+                sent=datetime.utcnow(),
+            )
+            for receiver_id in receiver_ids
+        ]
+        session.add_all(messages)
+        # INFO - 2026-10-18 - write the messages before publishing them: they must not be
+        # published if they cannot be written.
+        session.flush()
+        live_message_lib = LiveMessagesLib(self._config)
+        for message in messages:
+            live_message_lib.publish_message_to_user(message)
+
+    def _bulk_create_and_publish_messages(
+        self, event: Event, receiver_ids: Iterable[int], session: TracimSession
+    ) -> None:
+        """Create and publish messages of an event for many receivers at once.
+
+        Message rows are inserted with executemany statements instead of ORM objects
+        and the live message is serialized once as it is the same for every receiver.
+        """
+        receiver_ids = list(receiver_ids)
+        sent = datetime.utcnow()
+        for offset in range(0, len(receiver_ids), self.BULK_INSERT_CHUNK_SIZE):
+            session.execute(
+                Message.__table__.insert(),
+                [
+                    {"receiver_id": receiver_id, "event_id": event.event_id, "sent": sent}
+                    for receiver_id in receiver_ids[offset : offset + self.BULK_INSERT_CHUNK_SIZE]
+                ],
+            )
+        # INFO - 2026-10-18 - core statements are not tracked by the zope transaction, tell it that
+        # the session has been written to so that the messages are committed.
+        zope.sqlalchemy.mark_changed(session, keep_session=True)
+        live_message_lib = LiveMessagesLib(self._config)
+        live_message_lib.publish_dict_to_users(
+            receiver_ids, LiveMessagesLib.unread_message_as_dict(event)
+        )
 
 
 class AsyncLiveMessageBuilder(BaseLiveMessageBuilder):
@@ -1189,15 +1400,22 @@ def context(self) -> Generator[TracimContext, None, None]:
             yield context
 
     def publish_messages_for_event(self, event_id: int) -> None:
+        self.publish_messages_for_events([event_id])
+
+    def publish_messages_for_events(self, event_ids: List[int]) -> None:
+        """Enqueue one job per batch of events instead of one job per event."""
         redis_connection = get_redis_connection(self._config)
         queue = get_rq_queue(redis_connection, RqQueueName.EVENT)
-        logger.debug(
-            self,
-            "publish event(id={}) asynchronously to RQ queue {}".format(
-                event_id, RqQueueName.EVENT
-            ),
-        )
-        queue.enqueue(self._publish_messages_for_event, event_id)
+        batch_size = self._config.JOBS__ASYNC__EVENTS_BATCH_SIZE
+        for offset in range(0, len(event_ids), batch_size):
+            batch_event_ids = event_ids[offset : offset + batch_size]
+            logger.debug(
+                self,
+                "publish events(ids={}) asynchronously to RQ queue {}".format(
+                    batch_event_ids, RqQueueName.EVENT
+                ),
+            )
+            queue.enqueue(self._publish_messages_for_events, batch_event_ids)
 
 
 class SyncLiveMessageBuilder(BaseLiveMessageBuilder):
@@ -1215,6 +1433,10 @@ def publish_messages_for_event(self, event_id: int) -> None:
         logger.debug(self, "publish event(id={}) synchronously".format(event_id))
         self._publish_messages_for_event(event_id)
 
+    def publish_messages_for_events(self, event_ids: List[int]) -> None:
+        logger.debug(self, "publish events(ids={}) synchronously".format(event_ids))
+        self._publish_messages_for_events(event_ids)
+
 
 class MessageHooks:
     @hookimpl
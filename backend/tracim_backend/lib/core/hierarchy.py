@@ -0,0 +1,402 @@
+from datetime import datetime
+import typing
+
+from sqlalchemy import event as sqlalchemy_event
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.session import SessionTransaction
+import zope.sqlalchemy
+
+from tracim_backend.lib.core.plugins import hookimpl
+from tracim_backend.lib.utils.logger import logger
+from tracim_backend.models.data import HIERARCHY_INDEX_BACKFILLED_SESSION_INFO_KEY
+from tracim_backend.models.data import HIERARCHY_INDEX_SESSION_INFO_KEY
+from tracim_backend.models.data import Content
+from tracim_backend.models.data import ContentClosure
+from tracim_backend.models.data import ContentRevisionRO
+from tracim_backend.models.data import HierarchyIndexBackfill
+from tracim_backend.models.data import Workspace
+from tracim_backend.models.data import WorkspaceClosure
+from tracim_backend.models.tracim_session import TracimSession
+
+if typing.TYPE_CHECKING:
+    # INFO - 2026-10-18 - import for type-checking only, ContentApi uses this module
+    from tracim_backend.lib.utils.request import TracimContext
+
+ClosureModel = typing.Union[typing.Type[ContentClosure], typing.Type[WorkspaceClosure]]
+# (ancestor_id, descendant_id, depth)
+ClosureRow = typing.Tuple[int, int, int]
+
+
+class HierarchyIndexLib:
+    """
+    Query and maintain the closure tables of the content and workspace trees
+    (ContentClosure and WorkspaceClosure).
+
+    Tables are maintained as soon as the index is enabled but are only used to query the
+    trees once filled by rebuild() (see is_hierarchy_index_enabled), contents and workspaces
+    created before are not indexed until then.
+
+    With those tables, getting all descendants of a node, checking if a node is an ancestor
+    of another one or computing the size of a subtree are indexed lookups instead
+    of recursive queries.
+    """
+
+    CHUNK_SIZE = 500
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def get_content_descendant_ids(self, content_id: int) -> typing.List[int]:
+        return self._get_descendant_ids(ContentClosure, content_id)
+
+    def is_content_ancestor(self, ancestor_id: int, descendant_id: int) -> bool:
+        return self._is_ancestor(ContentClosure, ancestor_id, descendant_id)
+
+    def get_content_subtree_size(self, content_id: int) -> int:
+        """Number of descendants of the content (content itself excluded)."""
+        return self._get_subtree_size(ContentClosure, content_id)
+
+    def get_workspace_descendant_ids(self, workspace_id: int) -> typing.List[int]:
+        return self._get_descendant_ids(WorkspaceClosure, workspace_id)
+
+    def is_workspace_ancestor(self, ancestor_id: int, descendant_id: int) -> bool:
+        return self._is_ancestor(WorkspaceClosure, ancestor_id, descendant_id)
+
+    def get_workspace_subtree_size(self, workspace_id: int) -> int:
+        """Number of descendants of the workspace (workspace itself excluded)."""
+        return self._get_subtree_size(WorkspaceClosure, workspace_id)
+
+    def update_content(self, content: Content) -> None:
+        """Add the content to the index or move it (with its subtree) under its current parent."""
+        self._set_parent(ContentClosure, content.id, content.parent_id, self._get_content_parent_id)
+
+    def update_workspace(self, workspace: Workspace) -> None:
+        """Add the workspace to the index or move it (with its subtree) under its current parent."""
+        self._set_parent(
+            WorkspaceClosure,
+            workspace.workspace_id,
+            workspace.parent_id,
+            self._get_workspace_parent_id,
+        )
+
+    def remove_content(self, content_id: int) -> None:
+        self._remove(ContentClosure, content_id)
+
+    def remove_workspace(self, workspace_id: int) -> None:
+        self._remove(WorkspaceClosure, workspace_id)
+
+    def rebuild(self) -> typing.Dict[str, int]:
+        """
+        Rebuild both closure tables from the content and workspace trees.
+        :return: number of rows inserted for each table
+        """
+        result = {}
+        for closure, parents in (
+            (ContentClosure, self._get_content_parents()),
+            (WorkspaceClosure, self._get_workspace_parents()),
+        ):
+            self._session.query(closure).delete(synchronize_session=False)
+            rows = self._compute_closure_rows(parents)
+            self._insert_rows(closure, rows)
+            self._session.merge(
+                HierarchyIndexBackfill(
+                    table_name=closure.__tablename__, completed=datetime.utcnow()
+                )
+            )
+            result[closure.__tablename__] = len(rows)
+            logger.info(
+                self, "Rebuilt {} with {} rows".format(closure.__tablename__, len(rows)),
+            )
+        self._session.flush()
+        # INFO - 2026-10-18 - the index can be used from now on by this session
+        self._session.info[HIERARCHY_INDEX_BACKFILLED_SESSION_INFO_KEY] = True
+        return result
+
+    def invalidate(self) -> None:
+        """Forget the backfills of both tables: the index is not used until rebuilt again."""
+        self._session.query(HierarchyIndexBackfill).delete(synchronize_session=False)
+        self._session.info.pop(HIERARCHY_INDEX_BACKFILLED_SESSION_INFO_KEY, None)
+
+    def verify(self) -> typing.Dict[str, typing.Tuple[int, int]]:
+        """
+        Compare both closure tables to the content and workspace trees.
+        :return: number of missing and of unexpected rows for each table
+        """
+        result = {}
+        for closure, parents in (
+            (ContentClosure, self._get_content_parents()),
+            (WorkspaceClosure, self._get_workspace_parents()),
+        ):
+            expected_rows = self._compute_closure_rows(parents)
+            indexed_rows = set(
+                self._session.query(closure.ancestor_id, closure.descendant_id, closure.depth)
+            )
+            result[closure.__tablename__] = (
+                len(expected_rows - indexed_rows),
+                len(indexed_rows - expected_rows),
+            )
+        return result
+
+    def _get_descendant_ids(self, closure: ClosureModel, node_id: int) -> typing.List[int]:
+        return [
+            row[0]
+            for row in self._session.query(closure.descendant_id).filter(
+                closure.ancestor_id == node_id, closure.depth > 0
+            )
+        ]
+
+    def _is_ancestor(self, closure: ClosureModel, ancestor_id: int, descendant_id: int) -> bool:
+        query = self._session.query(closure.depth).filter(
+            closure.ancestor_id == ancestor_id,
+            closure.descendant_id == descendant_id,
+            closure.depth > 0,
+        )
+        return self._session.query(query.exists()).scalar()
+
+    def _get_subtree_size(self, closure: ClosureModel, node_id: int) -> int:
+        return (
+            self._session.query(closure.descendant_id)
+            .filter(closure.ancestor_id == node_id, closure.depth > 0)
+            .count()
+        )
+
+    def _is_indexed(self, closure: ClosureModel, node_id: int) -> bool:
+        query = self._session.query(closure.depth).filter(
+            closure.ancestor_id == node_id, closure.descendant_id == node_id
+        )
+        return self._session.query(query.exists()).scalar()
+
+    def _set_parent(
+        self,
+        closure: ClosureModel,
+        node_id: int,
+        parent_id: typing.Optional[int],
+        get_parent_id: typing.Callable[[int], typing.Optional[int]],
+    ) -> None:
+        rows = (
+            self._session.query(closure.ancestor_id, closure.depth)
+            .filter(closure.descendant_id == node_id, closure.depth <= 1)
+            .all()
+        )
+        is_indexed = any(depth == 0 for _, depth in rows)
+        indexed_parent_id = next((ancestor_id for ancestor_id, depth in rows if depth == 1), None)
+        if is_indexed and indexed_parent_id == parent_id:
+            return
+
+        # INFO - 2026-10-18 - the parent may have been created in the same flush
+        # and not be indexed yet.
+        if parent_id is not None and not self._is_indexed(closure, parent_id):
+            self._set_parent(closure, parent_id, get_parent_id(parent_id), get_parent_id)
+
+        if is_indexed:
+            subtree = (
+                self._session.query(closure.descendant_id, closure.depth)
+                .filter(closure.ancestor_id == node_id)
+                .all()
+            )
+            old_ancestor_ids = [
+                row[0]
+                for row in self._session.query(closure.ancestor_id).filter(
+                    closure.descendant_id == node_id, closure.depth > 0
+                )
+            ]
+            subtree_ids = [descendant_id for descendant_id, _ in subtree]
+            for offset in range(0, len(subtree_ids), self.CHUNK_SIZE):
+                self._session.query(closure).filter(
+                    closure.ancestor_id.in_(old_ancestor_ids),
+                    closure.descendant_id.in_(subtree_ids[offset : offset + self.CHUNK_SIZE]),
+                ).delete(synchronize_session=False)
+        else:
+            subtree = [(node_id, 0)]
+            self._insert_rows(closure, [(node_id, node_id, 0)])
+
+        if parent_id is not None:
+            new_ancestors = (
+                self._session.query(closure.ancestor_id, closure.depth)
+                .filter(closure.descendant_id == parent_id)
+                .all()
+            )
+            self._insert_rows(
+                closure,
+                [
+                    (ancestor_id, descendant_id, ancestor_depth + descendant_depth + 1)
+                    for ancestor_id, ancestor_depth in new_ancestors
+                    for descendant_id, descendant_depth in subtree
+                ],
+            )
+
+    def _remove(self, closure: ClosureModel, node_id: int) -> None:
+        self._session.query(closure).filter(
+            (closure.ancestor_id == node_id) | (closure.descendant_id == node_id)
+        ).delete(synchronize_session=False)
+
+    def _insert_rows(self, closure: ClosureModel, rows: typing.Iterable[ClosureRow]) -> None:
+        rows = list(rows)
+        for offset in range(0, len(rows), self.CHUNK_SIZE):
+            self._session.execute(
+                closure.__table__.insert(),
+                [
+                    {"ancestor_id": ancestor_id, "descendant_id": descendant_id, "depth": depth}
+                    for ancestor_id, descendant_id, depth in rows[offset : offset + self.CHUNK_SIZE]
+                ],
+            )
+        if rows:
+            zope.sqlalchemy.mark_changed(self._session, keep_session=True)
+
+    def _get_content_parent_id(self, content_id: int) -> typing.Optional[int]:
+        return (
+            self._session.query(ContentRevisionRO.parent_id)
+            .join(Content, Content.cached_revision_id == ContentRevisionRO.revision_id)
+            .filter(Content.id == content_id)
+            .scalar()
+        )
+
+    def _get_workspace_parent_id(self, workspace_id: int) -> typing.Optional[int]:
+        return (
+            self._session.query(Workspace.parent_id)
+            .filter(Workspace.workspace_id == workspace_id)
+            .scalar()
+        )
+
+    def _get_content_parents(self) -> typing.Dict[int, typing.Optional[int]]:
+        return dict(
+            self._session.query(Content.id, ContentRevisionRO.parent_id).join(
+                ContentRevisionRO, Content.cached_revision_id == ContentRevisionRO.revision_id
+            )
+        )
+
+    def _get_workspace_parents(self) -> typing.Dict[int, typing.Optional[int]]:
+        return dict(self._session.query(Workspace.workspace_id, Workspace.parent_id))
+
+    @staticmethod
+    def _compute_closure_rows(
+        parents: typing.Dict[int, typing.Optional[int]]
+    ) -> typing.Set[ClosureRow]:
+        """Compute closure rows from a node_id: parent_id dict."""
+        ancestors = {}  # type: typing.Dict[int, typing.List[typing.Tuple[int, int]]]
+        for node_id in parents:
+            path = []
+            current_id = node_id
+            while current_id in parents and current_id not in ancestors and current_id not in path:
+                path.append(current_id)
+                current_id = parents[current_id]
+            current_ancestors = ancestors.get(current_id, [])
+            for path_node_id in reversed(path):
+                current_ancestors = [(path_node_id, 0)] + [
+                    (ancestor_id, depth + 1) for ancestor_id, depth in current_ancestors
+                ]
+                ancestors[path_node_id] = current_ancestors
+        return {
+            (ancestor_id, node_id, depth)
+            for node_id, node_ancestors in ancestors.items()
+            for ancestor_id, depth in node_ancestors
+        }
+
+
+def _may_have_moved(content: Content) -> bool:
+    """
+    Whether the parent of a modified content may have changed.
+    Every modification creates a new revision: its parent is compared with the one
+    of the replaced current revision.
+    """
+    history = inspect(content).attrs.current_revision.history
+    if not history.added:
+        return False
+    previous_revision = history.deleted[0] if history.deleted else None
+    if previous_revision is None:
+        return True
+    return previous_revision.parent_id != content.current_revision.parent_id
+
+
+class HierarchyIndexHooks:
+    """Keep the hierarchy index up to date from the database crud hooks."""
+
+    # pluggy uses this attribute to name the plugin
+    __name__ = "HierarchyIndexHooks"
+
+    @hookimpl
+    def on_context_session_created(
+        self, db_session: TracimSession, context: "TracimContext"
+    ) -> None:
+        db_session.info[HIERARCHY_INDEX_SESSION_INFO_KEY] = True
+
+    @hookimpl
+    def on_content_created(self, content: Content, context: "TracimContext") -> None:
+        HierarchyIndexLib(context.dbsession).update_content(content)
+
+    @hookimpl
+    def on_content_modified(self, content: Content, context: "TracimContext") -> None:
+        if _may_have_moved(content):
+            HierarchyIndexLib(context.dbsession).update_content(content)
+
+    @hookimpl
+    def on_content_deleted(self, content: Content, context: "TracimContext") -> None:
+        HierarchyIndexLib(context.dbsession).remove_content(content.id)
+
+    @hookimpl
+    def on_workspace_created(self, workspace: Workspace, context: "TracimContext") -> None:
+        HierarchyIndexLib(context.dbsession).update_workspace(workspace)
+
+    @hookimpl
+    def on_workspace_modified(self, workspace: Workspace, context: "TracimContext") -> None:
+        HierarchyIndexLib(context.dbsession).update_workspace(workspace)
+
+    @hookimpl
+    def on_workspace_deleted(self, workspace: Workspace, context: "TracimContext") -> None:
+        HierarchyIndexLib(context.dbsession).remove_workspace(workspace.workspace_id)
+
+
+class HierarchyIndexInvalidationHooks:
+    """
+    Registered while the hierarchy index is disabled: the index is not maintained anymore,
+    so its backfills are forgotten as soon as a tree changes and it is not used before
+    being rebuilt once enabled again.
+    """
+
+    # pluggy uses this attribute to name the plugin
+    __name__ = "HierarchyIndexInvalidationHooks"
+    # INFO - 2026-10-18 - backfills are only deleted once per transaction
+    SESSION_INFO_KEY = "hierarchy_index_invalidated"
+
+    @hookimpl
+    def on_context_session_created(
+        self, db_session: TracimSession, context: "TracimContext"
+    ) -> None:
+        def reset(session: TracimSession, transaction: SessionTransaction) -> None:
+            if transaction.parent is None:
+                session.info.pop(self.SESSION_INFO_KEY, None)
+
+        sqlalchemy_event.listen(db_session, "after_transaction_end", reset)
+
+    def _invalidate(self, context: "TracimContext") -> None:
+        session = context.dbsession
+        if session.info.get(self.SESSION_INFO_KEY):
+            return
+        HierarchyIndexLib(session).invalidate()
+        session.info[self.SESSION_INFO_KEY] = True
+
+    @hookimpl
+    def on_content_created(self, content: Content, context: "TracimContext") -> None:
+        self._invalidate(context)
+
+    @hookimpl
+    def on_content_modified(self, content: Content, context: "TracimContext") -> None:
+        if _may_have_moved(content):
+            self._invalidate(context)
+
+    @hookimpl
+    def on_content_deleted(self, content: Content, context: "TracimContext") -> None:
+        self._invalidate(context)
+
+    @hookimpl
+    def on_workspace_created(self, workspace: Workspace, context: "TracimContext") -> None:
+        self._invalidate(context)
+
+    @hookimpl
+    def on_workspace_modified(self, workspace: Workspace, context: "TracimContext") -> None:
+        self._invalidate(context)
+
+    @hookimpl
+    def on_workspace_deleted(self, workspace: Workspace, context: "TracimContext") -> None:
+        self._invalidate(context)
@@ -9,6 +9,7 @@
 # TODO - G.M - 2020-05-14 - Use default event "message" for TLM to be usable with
 # "onmessage" EventSource Object in javascript.
 from tracim_backend.config import CFG
+from tracim_backend.models.event import Event
 from tracim_backend.models.event import Message
 from tracim_backend.views.core_api.schemas import LiveMessageSchema
 
@@ -58,7 +59,6 @@ class LiveMessagesLib(object):
 
     def __init__(self, config: CFG,) -> None:
         self._blocking_publish = config.LIVE_MESSAGES__BLOCKING_PUBLISH
-        global _pub_control_create_lock
         global _grip_pub_control
         with _pub_control_create_lock:
             if not _grip_pub_control:
@@ -72,6 +72,23 @@ def __init__(self, config: CFG,) -> None:
     def message_as_dict(cls, message: Message):
         return cls._message_schema.dump(message).data
 
+    @classmethod
+    def unread_message_as_dict(cls, event: Event) -> typing.Dict[str, typing.Any]:
+        """Serialize the (not yet read) message of an event without creating it.
+
+        The result is the same for every receiver of the event, so it can be
+        computed once and published to all of them.
+        """
+        return cls._message_schema.dump(
+            {
+                "fields": event.fields,
+                "event_id": event.event_id,
+                "event_type": event.event_type,
+                "created": event.created,
+                "read": None,
+            }
+        ).data
+
     @classmethod
     def get_server_side_event_string(
         cls, event_type: ServerSideEventType, data: typing.Any, comment: str = ""
@@ -86,13 +103,32 @@ def publish_message_to_user(self, message: Message):
         channel_name = self.user_grip_channel(message.receiver_id)
         self.publish_dict(channel_name, message_as_dict=LiveMessagesLib.message_as_dict(message))
 
+    def publish_dict_to_users(
+        self, user_ids: typing.Iterable[int], message_as_dict: typing.Dict[str, typing.Any]
+    ) -> None:
+        """Publish the same message to several users.
+
+        The server side event is only serialized once and publishing is never
+        blocking per user: when blocking publish is configured we wait once for all
+        messages to be sent.
+        """
+        assert _grip_pub_control
+        event_string = str(
+            JsonServerSideEvent(data=message_as_dict, event_type=ServerSideEventType.TLM)
+        )
+        for user_id in user_ids:
+            _grip_pub_control.publish_http_stream(
+                self.user_grip_channel(user_id), event_string, blocking=False
+            )
+        if self._blocking_publish:
+            _grip_pub_control.wait_all_sent()
+
     def close_channel_connections(self, channel: str) -> None:
         _grip_pub_control.publish_http_stream(
             channel, HttpStreamFormat(close=True), blocking=self._blocking_publish
         )
 
     def publish_dict(self, channel_name: str, message_as_dict: typing.Dict[str, typing.Any]):
-        global _grip_pub_control
         assert _grip_pub_control
         _grip_pub_control.publish_http_stream(
             channel_name,
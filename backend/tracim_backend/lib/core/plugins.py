@@ -114,12 +114,27 @@ def init_plugin_manager(app_config: CFG) -> pluggy.PluginManager:
     from tracim_backend.lib.core.event import EventBuilder
     from tracim_backend.lib.core.event import EventPublisher
     from tracim_backend.lib.core.event import MessageHooks
+    from tracim_backend.lib.core.hierarchy import HierarchyIndexHooks
+    from tracim_backend.lib.core.hierarchy import HierarchyIndexInvalidationHooks
+    from tracim_backend.lib.preview_pregeneration.pregeneration import PreviewPregenerationHooks
+    from tracim_backend.lib.core.read_status import NewInformationCacheHooks
+    from tracim_backend.lib.core.receiver_cache import ReceiverIdsCacheHooks
+    from tracim_backend.lib.core.workspace_usage import WorkspaceUsageHooks
     from tracim_backend.lib.search.search_factory import SearchFactory
     import tracim_backend.lib.core.mention as mention
 
     plugin_manager.register(EventBuilder(app_config))
     plugin_manager.register(EventPublisher(app_config))
     plugin_manager.register(MessageHooks())
+    plugin_manager.register(ReceiverIdsCacheHooks(app_config))
+    plugin_manager.register(WorkspaceUsageHooks())
+    plugin_manager.register(NewInformationCacheHooks())
+    if app_config.HIERARCHY_INDEX__ENABLED:
+        plugin_manager.register(HierarchyIndexHooks())
+    else:
+        plugin_manager.register(HierarchyIndexInvalidationHooks())
+    if app_config.PREVIEW__PREGENERATION__ENABLED:
+        plugin_manager.register(PreviewPregenerationHooks())
     mention.register_tracim_plugin(plugin_manager)
     search_api = SearchFactory.get_search_lib(session=None, config=app_config, current_user=None)
     search_api.register_plugins(plugin_manager)
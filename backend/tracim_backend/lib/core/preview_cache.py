@@ -0,0 +1,199 @@
+from collections import namedtuple
+import fcntl
+import hashlib
+import os
+import time
+import typing
+
+import filelock
+from preview_generator.utils import LOCKFILE_EXTENSION
+
+from tracim_backend.config import CFG
+from tracim_backend.lib.utils.logger import logger
+
+PreviewCacheStats = namedtuple("PreviewCacheStats", ["file_count", "size", "oldest_access"])
+PreviewCacheEntry = namedtuple("PreviewCacheEntry", ["last_access", "size", "path"])
+
+# INFO - 2026-10-18 - preview_generator names all the files of a source file
+# "{md5 of the source file path}[...]"
+PREVIEW_HASH_LENGTH = 32
+
+
+class PreviewCacheLib(object):
+    """
+    Keep the preview cache (PREVIEW_CACHE_DIR) within its budgets.
+
+    Previews are removed by least recent use (access and modification time, the time of use is
+    updated by touch()) when the cache is bigger than PREVIEW__CACHE__MAX_SIZE or when they have
+    not been used for PREVIEW__CACHE__MAX_AGE. Removed previews are generated again on their next
+    use.
+    """
+
+    PRUNE_MARKER_FILE_NAME = ".last_prune"
+    PRUNE_LOCK_FILE_NAME = ".prune.lock"
+    # INFO - 2026-10-18 - previews used recently may be being generated or sent
+    MIN_AGE = 60
+
+    def __init__(self, config: CFG) -> None:
+        self._config = config
+        self.cache_path = config.PREVIEW_CACHE_DIR
+
+    @property
+    def has_budget(self) -> bool:
+        return bool(self._config.PREVIEW__CACHE__MAX_SIZE or self._config.PREVIEW__CACHE__MAX_AGE)
+
+    def touch(self, preview_path: str) -> None:
+        """Update the time of use of the given preview"""
+        try:
+            os.utime(preview_path)
+        except OSError:
+            logger.warning(self, "Cannot update time of use of preview {}".format(preview_path))
+
+    def get_stats(self) -> PreviewCacheStats:
+        previews, lock_files = self._get_entries()
+        return self._get_stats(previews + lock_files)
+
+    def prune(self, dry_run: bool = False) -> PreviewCacheStats:
+        """
+        Remove the previews which do not fit in the budgets.
+        :param dry_run: only compute what would be removed
+        :return: stats of the removed files
+        """
+        previews, lock_files = self._get_entries()
+        now = time.time()
+        to_remove = []
+        if self._config.PREVIEW__CACHE__MAX_AGE:
+            expiration = now - self._config.PREVIEW__CACHE__MAX_AGE
+            to_remove = [entry for entry in previews if entry.last_access < expiration]
+            previews = [entry for entry in previews if entry.last_access >= expiration]
+        if self._config.PREVIEW__CACHE__MAX_SIZE:
+            previews.sort()
+            size = sum(entry.size for entry in previews)
+            removed_count = 0
+            for entry in previews:
+                if size <= self._config.PREVIEW__CACHE__MAX_SIZE:
+                    break
+                if entry.last_access > now - self.MIN_AGE:
+                    break
+                size -= entry.size
+                removed_count += 1
+            to_remove.extend(previews[:removed_count])
+            previews = previews[removed_count:]
+        # INFO - 2026-10-18 - preview_generator creates one lock file per source file,
+        # they are removed with the last preview of their source file
+        kept_hashes = {os.path.basename(entry.path)[:PREVIEW_HASH_LENGTH] for entry in previews}
+        to_remove.extend(
+            entry
+            for entry in lock_files
+            if os.path.basename(entry.path)[:PREVIEW_HASH_LENGTH] not in kept_hashes
+            and entry.last_access < now - self.MIN_AGE
+        )
+        if not dry_run:
+            to_remove = [entry for entry in to_remove if self._remove(entry.path)]
+        return self._get_stats(to_remove)
+
+    def prune_if_due(self) -> None:
+        """
+        Prune the cache if it has not been done for PREVIEW__CACHE__PRUNE_INTERVAL by any process.
+        """
+        if not self._config.PREVIEW__CACHE__PRUNE_INTERVAL or not self.has_budget:
+            return
+        if not self._is_prune_due():
+            return
+        try:
+            with filelock.FileLock(
+                os.path.join(self.cache_path, self.PRUNE_LOCK_FILE_NAME), timeout=0
+            ):
+                if not self._is_prune_due():
+                    return
+                removed = self.prune()
+                with open(os.path.join(self.cache_path, self.PRUNE_MARKER_FILE_NAME), "a"):
+                    os.utime(os.path.join(self.cache_path, self.PRUNE_MARKER_FILE_NAME))
+        except filelock.Timeout:
+            # INFO - 2026-10-18 - another process is pruning the cache
+            return
+        logger.info(
+            self,
+            "Preview cache pruned: {} files removed ({} bytes)".format(
+                removed.file_count, removed.size
+            ),
+        )
+
+    def delete_previews(self, source_file_path: str) -> int:
+        """
+        Delete all the previews of the given file.
+        :param source_file_path: path of the file given to preview_generator
+        :return: number of deleted files
+        """
+        source_hash = self._get_hash(source_file_path)
+        # INFO - 2026-10-18 - jpeg previews of documents are generated from their pdf preview
+        pdf_preview_hash = self._get_hash(os.path.join(self.cache_path, source_hash + ".pdf"))
+        deleted_count = 0
+        with os.scandir(self.cache_path) as dir_entries:
+            for dir_entry in dir_entries:
+                if dir_entry.name[:PREVIEW_HASH_LENGTH] in (source_hash, pdf_preview_hash):
+                    deleted_count += self._remove(dir_entry.path)
+        return deleted_count
+
+    def _is_prune_due(self) -> bool:
+        try:
+            last_prune = os.stat(
+                os.path.join(self.cache_path, self.PRUNE_MARKER_FILE_NAME)
+            ).st_mtime
+        except FileNotFoundError:
+            return True
+        return time.time() - last_prune >= self._config.PREVIEW__CACHE__PRUNE_INTERVAL
+
+    def _get_entries(
+        self,
+    ) -> typing.Tuple[typing.List[PreviewCacheEntry], typing.List[PreviewCacheEntry]]:
+        """
+        :return: previews and lock files of the cache
+        """
+        previews = []
+        lock_files = []
+        with os.scandir(self.cache_path) as dir_entries:
+            for dir_entry in dir_entries:
+                if dir_entry.name.startswith("."):
+                    continue
+                try:
+                    stat = dir_entry.stat()
+                except FileNotFoundError:
+                    continue
+                entry = PreviewCacheEntry(
+                    max(stat.st_atime, stat.st_mtime), stat.st_size, dir_entry.path
+                )
+                if dir_entry.name.endswith(LOCKFILE_EXTENSION):
+                    lock_files.append(entry)
+                else:
+                    previews.append(entry)
+        return previews, lock_files
+
+    def _get_stats(self, entries: typing.List[PreviewCacheEntry]) -> PreviewCacheStats:
+        return PreviewCacheStats(
+            file_count=len(entries),
+            size=sum(entry.size for entry in entries),
+            oldest_access=min((entry.last_access for entry in entries), default=None),
+        )
+
+    def _get_hash(self, file_path: str) -> str:
+        return hashlib.md5(file_path.encode("utf-8")).hexdigest()
+
+    def _remove(self, file_path: str) -> bool:
+        """
+        Remove the file, lock files are only removed when they are not locked.
+        :return: whether the file has been removed
+        """
+        try:
+            if not file_path.endswith(LOCKFILE_EXTENSION):
+                os.unlink(file_path)
+                return True
+            with open(file_path, "rb") as lock_file:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    return False
+                os.unlink(file_path)
+                return True
+        except FileNotFoundError:
+            return False
@@ -0,0 +1,182 @@
+from collections import namedtuple
+from contextlib import contextmanager
+import typing
+
+from depot.fields.upload import UploadedFile
+from preview_generator.exception import UnsupportedMimeType
+from sqlalchemy import bindparam
+from sqlalchemy.orm.attributes import set_committed_value
+import zope.sqlalchemy
+
+from tracim_backend.config import CFG
+from tracim_backend.exceptions import CannotGetDepotFileDepotCorrupted
+from tracim_backend.lib.core.storage import StorageLib
+from tracim_backend.lib.utils.logger import logger
+from tracim_backend.models.data import ContentRevisionRO
+from tracim_backend.models.tracim_session import TracimSession
+
+RevisionPreviewMetadata = namedtuple(
+    "RevisionPreviewMetadata", ["mimetype", "page_nb", "has_pdf", "has_jpeg"]
+)
+# INFO - 2026-10-18 - metadata of revisions without file or whose file cannot be read
+NO_PREVIEW_METADATA = RevisionPreviewMetadata(None, None, False, False)
+
+PREVIEW_METADATA_COLUMNS = RevisionPreviewMetadata(
+    "preview_mimetype", "preview_page_nb", "preview_has_pdf", "preview_has_jpeg"
+)
+
+
+class PreviewMetadataLib(object):
+    """
+    Preview capability, page number and mimetype of revision files.
+
+    They are computed from the file once per revision then stored in the revision, as computing
+    them needs the whole file (downloaded from the storage when it is not local).
+    """
+
+    CHUNK_SIZE = 100
+
+    def __init__(self, session: TracimSession, config: CFG) -> None:
+        self._session = session
+        self._config = config
+        self._storage_lib = None  # type: typing.Optional[StorageLib]
+
+    @property
+    def storage_lib(self) -> StorageLib:
+        if not self._storage_lib:
+            self._storage_lib = StorageLib(self._config)
+        return self._storage_lib
+
+    @staticmethod
+    def get_stored(revision: ContentRevisionRO) -> typing.Optional[RevisionPreviewMetadata]:
+        """:return: the stored metadata of the revision, None if not computed yet"""
+        if not revision.depot_file:
+            return NO_PREVIEW_METADATA
+        if revision.preview_has_jpeg is None:
+            return None
+        return RevisionPreviewMetadata(
+            *(getattr(revision, column_name) for column_name in PREVIEW_METADATA_COLUMNS)
+        )
+
+    def get(self, revision: ContentRevisionRO) -> RevisionPreviewMetadata:
+        """
+        :return: the metadata of the revision, computed and stored if not done yet
+        """
+        metadata = self.get_stored(revision)
+        if metadata:
+            return metadata
+        metadata, complete = self.compute(revision.depot_file, revision.file_extension)
+        if complete:
+            self._store({revision.revision_id: metadata})
+            for column_name, value in zip(PREVIEW_METADATA_COLUMNS, metadata):
+                set_committed_value(revision, column_name, value)
+        return metadata
+
+    def compute(
+        self, depot_file: UploadedFile, file_extension: str
+    ) -> typing.Tuple[RevisionPreviewMetadata, bool]:
+        """
+        Read metadata from the file.
+        :return: metadata and whether they are complete: false if the file cannot be read or
+        if the preview generator failed unexpectedly, such metadata should not be stored.
+        """
+        try:
+            with self._get_filepath(depot_file, file_extension) as file_path:
+                values = []
+                complete = True
+                for method_name, unsupported_value in (
+                    ("get_mimetype", None),
+                    ("get_page_nb", None),
+                    ("has_pdf_preview", False),
+                    ("has_jpeg_preview", False),
+                ):
+                    try:
+                        values.append(
+                            getattr(self.storage_lib.preview_manager, method_name)(
+                                file_path, file_ext=file_extension
+                            )
+                        )
+                    except UnsupportedMimeType:
+                        values.append(unsupported_value)
+                    except Exception:
+                        logger.warning(
+                            self, "Unknown Preview_Generator Exception Occured", exc_info=True
+                        )
+                        values.append(unsupported_value)
+                        complete = False
+                return RevisionPreviewMetadata(*values), complete
+        except CannotGetDepotFileDepotCorrupted:
+            logger.warning(
+                self, "Unable to get revision filepath, depot is corrupted", exc_info=True
+            )
+            return NO_PREVIEW_METADATA, False
+
+    def backfill(self, only_missing: bool = True) -> int:
+        """
+        Compute and store metadata of revisions with a file.
+        :param only_missing: only compute metadata not stored yet
+        :return: number of revisions whose metadata has been stored
+        """
+        query = self._session.query(
+            ContentRevisionRO.revision_id,
+            ContentRevisionRO.depot_file,
+            ContentRevisionRO.file_extension,
+        ).filter(ContentRevisionRO.depot_file.isnot(None))
+        if only_missing:
+            query = query.filter(ContentRevisionRO.preview_has_jpeg.is_(None))
+        stored_count = 0
+        last_revision_id = 0
+        while True:
+            rows = (
+                query.filter(ContentRevisionRO.revision_id > last_revision_id)
+                .order_by(ContentRevisionRO.revision_id)
+                .limit(self.CHUNK_SIZE)
+                .all()
+            )
+            if not rows:
+                break
+            last_revision_id = rows[-1].revision_id
+            metadata_by_revision_id = {}
+            for revision_id, depot_file, file_extension in rows:
+                metadata, complete = self.compute(depot_file, file_extension)
+                if complete:
+                    metadata_by_revision_id[revision_id] = metadata
+            self._store(metadata_by_revision_id)
+            stored_count += len(metadata_by_revision_id)
+        return stored_count
+
+    def _store(self, metadata_by_revision_id: typing.Dict[int, RevisionPreviewMetadata]) -> None:
+        if not metadata_by_revision_id:
+            return
+        table = ContentRevisionRO.__table__
+        # INFO - 2026-10-18 - core update: revisions are not modified from the ORM point of
+        # view, so no content modification event is created.
+        self._session.execute(
+            table.update()
+            .where(table.c.revision_id == bindparam("_revision_id"))
+            .values(
+                {
+                    column_name: bindparam("_{}".format(column_name))
+                    for column_name in PREVIEW_METADATA_COLUMNS
+                }
+            ),
+            [
+                dict(
+                    _revision_id=revision_id,
+                    **{
+                        "_{}".format(column_name): value
+                        for column_name, value in zip(PREVIEW_METADATA_COLUMNS, metadata)
+                    }
+                )
+                for revision_id, metadata in metadata_by_revision_id.items()
+            ],
+        )
+        zope.sqlalchemy.mark_changed(self._session, keep_session=True)
+
+    @contextmanager
+    def _get_filepath(
+        self, depot_file: UploadedFile, file_extension: str
+    ) -> typing.Generator[str, None, None]:
+        yield from self.storage_lib.get_filepath(
+            depot_file, file_extension=file_extension, temporary_prefix="tracim-revision-content"
+        )
@@ -0,0 +1,85 @@
+import typing
+
+from tracim_backend.lib.core.plugins import hookimpl
+from tracim_backend.models.data import Content
+from tracim_backend.models.tracim_session import TracimSession
+
+if typing.TYPE_CHECKING:
+    # INFO - 2026-10-18 - import for type-checking only, ContentApi uses this module
+    from tracim_backend.lib.utils.request import TracimContext
+
+
+class NewInformationCache:
+    """
+    Cache of "has new information" statuses (content or one of its descendants not read)
+    per user and content id, kept in the session for its lifetime.
+
+    Statuses of a user are dropped when they mark contents as read or unread
+    (see ContentApi.mark_read), all statuses when a content is created, modified or deleted
+    (see NewInformationCacheHooks).
+    """
+
+    SESSION_INFO_KEY = "tracim_new_information_cache"
+
+    def __init__(self, session: TracimSession) -> None:
+        self._session = session
+
+    def _get_user_entries(self, user_id: int) -> typing.Dict[int, bool]:
+        entries = self._session.info.setdefault(self.SESSION_INFO_KEY, {})
+        return entries.setdefault(user_id, {})
+
+    def get(
+        self, user_id: int, content_ids: typing.Iterable[int]
+    ) -> typing.Tuple[typing.Set[int], typing.List[int]]:
+        """
+        :return: ids of cached contents having new information, ids of contents not cached
+        """
+        user_entries = self._get_user_entries(user_id)
+        with_new_information = set()
+        missing_ids = []
+        for content_id in content_ids:
+            try:
+                if user_entries[content_id]:
+                    with_new_information.add(content_id)
+            except KeyError:
+                missing_ids.append(content_id)
+        return with_new_information, missing_ids
+
+    def set(
+        self,
+        user_id: int,
+        content_ids: typing.Iterable[int],
+        with_new_information: typing.Set[int],
+    ) -> None:
+        user_entries = self._get_user_entries(user_id)
+        for content_id in content_ids:
+            user_entries[content_id] = content_id in with_new_information
+
+    def invalidate(self, user_id: typing.Optional[int] = None) -> None:
+        """Drop statuses of given user, or of every user if None."""
+        entries = self._session.info.get(self.SESSION_INFO_KEY)
+        if not entries:
+            return
+        if user_id is None:
+            entries.clear()
+        else:
+            entries.pop(user_id, None)
+
+
+class NewInformationCacheHooks:
+    """Invalidate NewInformationCache from the database crud hooks."""
+
+    # pluggy uses this attribute to name the plugin
+    __name__ = "NewInformationCacheHooks"
+
+    @hookimpl
+    def on_content_created(self, content: Content, context: "TracimContext") -> None:
+        NewInformationCache(context.dbsession).invalidate()
+
+    @hookimpl
+    def on_content_modified(self, content: Content, context: "TracimContext") -> None:
+        NewInformationCache(context.dbsession).invalidate()
+
+    @hookimpl
+    def on_content_deleted(self, content: Content, context: "TracimContext") -> None:
+        NewInformationCache(context.dbsession).invalidate()
@@ -0,0 +1,216 @@
+import collections
+import threading
+import time
+import typing
+
+import redis
+from sqlalchemy import event as sqlalchemy_event
+
+from tracim_backend.config import CFG
+from tracim_backend.lib.core.plugins import hookimpl
+from tracim_backend.lib.rq import get_redis_connection
+from tracim_backend.lib.utils.logger import logger
+from tracim_backend.lib.utils.request import TracimContext
+from tracim_backend.models.auth import User
+from tracim_backend.models.data import UserRoleInWorkspace
+
+# (scope versions, creation time, user ids)
+CacheEntry = typing.Tuple[typing.Tuple[int, ...], float, typing.List[int]]
+
+# NOTE - 2026-10-18 - Those are process-wide: cached entries are shared by every
+# session/request/job of the process. Entries are only valid for the versions of
+# their scopes they were computed with, see ReceiverIdsCache.
+_entries = {}  # type: typing.Dict[str, CacheEntry]
+_local_versions = collections.defaultdict(int)  # type: typing.DefaultDict[str, int]
+_counters = {"hits": 0, "misses": 0}
+_redis_connections = {}  # type: typing.Dict[typing.Tuple[str, int, int], redis.Redis]
+_lock = threading.Lock()
+
+
+def _get_shared_redis_connection(config: CFG) -> redis.Redis:
+    """Reuse the same redis client (and its connection pool) for the whole process."""
+    key = (
+        config.JOBS__ASYNC__REDIS__HOST,
+        config.JOBS__ASYNC__REDIS__PORT,
+        config.JOBS__ASYNC__REDIS__DB,
+    )
+    with _lock:
+        if key not in _redis_connections:
+            _redis_connections[key] = get_redis_connection(config)
+        return _redis_connections[key]
+
+
+class ReceiverIdsCache:
+    """
+    Process-wide cache of user id sets used to compute live messages receivers
+    (administrators, members of a workspace, all users…).
+
+    Each cached set depends on one or more scopes (all users, one workspace).
+    A scope has a version which is incremented each time something changes in it
+    (see ReceiverIdsCacheHooks), an entry computed with older versions is never returned.
+    Versions are kept in redis when jobs are processed asynchronously so that the
+    invalidations made by the web processes are seen by the RQ workers, and in
+    process memory otherwise.
+    """
+
+    USERS_SCOPE = "users"
+    REDIS_VERSION_KEY_PREFIX = "tracim:receiver_ids_cache:version:"
+    # INFO - 2026-10-18 - there is one entry per workspace, expired entries are swept
+    # then the oldest ones dropped when this count is reached
+    MAX_ENTRIES = 10000
+
+    def __init__(self, config: CFG) -> None:
+        self._enabled = config.LIVE_MESSAGES__RECEIVER_CACHE__ENABLED
+        self._ttl = config.LIVE_MESSAGES__RECEIVER_CACHE__TTL
+        self._redis_connection = None
+        if self._enabled and config.JOBS__PROCESSING_MODE == CFG.CST.ASYNC:
+            self._redis_connection = _get_shared_redis_connection(config)
+
+    @staticmethod
+    def workspace_scope(workspace_id: int) -> str:
+        return "workspace_{}".format(workspace_id)
+
+    def get_versions(self, scopes: typing.Iterable[str]) -> typing.Tuple[int, ...]:
+        scopes = list(scopes)
+        if self._redis_connection:
+            values = self._redis_connection.mget(
+                [self.REDIS_VERSION_KEY_PREFIX + scope for scope in scopes]
+            )
+            return tuple(int(value or 0) for value in values)
+        with _lock:
+            return tuple(_local_versions[scope] for scope in scopes)
+
+    def invalidate(self, *scopes: str) -> None:
+        """Increment the version of given scopes, making every entry depending on them stale."""
+        if not self._enabled:
+            return
+        logger.debug(self, "Invalidating receiver ids cache scopes {}".format(scopes))
+        if self._redis_connection:
+            pipeline = self._redis_connection.pipeline()
+            for scope in scopes:
+                pipeline.incr(self.REDIS_VERSION_KEY_PREFIX + scope)
+            pipeline.execute()
+            return
+        with _lock:
+            for scope in scopes:
+                _local_versions[scope] += 1
+
+    def get_or_fetch(
+        self,
+        key: str,
+        scopes: typing.Iterable[str],
+        fetch_from_db: typing.Callable[[], typing.Iterable[int]],
+    ) -> typing.List[int]:
+        """Return the cached ids for key if still valid, else fetch and cache them."""
+        if not self._enabled:
+            return list(fetch_from_db())
+        # INFO - 2026-10-18 - versions are read before fetching: if an invalidation happens
+        # while fetching, the stored entry will be stale at next lookup.
+        versions = self.get_versions(scopes)
+        now = time.monotonic()
+        entry = _entries.get(key)
+        if entry and entry[0] == versions and now - entry[1] < self._ttl:
+            with _lock:
+                _counters["hits"] += 1
+            return list(entry[2])
+        ids = list(fetch_from_db())
+        with _lock:
+            _counters["misses"] += 1
+            if key not in _entries and len(_entries) >= self.MAX_ENTRIES:
+                self._sweep(now)
+            _entries[key] = (versions, now, ids)
+        return list(ids)
+
+    def _sweep(self, now: float) -> None:
+        """
+        Drop expired entries, then the oldest ones if the cache is still full.
+        _lock must be held.
+        """
+        for key in [key for key, entry in _entries.items() if now - entry[1] >= self._ttl]:
+            del _entries[key]
+        overflow = len(_entries) - self.MAX_ENTRIES + 1
+        if overflow > 0:
+            oldest_keys = sorted(_entries, key=lambda key: _entries[key][1])[:overflow]
+            for key in oldest_keys:
+                del _entries[key]
+
+    @staticmethod
+    def get_stats() -> typing.Dict[str, int]:
+        with _lock:
+            return {
+                "hits": _counters["hits"],
+                "misses": _counters["misses"],
+                "entries": len(_entries),
+            }
+
+    @staticmethod
+    def clear() -> None:
+        """Drop every cached entry and reset counters and local versions."""
+        with _lock:
+            _entries.clear()
+            _local_versions.clear()
+            _counters["hits"] = 0
+            _counters["misses"] = 0
+
+
+class ReceiverIdsCacheHooks:
+    """Invalidate ReceiverIdsCache scopes from the database crud hooks."""
+
+    # pluggy uses this attribute to name the plugin
+    __name__ = "ReceiverIdsCacheHooks"
+    # INFO - 2026-10-18 - scopes to invalidate again once the transaction of the session
+    # is committed
+    SESSION_INFO_KEY = "receiver_ids_cache_scopes"
+
+    def __init__(self, config: CFG) -> None:
+        self._config = config
+
+    def _invalidate(self, context: TracimContext, *scopes: str) -> None:
+        cache = ReceiverIdsCache(self._config)
+        cache.invalidate(*scopes)
+
+        # INFO - 2026-10-18 - hooks are called on flush: other processes may cache
+        # the not yet committed state in between, invalidate again once committed.
+        # Only one listener is registered per transaction, it invalidates every
+        # scope modified by the transaction.
+        session = context.dbsession
+        pending_scopes = session.info.get(self.SESSION_INFO_KEY)
+        if pending_scopes is None:
+            pending_scopes = session.info[self.SESSION_INFO_KEY] = set()
+
+            def invalidate_after_commit(session) -> None:
+                committed_scopes = session.info.pop(self.SESSION_INFO_KEY, set())
+                cache.invalidate(*committed_scopes)
+
+            sqlalchemy_event.listen(session, "after_commit", invalidate_after_commit, once=True)
+        pending_scopes.update(scopes)
+
+    @hookimpl
+    def on_user_created(self, user: User, context: TracimContext) -> None:
+        self._invalidate(context, ReceiverIdsCache.USERS_SCOPE)
+
+    @hookimpl
+    def on_user_modified(self, user: User, context: TracimContext) -> None:
+        self._invalidate(context, ReceiverIdsCache.USERS_SCOPE)
+
+    @hookimpl
+    def on_user_deleted(self, user: User, context: TracimContext) -> None:
+        self._invalidate(context, ReceiverIdsCache.USERS_SCOPE)
+
+    @hookimpl
+    def on_user_role_in_workspace_created(
+        self, role: UserRoleInWorkspace, context: TracimContext
+    ) -> None:
+        self._invalidate(context, ReceiverIdsCache.workspace_scope(role.workspace_id))
+
+    @hookimpl
+    def on_user_role_in_workspace_modified(
+        self, role: UserRoleInWorkspace, context: TracimContext
+    ) -> None:
+        self._invalidate(context, ReceiverIdsCache.workspace_scope(role.workspace_id))
+
+    @hookimpl
+    def on_user_role_in_workspace_deleted(
+        self, role: UserRoleInWorkspace, context: TracimContext
+    ) -> None:
+        self._invalidate(context, ReceiverIdsCache.workspace_scope(role.workspace_id))
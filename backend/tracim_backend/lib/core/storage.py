@@ -1,6 +1,7 @@
 from contextlib import contextmanager
 from datetime import datetime
 import os
+import shutil
 import tempfile
 import typing
 
@@ -21,6 +22,8 @@
 from tracim_backend.exceptions import TracimFileNotFound
 from tracim_backend.exceptions import TracimUnavailablePreviewType
 from tracim_backend.exceptions import UnavailablePreview
+from tracim_backend.lib.core.preview_cache import PreviewCacheLib
+from tracim_backend.lib.utils.file_cache import LocalFileCache
 from tracim_backend.lib.utils.logger import logger
 
 TEMPORARY_PREFIX = "tracim-revision-content"
@@ -37,6 +40,7 @@ def __init__(self, app_config: CFG) -> None:
             app_config.UPLOADED_FILES__STORAGE__STORAGE_NAME
         )
         self.preview_manager = PreviewManager(app_config.PREVIEW_CACHE_DIR, create_folder=True)
+        self.preview_cache_lib = PreviewCacheLib(app_config)
 
     def _get_depot_file(self, depot_file) -> StoredFile:
         if depot_file is None:
@@ -107,6 +111,36 @@ def get_filepath(
                 depot_stored_file, file_extension=file_extension, prefix=temporary_prefix
             )
 
+    def get_preview_source_filepath(
+        self,
+        depot_file: UploadedFile,
+        file_extension: str = "",
+        temporary_prefix: str = TEMPORARY_PREFIX,
+    ) -> str:
+        """
+        Get the filepath given by get_filepath() without materializing the file, previews of
+        the depot file are cached by preview_generator according to this path.
+        """
+        if self.app_config.UPLOADED_FILES__STORAGE__STORAGE_TYPE == DepotFileStorageType.LOCAL.slug:
+            return self._get_depot_file(depot_file)._file_path
+        if self.app_config.UPLOADED_FILES__STORAGE__CACHE__MAX_SIZE == 0:
+            return self._get_temporary_filepath(
+                depot_file.file_id, temporary_prefix, file_extension
+            )
+        return os.path.join(
+            self.app_config.UPLOADED_FILES__STORAGE__CACHE__PATH,
+            self._get_cache_key(depot_file.file_id, file_extension),
+        )
+
+    def delete_previews(self, depot_file: UploadedFile, file_extension: str = "") -> int:
+        """
+        Delete all the cached previews of the depot file.
+        :return: number of deleted files
+        """
+        return self.preview_cache_lib.delete_previews(
+            self.get_preview_source_filepath(depot_file, file_extension)
+        )
+
     @contextmanager
     def preview_generator_filepath_context(
         self, depot_file: UploadedFile, original_file_extension: str
@@ -158,6 +192,7 @@ def get_jpeg_preview(
         height: int = None,
         force_download: bool = None,
         last_modified: datetime = None,
+        page_nb: typing.Optional[int] = None,
     ) -> HapicFile:
         """
         Helper to get HapicFile jpeg preview for controller
@@ -170,6 +205,7 @@ def get_jpeg_preview(
                 depot_file=depot_file,
                 file_path=file_path,
                 original_file_extension=original_file_extension,
+                page_nb=page_nb,
             )
             jpg_preview_path = self.preview_manager.get_jpeg_preview(
                 file_path,
@@ -180,6 +216,7 @@ def get_jpeg_preview(
             )
         # INFO - G.M - 2019-08-08 - use given filename in all case but none or
         # "raw", where filename returned will a custom one.
+        self._use_preview(jpg_preview_path)
         if not filename or filename == "raw":
             filename = default_filename
         return HapicFile(
@@ -198,6 +235,7 @@ def get_one_page_pdf_preview(
         original_file_extension: str = "",
         force_download: bool = None,
         last_modified: datetime = None,
+        page_nb: typing.Optional[int] = None,
     ) -> HapicFile:
         """
         Helper to get one page pdf preview for controller
@@ -210,12 +248,14 @@ def get_one_page_pdf_preview(
                 depot_file=depot_file,
                 file_path=file_path,
                 original_file_extension=original_file_extension,
+                page_nb=page_nb,
             )
             pdf_preview_path = self.preview_manager.get_pdf_preview(
                 file_path, page=preview_page_number, file_ext=original_file_extension
             )
         # INFO - G.M - 2019-08-08 - use given filename in all case but none or
         # "raw", where filename returned will a custom one.
+        self._use_preview(pdf_preview_path)
         if not filename or filename == "raw":
             filename = default_filename
         return HapicFile(
@@ -245,6 +285,7 @@ def get_full_pdf_preview(
             )
         # INFO - G.M - 2019-08-08 - use given filename in all case but none or
         # "raw", where filename returned will a custom one.
+        self._use_preview(pdf_preview_path)
         if not filename or filename == "raw":
             filename = default_filename
         return HapicFile(
@@ -254,6 +295,13 @@ def get_full_pdf_preview(
             last_modified=last_modified,
         )
 
+    def _use_preview(self, preview_path: str) -> None:
+        """
+        Record the use of the preview for the preview cache eviction, prune the cache if needed.
+        """
+        self.preview_cache_lib.touch(preview_path)
+        self.preview_cache_lib.prune_if_due()
+
     def _preview_manager_page_format(self, page_number: int) -> int:
         """
         Convert page real number of page(begin at 1) to preview_manager page
@@ -267,16 +315,18 @@ def page_number_validator(
         file_path: str,
         original_file_extension: str,
         depot_file: UploadedFile,
+        page_nb: typing.Optional[int] = None,
     ) -> int:
         """
         Validate if the given page number exist in the given content
+        :param page_nb: page number of the content if already known, read from the file if None
         """
         preview_generator_page_number = self._preview_manager_page_format(
             preview_generator_page_number
         )
-        if preview_generator_page_number >= self.preview_manager.get_page_nb(
-            file_path, file_ext=original_file_extension
-        ):
+        if page_nb is None:
+            page_nb = self.preview_manager.get_page_nb(file_path, file_ext=original_file_extension)
+        if preview_generator_page_number >= page_nb:
             raise PageOfPreviewNotFound(
                 "page {page_number} of depot_file {file_id} does not exist".format(
                     page_number=preview_generator_page_number, file_id=depot_file.file_id
@@ -292,43 +342,59 @@ def _get_valid_content_filepath(
     ) -> typing.Generator[int, None, None]:
         """
         Generic way to get content filepath for all depot backend.
+        Content is kept in the local file cache, or in a temporary file if the cache is
+        disabled (UPLOADED_FILES__STORAGE__CACHE__MAX_SIZE is 0).
         :param depot_stored_file: content as depot StoredFile
         :param file_extension: extension of the file we expect
         :return: content filepath
         """
-
-        file_label = "{prefix}-{file_id}".format(prefix=prefix, file_id=depot_stored_file.file_id)
-        base_path = "{temp_dir}/{file_label}".format(
-            temp_dir=tempfile.gettempdir(), file_label=file_label,
+        if self.app_config.UPLOADED_FILES__STORAGE__CACHE__MAX_SIZE == 0:
+            yield from self._get_valid_content_temporary_filepath(
+                depot_stored_file, prefix=prefix, file_extension=file_extension
+            )
+            return
+        file_cache = LocalFileCache(
+            self.app_config.UPLOADED_FILES__STORAGE__CACHE__PATH,
+            max_size=self.app_config.UPLOADED_FILES__STORAGE__CACHE__MAX_SIZE,
+            max_count=self.app_config.UPLOADED_FILES__STORAGE__CACHE__MAX_COUNT,
         )
+        # INFO - 2026-10-18 - depot files are never modified, their id is a valid cache key.
+        # The path of an entry does not change between calls, so the preview_generator cache
+        # (based on the file path) is reused.
+        with file_cache.get_filepath(
+            self._get_cache_key(depot_stored_file.file_id, file_extension),
+            fill=lambda cache_file: shutil.copyfileobj(depot_stored_file, cache_file),
+        ) as file_path:
+            yield file_path
 
-        file_path = "{base_path}{file_extension}".format(
-            base_path=base_path, file_extension=file_extension,
-        )
+    def _get_valid_content_temporary_filepath(
+        self,
+        depot_stored_file: StoredFile,
+        prefix: str = "tracim-undefined",
+        file_extension: str = "",
+    ) -> typing.Generator[int, None, None]:
+        """
+        Get content filepath by writing the content to a temporary file, removed after use.
+        :param depot_stored_file: content as depot StoredFile
+        :param file_extension: extension of the file we expect
+        :return: content filepath
+        """
 
-        lockfile_path = "{base_path}{file_extension}".format(
-            base_path=base_path, file_extension=".lock",
-        )
-        # FIXME - G.M - 2020-01-05 - This will create a lockfile for
-        # each depot file we do need (each content revision)
-        # This file will NOT be removed at the end on Linux (FileLock use flock):
-        # see  https://stackoverflow.com/questions/17708885/flock-removing-locked-file-without-race-condition
-        # some investigation needs to be conducted to see if another solution is possible avoiding creating
-        # too many files. See https://github.com/tracim/tracim/issues/4014
+        file_path = self._get_temporary_filepath(depot_stored_file.file_id, prefix, file_extension)
+        lockfile_path = self._get_temporary_filepath(depot_stored_file.file_id, prefix, ".lock")
+        # INFO - 2026-10-18 - This creates a lockfile for each depot file (each content
+        # revision) which is NOT removed at the end on Linux (FileLock use flock), see
+        # https://github.com/tracim/tracim/issues/4014. LocalFileCache does not have this
+        # issue, this is only used when the cache is disabled.
         with filelock.FileLock(lockfile_path):
             try:
-                # HACK - G.M - 2020-01-05 - This mechanism is inefficient because it
-                # generates a temporary file each time
-                # Improvements need to be made in preview_generator itself
-                # to handle more properly these issues.
-                # We do rely on consistent path based on gettemdir(),
-                # normally /tmp to give consistent path, this is a quick fix which does
-                # not need any change in preview-generator.
+                # INFO - 2026-10-18 - We do rely on consistent path based on gettemdir(),
+                # normally /tmp to give consistent path to preview_generator.
                 # note: this base path is configurable through an envirnoment var according
                 # to the Python doc:
                 # https://docs.python.org/3/library/tempfile.html#tempfile.gettempdir
                 with open(file_path, "wb",) as tmp:
-                    tmp.write(depot_stored_file.read())
+                    shutil.copyfileobj(depot_stored_file, tmp)
                     tmp.flush()
                     yield file_path
             finally:
@@ -337,6 +403,17 @@ def _get_valid_content_filepath(
                 except FileNotFoundError:
                     pass
 
+    def _get_cache_key(self, file_id: str, file_extension: str) -> str:
+        return "{file_id}{file_extension}".format(file_id=file_id, file_extension=file_extension)
+
+    def _get_temporary_filepath(self, file_id: str, prefix: str, file_extension: str) -> str:
+        return "{temp_dir}/{prefix}-{file_id}{file_extension}".format(
+            temp_dir=tempfile.gettempdir(),
+            prefix=prefix,
+            file_id=file_id,
+            file_extension=file_extension,
+        )
+
     def _get_valid_content_filepath_legacy(
         self, depot_stored_file: StoredFile
     ) -> typing.Generator[int, None, None]:
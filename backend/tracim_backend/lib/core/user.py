@@ -386,7 +386,7 @@ def get_known_contents_in_context(
             query = query.limit(limit)
 
         contents = query.all()
-        return [content_api.get_content_in_context(content) for content in contents]
+        return content_api.get_contents_in_context(contents)
 
     def get_reserved_usernames(self) -> typing.Tuple[str, ...]:
         reserved_usernames = ["all", "reader", "contributor", "content-manager", "space-manager"]
@@ -15,6 +15,7 @@
 from tracim_backend.exceptions import WorkspacePublicDownloadDisabledException
 from tracim_backend.exceptions import WorkspacePublicUploadDisabledException
 from tracim_backend.lib.core.userworkspace import RoleApi
+from tracim_backend.lib.core.workspace_usage import WorkspaceUsageLib
 from tracim_backend.lib.utils.translation import Translator
 from tracim_backend.lib.utils.utils import current_date_for_filename
 from tracim_backend.models.auth import AuthType
@@ -331,16 +332,15 @@ def _parent_id_filter(self, query: Query, parent_ids: typing.List[int]) -> Query
     def get_all(self) -> typing.List[Workspace]:
         return self.default_order_workspace(self._base_query()).all()
 
+    def get_all_by_ids(self, workspace_ids: typing.List[int]) -> typing.List[Workspace]:
+        return self._base_query().filter(Workspace.workspace_id.in_(workspace_ids)).all()
+
     def get_all_children(self, parent_ids: typing.List[int]) -> typing.List[Workspace]:
         workspaces = self._parent_id_filter(parent_ids=parent_ids, query=self._base_query())
         return self.default_order_workspace(workspaces).all()
 
     def get_user_used_space(self, user: User) -> int:
-        workspaces = self.get_all_for_user(user, include_owned=True, include_with_role=False)
-        used_space = 0
-        for workspace in workspaces:
-            used_space += workspace.get_size()
-        return used_space
+        return WorkspaceUsageLib(self._session).get_owner_used_space(user)
 
     def _get_workspaces_owned_by_user(self, user_id: int) -> typing.List[Workspace]:
         return self._base_query_without_roles().filter(Workspace.owner_id == user_id).all()
@@ -0,0 +1,231 @@
+import typing
+
+from sqlalchemy import bindparam
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+import zope.sqlalchemy
+
+from tracim_backend.lib.core.plugins import hookimpl
+from tracim_backend.lib.utils.logger import logger
+from tracim_backend.models.auth import User
+from tracim_backend.models.data import Content
+from tracim_backend.models.data import ContentRevisionRO
+from tracim_backend.models.data import Workspace
+
+if typing.TYPE_CHECKING:
+    # INFO - 2026-10-18 - import for type-checking only, ContentApi uses this module
+    from tracim_backend.lib.utils.request import TracimContext
+
+
+class WorkspaceUsageLib:
+    """
+    Read and maintain the used space counter of workspaces (Workspace.used_space).
+
+    The counter is the value of Workspace.get_size(): the size of the files of all revisions
+    of the workspace whose content is neither deleted nor archived.
+    A NULL counter is unknown, it is computed and stored on first read.
+    """
+
+    CHUNK_SIZE = 500
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def get_workspace_used_space(self, workspace: Workspace) -> int:
+        if workspace.used_space is None:
+            used_space = workspace.get_size()
+            self._set_used_space(workspace.workspace_id, used_space)
+            set_committed_value(workspace, "used_space", used_space)
+        return workspace.used_space
+
+    def get_owner_used_space(self, user: User) -> int:
+        """Sum of the used space of the (not deleted) workspaces owned by the user."""
+        workspaces = (
+            self._session.query(Workspace)
+            .filter(Workspace.owner_id == user.user_id, Workspace.is_deleted == False)  # noqa: E712
+            .all()
+        )
+        return sum(self.get_workspace_used_space(workspace) for workspace in workspaces)
+
+    def update_content(self, content: Content, new_revisions: typing.List[ContentRevisionRO]):
+        """
+        Update counters of the workspaces for the revisions added to the content.
+        Must be called after the new revisions have been flushed.
+        """
+        if not new_revisions:
+            return
+        first_new_revision_id = min(revision.revision_id for revision in new_revisions)
+        previous_revision = (
+            self._session.query(ContentRevisionRO)
+            .filter(
+                ContentRevisionRO.content_id == content.id,
+                ContentRevisionRO.revision_id < first_new_revision_id,
+            )
+            .order_by(ContentRevisionRO.revision_id.desc())
+            .first()
+        )
+        was_active = previous_revision is not None and previous_revision.is_active
+        is_active = content.current_revision.is_active
+
+        if was_active and is_active:
+            # INFO - 2026-10-18 - only the new files are to be counted
+            size_deltas = {}  # type: typing.Dict[int, int]
+            for revision in new_revisions:
+                if revision.file_size:
+                    size_deltas[revision.workspace_id] = (
+                        size_deltas.get(revision.workspace_id, 0) + revision.file_size
+                    )
+            for workspace_id, size_delta in size_deltas.items():
+                self._add_used_space(workspace_id, size_delta)
+        elif is_active and not was_active:
+            self._add_revisions_size(content.id, sign=1)
+        elif was_active and not is_active:
+            self._add_revisions_size(content.id, sign=-1, before_revision_id=first_new_revision_id)
+
+    def invalidate(self, workspace_id: int) -> None:
+        self._set_used_space(workspace_id, None)
+
+    def reconcile(
+        self,
+        workspace_ids: typing.Optional[typing.List[int]] = None,
+        only_missing_file_sizes: bool = False,
+    ) -> typing.Dict[int, typing.Tuple[typing.Optional[int], int]]:
+        """
+        Read again file sizes from depot storage then recompute used space counters.
+        :param workspace_ids: limit to these workspaces, all workspaces if None
+        :param only_missing_file_sizes: only read file sizes not stored yet
+        :return: old and new counter value of each workspace
+        """
+        self._refresh_file_sizes(workspace_ids, only_missing_file_sizes)
+        query = self._session.query(Workspace)
+        if workspace_ids is not None:
+            query = query.filter(Workspace.workspace_id.in_(workspace_ids))
+        result = {}
+        for workspace in query.order_by(Workspace.workspace_id):
+            used_space = workspace.get_size()
+            result[workspace.workspace_id] = (workspace.used_space, used_space)
+            if workspace.used_space != used_space:
+                self._set_used_space(workspace.workspace_id, used_space)
+                set_committed_value(workspace, "used_space", used_space)
+        return result
+
+    def _refresh_file_sizes(
+        self, workspace_ids: typing.Optional[typing.List[int]], only_missing_file_sizes: bool
+    ) -> None:
+        query = self._session.query(
+            ContentRevisionRO.revision_id, ContentRevisionRO.depot_file, ContentRevisionRO.file_size
+        ).filter(ContentRevisionRO.depot_file.isnot(None))
+        if workspace_ids is not None:
+            query = query.filter(ContentRevisionRO.workspace_id.in_(workspace_ids))
+        if only_missing_file_sizes:
+            query = query.filter(ContentRevisionRO.file_size.is_(None))
+        last_revision_id = 0
+        while True:
+            rows = (
+                query.filter(ContentRevisionRO.revision_id > last_revision_id)
+                .order_by(ContentRevisionRO.revision_id)
+                .limit(self.CHUNK_SIZE)
+                .all()
+            )
+            if not rows:
+                break
+            last_revision_id = rows[-1].revision_id
+            new_file_sizes = []
+            for revision_id, depot_file, file_size in rows:
+                try:
+                    content_length = depot_file.file.content_length
+                except IOError:
+                    logger.warning(self, "Cannot get depot_file {}".format(depot_file.file_id))
+                    continue
+                if content_length != file_size:
+                    new_file_sizes.append(
+                        {"_revision_id": revision_id, "_file_size": content_length}
+                    )
+            if new_file_sizes:
+                table = ContentRevisionRO.__table__
+                self._session.execute(
+                    table.update()
+                    .where(table.c.revision_id == bindparam("_revision_id"))
+                    .values(file_size=bindparam("_file_size")),
+                    new_file_sizes,
+                )
+                zope.sqlalchemy.mark_changed(self._session, keep_session=True)
+
+    def _add_revisions_size(
+        self, content_id: int, sign: int, before_revision_id: typing.Optional[int] = None
+    ) -> None:
+        query = (
+            self._session.query(
+                ContentRevisionRO.workspace_id,
+                func.sum(ContentRevisionRO.file_size),
+                func.count(ContentRevisionRO.revision_id) - func.count(ContentRevisionRO.file_size),
+            )
+            .filter(
+                ContentRevisionRO.content_id == content_id,
+                ContentRevisionRO.depot_file.isnot(None),
+            )
+            .group_by(ContentRevisionRO.workspace_id)
+        )
+        if before_revision_id is not None:
+            query = query.filter(ContentRevisionRO.revision_id < before_revision_id)
+        for workspace_id, size, unknown_size_count in query:
+            if unknown_size_count:
+                # INFO - 2026-10-18 - some file sizes are not stored, the counter
+                # will be computed again on next read.
+                self.invalidate(workspace_id)
+            elif size:
+                self._add_used_space(workspace_id, sign * size)
+
+    def _add_used_space(self, workspace_id: int, size_delta: int) -> None:
+        # INFO - 2026-10-18 - the addition is done by the database to not lose
+        # concurrent updates. A NULL counter stays NULL.
+        table = Workspace.__table__
+        self._session.execute(
+            table.update()
+            .where(table.c.workspace_id == workspace_id)
+            .values(used_space=table.c.used_space + size_delta)
+        )
+        self._expire_used_space(workspace_id)
+
+    def _set_used_space(self, workspace_id: int, used_space: typing.Optional[int]) -> None:
+        table = Workspace.__table__
+        self._session.execute(
+            table.update().where(table.c.workspace_id == workspace_id).values(used_space=used_space)
+        )
+        zope.sqlalchemy.mark_changed(self._session, keep_session=True)
+        self._expire_used_space(workspace_id)
+
+    def _expire_used_space(self, workspace_id: int) -> None:
+        workspace = self._session.identity_map.get(identity_key(Workspace, workspace_id))
+        if workspace is not None:
+            self._session.expire(workspace, ["used_space"])
+
+
+class WorkspaceUsageHooks:
+    """Keep the used space counter of workspaces up to date from the database crud hooks."""
+
+    # pluggy uses this attribute to name the plugin
+    __name__ = "WorkspaceUsageHooks"
+
+    @hookimpl
+    def on_content_created(self, content: Content, context: "TracimContext") -> None:
+        self._update_content(content, context)
+
+    @hookimpl
+    def on_content_modified(self, content: Content, context: "TracimContext") -> None:
+        self._update_content(content, context)
+
+    @hookimpl
+    def on_content_deleted(self, content: Content, context: "TracimContext") -> None:
+        WorkspaceUsageLib(context.dbsession).invalidate(content.workspace_id)
+
+    def _update_content(self, content: Content, context: "TracimContext") -> None:
+        session = context.dbsession
+        new_revisions = [
+            obj
+            for obj in session.new
+            if isinstance(obj, ContentRevisionRO) and obj.content_id == content.id
+        ]
+        WorkspaceUsageLib(session).update_content(content, new_revisions)
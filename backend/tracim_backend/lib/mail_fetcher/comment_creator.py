@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+from collections import namedtuple
+import typing
+
+import pluggy
+import transaction
+
+from tracim_backend.app_models.contents import ContentTypeSlug
+from tracim_backend.config import CFG
+from tracim_backend.exceptions import ContentInNotEditableState
+from tracim_backend.exceptions import ContentNotFound
+from tracim_backend.exceptions import EmptyCommentContentNotAllowed
+from tracim_backend.exceptions import InsufficientUserRoleInWorkspace
+from tracim_backend.exceptions import UserDoesNotExist
+from tracim_backend.exceptions import UserIsDeleted
+from tracim_backend.exceptions import UserIsNotActive
+from tracim_backend.lib.core.content import ContentApi
+from tracim_backend.lib.core.plugins import init_plugin_manager
+from tracim_backend.lib.core.user import UserApi
+from tracim_backend.lib.utils.authorization import is_contributor
+from tracim_backend.lib.utils.logger import logger
+from tracim_backend.lib.utils.request import TracimContext
+from tracim_backend.models.auth import User
+from tracim_backend.models.setup_models import create_dbsession_for_context
+from tracim_backend.models.setup_models import get_engine
+from tracim_backend.models.setup_models import get_session_factory
+from tracim_backend.models.tracim_session import TracimSession
+
+# comment to create from a fetched mail: author_login is the mail sender address
+MailComment = namedtuple("MailComment", ["uid", "author_login", "content_id", "raw_content"])
+
+
+class MailCommentTracimContext(TracimContext):
+    """Context of comments created from mails: the current user is the author of the mail."""
+
+    def __init__(self, config: CFG, plugin_manager: pluggy.PluginManager) -> None:
+        super().__init__()
+        self._app_config = config
+        self._plugin_manager = plugin_manager
+        self._dbsession = None
+
+    @property
+    def app_config(self) -> CFG:
+        return self._app_config
+
+    @property
+    def current_user(self) -> typing.Optional[User]:
+        return self._current_user
+
+    @property
+    def dbsession(self) -> TracimSession:
+        assert self._dbsession
+        return self._dbsession
+
+    @property
+    def plugin_manager(self) -> pluggy.PluginManager:
+        return self._plugin_manager
+
+
+class MailCommentCreator(object):
+    """
+    Create comments of fetched mails directly in the database instead of through the API,
+    with the same checks as the API: the mail author must be an active user and a
+    contributor of the content workspace.
+    """
+
+    # INFO - 2026-10-18 - errors raised before any change in the database, the mail is skipped
+    REJECTION_EXCEPTIONS = (
+        UserDoesNotExist,
+        UserIsNotActive,
+        UserIsDeleted,
+        ContentNotFound,
+        InsufficientUserRoleInWorkspace,
+        ContentInNotEditableState,
+        EmptyCommentContentNotAllowed,
+    )
+
+    def __init__(self, config: CFG) -> None:
+        self._config = config
+        self._session_factory = get_session_factory(get_engine(config))
+        self._plugin_manager = init_plugin_manager(config)
+
+    def create_comments(self, comments: typing.List[MailComment]) -> typing.List[int]:
+        """
+        Create the comments in one transaction. If it fails, create them one transaction each
+        so that a bad mail does not prevent the others to be added.
+        :return: uids of the mails whose comment has been created
+        """
+        if not comments:
+            return []
+        try:
+            return self._create_comments_in_transaction(comments)
+        except Exception:
+            logger.exception(self, "Failed to create comments of mails batch, retry one by one")
+        created_uids = []
+        for comment in comments:
+            try:
+                created_uids.extend(self._create_comments_in_transaction([comment]))
+            except Exception:
+                logger.exception(
+                    self, "Failed to create comment of mail {}".format(comment.uid),
+                )
+        return created_uids
+
+    def _create_comments_in_transaction(
+        self, comments: typing.List[MailComment]
+    ) -> typing.List[int]:
+        context = MailCommentTracimContext(self._config, self._plugin_manager)
+        session = create_dbsession_for_context(self._session_factory, transaction.manager, context)
+        context._dbsession = session
+        created_uids = []
+        try:
+            for comment in comments:
+                try:
+                    self._create_comment(context, comment)
+                except self.REJECTION_EXCEPTIONS:
+                    logger.warning(
+                        self,
+                        "Comment of mail {} from {} rejected".format(
+                            comment.uid, comment.author_login
+                        ),
+                        exc_info=True,
+                    )
+                    continue
+                created_uids.append(comment.uid)
+            transaction.commit()
+        except Exception:
+            transaction.abort()
+            raise
+        finally:
+            context.cleanup()
+        return created_uids
+
+    def _create_comment(self, context: MailCommentTracimContext, comment: MailComment) -> None:
+        user_api = UserApi(current_user=None, session=context.dbsession, config=self._config)
+        user = user_api.get_one_by_login(comment.author_login)
+        if not user.is_active:
+            raise UserIsNotActive("User {} is not active".format(user.user_id))
+        if user.is_deleted:
+            raise UserIsDeleted("User {} is deleted".format(user.user_id))
+        context.set_user(user)
+        content_api = ContentApi(
+            show_archived=True,
+            show_deleted=True,
+            current_user=user,
+            session=context.dbsession,
+            config=self._config,
+        )
+        content = content_api.get_one(comment.content_id, content_type=ContentTypeSlug.ANY.value)
+        context._current_workspace = content.workspace
+        is_contributor.check(context)
+        content_api.create_comment(content.workspace, content, comment.raw_content, do_save=True)
@@ -1,6 +1,7 @@
 import typing
 
 from tracim_backend.config import CFG
+from tracim_backend.lib.mail_fetcher.comment_creator import MailCommentCreator
 from tracim_backend.lib.mail_fetcher.email_fetcher import MailFetcher
 from tracim_backend.lib.utils.daemon import FakeDaemon
 from tracim_backend.lib.utils.logger import logger
@@ -50,5 +51,10 @@ def run(self) -> None:
             use_txt_parsing=self.config.EMAIL__REPLY__USE_TXT_PARSING,
             lockfile_path=self.config.EMAIL__REPLY__LOCKFILE_PATH,
             burst=self.burst,
+            fetch_batch_size=self.config.EMAIL__REPLY__FETCH_BATCH_SIZE,
+            workers=self.config.EMAIL__REPLY__WORKERS,
+            comment_creator=MailCommentCreator(self.config)
+            if self.config.EMAIL__REPLY__DIRECT_INGESTION
+            else None,
         )
         self._fetcher.run()
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from email import message_from_bytes
 from email.header import decode_header
 from email.header import make_header
@@ -20,6 +22,8 @@
 from tracim_backend.exceptions import EmptyEmailBody
 from tracim_backend.exceptions import NoKeyFound
 from tracim_backend.exceptions import UnsupportedRequestMethod
+from tracim_backend.lib.mail_fetcher.comment_creator import MailComment
+from tracim_backend.lib.mail_fetcher.comment_creator import MailCommentCreator
 from tracim_backend.lib.mail_fetcher.email_processing.parser import ParsedHTMLMail
 from tracim_backend.lib.utils.authentification import TRACIM_API_KEY_HEADER
 from tracim_backend.lib.utils.authentification import TRACIM_API_USER_LOGIN_HEADER
@@ -242,6 +246,9 @@ def __init__(
         use_txt_parsing: bool,
         lockfile_path: str,
         burst: bool,
+        fetch_batch_size: int = 100,
+        workers: int = 4,
+        comment_creator: typing.Optional[MailCommentCreator] = None,
     ) -> None:
         """
         Fetch mail from a mailbox folder through IMAP and add their content to
@@ -266,6 +273,10 @@ def __init__(
         :param use_txt_parsing: parse txt mail
         :param burst: if true, run only one time,
         if false run as continous daemon.
+        :param fetch_batch_size: number of mails fetched (and flagged) at once
+        :param workers: number of mails processed concurrently (parsing and http requests)
+        :param comment_creator: if set, comments are created directly in the database
+        instead of through the http api
         """
         self.host = host
         self.port = port
@@ -285,6 +296,14 @@ def __init__(
         self.lock = filelock.FileLock(lockfile_path)
         self._is_active = True
         self.burst = burst
+        self.fetch_batch_size = fetch_batch_size
+        self.workers = workers
+        self.comment_creator = comment_creator
+        # INFO - 2026-10-18 - keep-alive connections to tracim api, shared by the workers
+        self._http_session = requests.Session()
+        http_adapter = requests.adapters.HTTPAdapter(pool_maxsize=workers)
+        self._http_session.mount("http://", http_adapter)
+        self._http_session.mount("https://", http_adapter)
 
     def run(self) -> None:
         logger.info(self, "Starting MailFetcher")
@@ -408,26 +427,34 @@ def run(self) -> None:
 
     def _check_mail(self, imapc: imapclient.IMAPClient) -> None:
         with self.lock.acquire(timeout=MAIL_FETCHER_FILELOCK_TIMEOUT):
-            messages = self._fetch(imapc)
-            cleaned_mails = [
-                DecodedMail(m.message, m.uid, self.reply_to_pattern, self.references_pattern)
-                for m in messages
-            ]
-            self._notify_tracim(cleaned_mails, imapc)
+            logger.debug(self, "Fetch unflagged messages")
+            uids = imapc.search(["UNFLAGGED"])
+            logger.debug(self, "Found {} unflagged mails".format(len(uids)))
+            # INFO - 2026-10-18 - mails are fetched by batches to bound memory usage
+            # when there are many new mails.
+            for offset in range(0, len(uids), self.fetch_batch_size):
+                if not self._is_active:
+                    break
+                messages = self._fetch(imapc, uids[offset : offset + self.fetch_batch_size])
+                cleaned_mails = [
+                    DecodedMail(m.message, m.uid, self.reply_to_pattern, self.references_pattern)
+                    for m in messages
+                ]
+                self._notify_tracim(cleaned_mails, imapc)
 
     def stop(self) -> None:
         self._is_active = False
 
-    def _fetch(self, imapc: imapclient.IMAPClient) -> typing.List[MessageContainer]:
+    def _fetch(
+        self, imapc: imapclient.IMAPClient, uids: typing.List[int]
+    ) -> typing.List[MessageContainer]:
         """
-        Get news message from mailbox
-        :return: list of new mails
+        Get given messages from mailbox
+        :param uids: uids of the messages to get
+        :return: list of mails
         """
         messages = []
 
-        logger.debug(self, "Fetch unflagged messages")
-        uids = imapc.search(["UNFLAGGED"])
-        logger.debug(self, "Found {} unflagged mails".format(len(uids)))
         for msgid, data in imapc.fetch(uids, ["BODY.PEEK[]"]).items():
             # INFO - G.M - 2017-12-08 - Fetch BODY.PEEK[]
             # Retrieve all mail(body and header) but don't set mail
@@ -454,7 +481,7 @@ def _fetch(self, imapc: imapclient.IMAPClient) -> typing.List[MessageContainer]:
 
     def _notify_tracim(self, mails: typing.List[DecodedMail], imapc: imapclient.IMAPClient) -> None:
         """
-        Send http request to tracim endpoint
+        Send http request to tracim endpoint, then flag mails correctly sent
         :param mails: list of mails to send
         :return: none
         """
@@ -463,41 +490,101 @@ def _notify_tracim(self, mails: typing.List[DecodedMail], imapc: imapclient.IMAP
         # , mail.get_body() etc ... for raise InvalidEmailError if missing
         #  required informations (actually get_from_address raise IndexError
         #  if no from address for example) and catch it here
-        while mails:
-            mail = mails.pop()
-            try:
-                method, endpoint, json_body_dict = self._create_comment_request(mail)
-            except NoKeyFound:
-                log = "Failed to create comment request due to missing specialkey in mail"
-                logger.exception(self, log)
-                continue
-            except EmptyEmailBody:
-                log = "Empty body, skip mail"
-                logger.error(self, log)
-                continue
-            except AutoReplyEmailNotAllowed:
-                log = "Autoreply mail, skip mail"
-                logger.warning(self, log)
-                continue
-            except Exception:
-                log = "Failed to create comment request in mail fetcher error"
-                logger.exception(self, log)
-                continue
+        if self.comment_creator:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                mail_comments = [
+                    mail_comment
+                    for mail_comment in executor.map(self._get_mail_comment, mails)
+                    if mail_comment
+                ]
+            sent_uids = self.comment_creator.create_comments(mail_comments)
+        else:
+            sent_uids = self._send_comment_requests(mails)
+
+        # Flag all correctly checked mail
+        if sent_uids:
+            imapc.add_flags(sent_uids, [IMAP_CHECKED_FLAG, IMAP_SEEN_FLAG])
+
+    def _send_comment_requests(self, mails: typing.List[DecodedMail]) -> typing.List[int]:
+        """
+        Send comments of the mails through the http api.
+        :return: uids of the mails correctly sent
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            # INFO - 2026-10-18 - requests of the same content are sent one after the other
+            # to keep comments order, requests of different contents concurrently.
+            requests_by_endpoint = OrderedDict()  # type: typing.Dict[str, typing.List[tuple]]
+            for mail, comment_request in zip(mails, executor.map(self._get_comment_request, mails)):
+                if comment_request:
+                    method, endpoint, json_body_dict = comment_request
+                    requests_by_endpoint.setdefault(endpoint, []).append(
+                        (mail, method, json_body_dict)
+                    )
+            sent_uids = []
+            for endpoint_sent_uids in executor.map(
+                self._send_endpoint_requests,
+                requests_by_endpoint.keys(),
+                requests_by_endpoint.values(),
+            ):
+                sent_uids.extend(endpoint_sent_uids)
+        return sent_uids
+
+    def _get_comment_request(
+        self, mail: DecodedMail
+    ) -> typing.Optional[typing.Tuple[str, str, dict]]:
+        """
+        :return: comment request of the mail, or None if the mail cannot be added as a comment
+        """
+        return self._parse_mail(self._create_comment_request, mail)
 
+    def _get_mail_comment(self, mail: DecodedMail) -> typing.Optional[MailComment]:
+        """
+        :return: comment of the mail, or None if the mail cannot be added as a comment
+        """
+        return self._parse_mail(self._create_mail_comment, mail)
+
+    def _parse_mail(
+        self, parser: typing.Callable[[DecodedMail], typing.Any], mail: DecodedMail
+    ) -> typing.Any:
+        try:
+            return parser(mail)
+        except NoKeyFound:
+            log = "Failed to create comment request due to missing specialkey in mail"
+            logger.exception(self, log)
+        except EmptyEmailBody:
+            log = "Empty body, skip mail"
+            logger.error(self, log)
+        except AutoReplyEmailNotAllowed:
+            log = "Autoreply mail, skip mail"
+            logger.warning(self, log)
+        except Exception:
+            log = "Failed to create comment request in mail fetcher error"
+            logger.exception(self, log)
+        return None
+
+    def _send_endpoint_requests(
+        self, endpoint: str, endpoint_requests: typing.List[typing.Tuple[DecodedMail, str, dict]]
+    ) -> typing.List[int]:
+        """
+        Send the requests of an endpoint in order, stop at the first failure.
+        :return: uids of the mails correctly sent
+        """
+        sent_uids = []
+        for mail, method, json_body_dict in endpoint_requests:
             try:
                 self._send_request(
-                    mail=mail,
-                    imapc=imapc,
-                    method=method,
-                    endpoint=endpoint,
-                    json_body_dict=json_body_dict,
+                    mail=mail, method=method, endpoint=endpoint, json_body_dict=json_body_dict,
                 )
             except requests.exceptions.Timeout:
                 log = "Timeout error to transmit fetched mail to tracim"
                 logger.exception(self, log)
-            except requests.exceptions.RequestException:
+                break
+            except (requests.exceptions.RequestException, BadStatusCode):
                 log = "Fail to transmit fetched mail to tracim"
                 logger.exception(self, log)
+                break
+            sent_uids.append(mail.uid)
+        return sent_uids
 
     def _get_auth_headers(self, user_email) -> dict:
         return {TRACIM_API_KEY_HEADER: self.api_key, TRACIM_API_USER_LOGIN_HEADER: user_email}
@@ -506,7 +593,7 @@ def _get_content_info(self, content_id, user_email):
         endpoint = "{api_base_url}contents/{content_id}".format(
             api_base_url=self.api_base_url, content_id=content_id
         )
-        result = requests.get(endpoint, headers=self._get_auth_headers(user_email))
+        result = self._http_session.get(endpoint, headers=self._get_auth_headers(user_email))
         if result.status_code not in [200, 204]:
             details = str(result.content)
             msg = "bad status code {}(200 is valid) response when trying to get info about a content: {}"
@@ -530,13 +617,19 @@ def _create_comment_request(self, mail: DecodedMail) -> typing.Tuple[str, str, d
         body = {"raw_content": mail_body}
         return method, endpoint, body
 
+    def _create_mail_comment(self, mail: DecodedMail) -> MailComment:
+        mail.check_validity_for_comment_content()
+        return MailComment(
+            uid=mail.uid,
+            author_login=mail.get_from_address(),
+            content_id=int(mail.get_key()),
+            raw_content=mail.get_body(
+                use_html_parsing=self.use_html_parsing, use_txt_parsing=self.use_txt_parsing
+            ),
+        )
+
     def _send_request(
-        self,
-        mail: DecodedMail,
-        imapc: imapclient.IMAPClient,
-        method: str,
-        endpoint: str,
-        json_body_dict: dict,
+        self, mail: DecodedMail, method: str, endpoint: str, json_body_dict: dict,
     ):
         logger.debug(
             self,
@@ -545,7 +638,7 @@ def _send_request(
             ),
         )
         if method == "POST":
-            request_method = requests.post
+            request_method = self._http_session.post
         else:
             # TODO - G.M - 2018-08-24 - Better handling exception
             raise UnsupportedRequestMethod("Request method not supported")
@@ -560,7 +653,3 @@ def _send_request(
             msg = "bad status code {} (200 and 204 are valid) response when sending mail to tracim: {}"
             msg = msg.format(str(r.status_code), details)
             raise BadStatusCode(msg)
-        # Flag all correctly checked mail
-        if r.status_code in [200, 204]:
-            imapc.add_flags((mail.uid,), IMAP_CHECKED_FLAG)
-            imapc.add_flags((mail.uid,), IMAP_SEEN_FLAG)
@@ -1,11 +1,14 @@
+import threading
 import typing
 
-from rq import Connection as RQConnection
-from rq import Worker as BaseRQWorker
+from rq import SimpleWorker
 from rq.dummy import do_nothing
+from rq.timeouts import BaseDeathPenalty
 from rq.worker import StopRequested
 
 from tracim_backend.config import CFG
+from tracim_backend.lib.mail_notifier.smtp_pool import SmtpConnectionPool
+from tracim_backend.lib.mail_notifier.smtp_pool import set_smtp_pool
 from tracim_backend.lib.rq import RqQueueName
 from tracim_backend.lib.rq import get_redis_connection
 from tracim_backend.lib.rq import get_rq_queue
@@ -14,6 +17,14 @@
 
 
 class MailSenderDaemon(FakeDaemon):
+    """
+    Send the emails queued by asynchronous jobs.
+
+    EMAIL__NOTIFICATION__SMTP__POOL_SIZE workers run in threads of this process and share
+    a pool of long-lived SMTP connections (see SmtpConnectionPool): emails not sent yet stay
+    in the RQ queue until a worker is free.
+    """
+
     # NOTE: use *args and **kwargs because parent __init__ use strange
     # * parameter
     def __init__(self, config: "CFG", burst=True, *args, **kwargs):
@@ -23,7 +34,7 @@ def __init__(self, config: "CFG", burst=True, *args, **kwargs):
         """
         super().__init__(*args, **kwargs)
         self.config = config
-        self.worker = None  # type: RQWorker
+        self.workers = []  # type: typing.List[RQWorker]
         self.burst = burst
 
     def append_thread_callback(self, callback: typing.Callable) -> None:
@@ -34,19 +45,65 @@ def stop(self) -> None:
         # When _stop_requested at False, tracim.lib.daemons.RQWorker
         # will raise StopRequested exception in worker thread after receive a
         # job.
-        self.worker._stop_requested = True
         redis_connection = get_redis_connection(self.config)
         queue = get_rq_queue(redis_connection, RqQueueName.MAIL_SENDER)
-        queue.enqueue(do_nothing)
+        for worker in self.workers:
+            worker._stop_requested = True
+            queue.enqueue(do_nothing)
 
     def run(self) -> None:
+        smtp_pool = SmtpConnectionPool.from_config(self.config)
+        set_smtp_pool(smtp_pool)
+        redis_connection = get_redis_connection(self.config)
+        self.workers = [
+            RQWorker(
+                [RqQueueName.MAIL_SENDER.value], connection=redis_connection, smtp_pool=smtp_pool,
+            )
+            for _ in range(smtp_pool.size)
+        ]
+        threads = [
+            threading.Thread(target=worker.work, kwargs={"burst": self.burst})
+            for worker in self.workers[1:]
+        ]
+        try:
+            for thread in threads:
+                thread.start()
+            self.workers[0].work(burst=self.burst)
+            for thread in threads:
+                thread.join()
+        finally:
+            smtp_pool.log_stats(self.workers[0].queues[0].count, force=True)
+            set_smtp_pool(None)
+            smtp_pool.close()
+
+
+class NoDeathPenalty(BaseDeathPenalty):
+    """
+    Jobs are not interrupted: the default death penalty uses signals which only work in the
+    main thread. SMTP connections of the pool have a socket timeout instead.
+    """
+
+    def setup_death_penalty(self) -> None:
+        pass
+
+    def cancel_death_penalty(self) -> None:
+        pass
 
-        with RQConnection(get_redis_connection(self.config)):
-            self.worker = RQWorker([RqQueueName.MAIL_SENDER.value])
-            self.worker.work(burst=self.burst)
 
+class RQWorker(SimpleWorker):
+    """
+    Worker running jobs in its own thread (no fork) so that the SMTP connection pool is kept
+    between jobs.
+    """
+
+    death_penalty_class = NoDeathPenalty
+
+    def __init__(
+        self, *args, smtp_pool: typing.Optional[SmtpConnectionPool] = None, **kwargs
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.smtp_pool = smtp_pool
 
-class RQWorker(BaseRQWorker):
     def _install_signal_handlers(self):
         # RQ Worker is designed to work in main thread
         # So we have to disable these signals (we implement server stop in
@@ -59,4 +116,6 @@ def dequeue_job_and_maintain_ttl(self, timeout):
         # StopRequested exception to stop worker.
         if self._stop_requested:
             raise StopRequested()
+        if self.smtp_pool:
+            self.smtp_pool.log_stats(self.queues[0].count)
         return super().dequeue_job_and_maintain_ttl(timeout)
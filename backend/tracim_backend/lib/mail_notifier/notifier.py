@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import logging
+import re
 import typing
 
 from mako.template import Template
@@ -135,6 +136,7 @@ def __init__(self, smtp_config: SmtpConfiguration, config: CFG, session: Session
         self._smtp_config = smtp_config
         self.config = config
         self.session = session
+        self._templates = {}  # type: typing.Dict[str, Template]
         # FIXME - G.M - We need to have a session for the emailNotifier
 
         # if not self.session:
@@ -196,6 +198,14 @@ def notify_content_update(self, event_actor_id: int, event_content_id: int) -> N
         :param event_content_id: related content_id
         :return:
         """
+        if self.config.EMAIL__NOTIFICATION__CONTENT_UPDATE__DIGEST:
+            logger.info(
+                self,
+                "Skipping content {} notification: content updates are sent in digest emails".format(
+                    event_content_id
+                ),
+            )
+            return
         # FIXME - D.A. - 2014-11-05
         # Dirty import. It's here in order to avoid circular import
         from tracim_backend.lib.core.content import ContentApi
@@ -245,6 +255,25 @@ def notify_content_update(self, event_actor_id: int, event_content_id: int) -> N
         email_sender = EmailSender(
             self.config, self._smtp_config, self.config.EMAIL__NOTIFICATION__ACTIVATED
         )
+        # INFO - 2026-10-18 - everything which does not depend on the recipient is built once,
+        # bodies are rendered once per language and per recipient variables used by the template
+        # (see _get_content_update_variant)
+        reply_to_addr = self.config.EMAIL__NOTIFICATION__REPLY_TO__EMAIL.replace(
+            "{content_id}", str(main_content.content_id)
+        )
+        reference_addr = self.config.EMAIL__NOTIFICATION__REFERENCES__EMAIL.replace(
+            "{content_id}", str(main_content.content_id)
+        )
+        content_in_context = content_api.get_content_in_context(content)
+        parent_in_context = None
+        if content.parent_id:
+            parent_in_context = content_api.get_content_in_context(content.parent)
+        template_filepath = self.config.EMAIL__NOTIFICATION__CONTENT_UPDATE__TEMPLATE__HTML
+        template_variables = self._get_template_variables(template_filepath)
+        sender = self._get_sender(user)
+        translators = {}  # type: typing.Dict[str, Translator]
+        subjects = {}  # type: typing.Dict[str, typing.Tuple[str, str]]
+        bodies = {}  # type: typing.Dict[tuple, str]
         for role in notifiable_roles:
             logger.info(
                 self,
@@ -252,55 +281,31 @@ def notify_content_update(self, event_actor_id: int, event_content_id: int) -> N
                     content.content_id, role.user.email
                 ),
             )
-            translator = Translator(app_config=self.config, default_lang=role.user.lang)
-            _ = translator.get_translation
-            # INFO - G.M - 2017-11-15 - set content_id in header to permit reply
-            # references can have multiple values, but only one in this case.
-            reply_to_addr = self.config.EMAIL__NOTIFICATION__REPLY_TO__EMAIL.replace(
-                "{content_id}", str(main_content.content_id)
-            )
-
-            reference_addr = self.config.EMAIL__NOTIFICATION__REFERENCES__EMAIL.replace(
-                "{content_id}", str(main_content.content_id)
-            )
-            #
-            #  INFO - D.A. - 2014-11-06
-            # We do not use .format() here because the subject defined in the .ini file
-            # may not include all required labels. In order to avoid partial format() (which result in an exception)
-            # we do use replace and force the use of .__str__() in order to process LazyString objects
-            #
-            content_status = translator.get_translation(main_content.get_status().label)
-            translated_subject = translator.get_translation(
-                self.config.EMAIL__NOTIFICATION__CONTENT_UPDATE__SUBJECT
-            )
-            subject = translated_subject.replace(
-                EST.WEBSITE_TITLE, self.config.WEBSITE__TITLE.__str__()
-            )
-            subject = subject.replace(EST.WORKSPACE_LABEL, main_content.workspace.label.__str__())
-            subject = subject.replace(EST.CONTENT_LABEL, main_content.label.__str__())
-            subject = subject.replace(EST.CONTENT_STATUS_LABEL, content_status)
-            reply_to_label = _("{username} & all members of {workspace}").format(
-                username=user.display_name, workspace=main_content.workspace.label
-            )
-
-            content_in_context = content_api.get_content_in_context(content)
-            parent_in_context = None
-            if content.parent_id:
-                parent_in_context = content_api.get_content_in_context(content.parent)
-
-            body_html = self._build_email_body_for_content(
-                self.config.EMAIL__NOTIFICATION__CONTENT_UPDATE__TEMPLATE__HTML,
-                role,
-                content_in_context,
-                parent_in_context,
-                workspace_in_context,
-                user,
-                translator,
-            )
+            lang = role.user.lang
+            if lang not in translators:
+                translators[lang] = Translator(app_config=self.config, default_lang=lang)
+                subjects[lang] = self._build_subject_for_content_update(
+                    main_content, user, translators[lang]
+                )
+            translator = translators[lang]
+            subject, reply_to_label = subjects[lang]
+
+            variant = self._get_content_update_variant(role, lang, template_variables)
+            if variant not in bodies:
+                bodies[variant] = self._build_email_body_for_content(
+                    template_filepath,
+                    role,
+                    content_in_context,
+                    parent_in_context,
+                    workspace_in_context,
+                    user,
+                    translator,
+                )
+            body_html = bodies[variant]
 
             message = EmailNotificationMessage(
                 subject=subject,
-                from_header=self._get_sender(user),
+                from_header=sender,
                 to_header=EmailAddress(role.user.display_name, role.user.email),
                 reply_to=EmailAddress(reply_to_label, reply_to_addr),
                 # INFO - G.M - 2017-11-15
@@ -326,6 +331,47 @@ def notify_content_update(self, event_actor_id: int, event_content_id: int) -> N
 
             send_email_through(self.config, email_sender.send_mail, message)
 
+    def _build_subject_for_content_update(
+        self, main_content: Content, actor: User, translator: Translator
+    ) -> typing.Tuple[str, str]:
+        """:return: subject and reply-to label of content update emails"""
+        _ = translator.get_translation
+        #
+        #  INFO - D.A. - 2014-11-06
+        # We do not use .format() here because the subject defined in the .ini file
+        # may not include all required labels. In order to avoid partial format() (which result in an exception)
+        # we do use replace and force the use of .__str__() in order to process LazyString objects
+        #
+        content_status = translator.get_translation(main_content.get_status().label)
+        translated_subject = translator.get_translation(
+            self.config.EMAIL__NOTIFICATION__CONTENT_UPDATE__SUBJECT
+        )
+        subject = translated_subject.replace(
+            EST.WEBSITE_TITLE, self.config.WEBSITE__TITLE.__str__()
+        )
+        subject = subject.replace(EST.WORKSPACE_LABEL, main_content.workspace.label.__str__())
+        subject = subject.replace(EST.CONTENT_LABEL, main_content.label.__str__())
+        subject = subject.replace(EST.CONTENT_STATUS_LABEL, content_status)
+        reply_to_label = _("{username} & all members of {workspace}").format(
+            username=actor.display_name, workspace=main_content.workspace.label
+        )
+        return subject, reply_to_label
+
+    @staticmethod
+    def _get_content_update_variant(
+        role: UserRoleInWorkspace, lang: str, template_variables: typing.Set[str]
+    ) -> tuple:
+        """
+        Key of the content update email bodies which are the same: recipients with the same
+        language and the same value for each recipient variable used by the template.
+        """
+        variant = [lang]
+        if "user" in template_variables:
+            variant.append(role.user_id)
+        if "role_label" in template_variables:
+            variant.append(role.role)
+        return tuple(variant)
+
     def notify_created_account(
         self, user: User, password: typing.Optional[str], origin_user: typing.Optional[User] = None
     ) -> None:
@@ -428,15 +474,7 @@ def _render_template(
         :return: template rendered string
         """
         try:
-            template = Template(
-                filename=mako_template_filepath,
-                default_filters=["html_escape"],
-                imports=[
-                    "from mako.filters import html_escape",
-                    "from lxml.html.diff import htmldiff",
-                    "import humanize",
-                ],
-            )
+            template = self._get_template(mako_template_filepath)
             return template.render(
                 _=translator.get_translation,
                 config=self.config,
@@ -447,6 +485,32 @@ def _render_template(
             logger.exception(self, "Failed to render email template")
             raise EmailTemplateError("Failed to render email template")
 
+    def _get_template(self, mako_template_filepath: str) -> Template:
+        """Compile the given template, once per EmailManager."""
+        if mako_template_filepath not in self._templates:
+            self._templates[mako_template_filepath] = Template(
+                filename=mako_template_filepath,
+                default_filters=["html_escape"],
+                imports=[
+                    "from mako.filters import html_escape",
+                    "from lxml.html.diff import htmldiff",
+                    "import humanize",
+                ],
+            )
+        return self._templates[mako_template_filepath]
+
+    def _get_template_variables(self, mako_template_filepath: str) -> typing.Set[str]:
+        """
+        Names of the context variables used by the given template: mako generated code
+        reads each of them with context.get().
+        """
+        try:
+            template = self._get_template(mako_template_filepath)
+        except Exception:
+            logger.exception(self, "Failed to compile email template")
+            raise EmailTemplateError("Failed to compile email template")
+        return set(re.findall(r"context\.get\('(\w+)'", template.code))
+
     def _build_context_for_content_update(
         self,
         role: UserRoleInWorkspace,
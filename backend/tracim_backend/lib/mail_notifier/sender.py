@@ -43,6 +43,77 @@ def send_email_through(
         )
 
 
+def open_smtp_connection(
+    smtp_config: SmtpConfiguration, timeout: typing.Optional[float] = None
+) -> smtplib.SMTP:
+    """
+    Connect to the SMTP server: EHLO, STARTTLS and login according to the given configuration.
+    :param timeout: socket timeout in seconds, no timeout if None
+    """
+    log = "Connecting to SMTP server {}"
+    logger.info(open_smtp_connection, log.format(smtp_config.server))
+    # INFO - 2026-10-18 - smtplib uses the global default timeout when no timeout is given
+    timeout_kwargs = {"timeout": timeout} if timeout is not None else {}
+    if smtp_config.encryption == SmtpEncryption.SMTPS:
+        smtp_connection = smtplib.SMTP_SSL(smtp_config.server, smtp_config.port, **timeout_kwargs)
+    else:
+        smtp_connection = smtplib.SMTP(smtp_config.server, smtp_config.port, **timeout_kwargs)
+    smtp_connection.ehlo()
+
+    if smtp_config.encryption == SmtpEncryption.DEFAULT:
+        try:
+            starttls_result = smtp_connection.starttls()
+
+            if starttls_result[0] == 220:
+                logger.info(open_smtp_connection, "SMTP Start TLS OK")
+
+            log = "SMTP Start TLS return code: {} with message: {}"
+            logger.debug(
+                open_smtp_connection,
+                log.format(starttls_result[0], starttls_result[1].decode("utf-8")),
+            )
+        except smtplib.SMTPResponseException as exc:
+            log = "SMTP start TLS return error code: {} with message: {}"
+            logger.error(
+                open_smtp_connection, log.format(exc.smtp_code, exc.smtp_error.decode("utf-8"))
+            )
+        except Exception:
+            log = "Unexpected exception during SMTP start TLS process"
+            logger.exception(open_smtp_connection, log)
+
+    if smtp_config.authentication:
+        try:
+            login_res = smtp_connection.login(smtp_config.login, smtp_config.password)
+
+            if login_res[0] == 235:
+                logger.info(open_smtp_connection, "SMTP Authentication Successful")
+            if login_res[0] == 503:
+                logger.info(open_smtp_connection, "SMTP Already Authenticated")
+
+            log = "SMTP login return code: {} with message: {}"
+            logger.debug(
+                open_smtp_connection, log.format(login_res[0], login_res[1].decode("utf-8"))
+            )
+        except smtplib.SMTPAuthenticationError as exc:
+            log = "SMTP auth return error code: {} with message: {}"
+            logger.error(
+                open_smtp_connection, log.format(exc.smtp_code, exc.smtp_error.decode("utf-8"))
+            )
+            logger.error(
+                open_smtp_connection,
+                "check your auth params combinaison " "(login/password) for SMTP",
+            )
+        except smtplib.SMTPResponseException as exc:
+            log = "SMTP login return error code: {} with message: {}"
+            logger.error(
+                open_smtp_connection, log.format(exc.smtp_code, exc.smtp_error.decode("utf-8"))
+            )
+        except Exception:
+            log = "Unexpected exception during SMTP login"
+            logger.exception(open_smtp_connection, log)
+    return smtp_connection
+
+
 class EmailSender(object):
     """
     Independent email sender class.
@@ -59,61 +130,7 @@ def __init__(self, config: CFG, smtp_config: SmtpConfiguration, really_send_mess
 
     def connect(self):
         if not self._smtp_connection:
-            log = "Connecting to SMTP server {}"
-            logger.info(self, log.format(self._smtp_config.server))
-            if self._smtp_config.encryption == SmtpEncryption.SMTPS:
-                self._smtp_connection = smtplib.SMTP_SSL(
-                    self._smtp_config.server, self._smtp_config.port
-                )
-            else:
-                self._smtp_connection = smtplib.SMTP(
-                    self._smtp_config.server, self._smtp_config.port
-                )
-            self._smtp_connection.ehlo()
-
-            if self._smtp_config.encryption == SmtpEncryption.DEFAULT:
-                try:
-                    starttls_result = self._smtp_connection.starttls()
-
-                    if starttls_result[0] == 220:
-                        logger.info(self, "SMTP Start TLS OK")
-
-                    log = "SMTP Start TLS return code: {} with message: {}"
-                    logger.debug(
-                        self, log.format(starttls_result[0], starttls_result[1].decode("utf-8"))
-                    )
-                except smtplib.SMTPResponseException as exc:
-                    log = "SMTP start TLS return error code: {} with message: {}"
-                    logger.error(self, log.format(exc.smtp_code, exc.smtp_error.decode("utf-8")))
-                except Exception:
-                    log = "Unexpected exception during SMTP start TLS process"
-                    logger.exception(self, log)
-
-            if self._smtp_config.authentication:
-                try:
-                    login_res = self._smtp_connection.login(
-                        self._smtp_config.login, self._smtp_config.password
-                    )
-
-                    if login_res[0] == 235:
-                        logger.info(self, "SMTP Authentication Successful")
-                    if login_res[0] == 503:
-                        logger.info(self, "SMTP Already Authenticated")
-
-                    log = "SMTP login return code: {} with message: {}"
-                    logger.debug(self, log.format(login_res[0], login_res[1].decode("utf-8")))
-                except smtplib.SMTPAuthenticationError as exc:
-                    log = "SMTP auth return error code: {} with message: {}"
-                    logger.error(self, log.format(exc.smtp_code, exc.smtp_error.decode("utf-8")))
-                    logger.error(
-                        self, "check your auth params combinaison " "(login/password) for SMTP"
-                    )
-                except smtplib.SMTPResponseException as exc:
-                    log = "SMTP login return error code: {} with message: {}"
-                    logger.error(self, log.format(exc.smtp_code, exc.smtp_error.decode("utf-8")))
-                except Exception:
-                    log = "Unexpected exception during SMTP login"
-                    logger.exception(self, log)
+            self._smtp_connection = open_smtp_connection(self._smtp_config)
 
     def disconnect(self):
         if self._smtp_connection:
@@ -127,7 +144,13 @@ def send_mail(self, message: MIMEMultipart):
             log = "Not sending email to {} (service disabled)"
             logger.info(self, log.format(message["To"]))
         else:
-            self.connect()  # Actually, this connects to SMTP only if required
+            # INFO - 2026-10-18 - the mail sender daemon shares a pool of long-lived connections
+            # between jobs, see MailSenderDaemon
+            from tracim_backend.lib.mail_notifier.smtp_pool import get_smtp_pool
+
+            smtp_pool = get_smtp_pool()
+            if not smtp_pool:
+                self.connect()  # Actually, this connects to SMTP only if required
             logger.info(self, "Sending email to {}".format(message["To"]))
             # TODO - G.M - 2019-01-29 - optimisize this code, we should not send
             # email if connection has failed.
@@ -135,7 +158,10 @@ def send_mail(self, message: MIMEMultipart):
             failed_action = "{:8s}".format("SENDFAIL")
             action = send_action
             try:
-                send_message_result = self._smtp_connection.send_message(message)
+                if smtp_pool:
+                    send_message_result = smtp_pool.send_message(message)
+                else:
+                    send_message_result = self._smtp_connection.send_message(message)
                 # INFO - G.M - 2019-01-29 - send_message return if not failed,
                 # dict of refused recipients.
 
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+from email.mime.multipart import MIMEMultipart
+import smtplib
+import threading
+import time
+import typing
+
+from tracim_backend.config import CFG
+from tracim_backend.lib.mail_notifier.sender import open_smtp_connection
+from tracim_backend.lib.mail_notifier.utils import SmtpConfiguration
+from tracim_backend.lib.utils.logger import logger
+
+_smtp_pool = None  # type: typing.Optional[SmtpConnectionPool]
+
+
+def get_smtp_pool() -> typing.Optional["SmtpConnectionPool"]:
+    """:return: the SMTP connection pool used by EmailSender in this process, if any"""
+    return _smtp_pool
+
+
+def set_smtp_pool(smtp_pool: typing.Optional["SmtpConnectionPool"]) -> None:
+    global _smtp_pool
+    _smtp_pool = smtp_pool
+
+
+class RateLimiter(object):
+    """Space out calls so that at most max_rate calls are done per second, 0 for no limit."""
+
+    def __init__(self, max_rate: float) -> None:
+        self._interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self._next_call_time = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> float:
+        """
+        Block until the next call is allowed.
+        :return: waited time in seconds
+        """
+        if not self._interval:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            call_time = max(now, self._next_call_time)
+            self._next_call_time = call_time + self._interval
+        delay = call_time - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class SmtpPoolStats(object):
+    """Counters of an SmtpConnectionPool, safe to update from several threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.sent_count = 0
+        self.failed_count = 0
+        self.opened_connection_count = 0
+        # INFO - 2026-10-18 - senders waiting for a free connection
+        self.waiting_count = 0
+        self.total_send_time = 0.0
+        self.max_send_time = 0.0
+
+    @property
+    def average_send_time(self) -> float:
+        send_count = self.sent_count + self.failed_count
+        return self.total_send_time / send_count if send_count else 0.0
+
+    def add_send(self, send_time: float, success: bool) -> None:
+        with self._lock:
+            if success:
+                self.sent_count += 1
+            else:
+                self.failed_count += 1
+            self.total_send_time += send_time
+            self.max_send_time = max(self.max_send_time, send_time)
+
+    def add_opened_connection(self) -> None:
+        with self._lock:
+            self.opened_connection_count += 1
+
+    def add_waiting(self, count: int) -> None:
+        with self._lock:
+            self.waiting_count += count
+
+
+class SmtpConnectionPool(object):
+    """
+    Long-lived SMTP connections shared by the threads of the mail sender daemon.
+
+    At most size connections are open at the same time: senders wait for a free one.
+    Connections are kept open between emails, so EHLO, STARTTLS and login are done once per
+    connection instead of once per email. A connection closed by the server (idle timeout,
+    restart…) is opened again and the email is sent once more.
+    Emails are sent at most max_rate per second, 0 for no limit.
+    """
+
+    # INFO - 2026-10-18 - socket timeout of the connections, in seconds: jobs of the mail
+    # sender daemon have no time limit.
+    CONNECTION_TIMEOUT = 60
+    # INFO - 2026-10-18 - minimum interval between two stats logs, in seconds
+    STATS_LOG_INTERVAL = 60
+
+    def __init__(self, smtp_config: SmtpConfiguration, size: int = 1, max_rate: float = 0) -> None:
+        self._smtp_config = smtp_config
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle_connections = []  # type: typing.List[smtplib.SMTP]
+        self._lock = threading.Lock()
+        self._rate_limiter = RateLimiter(max_rate)
+        self._last_stats_log_time = time.monotonic()
+        self.size = size
+        self.stats = SmtpPoolStats()
+
+    @classmethod
+    def from_config(cls, config: CFG) -> "SmtpConnectionPool":
+        smtp_config = SmtpConfiguration(
+            config.EMAIL__NOTIFICATION__SMTP__SERVER,
+            config.EMAIL__NOTIFICATION__SMTP__PORT,
+            config.EMAIL__NOTIFICATION__SMTP__USER,
+            config.EMAIL__NOTIFICATION__SMTP__PASSWORD,
+            config.EMAIL__NOTIFICATION__SMTP__ENCRYPTION,
+            config.EMAIL__NOTIFICATION__SMTP__AUTHENTICATION,
+        )
+        return cls(
+            smtp_config,
+            size=config.EMAIL__NOTIFICATION__SMTP__POOL_SIZE,
+            max_rate=config.EMAIL__NOTIFICATION__SMTP__MAX_RATE,
+        )
+
+    def send_message(self, message: MIMEMultipart) -> typing.Dict[str, typing.Tuple[int, bytes]]:
+        """
+        Send the message with a connection of the pool, like smtplib.SMTP.send_message().
+        :return: refused recipients
+        """
+        self._rate_limiter.wait()
+        if not self._slots.acquire(blocking=False):
+            self.stats.add_waiting(1)
+            self._slots.acquire()
+            self.stats.add_waiting(-1)
+        connection = None
+        reusable = False
+        success = False
+        start_time = time.monotonic()
+        try:
+            connection = self._take_connection()
+            try:
+                result = connection.send_message(message)
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                logger.info(self, "SMTP connection lost, connecting again")
+                self._close_connection(connection)
+                connection = None
+                connection = self._open_connection()
+                result = connection.send_message(message)
+            reusable = True
+            success = True
+            return result
+        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError):
+            # INFO - 2026-10-18 - smtplib has reset the transaction, the connection is still usable
+            reusable = True
+            raise
+        finally:
+            self.stats.add_send(time.monotonic() - start_time, success)
+            if connection is not None:
+                if reusable:
+                    with self._lock:
+                        self._idle_connections.append(connection)
+                else:
+                    self._close_connection(connection)
+            self._slots.release()
+
+    def log_stats(self, queue_depth: int, force: bool = False) -> None:
+        """Log the stats, at most once per STATS_LOG_INTERVAL unless forced."""
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_stats_log_time < self.STATS_LOG_INTERVAL:
+                return
+            self._last_stats_log_time = now
+        logger.info(
+            self,
+            "SMTP pool stats: {} emails queued, {} sent, {} failed, {} connections opened, "
+            "{} senders waiting, send time average {:.3f}s max {:.3f}s".format(
+                queue_depth,
+                self.stats.sent_count,
+                self.stats.failed_count,
+                self.stats.opened_connection_count,
+                self.stats.waiting_count,
+                self.stats.average_send_time,
+                self.stats.max_send_time,
+            ),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            connections = self._idle_connections
+            self._idle_connections = []
+        for connection in connections:
+            self._close_connection(connection)
+
+    def _take_connection(self) -> smtplib.SMTP:
+        with self._lock:
+            if self._idle_connections:
+                return self._idle_connections.pop()
+        return self._open_connection()
+
+    def _open_connection(self) -> smtplib.SMTP:
+        connection = open_smtp_connection(self._smtp_config, timeout=self.CONNECTION_TIMEOUT)
+        self.stats.add_opened_connection()
+        return connection
+
+    def _close_connection(self, connection: smtplib.SMTP) -> None:
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
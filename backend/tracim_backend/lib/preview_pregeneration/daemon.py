@@ -0,0 +1,62 @@
+import multiprocessing
+import typing
+
+from tracim_backend.config import CFG
+from tracim_backend.lib.rq import RqQueueName
+from tracim_backend.lib.rq import get_redis_connection
+from tracim_backend.lib.rq.worker import DatabaseWorker
+from tracim_backend.lib.utils.daemon import FakeDaemon
+from tracim_backend.lib.utils.logger import logger
+
+# INFO - 2026-10-18 - workers dequeue jobs from the first non-empty queue of this list
+PREVIEW_GENERATOR_QUEUE_NAMES = [
+    RqQueueName.PREVIEW_GENERATOR.value,
+    RqQueueName.PREVIEW_GENERATOR_LOW_PRIORITY.value,
+]
+
+
+def run_preview_generator_worker(config: CFG, burst: bool) -> None:
+    worker = DatabaseWorker(PREVIEW_GENERATOR_QUEUE_NAMES, connection=get_redis_connection(config))
+    worker.work(burst=burst, app_config=config)
+
+
+class PreviewGeneratorDaemon(FakeDaemon):
+    """
+    Generate the previews enqueued by PreviewPregenerationHooks and "tracimcli preview cache warm".
+
+    PREVIEW__PREGENERATION__WORKERS workers run in processes of their own: this limits the
+    number of previews generated concurrently, other jobs wait in the RQ queues.
+    """
+
+    def __init__(self, config: CFG, burst=True, *args, **kwargs):
+        """
+        :param config: Tracim Config
+        :param burst: if true, run one time, if false, run continuously
+        """
+        super().__init__(*args, **kwargs)
+        self.config = config
+        self.burst = burst
+        self.processes = []  # type: typing.List[multiprocessing.Process]
+
+    def append_thread_callback(self, callback: typing.Callable) -> None:
+        logger.warning("PreviewGeneratorDaemon does not implement append_thread_callback")
+        pass
+
+    def stop(self) -> None:
+        # INFO - 2026-10-18 - RQ workers stop after their current job on SIGTERM
+        for process in self.processes:
+            process.terminate()
+
+    def run(self) -> None:
+        self.processes = [
+            multiprocessing.Process(
+                target=run_preview_generator_worker,
+                args=(self.config, self.burst),
+                name="preview_generator_worker_{}".format(index),
+            )
+            for index in range(self.config.PREVIEW__PREGENERATION__WORKERS)
+        ]
+        for process in self.processes:
+            process.start()
+        for process in self.processes:
+            process.join()
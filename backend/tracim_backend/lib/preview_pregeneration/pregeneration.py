@@ -0,0 +1,228 @@
+import typing
+
+from sqlalchemy.event import listen
+from sqlalchemy.orm import Session
+
+from tracim_backend.config import CFG
+from tracim_backend.lib.core.plugins import hookimpl
+from tracim_backend.lib.core.preview_metadata import PreviewMetadataLib
+from tracim_backend.lib.core.preview_metadata import RevisionPreviewMetadata
+from tracim_backend.lib.rq import RqQueueName
+from tracim_backend.lib.rq import get_rq_queue2
+from tracim_backend.lib.rq.worker import worker_context
+from tracim_backend.lib.utils.logger import logger
+from tracim_backend.lib.utils.request import TracimContext
+from tracim_backend.models.data import Content
+from tracim_backend.models.data import ContentRevisionRO
+from tracim_backend.models.tracim_session import TracimSession
+
+
+class PreviewPregenerationLib(object):
+    """
+    Generate the previews of revision files before they are viewed: the jpeg previews of
+    all allowed dimensions and the one page pdf preview of the first
+    PREVIEW__PREGENERATION__MAX_PAGES pages.
+
+    Generation is done by the preview generator daemon through two RQ queues, in order of
+    priority: the first page of small files, then the first page of other files and the
+    next pages of all files.
+    """
+
+    CHUNK_SIZE = 100
+
+    def __init__(self, session: TracimSession, config: CFG) -> None:
+        self._session = session
+        self._config = config
+        self._preview_metadata_lib = PreviewMetadataLib(session, config)
+
+    def get_queue_name(self, revision: ContentRevisionRO) -> RqQueueName:
+        """:return: queue of the job generating the first page of the revision"""
+        if (revision.file_size or 0) <= self._config.PREVIEW__PREGENERATION__SMALL_FILE_SIZE:
+            return RqQueueName.PREVIEW_GENERATOR
+        return RqQueueName.PREVIEW_GENERATOR_LOW_PRIORITY
+
+    def enqueue(self, revision_ids_by_queue: typing.Dict[RqQueueName, typing.List[int]]) -> None:
+        for queue_name, revision_ids in revision_ids_by_queue.items():
+            queue = get_rq_queue2(self._config, queue_name)
+            for revision_id in revision_ids:
+                queue.enqueue(
+                    pregenerate_revision_previews,
+                    revision_id,
+                    job_timeout=self._config.PREVIEW__PREGENERATION__JOB_TIMEOUT,
+                )
+
+    def pregenerate(
+        self,
+        revision: ContentRevisionRO,
+        page_numbers: typing.Iterable[int],
+        metadata: typing.Optional[RevisionPreviewMetadata] = None,
+    ) -> typing.List[int]:
+        """
+        Generate the previews of the given pages of the revision file.
+        Pages use preview_generator numbering (first page is 0), pages which
+        do not exist are ignored.
+        :param metadata: preview metadata of the revision if already known
+        :return: the pages whose previews have been generated
+        """
+        metadata = metadata or self._preview_metadata_lib.get(revision)
+        if not (metadata.has_jpeg or metadata.has_pdf):
+            return []
+        page_numbers = [
+            page_number for page_number in page_numbers if page_number < (metadata.page_nb or 1)
+        ]
+        storage_lib = self._preview_metadata_lib.storage_lib
+        with storage_lib.preview_generator_filepath_context(
+            depot_file=revision.depot_file, original_file_extension=revision.file_extension
+        ) as file_path:
+            for page_number in page_numbers:
+                if metadata.has_jpeg:
+                    for preview_dim in self._config.PREVIEW__JPG__ALLOWED_DIMS:
+                        storage_lib.preview_manager.get_jpeg_preview(
+                            file_path,
+                            page=page_number,
+                            width=preview_dim.width,
+                            height=preview_dim.height,
+                            file_ext=revision.file_extension,
+                        )
+                if metadata.has_pdf:
+                    storage_lib.preview_manager.get_pdf_preview(
+                        file_path, page=page_number, file_ext=revision.file_extension
+                    )
+        return page_numbers
+
+    def warm(
+        self, workspace_ids: typing.Optional[typing.List[int]] = None, enqueue: bool = False
+    ) -> typing.Tuple[int, int]:
+        """
+        Generate (or enqueue the generation of) the previews of the current revision of
+        the files which are neither deleted nor archived.
+        :param workspace_ids: only warm files of these workspaces
+        :param enqueue: enqueue jobs for the preview generator daemon instead of generating
+        the previews in this process
+        :return: the number of processed revisions and the number of failed generations
+        """
+        query = (
+            self._session.query(ContentRevisionRO)
+            .join(Content, Content.cached_revision_id == ContentRevisionRO.revision_id)
+            .filter(
+                ContentRevisionRO.depot_file.isnot(None),
+                ContentRevisionRO.is_deleted == False,  # noqa: E712
+                ContentRevisionRO.is_archived == False,  # noqa: E712
+            )
+        )
+        if workspace_ids:
+            query = query.filter(ContentRevisionRO.workspace_id.in_(workspace_ids))
+        page_numbers = range(self._config.PREVIEW__PREGENERATION__MAX_PAGES)
+        revision_count = 0
+        error_count = 0
+        last_revision_id = 0
+        while True:
+            revisions = (
+                query.filter(ContentRevisionRO.revision_id > last_revision_id)
+                .order_by(ContentRevisionRO.revision_id)
+                .limit(self.CHUNK_SIZE)
+                .all()
+            )
+            if not revisions:
+                break
+            last_revision_id = revisions[-1].revision_id
+            revision_count += len(revisions)
+            if enqueue:
+                revision_ids_by_queue = {}  # type: typing.Dict[RqQueueName, typing.List[int]]
+                for revision in revisions:
+                    revision_ids_by_queue.setdefault(self.get_queue_name(revision), []).append(
+                        revision.revision_id
+                    )
+                self.enqueue(revision_ids_by_queue)
+                continue
+            for revision in revisions:
+                try:
+                    self.pregenerate(revision, page_numbers)
+                except Exception:
+                    logger.warning(
+                        self,
+                        "Unable to generate previews of revision {}".format(revision.revision_id),
+                        exc_info=True,
+                    )
+                    error_count += 1
+        return revision_count, error_count
+
+    def pregenerate_from_job(self, revision_id: int, first_page: bool) -> None:
+        """
+        Generate the first page of the revision then enqueue the next pages with a low
+        priority, or generate the next pages.
+        """
+        revision = self._session.query(ContentRevisionRO).get(revision_id)
+        if not revision or not revision.depot_file:
+            return
+        max_pages = self._config.PREVIEW__PREGENERATION__MAX_PAGES
+        metadata = self._preview_metadata_lib.get(revision)
+        if not first_page:
+            self.pregenerate(revision, range(1, max_pages), metadata)
+            return
+        if self.pregenerate(revision, [0], metadata) and min(max_pages, metadata.page_nb or 1) > 1:
+            get_rq_queue2(self._config, RqQueueName.PREVIEW_GENERATOR_LOW_PRIORITY).enqueue(
+                pregenerate_revision_previews,
+                revision_id,
+                first_page=False,
+                job_timeout=self._config.PREVIEW__PREGENERATION__JOB_TIMEOUT,
+            )
+
+
+def pregenerate_revision_previews(revision_id: int, first_page: bool = True) -> None:
+    """
+    Generate previews of a revision.
+    Is exclusively made to be used inside a RQ DatabaseWorker()
+    """
+    with worker_context() as context:
+        PreviewPregenerationLib(context.dbsession, context.app_config).pregenerate_from_job(
+            revision_id, first_page
+        )
+
+
+class PreviewPregenerationHooks(object):
+    """Enqueue the generation of the previews of new revision files."""
+
+    # pluggy uses this attribute to name the plugin
+    __name__ = "PreviewPregenerationHooks"
+
+    @hookimpl
+    def on_content_created(self, content: Content, context: TracimContext) -> None:
+        self._enqueue_new_files(content, context)
+
+    @hookimpl
+    def on_content_modified(self, content: Content, context: TracimContext) -> None:
+        self._enqueue_new_files(content, context)
+
+    def _enqueue_new_files(self, content: Content, context: TracimContext) -> None:
+        session = context.dbsession
+        preview_pregeneration_lib = PreviewPregenerationLib(session, context.app_config)
+        revision_ids_by_queue = {}  # type: typing.Dict[RqQueueName, typing.List[int]]
+        for obj in session.new:
+            # INFO - 2026-10-18 - preview metadata are copied to new revisions of an unchanged
+            # file, they are unknown for new files.
+            if (
+                isinstance(obj, ContentRevisionRO)
+                and obj.content_id == content.id
+                and obj.depot_file
+                and obj.preview_has_jpeg is None
+            ):
+                revision_ids_by_queue.setdefault(
+                    preview_pregeneration_lib.get_queue_name(obj), []
+                ).append(obj.revision_id)
+        if not revision_ids_by_queue:
+            return
+        content_id = content.content_id
+
+        def enqueue_after_commit(session: Session) -> None:
+            try:
+                preview_pregeneration_lib.enqueue(revision_ids_by_queue)
+            except Exception:
+                logger.exception(
+                    self,
+                    "Exception while enqueuing the preview generation of content {}".format(
+                        content_id
+                    ),
+                )
+
+        listen(session, "after_commit", enqueue_after_commit, once=True)
@@ -12,6 +12,8 @@ class RqQueueName(str, enum.Enum):
     EVENT = "event"
     MAIL_SENDER = "mail_sender"
     ELASTICSEARCH_INDEXER = "elasticsearch_indexer"
+    PREVIEW_GENERATOR = "preview_generator"
+    PREVIEW_GENERATOR_LOW_PRIORITY = "preview_generator_low_priority"
 
 
 def get_redis_connection(config: CFG) -> redis.Redis:
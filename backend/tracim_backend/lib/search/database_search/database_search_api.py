@@ -0,0 +1,385 @@
+from collections import defaultdict
+import re
+import typing
+
+from bs4 import BeautifulSoup
+import pluggy
+from sqlalchemy import desc
+from sqlalchemy import inspect
+from sqlalchemy.orm import Query
+from sqlalchemy.orm import Session
+
+from tracim_backend.app_models.contents import ContentTypeSlug
+from tracim_backend.config import CFG
+from tracim_backend.lib.core.content import ContentApi
+from tracim_backend.lib.core.plugins import hookimpl
+from tracim_backend.lib.core.tag import TagLib
+from tracim_backend.lib.search.database_search.fulltext_index import FullTextIndex
+from tracim_backend.lib.search.database_search.fulltext_index import FullTextIndexRow
+from tracim_backend.lib.search.database_search.fulltext_index import get_fulltext_index
+from tracim_backend.lib.search.models import ContentSearchResponse
+from tracim_backend.lib.search.search import IndexedContentsResults
+from tracim_backend.lib.search.search import SearchApi
+from tracim_backend.lib.search.simple_search.models import SimpleContentSearchResponse
+from tracim_backend.lib.search.simple_search.simple_search_api import SEARCH_SEPARATORS
+from tracim_backend.lib.utils.logger import logger
+from tracim_backend.lib.utils.request import TracimContext
+from tracim_backend.models.auth import User
+from tracim_backend.models.data import Content
+from tracim_backend.models.data import ContentRevisionRO
+from tracim_backend.models.tag import Tag
+from tracim_backend.models.tag import TagOnContent
+from tracim_backend.views.search_api.schemas import ContentSearchQuery
+
+# content types which won't be indexed directly: they are indexed with their main content
+EXCLUDED_CONTENT_TYPES = (ContentTypeSlug.COMMENT.value, ContentTypeSlug.TODO.value)
+
+
+class DatabaseSearchApi(SearchApi):
+    """
+    Search using a full text index stored in the database (PostgreSQL tsvector
+    or SQLite FTS5, see FullTextIndex):
+    - contents are indexed by DatabaseContentIndexer in the transaction modifying them,
+    comments and todos with the content they belong to
+    - filtering, ranking and pagination are done by the database
+    """
+
+    CHUNK_SIZE = 500
+
+    def __init__(self, session: Session, current_user: typing.Optional[User], config: CFG) -> None:
+        super().__init__(session=session, current_user=current_user, config=config)
+        self._fulltext_index = None  # type: typing.Optional[FullTextIndex]
+
+    @property
+    def fulltext_index(self) -> FullTextIndex:
+        if not self._fulltext_index:
+            self._fulltext_index = get_fulltext_index(self._session, self._config)
+        return self._fulltext_index
+
+    def create_indices(self) -> None:
+        self.fulltext_index.create()
+
+    def migrate_indices(self) -> None:
+        self.fulltext_index.drop()
+        self.fulltext_index.create()
+        self.index_all_content()
+
+    def delete_indices(self) -> None:
+        self.fulltext_index.drop()
+
+    def register_plugins(self, plugin_manager: pluggy.PluginManager) -> None:
+        plugin_manager.register(DatabaseContentIndexer())
+
+    def index_content(self, content: Content) -> None:
+        self.index_contents([content])
+
+    def index_all_content(self) -> IndexedContentsResults:
+        content_api = ContentApi(
+            session=self._session,
+            config=self._config,
+            current_user=None,
+            show_archived=True,
+            show_deleted=True,
+        )
+        return self.index_contents(self._get_contents_by_id(content_api.get_all_query()))
+
+    def index_contents(
+        self,
+        contents: typing.Iterable[Content],
+        on_progress: typing.Optional[typing.Callable[[IndexedContentsResults], None]] = None,
+    ) -> IndexedContentsResults:
+        """
+        Index the given contents (comments and todos are ignored) by chunks of CHUNK_SIZE.
+        :param on_progress: called with the results each time a chunk is indexed
+        """
+        results = IndexedContentsResults([], [])
+        chunk = []  # type: typing.List[Content]
+        for content in contents:
+            if content.type in EXCLUDED_CONTENT_TYPES:
+                continue
+            chunk.append(content)
+            if len(chunk) >= self.CHUNK_SIZE:
+                self._index_chunk(chunk, results, on_progress)
+                chunk = []
+        if chunk:
+            self._index_chunk(chunk, results, on_progress)
+        return results
+
+    def _get_contents_by_id(self, query: Query) -> typing.Iterator[Content]:
+        """Iterate over contents of the query ordered by id, loading them chunk by chunk."""
+        last_content_id = 0
+        while True:
+            contents = (
+                query.filter(Content.id > last_content_id)
+                .order_by(Content.id)
+                .limit(self.CHUNK_SIZE)
+                .all()
+            )
+            if not contents:
+                return
+            yield from contents
+            last_content_id = contents[-1].id
+
+    def remove_contents(self, content_ids: typing.List[int]) -> None:
+        self.fulltext_index.remove(content_ids)
+
+    def _index_chunk(
+        self,
+        contents: typing.List[Content],
+        results: IndexedContentsResults,
+        on_progress: typing.Optional[typing.Callable[[IndexedContentsResults], None]],
+    ) -> None:
+        self.fulltext_index.update(self._create_index_rows(contents))
+        results.content_ids_to_index.extend(content.id for content in contents)
+        if on_progress:
+            on_progress(results)
+
+    def _create_index_rows(self, contents: typing.List[Content]) -> typing.List[FullTextIndexRow]:
+        content_ids = [content.id for content in contents]
+        revisions = (
+            self._session.query(ContentRevisionRO)
+            .join(Content, Content.cached_revision_id == ContentRevisionRO.revision_id)
+            .filter(Content.id.in_(content_ids))
+        )
+        parents_by_content_id = Content.get_recursive_parents_of(self._session, contents)
+        parent_states = self._get_parent_states(parents_by_content_id)
+        tags_by_content_id = defaultdict(list)
+        for content_id, tag_name in (
+            self._session.query(TagOnContent.content_id, Tag.tag_name)
+            .join(Tag, Tag.tag_id == TagOnContent.tag_id)
+            .filter(TagOnContent.content_id.in_(content_ids))
+        ):
+            tags_by_content_id[content_id].append(tag_name)
+        comments_by_content_id = defaultdict(list)
+        for parent_id, raw_content in (
+            self._session.query(ContentRevisionRO.parent_id, ContentRevisionRO.raw_content)
+            .join(Content, Content.cached_revision_id == ContentRevisionRO.revision_id)
+            .filter(
+                ContentRevisionRO.parent_id.in_(content_ids),
+                ContentRevisionRO.type.in_(EXCLUDED_CONTENT_TYPES),
+                ContentRevisionRO.is_deleted == False,  # noqa: E712
+                ContentRevisionRO.is_archived == False,  # noqa: E712
+            )
+            .order_by(ContentRevisionRO.created, Content.id)
+        ):
+            comments_by_content_id[parent_id].append(self._html_to_text(raw_content))
+
+        rows = []
+        for revision in revisions:
+            parent_ids = [parent.id for parent in parents_by_content_id[revision.content_id]]
+            rows.append(
+                FullTextIndexRow(
+                    content_id=revision.content_id,
+                    label=revision.label,
+                    file_name=revision.file_name,
+                    tags=" ".join(tags_by_content_id[revision.content_id]),
+                    description=revision.description,
+                    raw_content=self._html_to_text(revision.raw_content),
+                    comments="\n".join(comments_by_content_id[revision.content_id]),
+                    deleted_through_parent=any(
+                        parent_states[parent_id][0] for parent_id in parent_ids
+                    ),
+                    archived_through_parent=any(
+                        parent_states[parent_id][1] for parent_id in parent_ids
+                    ),
+                )
+            )
+        return rows
+
+    def _get_parent_states(
+        self, parents_by_content_id: typing.Dict[int, typing.List[Content]]
+    ) -> typing.Dict[int, typing.Tuple[bool, bool]]:
+        """:return: (is_deleted, is_archived) of the given parents by id"""
+        parents = {
+            parent.id: parent for parents in parents_by_content_id.values() for parent in parents
+        }
+        if not parents:
+            return {}
+        parent_states = {
+            content_id: (is_deleted, is_archived)
+            for content_id, is_deleted, is_archived in self._session.query(
+                Content.id, ContentRevisionRO.is_deleted, ContentRevisionRO.is_archived
+            )
+            .join(ContentRevisionRO, Content.cached_revision_id == ContentRevisionRO.revision_id)
+            .filter(Content.id.in_(list(parents)))
+        }
+        # INFO - 2026-10-18 - parents not flushed yet (see Content.get_recursive_parents_of)
+        for parent_id, parent in parents.items():
+            if parent_id not in parent_states:
+                parent_states[parent_id] = (parent.is_deleted, parent.is_archived)
+        return parent_states
+
+    @staticmethod
+    def _html_to_text(html: typing.Optional[str]) -> str:
+        if not html:
+            return ""
+        return BeautifulSoup(html, "html.parser").get_text(" ")
+
+    def search_content(self, search_parameters: ContentSearchQuery) -> ContentSearchResponse:
+        """
+        Search contents containing any of the keywords of the search string
+        (or a word starting with one of them), best matches first.
+        - do no show archived/deleted content by default
+        - filter content found according to workspace of current_user
+        """
+        keywords = [
+            keyword
+            for keyword in re.split(SEARCH_SEPARATORS, search_parameters.search_string or "")
+            if keyword.strip()
+        ]
+        if not keywords:
+            return ContentSearchResponse()
+
+        content_api = ContentApi(
+            session=self._session,
+            current_user=self._user,
+            config=self._config,
+            show_deleted=search_parameters.show_deleted,
+            show_archived=search_parameters.show_archived,
+            show_active=search_parameters.show_active,
+        )
+        query, score = self._search_query(
+            keywords=keywords,
+            content_api=content_api,
+            content_types=search_parameters.content_types,
+        )
+        total_hits = query.count()
+        offset = self.offset_from_pagination(search_parameters.size, search_parameters.page_nb)
+        results = (
+            query.add_columns(score)
+            .order_by(desc(score), desc(Content.updated), desc(Content.id))
+            .offset(offset)
+            .limit(search_parameters.size)
+            .all()
+        )
+        return SimpleContentSearchResponse(
+            content_list=content_api.get_contents_in_context(content for content, _ in results),
+            total_hits=total_hits,
+            scores=[score for _, score in results],
+            is_total_hits_accurate=True,
+        )
+
+    def _search_query(
+        self,
+        keywords: typing.List[str],
+        content_api: ContentApi,
+        content_types: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Tuple[Query, typing.Any]:
+        """
+        :return: query of matching contents and their score expression
+        """
+        match = self.fulltext_index.match(keywords)
+        query = (
+            content_api.get_base_query(None)
+            .join(match.table, match.content_id == Content.id)
+            .filter(match.criterion)
+        )
+        if not content_api._show_deleted:
+            query = query.filter(match.table.c.deleted_through_parent == False)  # noqa: E712
+        if not content_api._show_archived:
+            query = query.filter(match.table.c.archived_through_parent == False)  # noqa: E712
+        if content_types:
+            query = query.filter(Content.type.in_(content_types))
+        return query, match.score
+
+
+class DatabaseContentIndexer:
+    """Keep the database full text index up to date from the database crud hooks."""
+
+    @hookimpl
+    def on_content_created(self, content: Content, context: TracimContext) -> None:
+        self.index_contents([self._get_main_content(content)], context)
+
+    @hookimpl
+    def on_content_modified(self, content: Content, context: TracimContext) -> None:
+        """Index the given content and, if its state or parent changed, its children."""
+        contents = [self._get_main_content(content)]
+        if self._should_reindex_children(content, context.dbsession):
+            contents.extend(content.recursive_children)
+        self.index_contents(contents, context)
+
+    @hookimpl
+    def on_content_deleted(self, content: Content, context: TracimContext) -> None:
+        if content.type in EXCLUDED_CONTENT_TYPES:
+            if content.parent:
+                self.index_contents([self._get_main_content(content)], context)
+            return
+        search_api = self._get_search_api(context)
+        if search_api.fulltext_index.exists():
+            search_api.remove_contents([content.id])
+
+    @hookimpl
+    def on_content_tag_created(self, content_tag: TagOnContent, context: TracimContext) -> None:
+        self.index_contents([content_tag.content], context)
+
+    @hookimpl
+    def on_content_tag_deleted(self, content_tag: TagOnContent, context: TracimContext) -> None:
+        self.index_contents([content_tag.content], context)
+
+    @hookimpl
+    def on_tag_modified(self, tag: Tag, context: TracimContext) -> None:
+        self.index_contents(TagLib(context.dbsession).get_contents(tag), context)
+
+    def index_contents(self, contents: typing.Iterable[Content], context: TracimContext) -> None:
+        # INFO - 2026-10-18 - do not fail content modifications while the index is not created
+        # (see "tracimcli search index-create")
+        if not self._get_search_api(context).fulltext_index.exists():
+            logger.warning(self, "Full text index does not exist, contents are not indexed")
+            return
+        self.sync_index_contents(contents, context)
+
+    def sync_index_contents(
+        self,
+        contents: typing.Iterable[Content],
+        context: TracimContext,
+        on_progress: typing.Optional[typing.Callable[[IndexedContentsResults], None]] = None,
+    ) -> int:
+        """:return: number of contents whose indexing failed"""
+        results = self._get_search_api(context).index_contents(contents, on_progress=on_progress)
+        return results.get_nb_index_errors()
+
+    @staticmethod
+    def _get_search_api(context: TracimContext) -> DatabaseSearchApi:
+        return DatabaseSearchApi(
+            session=context.dbsession, current_user=None, config=context.app_config
+        )
+
+    @staticmethod
+    def _get_main_content(content: Content) -> Content:
+        """Find the first ancestor which has a type to be indexed."""
+        while content.parent and content.type in EXCLUDED_CONTENT_TYPES:
+            content = content.parent
+        return content
+
+    @staticmethod
+    def _should_reindex_children(content: Content, session: Session) -> bool:
+        """
+        Children are indexed with the deleted/archived state of their parents:
+        they must be indexed again when this state or their parent changes.
+        """
+        # INFO - 2026-10-18 - every modification creates a new revision, so the state is compared
+        # with the one of the previous current revision instead of the attribute history
+        # of the new revision, which is always changed.
+        history = inspect(content).attrs.current_revision.history
+        if not history.added:
+            return False
+        revision = content.current_revision
+        if history.deleted and history.deleted[0] is not None:
+            previous_revision = history.deleted[0]
+        else:
+            previous_revision = (
+                session.query(ContentRevisionRO)
+                .filter(
+                    ContentRevisionRO.content_id == content.id,
+                    ContentRevisionRO.revision_id < revision.revision_id,
+                )
+                .order_by(desc(ContentRevisionRO.revision_id))
+                .first()
+            )
+        if previous_revision is None:
+            return False
+        return (
+            revision.is_deleted != previous_revision.is_deleted
+            or revision.is_archived != previous_revision.is_archived
+            or revision.parent_id != previous_revision.parent_id
+        )
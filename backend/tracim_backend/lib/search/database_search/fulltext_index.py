@@ -0,0 +1,271 @@
+from abc import ABC
+from abc import abstractmethod
+from collections import namedtuple
+import typing
+
+from sqlalchemy import Boolean
+from sqlalchemy import Column
+from sqlalchemy import Index
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Table
+from sqlalchemy import Text
+from sqlalchemy import bindparam
+from sqlalchemy import func
+from sqlalchemy import literal_column
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+import zope.sqlalchemy
+
+from tracim_backend.config import CFG
+from tracim_backend.exceptions import NoValidSearchEngine
+
+FULLTEXT_INDEX_TABLE_NAME = "content_fulltext_index"
+
+# INFO - 2026-10-18 - text of a content to index: comments and todos text is indexed
+# with the content they belong to.
+FullTextIndexRow = namedtuple(
+    "FullTextIndexRow",
+    [
+        "content_id",
+        "label",
+        "file_name",
+        "tags",
+        "description",
+        "raw_content",
+        "comments",
+        "deleted_through_parent",
+        "archived_through_parent",
+    ],
+)
+
+# (table in the FROM clause, column to join with Content.id, match criterion, score)
+FullTextMatch = namedtuple("FullTextMatch", ["table", "content_id", "criterion", "score"])
+
+
+class FullTextIndex(ABC):
+    """
+    Full text index of contents stored in the database.
+
+    The index must be created (see create()) before indexing contents, its structure
+    depends on the database.
+    """
+
+    CHUNK_SIZE = 500
+
+    def __init__(self, session: Session, config: CFG) -> None:
+        self._session = session
+        self._config = config
+
+    @property
+    @abstractmethod
+    def table(self) -> Table:
+        pass
+
+    @abstractmethod
+    def create(self) -> None:
+        pass
+
+    @abstractmethod
+    def match(self, keywords: typing.List[str]) -> FullTextMatch:
+        """
+        Criterion matching contents containing any of the keywords (or a word starting
+        with one of them), and the score of matched contents (higher is better).
+        """
+        pass
+
+    @abstractmethod
+    def _insert_rows(self, rows: typing.List[FullTextIndexRow]) -> None:
+        pass
+
+    def exists(self) -> bool:
+        connection = self._session.connection()
+        return connection.dialect.has_table(connection, FULLTEXT_INDEX_TABLE_NAME)
+
+    def drop(self) -> None:
+        self._session.execute("DROP TABLE IF EXISTS {}".format(FULLTEXT_INDEX_TABLE_NAME))
+        zope.sqlalchemy.mark_changed(self._session, keep_session=True)
+
+    def update(self, rows: typing.List[FullTextIndexRow]) -> None:
+        """Add the given contents to the index or replace them."""
+        for offset in range(0, len(rows), self.CHUNK_SIZE):
+            chunk = rows[offset : offset + self.CHUNK_SIZE]
+            self.remove([row.content_id for row in chunk])
+            self._insert_rows(chunk)
+
+    def remove(self, content_ids: typing.List[int]) -> None:
+        content_id_column = self._get_content_id_column()
+        for offset in range(0, len(content_ids), self.CHUNK_SIZE):
+            self._session.execute(
+                self.table.delete().where(
+                    content_id_column.in_(content_ids[offset : offset + self.CHUNK_SIZE])
+                )
+            )
+        if content_ids:
+            zope.sqlalchemy.mark_changed(self._session, keep_session=True)
+
+    def _get_content_id_column(self) -> Column:
+        return self.table.c.content_id
+
+
+class PostgresqlFullTextIndex(FullTextIndex):
+    """
+    Index stored in a tsvector column with a GIN index, the text search configuration
+    used is SEARCH__DATABASE__TEXT_SEARCH_CONFIG.
+    """
+
+    _metadata = MetaData()
+    _table = Table(
+        FULLTEXT_INDEX_TABLE_NAME,
+        _metadata,
+        Column("content_id", Integer, primary_key=True),
+        Column("deleted_through_parent", Boolean, nullable=False),
+        Column("archived_through_parent", Boolean, nullable=False),
+        Column("document", TSVECTOR, nullable=False),
+        Index(
+            "idx__{}__document".format(FULLTEXT_INDEX_TABLE_NAME),
+            "document",
+            postgresql_using="gin",
+        ),
+    )
+    # INFO - 2026-10-18 - weights of the columns, A is the most important one.
+    WEIGHTS = (
+        ("label", "A"),
+        ("file_name", "A"),
+        ("tags", "B"),
+        ("description", "C"),
+        ("raw_content", "D"),
+        ("comments", "D"),
+    )
+
+    @property
+    def table(self) -> Table:
+        return self._table
+
+    def create(self) -> None:
+        self._table.create(self._session.connection(), checkfirst=True)
+        zope.sqlalchemy.mark_changed(self._session, keep_session=True)
+
+    def match(self, keywords: typing.List[str]) -> FullTextMatch:
+        query = func.to_tsquery(
+            self._config.SEARCH__DATABASE__TEXT_SEARCH_CONFIG,
+            " | ".join(
+                "'{}':*".format(keyword.replace("\\", "").replace("'", "''"))
+                for keyword in keywords
+            ),
+        )
+        document = self._table.c.document
+        return FullTextMatch(
+            table=self._table,
+            content_id=self._table.c.content_id,
+            criterion=document.op("@@")(query),
+            score=func.ts_rank(document, query),
+        )
+
+    def _insert_rows(self, rows: typing.List[FullTextIndexRow]) -> None:
+        if not rows:
+            return
+        document: typing.Optional[ColumnElement] = None
+        for field, weight in self.WEIGHTS:
+            field_vector = func.setweight(
+                func.to_tsvector(
+                    self._config.SEARCH__DATABASE__TEXT_SEARCH_CONFIG,
+                    func.coalesce(bindparam(field), ""),
+                ),
+                weight,
+            )
+            document = field_vector if document is None else document.op("||")(field_vector)
+        self._session.execute(
+            self._table.insert().values(
+                content_id=bindparam("content_id"),
+                deleted_through_parent=bindparam("deleted_through_parent"),
+                archived_through_parent=bindparam("archived_through_parent"),
+                document=document,
+            ),
+            [row._asdict() for row in rows],
+        )
+        zope.sqlalchemy.mark_changed(self._session, keep_session=True)
+
+
+class SqliteFullTextIndex(FullTextIndex):
+    """
+    Index stored in a FTS5 virtual table whose rowid is the content id.
+    """
+
+    _metadata = MetaData()
+    _table = Table(
+        FULLTEXT_INDEX_TABLE_NAME,
+        _metadata,
+        Column("rowid", Integer, primary_key=True),
+        Column("deleted_through_parent", Boolean),
+        Column("archived_through_parent", Boolean),
+        Column("label", Text),
+        Column("file_name", Text),
+        Column("tags", Text),
+        Column("description", Text),
+        Column("raw_content", Text),
+        Column("comments", Text),
+    )
+    # INFO - 2026-10-18 - bm25 weights of all columns (unindexed ones first), in the table order
+    WEIGHTS = (0.0, 0.0, 10.0, 10.0, 5.0, 2.0, 1.0, 1.0)
+
+    @property
+    def table(self) -> Table:
+        return self._table
+
+    def create(self) -> None:
+        self._session.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS {} USING fts5("
+            "deleted_through_parent UNINDEXED, archived_through_parent UNINDEXED, "
+            "label, file_name, tags, description, raw_content, comments, "
+            "tokenize = 'unicode61 remove_diacritics 2')".format(FULLTEXT_INDEX_TABLE_NAME)
+        )
+        zope.sqlalchemy.mark_changed(self._session, keep_session=True)
+
+    def match(self, keywords: typing.List[str]) -> FullTextMatch:
+        query = " OR ".join('"{}"*'.format(keyword.replace('"', '""')) for keyword in keywords)
+        table = literal_column(FULLTEXT_INDEX_TABLE_NAME)
+        return FullTextMatch(
+            table=self._table,
+            content_id=self._table.c.rowid,
+            criterion=table.op("MATCH")(query),
+            # INFO - 2026-10-18 - bm25() is lower for better matches
+            score=-func.bm25(table, *self.WEIGHTS),
+        )
+
+    def _insert_rows(self, rows: typing.List[FullTextIndexRow]) -> None:
+        if not rows:
+            return
+        self._session.execute(
+            self._table.insert(),
+            [
+                {
+                    "rowid": row.content_id,
+                    "deleted_through_parent": row.deleted_through_parent,
+                    "archived_through_parent": row.archived_through_parent,
+                    "label": row.label,
+                    "file_name": row.file_name,
+                    "tags": row.tags,
+                    "description": row.description,
+                    "raw_content": row.raw_content,
+                    "comments": row.comments,
+                }
+                for row in rows
+            ],
+        )
+        zope.sqlalchemy.mark_changed(self._session, keep_session=True)
+
+    def _get_content_id_column(self) -> Column:
+        return self._table.c.rowid
+
+
+def get_fulltext_index(session: Session, config: CFG) -> FullTextIndex:
+    dialect_name = session.connection().dialect.name
+    if dialect_name == "postgresql":
+        return PostgresqlFullTextIndex(session, config)
+    if dialect_name == "sqlite":
+        return SqliteFullTextIndex(session, config)
+    raise NoValidSearchEngine(
+        'Database search engine is not available with "{}" databases'.format(dialect_name)
+    )
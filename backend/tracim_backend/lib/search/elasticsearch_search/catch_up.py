@@ -0,0 +1,234 @@
+from collections import namedtuple
+from datetime import datetime
+from datetime import timedelta
+import typing
+
+from elasticsearch import NotFoundError
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from tracim_backend.app_models.contents import ContentTypeSlug
+from tracim_backend.config import CFG
+from tracim_backend.exceptions import IndexingError
+from tracim_backend.lib.core.content import ContentApi
+from tracim_backend.lib.core.tag import TagLib
+from tracim_backend.lib.search.elasticsearch_search.elasticsearch_search import ESContentIndexer
+from tracim_backend.lib.search.elasticsearch_search.elasticsearch_search import ESSearchApi
+from tracim_backend.lib.utils.logger import logger
+from tracim_backend.models.auth import User
+from tracim_backend.models.data import Content
+from tracim_backend.models.data import Workspace
+from tracim_backend.models.event import EntityType
+from tracim_backend.models.event import Event
+from tracim_backend.models.event import OperationType
+from tracim_backend.models.search_index import SearchIndexCheckpoint
+from tracim_backend.models.tag import Tag
+
+CHECKPOINT_NAME = "elasticsearch"
+
+CatchUpResult = namedtuple(
+    "CatchUpResult",
+    ["event_count", "last_event_id", "content_count", "user_count", "workspace_count"],
+)
+
+
+class IndexChanges:
+    """Ids of the entities to index again, collected from events."""
+
+    def __init__(self) -> None:
+        self.content_ids = set()  # type: typing.Set[int]
+        # contents whose owner must be indexed too (indexed users have the date of their
+        # newest authored content)
+        self.owned_content_ids = set()  # type: typing.Set[int]
+        # contents whose children must be indexed too
+        self.parent_content_ids = set()  # type: typing.Set[int]
+        self.user_ids = set()  # type: typing.Set[int]
+        self.workspace_ids = set()  # type: typing.Set[int]
+        # workspaces whose contents must be indexed too
+        self.content_workspace_ids = set()  # type: typing.Set[int]
+        self.tag_ids = set()  # type: typing.Set[int]
+
+    def add_event(self, event: Event) -> None:
+        if event.entity_type in (EntityType.CONTENT, EntityType.CONTENT_TAG):
+            self.content_ids.add(event.content_id)
+            if event.entity_type == EntityType.CONTENT:
+                self.owned_content_ids.add(event.content_id)
+                if event.operation != OperationType.CREATED:
+                    self.parent_content_ids.add(event.content_id)
+        elif event.entity_type == EntityType.TAG:
+            if event.operation == OperationType.MODIFIED:
+                self.tag_ids.add(event.tag["tag_id"])
+        elif event.entity_type == EntityType.WORKSPACE:
+            self.workspace_ids.add(event.workspace_id)
+            if event.operation != OperationType.CREATED:
+                self.content_workspace_ids.add(event.workspace_id)
+        elif event.entity_type == EntityType.WORKSPACE_MEMBER:
+            self.workspace_ids.add(event.workspace_id)
+            self.user_ids.add(event.user["user_id"])
+        elif event.entity_type == EntityType.USER:
+            self.user_ids.add(event.user["user_id"])
+
+
+class ESIndexCatchUp:
+    """
+    Index again the contents, users and spaces changed since a checkpoint.
+
+    Indexing done by ESContentIndexer/ESUserIndexer/ESWorkspaceIndexer is lost when
+    elasticsearch or the RQ worker is down: the checkpoint is the id of the last event whose
+    changes are known to be indexed, catching up reads the events created after it and
+    indexes the entities they concern, batch by batch.
+
+    Only events older than SEARCH__ELASTICSEARCH__CATCH_UP__SETTLE_DELAY seconds are read:
+    event ids are given when events are created, not when their transaction is committed.
+
+    Contents are not indexed again when their author is renamed.
+    """
+
+    def __init__(
+        self, session: Session, config: CFG, search_api: typing.Optional[ESSearchApi] = None
+    ) -> None:
+        self._session = session
+        self._config = config
+        self._search_api = search_api or ESSearchApi(
+            session=session, config=config, current_user=None
+        )
+
+    def get_checkpoint(self) -> typing.Optional[int]:
+        checkpoint = self._session.query(SearchIndexCheckpoint).get(CHECKPOINT_NAME)
+        return checkpoint.event_id if checkpoint else None
+
+    def set_checkpoint(self, event_id: int) -> None:
+        checkpoint = self._session.query(SearchIndexCheckpoint).get(CHECKPOINT_NAME)
+        if not checkpoint:
+            checkpoint = SearchIndexCheckpoint(name=CHECKPOINT_NAME)
+            self._session.add(checkpoint)
+        checkpoint.event_id = event_id
+        checkpoint.updated = datetime.utcnow()
+        self._session.flush()
+
+    def get_last_event_id(self) -> int:
+        return self._session.query(func.max(Event.event_id)).scalar() or 0
+
+    def catch_up_batch(self) -> CatchUpResult:
+        """
+        Index the changes of the next SEARCH__ELASTICSEARCH__CATCH_UP__BATCH_SIZE events after
+        the checkpoint and move the checkpoint after them.
+        :return: the result of the batch, with an event_count of 0 if there is nothing to index
+        :raise IndexingError: if some entities were not indexed, the checkpoint is not moved
+        """
+        checkpoint = self.get_checkpoint()
+        if checkpoint is None:
+            raise IndexingError(
+                'No search index checkpoint, index everything with "tracimcli search index-populate"'
+            )
+        settled_date = datetime.utcnow() - timedelta(
+            seconds=self._config.SEARCH__ELASTICSEARCH__CATCH_UP__SETTLE_DELAY
+        )
+        events = (
+            self._session.query(Event)
+            .filter(Event.event_id > checkpoint, Event.created <= settled_date)
+            .order_by(Event.event_id)
+            .limit(max(self._config.SEARCH__ELASTICSEARCH__CATCH_UP__BATCH_SIZE, 1))
+            .all()
+        )
+        if not events:
+            return CatchUpResult(
+                event_count=0,
+                last_event_id=checkpoint,
+                content_count=0,
+                user_count=0,
+                workspace_count=0,
+            )
+        changes = IndexChanges()
+        for event in events:
+            changes.add_event(event)
+        # INFO - 2026-10-18 - contents first: they add their owners to the users to index
+        content_count = self._index_contents(changes)
+        user_count = self._index_users(changes.user_ids)
+        workspace_count = self._index_workspaces(changes.workspace_ids)
+        self.set_checkpoint(events[-1].event_id)
+        return CatchUpResult(
+            event_count=len(events),
+            last_event_id=events[-1].event_id,
+            content_count=content_count,
+            user_count=user_count,
+            workspace_count=workspace_count,
+        )
+
+    def _index_contents(self, changes: IndexChanges) -> int:
+        content_api = ContentApi(
+            session=self._session,
+            current_user=None,
+            config=self._config,
+            show_deleted=True,
+            show_archived=True,
+        )
+        contents: typing.Dict[int, Content] = {}
+        changed_contents = content_api.get_all_by_ids(list(changes.content_ids))
+        for content in changed_contents:
+            if content.content_id in changes.owned_content_ids:
+                changes.user_ids.add(content.current_revision.owner_id)
+            content = ESContentIndexer._get_main_content(content)
+            contents[content.content_id] = content
+            if (
+                content.content_id in changes.parent_content_ids
+                and content.type == ContentTypeSlug.FOLDER.value
+            ):
+                contents.update((child.content_id, child) for child in content.recursive_children)
+        if changes.content_workspace_ids:
+            workspaces = (
+                self._session.query(Workspace)
+                .filter(Workspace.workspace_id.in_(changes.content_workspace_ids))
+                .all()
+            )
+            if workspaces:
+                contents.update(
+                    (content.content_id, content)
+                    for content in content_api.get_all_query(workspaces=workspaces)
+                )
+        tag_lib = TagLib(self._session)
+        for tag in self._session.query(Tag).filter(Tag.tag_id.in_(changes.tag_ids)):
+            contents.update((content.content_id, content) for content in tag_lib.get_contents(tag))
+
+        for content_id in changes.content_ids - {
+            content.content_id for content in changed_contents
+        }:
+            self._delete_document(self._search_api.delete_content_by_id, content_id)
+        indexed_contents = list(
+            ESContentIndexer._filter_excluded_content_types(
+                content for _, content in sorted(contents.items())
+            )
+        )
+        results = self._search_api.index_contents(indexed_contents)
+        if results.get_nb_index_errors():
+            raise IndexingError(
+                "Got error(s) while indexing contents {}".format(
+                    results.errored_indexed_contents_ids
+                )
+            )
+        return len(indexed_contents)
+
+    def _index_users(self, user_ids: typing.Set[int]) -> int:
+        users = self._session.query(User).filter(User.user_id.in_(user_ids)).all()
+        for user in users:
+            self._search_api.index_user(user)
+        for user_id in user_ids - {user.user_id for user in users}:
+            self._delete_document(self._search_api.delete_user_by_id, user_id)
+        return len(users)
+
+    def _index_workspaces(self, workspace_ids: typing.Set[int]) -> int:
+        workspaces = (
+            self._session.query(Workspace).filter(Workspace.workspace_id.in_(workspace_ids)).all()
+        )
+        for workspace in workspaces:
+            self._search_api.index_workspace(workspace)
+        for workspace_id in workspace_ids - {workspace.workspace_id for workspace in workspaces}:
+            self._delete_document(self._search_api.delete_workspace_by_id, workspace_id)
+        return len(workspaces)
+
+    def _delete_document(self, delete: typing.Callable[[int], None], document_id: int) -> None:
+        """Delete the document of an entity removed from the database."""
+        try:
+            delete(document_id)
+        except NotFoundError:
+            logger.debug(self, "Document {} is already deleted".format(document_id))
@@ -1,13 +1,18 @@
+from collections import deque
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import itertools
+import time
 import typing
 
 from dateutil.parser import parse
 from elasticsearch import Elasticsearch
 from elasticsearch import NotFoundError
 from elasticsearch.client import IngestClient
+from elasticsearch.helpers import streaming_bulk
 from elasticsearch_dsl import Document
 from elasticsearch_dsl import Index
-from elasticsearch_dsl import InnerDoc
 from elasticsearch_dsl import Search
 from elasticsearch_dsl.response.aggs import Bucket
 import pluggy
@@ -30,14 +35,16 @@
 from tracim_backend.lib.rq import get_rq_queue2
 from tracim_backend.lib.rq.worker import worker_context
 from tracim_backend.lib.search.elasticsearch_search.es_models import EXACT_FIELD
-from tracim_backend.lib.search.elasticsearch_search.es_models import DigestComments
-from tracim_backend.lib.search.elasticsearch_search.es_models import DigestContent
-from tracim_backend.lib.search.elasticsearch_search.es_models import DigestTodo
-from tracim_backend.lib.search.elasticsearch_search.es_models import DigestUser
-from tracim_backend.lib.search.elasticsearch_search.es_models import DigestWorkspace
 from tracim_backend.lib.search.elasticsearch_search.es_models import IndexedContent
 from tracim_backend.lib.search.elasticsearch_search.es_models import IndexedWorkspace
 from tracim_backend.lib.search.elasticsearch_search.es_models import create_indexed_user_class
+from tracim_backend.lib.search.elasticsearch_search.indexed_content_builder import FILE_PIPELINE_ID
+from tracim_backend.lib.search.elasticsearch_search.indexed_content_builder import (
+    IndexedContentBuilder,
+)
+from tracim_backend.lib.search.elasticsearch_search.indexed_content_builder import (
+    IndexedContentDocument,
+)
 from tracim_backend.lib.search.elasticsearch_search.models import ESContentSearchResponse
 from tracim_backend.lib.search.elasticsearch_search.models import FacetCount
 from tracim_backend.lib.search.elasticsearch_search.models import UserSearchResponse
@@ -46,12 +53,12 @@
 from tracim_backend.lib.search.models import ContentSearchResponse
 from tracim_backend.lib.search.models import UserSearchField
 from tracim_backend.lib.search.models import WorkspaceSearchField
+from tracim_backend.lib.search.search import IndexedContentsResults
 from tracim_backend.lib.search.search import SearchApi
 from tracim_backend.lib.search.search_factory import ELASTICSEARCH__SEARCH_ENGINE_SLUG
 from tracim_backend.lib.utils.logger import logger
 from tracim_backend.lib.utils.request import TracimContext
 from tracim_backend.models.auth import User
-from tracim_backend.models.context_models import ContentInContext
 from tracim_backend.models.context_models import UserInContext
 from tracim_backend.models.data import Content
 from tracim_backend.models.data import ContentRevisionRO
@@ -61,7 +68,6 @@
 from tracim_backend.models.tag import TagOnContent
 from tracim_backend.views.search_api.schemas import AdvancedContentSearchQuery
 
-FILE_PIPELINE_ID = "attachment"
 FILE_PIPELINE_SOURCE_FIELD = "b64_file"
 FILE_PIPELINE_DESTINATION_FIELD = "file_data"
 FILE_PIPELINE_LANGS = ["en", "fr", "pt", "de", "ar", "es", "nb_NO"]
@@ -75,6 +81,14 @@
 
 T = typing.TypeVar("T")
 
+# INFO - 2026-10-18 - delays in seconds between two sendings of failed bulk actions
+BULK_RETRY_INITIAL_DELAY = 1
+BULK_RETRY_MAX_DELAY = 30
+
+BulkAction = typing.Dict[str, typing.Any]
+# INFO - 2026-10-18 - chunk of contents whose documents are being sent by the bulk indexing pool
+PendingBulkChunk = namedtuple("PendingBulkChunk", ["content_ids", "errored_content_ids", "future"])
+
 
 def name_starts_with_any_prefix(name: str, name_prefixes: typing.Iterable[str]) -> bool:
     return any(name.startswith(n) for n in name_prefixes)
@@ -230,117 +244,182 @@ def migrate_indices(self) -> None:
             # move the alias to point to the newly created index
             self.set_alias(parameters, new_index_name)
 
-    def _index_subcontents(
-        self, content_in_context: ContentInContext
-    ) -> typing.Dict[str, typing.List[InnerDoc]]:
-        comments = [
-            DigestComments(
-                content_id=comment.content_id,
-                parent_id=comment.parent_id,
-                content_type=comment.content_type,
-                raw_content=comment.raw_content,
-            )
-            for comment in content_in_context.comments
-        ]
-        todos = [
-            DigestTodo(
-                content_id=todo.content_id,
-                parent_id=todo.parent_id,
-                content_type=todo.content_type,
-                raw_content=todo.raw_content,
-            )
-            for todo in content_in_context.todos
-        ]
-        return {"comments": comments, "todos": todos}
-
-    def _create_digest_user_from_user(self, user_in_context: UserInContext) -> DigestUser:
-        return DigestUser(
-            user_id=user_in_context.user_id,
-            public_name=user_in_context.public_name,
-            has_avatar=user_in_context.has_avatar,
-            has_cover=user_in_context.has_cover,
-        )
-
     def index_content(self, content: Content) -> None:
         """
         Index/update a content into elastic_search engine
         """
-        content_in_context = ContentInContext(content, config=self._config, dbsession=self._session)
-        logger.info(self, "Indexing content {}".format(content_in_context.content_id))
-        author = self._create_digest_user_from_user(content_in_context.author)
-        last_modifier = self._create_digest_user_from_user(content_in_context.last_modifier)
-        workspace = DigestWorkspace(
-            workspace_id=content_in_context.workspace.workspace_id,
-            label=content_in_context.workspace.label,
-        )
-        path = [
-            DigestContent(
-                content_id=component.content_id,
-                label=component.label,
-                slug=component.slug,
-                content_type=component.content_type,
-            )
-            for component in content_in_context.content_path
-        ]
-        indexed_subcontent = self._index_subcontents(content_in_context)
-        comments = indexed_subcontent["comments"]
-        todos = indexed_subcontent["todos"]
-        tags = [content_tag.tag.tag_name for content_tag in content.tags]
-        indexed_content = IndexedContent(
-            content_namespace=content_in_context.content_namespace,
-            content_id=content_in_context.content_id,
-            current_revision_id=content_in_context.current_revision_id,
-            current_revision_type=content_in_context.current_revision_type,
-            slug=content_in_context.slug,
-            parent_id=content_in_context.parent_id,
-            workspace_id=content_in_context.workspace_id,
-            workspace=workspace,
-            label=content_in_context.label,
-            content_type=content_in_context.content_type,
-            sub_content_types=content_in_context.sub_content_types,
-            status=content_in_context.status,
-            is_archived=content_in_context.is_archived,
-            is_deleted=content_in_context.is_deleted,
-            is_editable=content_in_context.is_editable,
-            is_active=content_in_context.is_active,
-            show_in_ui=content_in_context.show_in_ui,
-            file_extension=content_in_context.file_extension,
-            filename=content_in_context.filename,
-            modified=content_in_context.modified,
-            created=content_in_context.created,
-            active_shares=content_in_context.actives_shares,
-            description=content_in_context.description,
-            path=path,
-            comments=comments,
-            comment_count=len(comments),
-            todos=todos,
-            todo_count=len(todos),
-            tags=tags,
-            tag_count=len(tags),
-            author=author,
-            last_modifier=last_modifier,
-            archived_through_parent_id=content_in_context.archived_through_parent_id,
-            deleted_through_parent_id=content_in_context.deleted_through_parent_id,
-            raw_content=content_in_context.raw_content,
-            content_size=content_in_context.size,
-        )
-        indexed_content.meta.id = content_in_context.content_id
-        content_index_alias = self._get_index_parameters(IndexedContent).alias
-        pipeline_id = None  # type: typing.Optional[str]
-        if self._should_index_depot_file(content_in_context):
-            indexed_content.b64_file = content_in_context.get_b64_file()
-            pipeline_id = FILE_PIPELINE_ID
+        logger.info(self, "Indexing content {}".format(content.content_id))
+        indexed_content, pipeline_id = self.create_indexed_content(content)
         indexed_content.save(
             using=self.es,
             pipeline=pipeline_id,
-            index=content_index_alias,
+            index=self._get_index_parameters(IndexedContent).alias,
             request_timeout=self._config.SEARCH__ELASTICSEARCH__REQUEST_TIMEOUT,
         )
 
-    def index_contents(self, contents: typing.Iterable[Content]) -> None:
-        """Index the given contents."""
-        for content in contents:
-            self.index_content(content)
+    def create_indexed_content(
+        self, content: Content
+    ) -> typing.Tuple[IndexedContent, typing.Optional[str]]:
+        """
+        Create the document of a content to index.
+        :return: the document and the id of the ingest pipeline to use (None if no pipeline)
+        """
+        try:
+            return self.create_indexed_contents([content])[content.content_id]
+        except KeyError as exc:
+            raise IndexingError(
+                "Unable to create document of content {}".format(content.content_id)
+            ) from exc
+
+    def create_indexed_contents(
+        self, contents: typing.List[Content]
+    ) -> typing.Dict[int, IndexedContentDocument]:
+        """
+        Create the documents of several contents with a fixed number of queries,
+        see IndexedContentBuilder.
+        :return: documents and ingest pipeline ids by content id, contents whose document
+        could not be created are missing
+        """
+        return IndexedContentBuilder(self._session, self._config).create_indexed_contents(
+            [content.content_id for content in contents]
+        )
+
+    def index_contents(
+        self,
+        contents: typing.Iterable[Content],
+        on_progress: typing.Optional[typing.Callable[[IndexedContentsResults], None]] = None,
+    ) -> IndexedContentsResults:
+        """
+        Index the given contents with the bulk API.
+
+        Documents are sent by chunks of SEARCH__ELASTICSEARCH__BULK__CHUNK_SIZE, by a pool of
+        SEARCH__ELASTICSEARCH__BULK__WORKERS threads while the next chunks are created.
+        Chunks are completed in the order of the contents: if contents are ordered by id,
+        every content up to the last content id of the results has been processed.
+        :param on_progress: called with the results each time a chunk is completed
+        :return: ids of the contents to index and of the ones whose indexing failed
+        """
+        results = IndexedContentsResults([], [])
+        chunk_size = max(self._config.SEARCH__ELASTICSEARCH__BULK__CHUNK_SIZE, 1)
+        workers = max(self._config.SEARCH__ELASTICSEARCH__BULK__WORKERS, 1)
+        contents = iter(contents)
+        pending_chunks = deque()  # type: typing.Deque[PendingBulkChunk]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                chunk = list(itertools.islice(contents, chunk_size))
+                if not chunk:
+                    break
+                content_ids, actions, errored_content_ids = self._create_bulk_actions(chunk)
+                pending_chunks.append(
+                    PendingBulkChunk(
+                        content_ids=content_ids,
+                        errored_content_ids=errored_content_ids,
+                        future=executor.submit(self._send_bulk_actions, actions),
+                    )
+                )
+                # INFO - 2026-10-18 - only create the next chunk when a worker is available
+                # to keep a bounded number of documents in memory.
+                if len(pending_chunks) >= workers:
+                    self._complete_bulk_chunk(pending_chunks.popleft(), results, on_progress)
+            while pending_chunks:
+                self._complete_bulk_chunk(pending_chunks.popleft(), results, on_progress)
+        return results
+
+    def _create_bulk_actions(
+        self, contents: typing.List[Content]
+    ) -> typing.Tuple[typing.List[int], typing.List[BulkAction], typing.List[int]]:
+        """
+        :return: ids of contents, bulk actions of their documents,
+        ids of contents whose document could not be created
+        """
+        content_index_alias = self._get_index_parameters(IndexedContent).alias
+        content_ids = [content.content_id for content in contents]
+        try:
+            documents = self.create_indexed_contents(contents)
+        except Exception:
+            logger.exception(
+                self, "Exception while creating documents of contents {}".format(content_ids),
+            )
+            documents = {}
+        actions = []
+        errored_content_ids = []
+        for content_id in content_ids:
+            try:
+                indexed_content, pipeline_id = documents[content_id]
+            except KeyError:
+                errored_content_ids.append(content_id)
+                continue
+            action = indexed_content.to_dict(include_meta=True)
+            action["_index"] = content_index_alias
+            if pipeline_id:
+                action["pipeline"] = pipeline_id
+            actions.append(action)
+        return content_ids, actions, errored_content_ids
+
+    def _send_bulk_actions(self, actions: typing.List[BulkAction]) -> typing.List[int]:
+        """
+        Send given actions with the bulk API, failed actions are sent again up to
+        SEARCH__ELASTICSEARCH__BULK__MAX_RETRIES times if their error is not permanent.
+        :return: ids of contents whose indexing failed
+        """
+        errored_content_ids = []
+        for retry in range(self._config.SEARCH__ELASTICSEARCH__BULK__MAX_RETRIES + 1):
+            if not actions:
+                break
+            if retry:
+                time.sleep(min(BULK_RETRY_INITIAL_DELAY * 2 ** (retry - 1), BULK_RETRY_MAX_DELAY))
+            failed_actions = []
+            # INFO - 2026-10-18 - results are given in the order of the actions
+            for action, (ok, item) in zip(
+                actions,
+                streaming_bulk(
+                    self.es,
+                    actions,
+                    chunk_size=len(actions),
+                    raise_on_error=False,
+                    raise_on_exception=False,
+                    request_timeout=self._config.SEARCH__ELASTICSEARCH__REQUEST_TIMEOUT,
+                ),
+            ):
+                if ok:
+                    continue
+                error = next(iter(item.values()))
+                logger.warning(
+                    self,
+                    'Error while indexing content {}: {} "{}"'.format(
+                        action["_id"], error.get("status"), error.get("error")
+                    ),
+                )
+                status = error.get("status")
+                if isinstance(status, int) and status != 429 and status < 500:
+                    errored_content_ids.append(action["_id"])
+                else:
+                    failed_actions.append(action)
+            actions = failed_actions
+        errored_content_ids.extend(action["_id"] for action in actions)
+        return errored_content_ids
+
+    def _complete_bulk_chunk(
+        self,
+        chunk: PendingBulkChunk,
+        results: IndexedContentsResults,
+        on_progress: typing.Optional[typing.Callable[[IndexedContentsResults], None]],
+    ) -> None:
+        results.content_ids_to_index.extend(chunk.content_ids)
+        results.errored_indexed_contents_ids.extend(chunk.errored_content_ids)
+        try:
+            results.errored_indexed_contents_ids.extend(chunk.future.result())
+        except Exception:
+            logger.exception(
+                self, "Exception while indexing contents {}".format(chunk.content_ids),
+            )
+            results.errored_indexed_contents_ids.extend(
+                content_id
+                for content_id in chunk.content_ids
+                if content_id not in chunk.errored_content_ids
+            )
+        if on_progress:
+            on_progress(results)
 
     def index_user(self, user: User) -> None:
         """Index the given user in the appropriate index."""
@@ -378,8 +457,11 @@ def index_user(self, user: User) -> None:
 
     def delete_user(self, user: User) -> None:
         """Delete the given user from the corresponding ES index."""
+        self.delete_user_by_id(user.user_id)
+
+    def delete_user_by_id(self, user_id: int) -> None:
         user_index_alias = self._get_index_parameters(self.IndexedUser).alias
-        self.es.delete(user_index_alias, user.user_id)
+        self.es.delete(user_index_alias, user_id)
 
     def index_workspace(self, workspace: Workspace) -> None:
         """Index the given worspace in the appropriate ES index."""
@@ -406,80 +488,21 @@ def index_workspace(self, workspace: Workspace) -> None:
 
     def delete_workspace(self, workspace: Workspace) -> None:
         """Delete the given workspace from the corresponding ES index."""
+        self.delete_workspace_by_id(workspace.workspace_id)
+
+    def delete_workspace_by_id(self, workspace_id: int) -> None:
         workspace_index_alias = self._get_index_parameters(IndexedWorkspace).alias
-        self.es.delete(workspace_index_alias, workspace.workspace_id)
+        self.es.delete(workspace_index_alias, workspace_id)
+
+    def delete_content_by_id(self, content_id: int) -> None:
+        """Delete the document of a content removed from the database."""
+        content_index_alias = self._get_index_parameters(IndexedContent).alias
+        self.es.delete(content_index_alias, content_id)
 
     def register_plugins(self, plugin_manager: pluggy.PluginManager) -> None:
         for parameters in self._get_indices_parameters():
             plugin_manager.register(parameters.indexer)
 
-    def _should_index_depot_file(self, content: ContentInContext) -> bool:
-        if not self._config.SEARCH__ELASTICSEARCH__USE_INGEST:
-            logger.debug(
-                self,
-                'Skip binary indexation of content "{}" will be not indexed: ingest mode disabled'.format(
-                    content.content_id
-                ),
-            )
-            return False
-
-        if not content.content.depot_file or content.size is None:
-            logger.debug(
-                self,
-                'Skip binary indexation of content "{}":  invalid file format'.format(
-                    content.content_id
-                ),
-            )
-            return False
-
-        # INFO - G.M - 2019-06-24 - check mimetype validity
-        if (
-            self._config.SEARCH__ELASTICSEARCH__INGEST__MIMETYPE_WHITELIST
-            and content.mimetype
-            not in self._config.SEARCH__ELASTICSEARCH__INGEST__MIMETYPE_WHITELIST
-        ):
-            logger.debug(
-                self,
-                'Skip binary indexation of content "{}": mimetype "{}" not whitelisted'.format(
-                    content.content_id, content.mimetype
-                ),
-            )
-            return False
-
-        # INFO - G.M - 2019-06-24 - check mimetype validity
-        if (
-            self._config.SEARCH__ELASTICSEARCH__INGEST__MIMETYPE_BLACKLIST
-            and content.mimetype in self._config.SEARCH__ELASTICSEARCH__INGEST__MIMETYPE_BLACKLIST
-        ):
-            logger.debug(
-                self,
-                'Skip binary indexation of content "{}": mimetype "{}" blacklisted'.format(
-                    content.content_id, content.mimetype
-                ),
-            )
-            return False
-
-        if content.size == 0:
-            logger.debug(
-                self,
-                'Skip binary indexation of content "{}":  empty file'.format(content.content_id),
-            )
-            return False
-
-        # INFO - G.M - 2019-06-24 - check content size
-        if content.size > self._config.SEARCH__ELASTICSEARCH__INGEST__SIZE_LIMIT:
-            logger.debug(
-                self,
-                'Skip binary indexation of content "{}": binary is "{}" bytes, max allowed size for indexation is ({})'.format(
-                    content.content_id,
-                    content.size,
-                    self._config.SEARCH__ELASTICSEARCH__INGEST__SIZE_LIMIT,
-                ),
-            )
-            return False
-
-        return True
-
     @classmethod
     def create_es_datetime_range(
         cls, range_from: typing.Optional[datetime], range_to: typing.Optional[datetime]
@@ -899,6 +922,7 @@ def _create_ingest_pipeline(self) -> None:
                 "attachment": {
                     "field": FILE_PIPELINE_SOURCE_FIELD,
                     "target_field": FILE_PIPELINE_DESTINATION_FIELD,
+                    "indexed_chars": self._config.SEARCH__ELASTICSEARCH__INGEST__TEXT_SIZE_LIMIT,
                 }
             },
             {"remove": {"field": FILE_PIPELINE_SOURCE_FIELD}},
@@ -1047,20 +1071,19 @@ def index_via_rq_worker(session: Session, flush_context=None) -> None:
             if indexing_error_count:
                 raise IndexingError()
 
-    def sync_index_contents(self, contents: typing.List[Content], context: TracimContext) -> int:
+    def sync_index_contents(
+        self,
+        contents: typing.Iterable[Content],
+        context: TracimContext,
+        on_progress: typing.Optional[typing.Callable[[IndexedContentsResults], None]] = None,
+    ) -> int:
         search_api = ESSearchApi(
             session=context.dbsession, config=context.app_config, current_user=None
         )
-        indexing_error_count = 0
-        for content in self._filter_excluded_content_types(contents):
-            try:
-                search_api.index_content(content)
-            except Exception:
-                logger.exception(
-                    self, "Exception while indexing content {}".format(content.content_id)
-                )
-                indexing_error_count += 1
-        return indexing_error_count
+        results = search_api.index_contents(
+            self._filter_excluded_content_types(contents), on_progress=on_progress
+        )
+        return results.get_nb_index_errors()
 
     def _index_contents_from_ids(self, content_ids: typing.List[int]) -> None:
         """Index contents whose ids are given.
@@ -1073,13 +1096,14 @@ def _index_contents_from_ids(self, content_ids: typing.List[int]) -> None:
             search_api = ESSearchApi(
                 session=context.dbsession, config=context.app_config, current_user=None
             )
-            indexing_error_count = 0
-            for content_id in content_ids:
-                try:
-                    search_api.index_content(capi.get_one(content_id))
-                except Exception:
-                    indexing_error_count += 1
-                    logger.exception(self, "Exception while indexing content {}".format(content_id))
+            contents = capi.get_all_by_ids(content_ids)
+            missing_content_ids = set(content_ids) - {content.content_id for content in contents}
+            if missing_content_ids:
+                logger.error(
+                    self, "Contents {} not found, cannot index them".format(missing_content_ids)
+                )
+            indexing_error_count = len(missing_content_ids)
+            indexing_error_count += search_api.index_contents(contents).get_nb_index_errors()
             if indexing_error_count:
                 raise IndexingError(
                     "Got error(s) while indexing content ids {}".format(content_ids)
@@ -0,0 +1,373 @@
+import base64
+from collections import defaultdict
+from collections import namedtuple
+import typing
+
+from slugify import slugify
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import selectinload
+
+from tracim_backend.app_models.contents import ContentTypeSlug
+from tracim_backend.app_models.contents import content_type_list
+from tracim_backend.applications.share.models import ContentShare
+from tracim_backend.config import CFG
+from tracim_backend.lib.core.content import ContentApi
+from tracim_backend.lib.search.elasticsearch_search.es_models import DigestComments
+from tracim_backend.lib.search.elasticsearch_search.es_models import DigestContent
+from tracim_backend.lib.search.elasticsearch_search.es_models import DigestTodo
+from tracim_backend.lib.search.elasticsearch_search.es_models import DigestUser
+from tracim_backend.lib.search.elasticsearch_search.es_models import DigestWorkspace
+from tracim_backend.lib.search.elasticsearch_search.es_models import IndexedContent
+from tracim_backend.lib.search.elasticsearch_search.text_extractor import FileTextExtractor
+from tracim_backend.lib.utils.logger import logger
+from tracim_backend.models.context_models import ContentInContext
+from tracim_backend.models.context_models import UserInContext
+from tracim_backend.models.data import Content
+from tracim_backend.models.data import ContentRevisionRO
+from tracim_backend.models.data import Workspace
+from tracim_backend.models.tag import TagOnContent
+
+FILE_PIPELINE_ID = "attachment"
+
+# INFO - 2026-10-18 - document of a content and the id of the ingest pipeline to use (or None)
+IndexedContentDocument = namedtuple("IndexedContentDocument", ["document", "pipeline_id"])
+
+
+class IndexedContentBuilder:
+    """
+    Create the search documents of contents.
+
+    Everything the documents need (revisions and their authors, workspaces, parents,
+    comments and todos, tags, shares) is loaded for all contents at once: the number of
+    queries does not depend on the number of contents.
+    """
+
+    SUBCONTENT_TYPES = (ContentTypeSlug.COMMENT.value, ContentTypeSlug.TODO.value)
+
+    def __init__(self, session: Session, config: CFG) -> None:
+        self._session = session
+        self._config = config
+        self._content_api = ContentApi(
+            current_user=None,
+            session=session,
+            config=config,
+            show_deleted=True,
+            show_archived=True,
+            show_active=True,
+            show_temporary=True,
+        )
+        self._text_extractor = FileTextExtractor(
+            config, max_chars=config.SEARCH__ELASTICSEARCH__INGEST__TEXT_SIZE_LIMIT
+        )
+
+    def create_indexed_contents(
+        self, content_ids: typing.List[int]
+    ) -> typing.Dict[int, IndexedContentDocument]:
+        """
+        :return: documents by content id. Contents not found or whose document could not be
+        created are missing.
+        """
+        if not content_ids:
+            return {}
+        contents = self._get_contents(content_ids)
+        # INFO - 2026-10-18 - workspaces are kept referenced while documents are created
+        # so that Content.workspace is read from the identity map.
+        workspaces = self._get_workspaces(contents)  # noqa: F841
+        parents_by_content_id = Content.get_recursive_parents_of(self._session, contents)
+        parent_revisions = self._get_current_revisions(
+            {parent.id for parents in parents_by_content_id.values() for parent in parents}
+        )
+        subcontents_by_parent_id = self._get_subcontents(content_ids)
+        tags_by_content_id = self._get_tags(content_ids)
+        active_share_counts = self._get_active_share_counts(content_ids)
+
+        documents = {}
+        for content in contents:
+            try:
+                documents[content.id] = self._create_indexed_content(
+                    content,
+                    parent_revisions=[
+                        parent_revisions[parent.id] for parent in parents_by_content_id[content.id]
+                    ],
+                    subcontents=subcontents_by_parent_id[content.id],
+                    tags=tags_by_content_id[content.id],
+                    active_share_count=active_share_counts.get(content.id, 0),
+                )
+            except Exception:
+                logger.exception(
+                    self, "Exception while creating document of content {}".format(content.id)
+                )
+        return documents
+
+    def _get_contents(self, content_ids: typing.List[int]) -> typing.List[Content]:
+        # INFO - 2026-10-18 - most Content attributes are read from Content.revision
+        # which needs all revisions of the content, first and last ones give the author
+        # and the last modifier.
+        return (
+            self._session.query(Content)
+            .filter(Content.id.in_(content_ids))
+            .options(selectinload(Content.revisions).joinedload(ContentRevisionRO.owner))
+            .order_by(Content.id)
+            .all()
+        )
+
+    def _get_workspaces(self, contents: typing.List[Content]) -> typing.List[Workspace]:
+        workspace_ids = {content.current_revision.workspace_id for content in contents}
+        return (
+            self._session.query(Workspace).filter(Workspace.workspace_id.in_(workspace_ids)).all()
+        )
+
+    def _get_current_revisions(
+        self, content_ids: typing.Set[int]
+    ) -> typing.Dict[int, ContentRevisionRO]:
+        if not content_ids:
+            return {}
+        revisions = (
+            self._session.query(ContentRevisionRO)
+            .join(Content, Content.cached_revision_id == ContentRevisionRO.revision_id)
+            .filter(Content.id.in_(content_ids))
+        )
+        return {revision.content_id: revision for revision in revisions}
+
+    def _get_subcontents(
+        self, content_ids: typing.List[int]
+    ) -> typing.DefaultDict[int, typing.List[ContentRevisionRO]]:
+        """Current revisions of comments and todos (neither deleted nor archived) by parent id."""
+        revisions = (
+            self._session.query(ContentRevisionRO)
+            .join(Content, Content.cached_revision_id == ContentRevisionRO.revision_id)
+            .filter(
+                ContentRevisionRO.parent_id.in_(content_ids),
+                ContentRevisionRO.type.in_(self.SUBCONTENT_TYPES),
+                ContentRevisionRO.is_deleted == False,  # noqa: E712
+                ContentRevisionRO.is_archived == False,  # noqa: E712
+            )
+            .order_by(ContentRevisionRO.created, Content.id)
+        )
+        subcontents_by_parent_id = defaultdict(list)
+        for revision in revisions:
+            subcontents_by_parent_id[revision.parent_id].append(revision)
+        return subcontents_by_parent_id
+
+    def _get_tags(self, content_ids: typing.List[int]) -> typing.DefaultDict[int, typing.List[str]]:
+        tags_by_content_id = defaultdict(list)
+        for content_tag in self._session.query(TagOnContent).filter(
+            TagOnContent.content_id.in_(content_ids)
+        ):
+            tags_by_content_id[content_tag.content_id].append(content_tag.tag.tag_name)
+        return tags_by_content_id
+
+    def _get_active_share_counts(self, content_ids: typing.List[int]) -> typing.Dict[int, int]:
+        return dict(
+            self._session.query(ContentShare.content_id, func.count(ContentShare.share_id))
+            .filter(
+                ContentShare.content_id.in_(content_ids),
+                ContentShare.enabled == True,  # noqa: E712
+            )
+            .group_by(ContentShare.content_id)
+        )
+
+    def _create_indexed_content(
+        self,
+        content: Content,
+        parent_revisions: typing.List[ContentRevisionRO],
+        subcontents: typing.List[ContentRevisionRO],
+        tags: typing.List[str],
+        active_share_count: int,
+    ) -> IndexedContentDocument:
+        """
+        :param parent_revisions: current revisions of the parents, from the direct parent
+        """
+        content_in_context = ContentInContext(content, config=self._config, dbsession=self._session)
+        author = self._create_digest_user(content.first_revision.owner)
+        last_modifier = self._create_digest_user(content.last_revision.owner)
+        workspace = DigestWorkspace(
+            workspace_id=content_in_context.workspace.workspace_id,
+            label=content_in_context.workspace.label,
+        )
+        path = [
+            DigestContent(
+                content_id=revision.content_id,
+                label=revision.label,
+                slug=slugify(revision.label),
+                content_type=content_type_list.get_one_by_slug(revision.type).slug,
+            )
+            for revision in reversed(parent_revisions)
+        ]
+        path.append(
+            DigestContent(
+                content_id=content_in_context.content_id,
+                label=content_in_context.label,
+                slug=content_in_context.slug,
+                content_type=content_in_context.content_type,
+            )
+        )
+        comments = [
+            DigestComments(
+                content_id=revision.content_id,
+                parent_id=revision.parent_id,
+                content_type=content_type_list.get_one_by_slug(revision.type).slug,
+                raw_content=revision.raw_content,
+            )
+            for revision in subcontents
+            if revision.type == ContentTypeSlug.COMMENT.value
+        ]
+        todos = [
+            DigestTodo(
+                content_id=revision.content_id,
+                parent_id=revision.parent_id,
+                content_type=content_type_list.get_one_by_slug(revision.type).slug,
+                raw_content=revision.raw_content,
+            )
+            for revision in subcontents
+            if revision.type == ContentTypeSlug.TODO.value
+        ]
+        # INFO - 2026-10-18 - the stored file size avoids reading the file from the storage
+        size = content.current_revision.file_size
+        if size is None or not content.depot_file:
+            size = content_in_context.size
+        indexed_content = IndexedContent(
+            content_namespace=content_in_context.content_namespace,
+            content_id=content_in_context.content_id,
+            current_revision_id=content_in_context.current_revision_id,
+            current_revision_type=content_in_context.current_revision_type,
+            slug=content_in_context.slug,
+            parent_id=content_in_context.parent_id,
+            workspace_id=content_in_context.workspace_id,
+            workspace=workspace,
+            label=content_in_context.label,
+            content_type=content_in_context.content_type,
+            sub_content_types=content_in_context.sub_content_types,
+            status=content_in_context.status,
+            is_archived=content_in_context.is_archived,
+            is_deleted=content_in_context.is_deleted,
+            is_editable=self._content_api.is_editable(content),
+            is_active=content_in_context.is_active,
+            show_in_ui=content_in_context.show_in_ui,
+            file_extension=content_in_context.file_extension,
+            filename=content_in_context.filename,
+            modified=content_in_context.modified,
+            created=content_in_context.created,
+            active_shares=active_share_count,
+            description=content_in_context.description,
+            path=path,
+            comments=comments,
+            comment_count=len(comments),
+            todos=todos,
+            todo_count=len(todos),
+            tags=tags,
+            tag_count=len(tags),
+            author=author,
+            last_modifier=last_modifier,
+            archived_through_parent_id=next(
+                (revision.content_id for revision in parent_revisions if revision.is_archived), 0
+            ),
+            deleted_through_parent_id=next(
+                (revision.content_id for revision in parent_revisions if revision.is_deleted), 0
+            ),
+            raw_content=content_in_context.raw_content,
+            content_size=size,
+        )
+        indexed_content.meta.id = content_in_context.content_id
+        pipeline_id = None  # type: typing.Optional[str]
+        if self._should_index_depot_file(content_in_context, size):
+            indexed_content.b64_file = self._get_b64_file(content_in_context)
+            if indexed_content.b64_file:
+                pipeline_id = FILE_PIPELINE_ID
+        return IndexedContentDocument(indexed_content, pipeline_id)
+
+    def _get_b64_file(self, content: ContentInContext) -> typing.Optional[str]:
+        """
+        Give the file of a content to the ingest pipeline: only its text (base64 encoded)
+        when it can be extracted by tracim, the whole file otherwise.
+        """
+        if not self._text_extractor.can_extract(content.mimetype):
+            return content.get_b64_file()
+        text = self._text_extractor.extract(
+            content.content.depot_file, content.mimetype, content.file_extension
+        )
+        if not text:
+            return None
+        return base64.b64encode(text.encode("utf-8")).decode("ascii")
+
+    def _should_index_depot_file(
+        self, content: ContentInContext, size: typing.Optional[int]
+    ) -> bool:
+        if not self._config.SEARCH__ELASTICSEARCH__USE_INGEST:
+            logger.debug(
+                self,
+                'Skip binary indexation of content "{}" will be not indexed: ingest mode disabled'.format(
+                    content.content_id
+                ),
+            )
+            return False
+
+        if not content.content.depot_file or size is None:
+            logger.debug(
+                self,
+                'Skip binary indexation of content "{}":  invalid file format'.format(
+                    content.content_id
+                ),
+            )
+            return False
+
+        # INFO - G.M - 2019-06-24 - check mimetype validity
+        if (
+            self._config.SEARCH__ELASTICSEARCH__INGEST__MIMETYPE_WHITELIST
+            and content.mimetype
+            not in self._config.SEARCH__ELASTICSEARCH__INGEST__MIMETYPE_WHITELIST
+        ):
+            logger.debug(
+                self,
+                'Skip binary indexation of content "{}": mimetype "{}" not whitelisted'.format(
+                    content.content_id, content.mimetype
+                ),
+            )
+            return False
+
+        # INFO - G.M - 2019-06-24 - check mimetype validity
+        if (
+            self._config.SEARCH__ELASTICSEARCH__INGEST__MIMETYPE_BLACKLIST
+            and content.mimetype in self._config.SEARCH__ELASTICSEARCH__INGEST__MIMETYPE_BLACKLIST
+        ):
+            logger.debug(
+                self,
+                'Skip binary indexation of content "{}": mimetype "{}" blacklisted'.format(
+                    content.content_id, content.mimetype
+                ),
+            )
+            return False
+
+        if size == 0:
+            logger.debug(
+                self,
+                'Skip binary indexation of content "{}":  empty file'.format(content.content_id),
+            )
+            return False
+
+        # INFO - G.M - 2019-06-24 - check content size
+        # INFO - 2026-10-18 - extracted text is limited instead of the file size
+        if size > self._config.SEARCH__ELASTICSEARCH__INGEST__SIZE_LIMIT and not (
+            self._text_extractor.can_extract(content.mimetype)
+        ):
+            logger.debug(
+                self,
+                'Skip binary indexation of content "{}": binary is "{}" bytes, max allowed size for indexation is ({})'.format(
+                    content.content_id,
+                    size,
+                    self._config.SEARCH__ELASTICSEARCH__INGEST__SIZE_LIMIT,
+                ),
+            )
+            return False
+
+        return True
+
+    def _create_digest_user(self, user) -> DigestUser:
+        user_in_context = UserInContext(user=user, dbsession=self._session, config=self._config)
+        return DigestUser(
+            user_id=user_in_context.user_id,
+            public_name=user_in_context.public_name,
+            has_avatar=user_in_context.has_avatar,
+            has_cover=user_in_context.has_cover,
+        )
@@ -0,0 +1,89 @@
+import codecs
+from contextlib import contextmanager
+import subprocess
+import typing
+
+from depot.fields.upload import UploadedFile
+
+from tracim_backend.config import CFG
+from tracim_backend.lib.core.storage import StorageLib
+from tracim_backend.lib.utils.logger import logger
+
+PDF_MIMETYPE = "application/pdf"
+TEXT_MIMETYPES = (
+    "application/json",
+    "application/javascript",
+    "application/x-javascript",
+    "application/xml",
+    "application/x-sh",
+    "application/x-python",
+    "application/sql",
+)
+
+
+class FileTextExtractor:
+    """
+    Extract the text of files to index it: files are read by chunks and extraction stops
+    once max_chars characters are read, so that memory used does not depend on the file size.
+
+    Text is extracted from text files and, with pdftotext (from poppler-utils, also used by
+    preview_generator), from pdf files.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, config: CFG, max_chars: int) -> None:
+        self._config = config
+        self._max_chars = max_chars
+
+    def can_extract(self, mimetype: typing.Optional[str]) -> bool:
+        if not mimetype:
+            return False
+        return mimetype.startswith("text/") or mimetype in TEXT_MIMETYPES + (PDF_MIMETYPE,)
+
+    def extract(
+        self, depot_file: UploadedFile, mimetype: str, file_extension: str = ""
+    ) -> typing.Optional[str]:
+        """
+        :return: at most max_chars characters of text, None if text cannot be extracted
+        """
+        if mimetype == PDF_MIMETYPE:
+            return self._extract_from_pdf(depot_file, file_extension)
+        return self._read_text(depot_file.file)
+
+    def _read_text(self, stream: typing.BinaryIO) -> str:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        parts = []
+        length = 0
+        while length < self._max_chars:
+            chunk = stream.read(self.CHUNK_SIZE)
+            part = decoder.decode(chunk, final=not chunk)
+            parts.append(part)
+            length += len(part)
+            if not chunk:
+                break
+        return "".join(parts)[: self._max_chars]
+
+    def _extract_from_pdf(
+        self, depot_file: UploadedFile, file_extension: str
+    ) -> typing.Optional[str]:
+        get_filepath = contextmanager(StorageLib(self._config).get_filepath)
+        try:
+            with get_filepath(
+                depot_file, file_extension=file_extension, temporary_prefix="tracim-text-extraction"
+            ) as file_path:
+                process = subprocess.Popen(
+                    ["pdftotext", "-enc", "UTF-8", file_path, "-"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+                try:
+                    return self._read_text(process.stdout)
+                finally:
+                    # INFO - 2026-10-18 - the remaining text of big documents is not needed
+                    process.kill()
+                    process.wait()
+                    process.stdout.close()
+        except FileNotFoundError:
+            logger.warning(self, "pdftotext is not available, text of pdf files is not indexed")
+        return None
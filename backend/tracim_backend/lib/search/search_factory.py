@@ -8,6 +8,7 @@
 
 ELASTICSEARCH__SEARCH_ENGINE_SLUG = "elasticsearch"
 SIMPLE__SEARCH_ENGINE_SLUG = "simple"
+DATABASE__SEARCH_ENGINE_SLUG = "database"
 
 
 class SearchFactory(object):
@@ -22,7 +23,7 @@ def get_search_controller(cls, config: CFG):
             from tracim_backend.views.search_api.elasticsearch_controller import ESSearchController
 
             return ESSearchController()
-        elif config.SEARCH__ENGINE == SIMPLE__SEARCH_ENGINE_SLUG:
+        elif config.SEARCH__ENGINE in (SIMPLE__SEARCH_ENGINE_SLUG, DATABASE__SEARCH_ENGINE_SLUG):
             # TODO - G.M - 2019-05-22 - fix circular import
             from tracim_backend.views.search_api.simple_search_controller import (
                 SimpleSearchController,
@@ -54,16 +55,28 @@ def get_simple_search_api(
 
         return SimpleSearchApi(session=session, current_user=current_user, config=config)
 
+    @classmethod
+    def get_database_search_api(
+        cls, session: Session, current_user: typing.Optional[User], config: CFG
+    ) -> "DatabaseSearchApi":  # noqa: F821
+        # TODO - G.M - 2019-05-22 - fix circular import
+        from tracim_backend.lib.search.database_search.database_search_api import DatabaseSearchApi
+
+        return DatabaseSearchApi(session=session, current_user=current_user, config=config)
+
     @classmethod
     def get_search_lib(
         cls, session: Session, current_user: typing.Optional[User], config: CFG
-    ) -> typing.Union["ESSearchApi", "SimpleSearchApi"]:
+    ) -> typing.Union["ESSearchApi", "SimpleSearchApi", "DatabaseSearchApi"]:  # noqa: F821
         if config.SEARCH__ENGINE == ELASTICSEARCH__SEARCH_ENGINE_SLUG:
             return cls.get_elastic_search_api(session, current_user, config)
 
         if config.SEARCH__ENGINE == SIMPLE__SEARCH_ENGINE_SLUG:
             return cls.get_simple_search_api(session, current_user, config)
 
+        if config.SEARCH__ENGINE == DATABASE__SEARCH_ENGINE_SLUG:
+            return cls.get_database_search_api(session, current_user, config)
+
         raise NoValidSearchEngine(
             "Can't provide search lib"
             ' because the provided search engine "{}"'
@@ -14,9 +14,20 @@ class SimpleContentSearchResponse(ContentSearchResponse):
 
     DEFAULT_SCORE = 1
 
-    def __init__(self, content_list: typing.List[ContentInContext], total_hits: int):
+    def __init__(
+        self,
+        content_list: typing.List[ContentInContext],
+        total_hits: int,
+        scores: typing.Optional[typing.List[float]] = None,
+        is_total_hits_accurate: bool = False,
+    ):
+        """
+        :param scores: scores of the contents, in the same order, DEFAULT_SCORE if not given
+        """
         contents = []
-        for content in content_list:
+        content_paths = ContentInContext.get_content_paths(content_list)
+        scores = scores or [self.DEFAULT_SCORE] * len(content_list)
+        for content, score in zip(content_list, scores):
             path = [
                 SearchedDigestContent(
                     content_id=component.content_id,
@@ -24,7 +35,7 @@ def __init__(self, content_list: typing.List[ContentInContext], total_hits: int)
                     slug=component.slug,
                     content_type=component.content_type,
                 )
-                for component in content.content_path
+                for component in content_paths[content.content_id]
             ]
 
             comments = [
@@ -75,7 +86,7 @@ def __init__(self, content_list: typing.List[ContentInContext], total_hits: int)
                 filename=content.filename,
                 modified=content.modified,
                 created=content.created,
-                score=self.DEFAULT_SCORE,
+                score=score,
                 current_revision_id=content.current_revision_id,
                 current_revision_type=content.current_revision_type,
                 workspace_id=content.workspace_id,
@@ -84,4 +95,6 @@ def __init__(self, content_list: typing.List[ContentInContext], total_hits: int)
                 parent_id=content.parent_id,
             )
             contents.append(content)
-        super().__init__(contents=contents, total_hits=total_hits, is_total_hits_accurate=False)
+        super().__init__(
+            contents=contents, total_hits=total_hits, is_total_hits_accurate=is_total_hits_accurate,
+        )
@@ -99,9 +99,7 @@ def search(
             parsed_content_ids.append(content.content_id)
             current_offset += 1
 
-        content_in_context_list = []
-        for content in results:
-            content_in_context_list.append(content_api.get_content_in_context(content))
+        content_in_context_list = content_api.get_contents_in_context(results)
         return SimpleContentSearchResponse(
             content_list=content_in_context_list, total_hits=current_offset
         )
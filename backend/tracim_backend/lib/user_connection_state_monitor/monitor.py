@@ -1,3 +1,4 @@
+from collections import OrderedDict
 import re
 import time
 import typing
@@ -23,10 +24,12 @@
 
 
 class CustomTracimContext(TracimContext):
-    def __init__(self, config: CFG) -> None:
+    def __init__(
+        self, config: CFG, plugin_manager: typing.Optional[pluggy.PluginManager] = None
+    ) -> None:
         super().__init__()
         self._app_config = config
-        self._plugin_manager = init_plugin_manager(config)
+        self._plugin_manager = plugin_manager or init_plugin_manager(config)
         self._session = None
 
     @property
@@ -46,34 +49,139 @@ def plugin_manager(self) -> pluggy.PluginManager:
         return self._plugin_manager
 
 
+class ConnectionStatusStats(object):
+    """Counters of the connection statuses written by UserConnectionStateMonitor."""
+
+    def __init__(self) -> None:
+        self.received_message_count = 0
+        self.flush_count = 0
+        self.written_status_count = 0
+        self.last_batch_size = 0
+        self.max_batch_size = 0
+        # INFO - 2026-10-18 - processing lag: delay between the reception of the oldest status
+        # change of a batch and its write in the database, in seconds.
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    def add_flush(self, batch_size: int, lag: float) -> None:
+        self.flush_count += 1
+        self.written_status_count += batch_size
+        self.last_batch_size = batch_size
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+
+
 class UserConnectionStateMonitor:
+    """
+    Set the connection status of users from the stats messages of pushpin.
+
+    Status changes are gathered during USER__CONNECTION_STATUS__FLUSH_INTERVAL seconds, then
+    written with one UPDATE per status: only the last status received for a user is written.
+    """
+
+    # INFO - 2026-10-18 - messages read at once before handling pending statuses again
+    MAX_MESSAGES_PER_POLL = 1000
+    # INFO - 2026-10-18 - minimum interval between two stats logs, in seconds
+    STATS_LOG_INTERVAL = 60
+
     def __init__(self, config: CFG):
         self.config = config
         self.session_factory = get_session_factory(get_engine(config))
+        self.plugin_manager = init_plugin_manager(config)
         self.pending_offline_users = {}
+        self.pending_statuses = OrderedDict()  # type: typing.Dict[int, UserConnectionStatus]
+        self.pending_statuses_since = None  # type: typing.Optional[float]
+        self.flush_interval = config.USER__CONNECTION_STATUS__FLUSH_INTERVAL
+        self.stats = ConnectionStatusStats()
+        self._last_stats_log_time = time.monotonic()
+        self._stopped = False
+
+    def stop(self) -> None:
+        self._stopped = True
 
     def set_user_connection_status(
         self, user_id: typing.Optional[int], status: UserConnectionStatus
     ) -> None:
+        """
+        Write the connection status of the user, or of all users if user_id is None, now.
+        """
         try:
             del self.pending_offline_users[user_id]
         except KeyError:
             pass
+        self.pending_statuses.pop(user_id, None)
+        self._write_statuses({status: [user_id] if user_id else None})
+        logger.debug(self, "Set connection status of user {} to {}".format(user_id or "*", status))
 
-        context = CustomTracimContext(self.config)
+    def queue_user_connection_status(self, user_id: int, status: UserConnectionStatus) -> None:
+        """
+        Write the connection status of the user with the next batch of status changes.
+        """
+        try:
+            del self.pending_offline_users[user_id]
+        except KeyError:
+            pass
+        # INFO - 2026-10-18 - move the user at the end so that statuses are logged in order
+        self.pending_statuses.pop(user_id, None)
+        self.pending_statuses[user_id] = status
+        if self.pending_statuses_since is None:
+            self.pending_statuses_since = time.monotonic()
+        if not self.flush_interval:
+            self.flush_pending_statuses()
+
+    def flush_pending_statuses(self, force: bool = True) -> None:
+        """
+        Write the pending status changes, one UPDATE per status.
+        :param force: if False, write only when the pending changes are older than flush_interval
+        """
+        if not self.pending_statuses:
+            return
+        if not force and self.pending_statuses_since + self.flush_interval > time.monotonic():
+            return
+        user_ids_by_status = OrderedDict()
+        for user_id, status in self.pending_statuses.items():
+            user_ids_by_status.setdefault(status, []).append(user_id)
+        try:
+            self._write_statuses(user_ids_by_status)
+        except Exception:
+            # INFO - 2026-10-18 - statuses are kept and written again after flush_interval
+            logger.exception(self, "Failed to write connection statuses of users")
+            self.pending_statuses_since = time.monotonic()
+            return
+        self.stats.add_flush(
+            len(self.pending_statuses), time.monotonic() - self.pending_statuses_since
+        )
+        for user_id, status in self.pending_statuses.items():
+            logger.debug(self, "Set connection status of user {} to {}".format(user_id, status))
+        self.pending_statuses.clear()
+        self.pending_statuses_since = None
+
+    def _write_statuses(
+        self,
+        user_ids_by_status: typing.Dict[UserConnectionStatus, typing.Optional[typing.List[int]]],
+    ) -> None:
+        """
+        Write statuses in one transaction, user_ids None meaning all users.
+        """
+        context = CustomTracimContext(self.config, self.plugin_manager)
         session = create_dbsession_for_context(self.session_factory, transaction.manager, context)
 
         context._session = session
 
-        uapi = UserApi(session=session, current_user=None, config=self.config)
-        query = uapi.base_query()
-
-        if user_id:
-            query = query.filter(User.user_id == user_id)
-
-        query.update({User.connection_status: status})
-        transaction.commit()
-        logger.debug(self, "Set connection status of user {} to {}".format(user_id or "*", status))
+        try:
+            uapi = UserApi(session=session, current_user=None, config=self.config)
+            for status, user_ids in user_ids_by_status.items():
+                query = uapi.base_query()
+                if user_ids is not None:
+                    query = query.filter(User.user_id.in_(user_ids))
+                query.update({User.connection_status: status}, synchronize_session=False)
+            transaction.commit()
+        except Exception:
+            transaction.abort()
+            raise
+        finally:
+            context.cleanup()
 
     def add_to_pending_offline_users(self, user_id: int) -> None:
         logger.debug(self, "User {} left".format(user_id))
@@ -87,7 +195,71 @@ def handle_pending_offline_users(self, online_timeout: int):
         for (user_id, last_seen_time) in list(self.pending_offline_users.items()):
             if last_seen_time and last_seen_time + online_timeout <= current_time:
                 del self.pending_offline_users[user_id]
-                self.set_user_connection_status(user_id, UserConnectionStatus.OFFLINE)
+                self.queue_user_connection_status(user_id, UserConnectionStatus.OFFLINE)
+
+    def handle_stats_message(self, m_raw: bytes) -> None:
+        """
+        Handle a message of the pushpin stats socket.
+        """
+        self.stats.received_message_count += 1
+        # We parse messages the way given by the Pushpin documentation (see the info message at
+        # the top of this file)
+        mtype, mdata = m_raw.split(b" ", 1)
+        if mdata[0] != ord("T"):
+            logger.warning(self, "Unsupported format ", mdata[0])
+            return
+
+        m = tnetstring.loads(mdata[1:])
+
+        # Let's check that the message is about a user channel
+        channel_name = m.get(b"channel", None)
+        if not channel_name:
+            return
+
+        # If so, let's get the user id
+        match = re.match("^user_([\\d]+)$", channel_name.decode())
+
+        if not match:
+            logger.debug(self, "Channel {} is not a live message channel")
+            return
+
+        user_id = int(match.group(1))
+
+        if m.get(b"unavailable", False) or m.get(b"subscribers", 0) == 0:
+            # The user just disconnected, we will mark them as online after a delay
+            self.add_to_pending_offline_users(user_id)
+        else:
+            # The user is online
+            self.queue_user_connection_status(user_id, UserConnectionStatus.ONLINE)
+
+    def log_stats(self, force: bool = False) -> None:
+        """Log the stats, at most once per STATS_LOG_INTERVAL unless forced."""
+        now = time.monotonic()
+        if not force and now - self._last_stats_log_time < self.STATS_LOG_INTERVAL:
+            return
+        self._last_stats_log_time = now
+        logger.info(
+            self,
+            "Connection status stats: {} messages received, {} statuses written in {} batches, "
+            "{} pending, batch size last {} max {}, lag last {:.3f}s max {:.3f}s".format(
+                self.stats.received_message_count,
+                self.stats.written_status_count,
+                self.stats.flush_count,
+                len(self.pending_statuses),
+                self.stats.last_batch_size,
+                self.stats.max_batch_size,
+                self.stats.last_lag,
+                self.stats.max_lag,
+            ),
+        )
+
+    def _get_poll_timeout(self, online_timeout: int) -> int:
+        """:return: time to wait for messages, in milliseconds"""
+        timeout = online_timeout
+        if self.pending_statuses_since is not None:
+            flush_time = self.pending_statuses_since + self.flush_interval
+            timeout = max(0, min(timeout, flush_time - time.monotonic()))
+        return int(timeout * 1000)
 
     def run(self) -> None:
         # We assume everybody is offline when starting the daemon. This is true when starting a
@@ -108,45 +280,30 @@ def run(self) -> None:
         poller = zmq.Poller()
         poller.register(sock, zmq.POLLIN)
 
-        while True:
-            # Let's wait messages for online_timeout seconds
-            evts = poller.poll(online_timeout * 1000)
-
-            # When a message is received, or after the timeout, we mark as offline users that should
-            # be marked as offline
-            self.handle_pending_offline_users(online_timeout)
-
-            if not evts:
-                # No message was received
-                continue
-
-            # We parse messages the way given by the Pushpin documentation (see the info message at
-            # the top of this file)
-            m_raw = sock.recv()
-            mtype, mdata = m_raw.split(b" ", 1)
-            if mdata[0] != ord("T"):
-                logger.warning(self, "Unsupported format ", mdata[0])
-                continue
-
-            m = tnetstring.loads(mdata[1:])
-
-            # Let's check that the message is about a user channel
-            channel_name = m.get(b"channel", None)
-            if not channel_name:
-                continue
-
-            # If so, let's get the user id
-            match = re.match("^user_([\\d]+)$", channel_name.decode())
-
-            if not match:
-                logger.debug(self, "Channel {} is not a live message channel")
-                continue
-
-            user_id = int(match.group(1))
-
-            if m.get(b"unavailable", False) or m.get(b"subscribers", 0) == 0:
-                # The user just disconnected, we will mark them as online after a delay
-                self.add_to_pending_offline_users(user_id)
-            else:
-                # The user is online
-                self.set_user_connection_status(user_id, UserConnectionStatus.ONLINE)
+        try:
+            while not self._stopped:
+                # Let's wait messages for online_timeout seconds, or until pending statuses
+                # have to be written
+                evts = poller.poll(self._get_poll_timeout(online_timeout))
+
+                # When a message is received, or after the timeout, we mark as offline users that
+                # should be marked as offline
+                self.handle_pending_offline_users(online_timeout)
+
+                if evts:
+                    # Read all the received messages (up to MAX_MESSAGES_PER_POLL) so that
+                    # their status changes are written in the same batch
+                    for _ in range(self.MAX_MESSAGES_PER_POLL):
+                        try:
+                            m_raw = sock.recv(zmq.NOBLOCK)
+                        except zmq.Again:
+                            break
+                        self.handle_stats_message(m_raw)
+
+                self.flush_pending_statuses(force=False)
+                self.log_stats()
+        finally:
+            self.flush_pending_statuses()
+            self.log_stats(force=True)
+            sock.close()
+            ctx.term()
@@ -0,0 +1,163 @@
+from contextlib import contextmanager
+import fcntl
+import os
+import tempfile
+import time
+import typing
+import zlib
+
+import filelock
+
+from tracim_backend.lib.utils.logger import logger
+
+
+class LocalFileCache(object):
+    """
+    Bounded on-disk cache of files, shared by all the processes of a host.
+
+    Each entry is a file of the cache directory, named by its key. The least recently used
+    entries are removed when the cache contains more than max_size bytes or max_count files.
+
+    Processes using an entry hold a shared lock (flock) on the entry file itself, an entry is
+    only removed by a process which gets an exclusive lock on it: entries in use are never
+    removed. Creation of entries is serialized through a fixed number of lock files
+    (LOCK_COUNT), no lock file is created per entry.
+    """
+
+    LOCK_COUNT = 16
+    LOCK_FILE_PREFIX = ".lock-"
+    TEMPORARY_FILE_SUFFIX = ".part"
+    # INFO - 2026-10-18 - temporary files of processes killed while filling an entry
+    TEMPORARY_FILE_MAX_AGE = 3600
+
+    def __init__(self, directory_path: str, max_size: int, max_count: int) -> None:
+        self.directory_path = directory_path
+        self.max_size = max_size
+        self.max_count = max_count
+
+    @contextmanager
+    def get_filepath(
+        self, key: str, fill: typing.Callable[[typing.BinaryIO], None]
+    ) -> typing.Generator[str, None, None]:
+        """
+        Give the path of the entry of the given key, which is available in the context.
+        :param key: name of the entry file, must be a valid file name
+        :param fill: function writing the content of the entry in the given file, called if
+        the entry is not in the cache
+        """
+        os.makedirs(self.directory_path, exist_ok=True)
+        file_path = os.path.join(self.directory_path, key)
+        created = False
+        fd = self._open_locked(file_path)
+        if fd is None:
+            with filelock.FileLock(self._get_lock_path(key)):
+                fd = self._open_locked(file_path)
+                if fd is None:
+                    fd = self._create(file_path, fill)
+                    created = True
+        try:
+            # INFO - 2026-10-18 - modification time is the last use time of the entry
+            os.utime(fd)
+            yield file_path
+        finally:
+            os.close(fd)
+        if created:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache respects its limits."""
+        entries = []
+        now = time.time()
+        with os.scandir(self.directory_path) as dir_entries:
+            for dir_entry in dir_entries:
+                if dir_entry.name.startswith(self.LOCK_FILE_PREFIX):
+                    continue
+                try:
+                    stat = dir_entry.stat()
+                except FileNotFoundError:
+                    continue
+                if dir_entry.name.endswith(self.TEMPORARY_FILE_SUFFIX):
+                    if stat.st_mtime < now - self.TEMPORARY_FILE_MAX_AGE:
+                        self._remove(dir_entry.path)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, dir_entry.path))
+        entries.sort()
+        total_size = sum(size for _, size, _ in entries)
+        total_count = len(entries)
+        for _, size, path in entries:
+            if total_size <= self.max_size and total_count <= self.max_count:
+                break
+            if self._remove(path):
+                total_size -= size
+                total_count -= 1
+
+    def _create(self, file_path: str, fill: typing.Callable[[typing.BinaryIO], None]) -> int:
+        """
+        Fill a temporary file then move it to the entry path.
+        :return: file descriptor of the entry, locked
+        """
+        fd, temporary_path = tempfile.mkstemp(
+            dir=self.directory_path,
+            prefix="{}.".format(os.path.basename(file_path)),
+            suffix=self.TEMPORARY_FILE_SUFFIX,
+        )
+        try:
+            with os.fdopen(os.dup(fd), "wb") as temporary_file:
+                fill(temporary_file)
+            # INFO - 2026-10-18 - the entry is locked before being visible,
+            # it cannot be removed before being used
+            fcntl.flock(fd, fcntl.LOCK_SH)
+            os.replace(temporary_path, file_path)
+        except BaseException:
+            os.close(fd)
+            self._remove(temporary_path)
+            raise
+        return fd
+
+    def _open_locked(self, file_path: str) -> typing.Optional[int]:
+        """
+        :return: file descriptor of the entry with a shared lock, None if the entry does not exist
+        """
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except FileNotFoundError:
+            return None
+        fcntl.flock(fd, fcntl.LOCK_SH)
+        # INFO - 2026-10-18 - the entry may have been removed between open and lock
+        if not self._is_current_entry(fd, file_path):
+            os.close(fd)
+            return None
+        return fd
+
+    def _remove(self, file_path: str) -> bool:
+        """
+        Remove the file if it is not in use.
+        :return: whether the file has been removed
+        """
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except FileNotFoundError:
+            return False
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        try:
+            if not self._is_current_entry(fd, file_path):
+                return False
+            os.unlink(file_path)
+            logger.debug(self, "File {} removed from cache".format(file_path))
+            return True
+        finally:
+            os.close(fd)
+
+    def _is_current_entry(self, fd: int, file_path: str) -> bool:
+        try:
+            return os.fstat(fd).st_ino == os.stat(file_path).st_ino
+        except FileNotFoundError:
+            return False
+
+    def _get_lock_path(self, key: str) -> str:
+        lock_index = zlib.crc32(key.encode("utf-8")) % self.LOCK_COUNT
+        return os.path.join(self.directory_path, "{}{}".format(self.LOCK_FILE_PREFIX, lock_index))
@@ -1,7 +1,31 @@
+from datetime import datetime
+from datetime import timezone
+import enum
+import typing
+
+from depot.fields.upload import UploadedFile
 from pyramid.events import INewResponse
+from pyramid.httpexceptions import HTTPNotModified
+from pyramid.request import Request
+from pyramid.response import Response
 
 from tracim_backend.views import BASE_API
 
+if typing.TYPE_CHECKING:
+    from tracim_backend.models.data import ContentRevisionRO
+
+# INFO - 2026-10-18 - status codes of responses whose cache headers are set by use_http_cache(),
+# error responses keep the default "no-store"
+CACHEABLE_STATUS_CODES = (200, 206, 304)
+
+
+class HttpCachePolicy(enum.Enum):
+    # INFO - 2026-10-18 - content of the url never changes (revision urls)
+    IMMUTABLE = "private, max-age=31536000, immutable"
+    # INFO - 2026-10-18 - content of the url may change, clients check their copy is up to date
+    # with a conditional request before each use
+    REVALIDATE = "private, no-cache"
+
 
 def default_to_cache_control_no_store(event: INewResponse) -> None:
     request = event.request
@@ -10,3 +34,53 @@ def default_to_cache_control_no_store(event: INewResponse) -> None:
     response = event.response
     if "Cache-Control" not in response.headers:
         response.headers["Cache-Control"] = "no-store"
+
+
+def get_revision_etag(revision: "ContentRevisionRO", *variant: typing.Any) -> str:
+    """
+    Strong validator of a file of a revision, revision files are never modified.
+    :param variant: parameters of the file (preview type, page, size...)
+    """
+    return "-".join(str(part) for part in (revision.revision_id, revision.file_size or 0) + variant)
+
+
+def get_depot_file_etag(depot_file: UploadedFile, *variant: typing.Any) -> str:
+    """
+    Strong validator of a depot file, depot files are never modified.
+    :param variant: parameters of the file (preview type, page, size...)
+    """
+    return "-".join(str(part) for part in (depot_file.file_id,) + variant)
+
+
+def use_http_cache(
+    request: Request,
+    policy: HttpCachePolicy,
+    etag: str,
+    last_modified: typing.Optional[datetime] = None,
+) -> typing.Optional[Response]:
+    """
+    Set the cache headers of the response of the request.
+    :return: a "304 Not Modified" response if the copy of the client is up to date, the file
+    should not be read in this case. None otherwise.
+    """
+
+    def set_cache_headers(request: Request, response: Response) -> None:
+        if response.status_code not in CACHEABLE_STATUS_CODES:
+            return
+        response.headers["Cache-Control"] = policy.value
+        response.etag = etag
+        if last_modified:
+            response.last_modified = last_modified
+
+    request.add_response_callback(set_cache_headers)
+    if request.if_none_match:
+        if etag in request.if_none_match:
+            return HTTPNotModified()
+        return None
+    # INFO - 2026-10-18 - If-Modified-Since is ignored when If-None-Match is given (RFC 7232)
+    if last_modified and request.if_modified_since:
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        if last_modified.replace(microsecond=0) <= request.if_modified_since:
+            return HTTPNotModified()
+    return None
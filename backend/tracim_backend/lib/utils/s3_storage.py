@@ -0,0 +1,43 @@
+import typing
+import uuid
+
+from depot._compat import percent_encode
+from depot.io import utils
+from depot.io.boto3 import S3Storage
+from depot.utils import make_content_disposition
+
+
+class StreamingS3Storage(S3Storage):
+    """
+    S3Storage which stores file objects that cannot be seeked (like an upload being received)
+    with a multipart upload: depot S3Storage reads them in memory.
+    """
+
+    def create(
+        self,
+        content: typing.Any,
+        filename: typing.Optional[str] = None,
+        content_type: typing.Optional[str] = None,
+    ) -> str:
+        content, filename, content_type = self.fileinfo(content, filename, content_type)
+        if not hasattr(content, "seekable") or content.seekable():
+            return super().create(content, filename, content_type)
+
+        new_file_id = str(uuid.uuid1())
+        key = self._bucket_driver.new_key(new_file_id)
+        key.upload_fileobj(content, ExtraArgs=self._get_upload_args(filename, content_type))
+        return new_file_id
+
+    def _get_upload_args(
+        self, filename: typing.Optional[str], content_type: typing.Optional[str]
+    ) -> typing.Dict[str, typing.Any]:
+        # INFO - 2026-10-18 - same object attributes as S3Storage
+        if filename:
+            filename = percent_encode(filename, safe="!#$&+-.^_`|~", encoding="utf-8")
+        return {
+            "ACL": self._policy,
+            "StorageClass": self._storage_class,
+            "Metadata": {"x-depot-filename": filename, "x-depot-modified": utils.timestamp()},
+            "ContentType": content_type,
+            "ContentDisposition": make_content_disposition("inline", filename),
+        }
@@ -19,6 +19,8 @@
 from tracim_backend.lib.utils.utils import webdav_convert_file_name_to_bdd
 from tracim_backend.lib.webdav import resources
 from tracim_backend.lib.webdav.lock_storage import LockStorage
+from tracim_backend.lib.webdav.path_cache import CachedWebdavPath
+from tracim_backend.lib.webdav.path_cache import WebdavPathCache
 from tracim_backend.lib.webdav.resources import get_content_resource
 from tracim_backend.lib.webdav.resources import get_workspace_resource
 from tracim_backend.models.auth import User
@@ -41,16 +43,24 @@ class ProcessedWebdavPath(object):
     - provide useful properties to handle the WebDAV request
     """
 
-    def __init__(self, path: str, current_user: User, session: TracimSession, app_config: CFG):
+    def __init__(
+        self,
+        path: str,
+        current_user: User,
+        session: TracimSession,
+        app_config: CFG,
+        path_cache: typing.Optional[WebdavPathCache] = None,
+    ):
         self.path = path
         self.workspace_api = WorkspaceApi(
             current_user=current_user, session=session, config=app_config
         )
         self.content_api = ContentApi(current_user=current_user, session=session, config=app_config)
+        self._session = session
+        self._path_cache = path_cache
 
         self.workspaces = []
         self.contents = []
-        path_parts = self._path_splitter(self.path)
         # TODO - G.M - 2020-10-09 - Find a proper way to refactor this code to make easier to
         # understood. This code is a bit confusing because:
         # - distinction between invalid path, proper destination path (for move) and root is not so
@@ -60,9 +70,9 @@ def __init__(self, path: str, current_user: User, session: TracimSession, app_co
         if not path_parts:
             self.workspaces.append(None)
             return
-        workspace_found = True
-        current_part_index = 0
+        current_part_index = self._load_cached_prefix(path_parts)
         # Build space hierarchy
+        workspace_found = not self.contents
         while workspace_found:
             try:
                 part = path_parts[current_part_index]
@@ -90,6 +100,100 @@ def __init__(self, path: str, current_user: User, session: TracimSession, app_co
                 except ContentNotFound:
                     content = None
                 self.contents.append(content)
+        self._cache_resolved_prefixes(path_parts)
+
+    def _load_cached_prefix(self, path_parts: typing.List[str]) -> int:
+        """
+        Fill workspaces and contents from the longest cached prefix of the path.
+        :return: number of path parts resolved
+        """
+        if not self._path_cache:
+            return 0
+        for part_count in range(len(path_parts), 0, -1):
+            prefix = "/".join(path_parts[:part_count])
+            cached_path = self._path_cache.get(prefix)
+            if not cached_path:
+                continue
+            if cached_path.shared:
+                loaded = self._load_checked(cached_path, path_parts[:part_count])
+            else:
+                loaded = self._load(cached_path)
+            if loaded:
+                self.workspaces, self.contents = loaded
+                return part_count
+            self._path_cache.invalidate(prefix)
+        return 0
+
+    def _load(
+        self, cached_path: CachedWebdavPath
+    ) -> typing.Optional[typing.Tuple[typing.List[Workspace], typing.List[Content]]]:
+        # INFO - 2026-10-18 - objects already loaded by the request are in the session
+        # identity map, getting them by primary key does not query the database.
+        workspaces = [self._session.query(Workspace).get(id_) for id_ in cached_path.workspace_ids]
+        contents = [self._session.query(Content).get(id_) for id_ in cached_path.content_ids]
+        if None in workspaces or None in contents:
+            return None
+        return workspaces, contents
+
+    def _load_checked(
+        self, cached_path: CachedWebdavPath, path_parts: typing.List[str]
+    ) -> typing.Optional[typing.Tuple[typing.List[Workspace], typing.List[Content]]]:
+        """
+        Load a path cached by another request: the workspaces and contents must still be
+        visible to the user with the same names and parents.
+        """
+        workspaces_by_id = {
+            workspace.workspace_id: workspace
+            for workspace in self.workspace_api.get_all_by_ids(list(cached_path.workspace_ids))
+        }
+        workspaces = [workspaces_by_id.get(id_) for id_ in cached_path.workspace_ids]
+        if None in workspaces:
+            return None
+        contents = []  # type: typing.List[Content]
+        if cached_path.content_ids:
+            contents_by_id = {
+                content.content_id: content
+                for content in self.content_api.get_all_by_ids(
+                    list(cached_path.content_ids), workspace=workspaces[-1]
+                )
+            }
+            contents = [contents_by_id.get(id_) for id_ in cached_path.content_ids]
+            if None in contents:
+                return None
+
+        for index, (workspace, part) in enumerate(zip(workspaces, path_parts)):
+            if workspace.filemanager_filename != webdav_convert_file_name_to_bdd(part):
+                return None
+            if index and workspace.parent_id != workspaces[index - 1].workspace_id:
+                return None
+        parent_id = None
+        for content, part in zip(contents, path_parts[len(workspaces) :]):
+            if (
+                content.file_name != webdav_convert_file_name_to_bdd(part)
+                or content.parent_id != parent_id
+            ):
+                return None
+            parent_id = content.content_id
+        return workspaces, contents
+
+    def _cache_resolved_prefixes(self, path_parts: typing.List[str]) -> None:
+        if not self._path_cache:
+            return
+        workspace_ids = [workspace.workspace_id for workspace in self.workspaces]
+        content_ids = []  # type: typing.List[int]
+        for part_index in range(len(path_parts)):
+            if part_index >= len(workspace_ids):
+                content_index = part_index - len(workspace_ids)
+                if content_index >= len(self.contents) or self.contents[content_index] is None:
+                    # INFO - 2026-10-18 - paths not found are not cached as they
+                    # can be created at any time
+                    return
+                content_ids.append(self.contents[content_index].content_id)
+            self._path_cache.set(
+                "/".join(path_parts[: part_index + 1]),
+                workspace_ids[: part_index + 1],
+                content_ids,
+            )
 
     def _path_splitter(self, path: str) -> typing.List[str]:
         path_parts = path.split("/")
@@ -153,6 +257,7 @@ def __init__(
         self._plugin_manager = plugin_manager
         self.processed_path = None
         self.processed_destpath = None
+        self._path_cache = None
 
     def set_path(self, path: str) -> None:
         self.processed_path = ProcessedWebdavPath(
@@ -160,8 +265,18 @@ def set_path(self, path: str) -> None:
             current_user=self.current_user,
             session=self.dbsession,
             app_config=self.app_config,
+            path_cache=self.path_cache,
         )
 
+    @property
+    def path_cache(self) -> WebdavPathCache:
+        """Resolved paths of the current user, see WebdavPathCache."""
+        if not self._path_cache:
+            self._path_cache = WebdavPathCache(
+                user_id=self.current_user.user_id, ttl=self.app_config.WEBDAV__PATH_CACHE__TTL
+            )
+        return self._path_cache
+
     @property
     def dbsession(self) -> TracimSession:
         assert self._session
@@ -221,6 +336,7 @@ def set_destpath(self, destpath: str) -> None:
             current_user=self.current_user,
             session=self.dbsession,
             app_config=self.app_config,
+            path_cache=self.path_cache,
         )
 
     @property
@@ -0,0 +1,90 @@
+from collections import OrderedDict
+from collections import namedtuple
+import threading
+import time
+import typing
+
+Ids = typing.Tuple[int, ...]
+SharedKey = typing.Tuple[int, str]
+SharedValue = typing.Tuple[float, Ids, Ids]
+
+# INFO - 2026-10-18 - shared entries must be checked before use, the tree
+# may have been modified by another request.
+CachedWebdavPath = namedtuple("CachedWebdavPath", ["workspace_ids", "content_ids", "shared"])
+
+# INFO - 2026-10-18 - entries shared between requests: (user_id, path) -> (expiry, ids)
+_shared_entries = OrderedDict()  # type: OrderedDict[SharedKey, SharedValue]
+_lock = threading.Lock()
+
+
+class WebdavPathCache:
+    """
+    Cache of resolved WebDAV paths: normalized path -> (workspace ids, content ids).
+
+    Entries are kept for the whole request. If ttl is not 0, they are also shared between
+    the requests of the same user for ttl seconds.
+    Only paths where every part has been found are cached.
+    """
+
+    MAX_SHARED_ENTRIES = 10000
+
+    def __init__(self, user_id: int, ttl: int = 0) -> None:
+        self._user_id = user_id
+        self._ttl = ttl
+        self._entries = {}  # type: typing.Dict[str, typing.Tuple[Ids, Ids]]
+
+    @staticmethod
+    def normalize(path: str) -> str:
+        return "/" + "/".join(part for part in path.split("/") if part)
+
+    def get(self, path: str) -> typing.Optional[CachedWebdavPath]:
+        path = self.normalize(path)
+        try:
+            workspace_ids, content_ids = self._entries[path]
+            return CachedWebdavPath(workspace_ids, content_ids, shared=False)
+        except KeyError:
+            pass
+        if not self._ttl:
+            return None
+        with _lock:
+            entry = _shared_entries.get((self._user_id, path))
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return CachedWebdavPath(entry[1], entry[2], shared=True)
+
+    def set(
+        self, path: str, workspace_ids: typing.Sequence[int], content_ids: typing.Sequence[int]
+    ) -> None:
+        path = self.normalize(path)
+        workspace_ids = tuple(workspace_ids)
+        content_ids = tuple(content_ids)
+        self._entries[path] = (workspace_ids, content_ids)
+        if not self._ttl:
+            return
+        key = (self._user_id, path)
+        with _lock:
+            _shared_entries[key] = (time.monotonic() + self._ttl, workspace_ids, content_ids)
+            _shared_entries.move_to_end(key)
+            while len(_shared_entries) > self.MAX_SHARED_ENTRIES:
+                _shared_entries.popitem(last=False)
+
+    def invalidate(self, path: str) -> None:
+        """Remove the given path and every path below it."""
+        path = self.normalize(path)
+        prefix = path.rstrip("/") + "/"
+
+        def is_invalidated(cached_path: str) -> bool:
+            return cached_path == path or cached_path.startswith(prefix)
+
+        for cached_path in [p for p in self._entries if is_invalidated(p)]:
+            del self._entries[cached_path]
+        if not self._ttl:
+            return
+        with _lock:
+            for key in [key for key in _shared_entries if is_invalidated(key[1])]:
+                del _shared_entries[key]
+
+    @staticmethod
+    def clear_shared() -> None:
+        with _lock:
+            _shared_entries.clear()
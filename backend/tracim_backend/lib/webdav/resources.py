@@ -310,19 +310,17 @@ def _get_members(
         members = []
         if self.content:
             parent_id = self.content.content_id
-            children = self.content_api.get_all(
-                content_type=ContentTypeSlug.ANY.value,
-                workspaces=[self.workspace],
-                parent_ids=[parent_id],
-                order_by_properties=["content_id"],
-            )
+            parent_ids = [parent_id]
         else:
-            children = self.content_api.get_all(
-                content_type=ContentTypeSlug.ANY.value,
-                workspaces=[self.workspace],
-                parent_ids=[0],
-                order_by_properties=["content_id"],
-            )
+            parent_ids = [0]
+        # INFO - 2026-10-18 - properties of contents are read from their current revision,
+        # which is loaded with the members by the query.
+        children = self.content_api.get_all_query(
+            content_type_slug=ContentTypeSlug.ANY.value,
+            workspaces=[self.workspace],
+            parent_ids=parent_ids,
+            order_by_properties=["content_id"],
+        ).all()
         for child in children:
             if child.file_name in members_names:
                 continue
@@ -358,7 +356,11 @@ def createEmptyResource(self, file_name: str):
         if resource:
             content = resource.content
         try:
-            self.content_api.check_upload_size(int(self.environ["CONTENT_LENGTH"]), self.workspace)
+            # INFO - 2026-10-18 - no content length with chunked transfer encoding,
+            # the size is checked again once the file is received, see FakeFileStream.
+            self.content_api.check_upload_size(
+                int(self.environ.get("CONTENT_LENGTH") or 0), self.workspace
+            )
         except (
             FileSizeOverMaxLimitation,
             FileSizeOverWorkspaceEmptySpace,
@@ -718,6 +720,7 @@ def delete(self):
                 self.content_api.save(self.content)
         except TracimException as exc:
             raise DAVError(HTTP_FORBIDDEN, contextinfo=str(exc)) from exc
+        self.tracim_context.path_cache.invalidate(self.path)
         transaction.commit()
 
     def supportRecursiveMove(self, destpath: str):
@@ -795,6 +798,8 @@ def move_folder(self, destpath: str):
         except TracimException as exc:
             raise DAVError(HTTP_FORBIDDEN, contextinfo=str(exc)) from exc
 
+        self.tracim_context.path_cache.invalidate(self.path)
+        self.tracim_context.path_cache.invalidate(destpath)
         transaction.commit()
 
     @webdav_check_right(is_contributor)
@@ -844,6 +849,10 @@ def __repr__(self) -> str:
 
     @webdav_check_right(is_reader)
     def getContentLength(self) -> int:
+        # INFO - 2026-10-18 - the stored size avoids reading the file from the storage
+        file_size = self.content.current_revision.file_size
+        if file_size is not None:
+            return file_size
         return self.content.depot_file.file.content_length
 
     @webdav_check_right(is_reader)
@@ -873,7 +882,7 @@ def getContent(self) -> typing.BinaryIO:
     def beginWrite(self, contentType: str = None) -> FakeFileStream:
         try:
             self.content_api.check_upload_size(
-                int(self.environ["CONTENT_LENGTH"]), self.content.workspace
+                int(self.environ.get("CONTENT_LENGTH") or 0), self.content.workspace
             )
         except (
             FileSizeOverMaxLimitation,
@@ -984,6 +993,8 @@ def move_file(self, destpath: str) -> None:
         except TracimException as exc:
             raise DAVError(HTTP_FORBIDDEN, contextinfo=str(exc)) from exc
 
+        self.tracim_context.path_cache.invalidate(self.path)
+        self.tracim_context.path_cache.invalidate(destpath)
         transaction.commit()
 
     def copyMoveSingle(self, destpath, isMove):
@@ -1054,6 +1065,7 @@ def delete(self):
                 self.content_api.save(self.content)
         except TracimException as exc:
             raise DAVError(HTTP_FORBIDDEN, contextinfo=str(exc)) from exc
+        self.tracim_context.path_cache.invalidate(self.path)
         transaction.commit()
 
 
@@ -1,15 +1,24 @@
 # -*- coding: utf-8 -*-
+import hashlib
+import io
 import tempfile
+import time
+import typing
 
 from sqlalchemy.orm import Session
 import transaction
 from wsgidav import util
 from wsgidav.dav_error import HTTP_FORBIDDEN
+from wsgidav.dav_error import HTTP_REQUEST_ENTITY_TOO_LARGE
 from wsgidav.dav_error import DAVError
 
 from tracim_backend.app_models.contents import content_type_list
+from tracim_backend.exceptions import FileSizeOverMaxLimitation
+from tracim_backend.exceptions import FileSizeOverOwnerEmptySpace
+from tracim_backend.exceptions import FileSizeOverWorkspaceEmptySpace
 from tracim_backend.exceptions import TracimException
 from tracim_backend.lib.core.content import ContentApi
+from tracim_backend.lib.utils.logger import logger
 from tracim_backend.models.data import ActionDescription
 from tracim_backend.models.data import Content
 from tracim_backend.models.data import Workspace
@@ -29,6 +38,58 @@ class SpecialFolderExtension(object):
     History = "/.history"
 
 
+class UploadStream(io.RawIOBase):
+    """
+    Readable file object over the chunks of a request body, so that depot storages
+    store an upload while it is received.
+    Size and sha256 digest of the content are computed while it is read.
+    """
+
+    def __init__(self, chunks: typing.Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._chunk = b""
+        self._offset = 0
+        self._hash = hashlib.sha256()
+        self.size = 0
+
+    @property
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def read(self, size: typing.Optional[int] = -1) -> bytes:
+        parts = []
+        remaining = -1 if size is None or size < 0 else size
+        while remaining != 0:
+            if self._offset >= len(self._chunk):
+                self._chunk = next(self._chunks, None)
+                self._offset = 0
+                if self._chunk is None:
+                    self._chunk = b""
+                    break
+                continue
+            if remaining < 0:
+                end = len(self._chunk)
+            else:
+                end = min(len(self._chunk), self._offset + remaining)
+                remaining -= end - self._offset
+            if self._offset == 0 and end == len(self._chunk):
+                # INFO - 2026-10-18 - whole chunk, avoid a copy
+                parts.append(self._chunk)
+            else:
+                parts.append(self._chunk[self._offset : end])
+            self._offset = end
+        data = parts[0] if len(parts) == 1 else b"".join(parts)
+        self.size += len(data)
+        self._hash.update(data)
+        return bytes(data)
+
+
 class FakeFileStream(object):
     """
     Fake a FileStream that we're giving to wsgidav to receive data and create files / new revisions
@@ -40,7 +101,7 @@ class FakeFileStream(object):
     to get a filestream and write content in it
 
     In the first case scenario, the transfer takes two part : it first create the resource (createEmptyResource)
-    then add its content (beginWrite, write, close..). If we went without this class, we would create two revision
+    then add its content (beginWrite, writelines, close..). If we went without this class, we would create two revision
     of the file upon creating a new file, which is not what we want.
     """
 
@@ -63,12 +124,10 @@ def __init__(
         :param content:
         :param parent:
         """
-        # TODO - G.M - 2019-06-13 - use true streaming mechanism,
-        # instead of a true streaming mechanism we use
-        # a temporary file to avoid big file in memory without needing to refactor all
-        # upload mechanism of WebDAV
-        # see https://github.com/tracim/tracim/issues/1911
-        self.temp_file = tempfile.NamedTemporaryFile(suffix="tracim_webdav_upload_")
+        # INFO - 2026-10-18 - only used when data is given through write(),
+        # wsgidav gives the whole request body to writelines().
+        self.temp_file = None  # type: typing.Optional[typing.IO[bytes]]
+        self._is_saved = False
         self._session = session
         self._file_name = file_name if file_name != "" else self._content.file_name
         self._content = content
@@ -99,29 +158,76 @@ def endWrite(self, withErrors: bool):
         """
         pass
 
-    def write(self, s: str):
+    def writelines(self, data_stream: typing.Iterable[bytes]) -> None:
         """
-        Called by request_server when writing content to files, we put it inside a filestream
+        Called by request_server with an iterator over the request body: the file is written
+        to the depot storage while it is received, without temporary file.
         """
+        upload_stream = UploadStream(data_stream)
+        start = time.perf_counter()
+        try:
+            self._save(upload_stream)
+        except Exception:
+            # INFO - 2026-10-18 - the file may already be stored, rolling back the session
+            # removes it from the depot storage (the session is kept open by zope on abort).
+            self._session.rollback()
+            transaction.abort()
+            raise
+        elapsed_time = time.perf_counter() - start
+        logger.debug(
+            self,
+            "Stored {} ({} bytes, sha256 {}) in {:.3f}s".format(
+                self._path, upload_stream.size, upload_stream.hexdigest, elapsed_time
+            ),
+        )
+
+    def write(self, s: bytes):
+        """
+        Called when writing content to files chunk by chunk, we put it inside a temporary file
+        """
+        if self.temp_file is None:
+            self.temp_file = tempfile.NamedTemporaryFile(suffix="tracim_webdav_upload_")
         self.temp_file.write(s)
 
     def close(self):
         """
         Called by request_server when the file content has been written. We either add a new content or create
-        a new revision
+        a new revision (if not already done in writelines)
         """
+        if self.temp_file is not None:
+            self.temp_file.seek(0)
+            self._save(self.temp_file)
+            self.temp_file.close()
+        elif not self._is_saved:
+            self._save(io.BytesIO())
 
-        self.temp_file.seek(0)
+        transaction.commit()
 
+    def _save(self, file_object: typing.BinaryIO) -> None:
         if self._content is None:
-            self.create_file()
+            self.create_file(file_object)
         else:
-            self.update_file()
+            self.update_file(file_object)
+        self._is_saved = True
 
-        transaction.commit()
-        self.temp_file.close()
+    def _check_upload_size(self, file_object: typing.BinaryIO) -> None:
+        """
+        Check the size limitations again with the real size of a streamed file as the request
+        may not have a content length (chunked transfer encoding).
+        Must be called before the new file is flushed to not count it in the used space.
+        """
+        if not isinstance(file_object, UploadStream):
+            return
+        try:
+            self._api.check_upload_size(file_object.size, self._workspace)
+        except (
+            FileSizeOverMaxLimitation,
+            FileSizeOverWorkspaceEmptySpace,
+            FileSizeOverOwnerEmptySpace,
+        ) as exc:
+            raise DAVError(HTTP_REQUEST_ENTITY_TOO_LARGE, contextinfo=str(exc))
 
-    def create_file(self):
+    def create_file(self, file_object: typing.BinaryIO):
         """
         Called when this is a new file; will create a new Content initialized with the correct content
         """
@@ -138,13 +244,14 @@ def create_file(self):
                     do_save=False,
                 )
                 self._api.update_file_data(
-                    file, self._file_name, util.guessMimeType(self._file_name), self.temp_file
+                    file, self._file_name, util.guessMimeType(self._file_name), file_object
                 )
+                self._check_upload_size(file_object)
         except TracimException as exc:
             raise DAVError(HTTP_FORBIDDEN) from exc
         self._api.save(file, ActionDescription.CREATION)
 
-    def update_file(self):
+    def update_file(self, file_object: typing.BinaryIO):
         """
         Called when we're updating an existing content; we create a new revision and update the file content
         """
@@ -154,8 +261,9 @@ def update_file(self):
                     self._content,
                     self._file_name,
                     util.guessMimeType(self._content.file_name),
-                    self.temp_file,
+                    file_object,
                 )
+                self._check_upload_size(file_object)
         except TracimException as exc:
             raise DAVError(HTTP_FORBIDDEN) from exc
 
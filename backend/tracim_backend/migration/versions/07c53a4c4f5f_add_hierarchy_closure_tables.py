@@ -0,0 +1,76 @@
+"""add hierarchy closure tables
+
+Revision ID: 07c53a4c4f5f
+Revises: 27e6c43ac6e4
+Create Date: 2026-10-18 10:12:41.218373
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "07c53a4c4f5f"
+down_revision = "27e6c43ac6e4"
+
+
+def upgrade():
+    # INFO - 2026-10-18 - tables are filled by "tracimcli db hierarchy-index backfill"
+    op.create_table(
+        "content_closure",
+        sa.Column("ancestor_id", sa.Integer(), nullable=False),
+        sa.Column("descendant_id", sa.Integer(), nullable=False),
+        sa.Column("depth", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["ancestor_id"],
+            ["content.id"],
+            name=op.f("fk_content_closure_ancestor_id_content"),
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["descendant_id"],
+            ["content.id"],
+            name=op.f("fk_content_closure_descendant_id_content"),
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("ancestor_id", "descendant_id", name=op.f("pk_content_closure")),
+    )
+    op.create_index(
+        "idx__content_closure__descendant_id", "content_closure", ["descendant_id"], unique=False
+    )
+
+    op.create_table(
+        "workspace_closure",
+        sa.Column("ancestor_id", sa.Integer(), nullable=False),
+        sa.Column("descendant_id", sa.Integer(), nullable=False),
+        sa.Column("depth", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["ancestor_id"],
+            ["workspaces.workspace_id"],
+            name=op.f("fk_workspace_closure_ancestor_id_workspaces"),
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["descendant_id"],
+            ["workspaces.workspace_id"],
+            name=op.f("fk_workspace_closure_descendant_id_workspaces"),
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("ancestor_id", "descendant_id", name=op.f("pk_workspace_closure")),
+    )
+    op.create_index(
+        "idx__workspace_closure__descendant_id",
+        "workspace_closure",
+        ["descendant_id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("idx__workspace_closure__descendant_id", table_name="workspace_closure")
+    op.drop_table("workspace_closure")
+    op.drop_index("idx__content_closure__descendant_id", table_name="content_closure")
+    op.drop_table("content_closure")
@@ -0,0 +1,27 @@
+"""add search index checkpoints
+
+Revision ID: 3d5e8a1f0b27
+Revises: a0c31398964e
+Create Date: 2026-10-18 16:02:17.530214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "3d5e8a1f0b27"
+down_revision = "a0c31398964e"
+
+
+def upgrade():
+    op.create_table(
+        "search_index_checkpoints",
+        sa.Column("name", sa.Unicode(length=255), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("updated", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("name", name=op.f("pk_search_index_checkpoints")),
+    )
+
+
+def downgrade():
+    op.drop_table("search_index_checkpoints")
@@ -0,0 +1,31 @@
+"""add preview metadata to content revisions
+
+Revision ID: 5b2e9c7d4a18
+Revises: 3d5e8a1f0b27
+Create Date: 2026-10-18 21:12:45.381902
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "5b2e9c7d4a18"
+down_revision = "3d5e8a1f0b27"
+
+
+def upgrade():
+    # INFO - 2026-10-18 - NULL values are computed on first read or filled by
+    # "tracimcli db preview-metadata backfill".
+    with op.batch_alter_table("content_revisions") as batch_op:
+        batch_op.add_column(sa.Column("preview_mimetype", sa.Unicode(length=255), nullable=True))
+        batch_op.add_column(sa.Column("preview_page_nb", sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column("preview_has_pdf", sa.Boolean(), nullable=True))
+        batch_op.add_column(sa.Column("preview_has_jpeg", sa.Boolean(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("content_revisions") as batch_op:
+        batch_op.drop_column("preview_has_jpeg")
+        batch_op.drop_column("preview_has_pdf")
+        batch_op.drop_column("preview_page_nb")
+        batch_op.drop_column("preview_mimetype")
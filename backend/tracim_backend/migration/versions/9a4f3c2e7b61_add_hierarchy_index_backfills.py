@@ -0,0 +1,28 @@
+"""add hierarchy index backfills
+
+Revision ID: 9a4f3c2e7b61
+Revises: 5b2e9c7d4a18
+Create Date: 2026-10-18 21:34:08.412093
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "9a4f3c2e7b61"
+down_revision = "5b2e9c7d4a18"
+
+
+def upgrade():
+    # INFO - 2026-10-18 - rows are added by "tracimcli db hierarchy-index backfill",
+    # the hierarchy index is not used until then
+    op.create_table(
+        "hierarchy_index_backfills",
+        sa.Column("table_name", sa.Unicode(length=255), nullable=False),
+        sa.Column("completed", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("table_name", name=op.f("pk_hierarchy_index_backfills")),
+    )
+
+
+def downgrade():
+    op.drop_table("hierarchy_index_backfills")
@@ -0,0 +1,29 @@
+"""add file size to revisions and used space to workspaces
+
+Revision ID: a0c31398964e
+Revises: 07c53a4c4f5f
+Create Date: 2026-10-18 14:02:19.564107
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "a0c31398964e"
+down_revision = "07c53a4c4f5f"
+
+
+def upgrade():
+    # INFO - 2026-10-18 - NULL values are filled by "tracimcli space usage reconcile",
+    # used space of workspaces is also computed on first read.
+    with op.batch_alter_table("content_revisions") as batch_op:
+        batch_op.add_column(sa.Column("file_size", sa.BigInteger(), nullable=True))
+    with op.batch_alter_table("workspaces") as batch_op:
+        batch_op.add_column(sa.Column("used_space", sa.BigInteger(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("workspaces") as batch_op:
+        batch_op.drop_column("used_space")
+    with op.batch_alter_table("content_revisions") as batch_op:
+        batch_op.drop_column("file_size")
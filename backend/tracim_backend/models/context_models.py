@@ -2,10 +2,12 @@
 import base64
 import cgi
 from datetime import datetime
+from typing import Callable
 from typing import Dict
 from typing import Generic
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import TypeVar
 
 from slugify import slugify
@@ -1120,7 +1122,9 @@ def created(self) -> datetime:
 
     @property
     def used_space(self) -> int:
-        return self.workspace.get_size()
+        from tracim_backend.lib.core.workspace_usage import WorkspaceUsageLib
+
+        return WorkspaceUsageLib(self.dbsession).get_workspace_used_space(self.workspace)
 
     @property
     def allowed_space(self) -> int:
@@ -1234,12 +1238,23 @@ class ContentInContext(object):
     """
 
     def __init__(
-        self, content: Content, dbsession: Session, config: CFG, user: User = None
+        self,
+        content: Content,
+        dbsession: Session,
+        config: CFG,
+        user: User = None,
+        get_ids_with_new_information: Optional[Callable[[], Set[int]]] = None,
     ) -> None:
+        """
+        :param get_ids_with_new_information: function giving ids of contents having new
+        information for the user, shared by contents listed together
+        (see ContentApi.get_contents_in_context)
+        """
         self.content = content
         self.dbsession = dbsession
         self.config = config
         self._user = user
+        self._get_ids_with_new_information = get_ids_with_new_information
 
     # Default
     @property
@@ -1315,14 +1330,12 @@ def parent_label(self) -> Optional[str]:
 
     @property
     def parents(self) -> List["ContentInContext"]:
-        parents = []
-        if self.parent:
-            parents.append(self.parent)
-            parent = self.parent
-            while parent.parent is not None:
-                parents.append(parent.parent)
-                parent = parent.parent
-        return parents
+        return [
+            ContentInContext(
+                content=parent, dbsession=self.dbsession, config=self.config, user=self._user
+            )
+            for parent in self.content.recursive_parents
+        ]
 
     @property
     def comments(self) -> List["ContentInContext"]:
@@ -1333,22 +1346,20 @@ def todos(self) -> List["ContentInContext"]:
         return self.subcontent_in_context([ContentTypeSlug.TODO])
 
     def subcontent_in_context(self, content_types):
-        subcontents_in_context = []
-        for subcontent in self.content.get_subcontents(content_types=content_types):
-            from tracim_backend.lib.core.content import ContentApi
+        from tracim_backend.lib.core.content import ContentApi
 
-            content_api = ContentApi(
-                current_user=self._user,
-                session=self.dbsession,
-                config=self.config,
-                show_deleted=True,
-                show_archived=True,
-                show_active=True,
-                show_temporary=True,
-            )
-            subcontent_in_context = content_api.get_content_in_context(subcontent)
-            subcontents_in_context.append(subcontent_in_context)
-        return subcontents_in_context
+        content_api = ContentApi(
+            current_user=self._user,
+            session=self.dbsession,
+            config=self.config,
+            show_deleted=True,
+            show_archived=True,
+            show_active=True,
+            show_temporary=True,
+        )
+        return content_api.get_contents_in_context(
+            self.content.get_subcontents(content_types=content_types)
+        )
 
     @property
     def label(self) -> str:
@@ -1485,7 +1496,14 @@ def slug(self) -> str:
     @property
     def read_by_user(self) -> bool:
         assert self._user
-        return not self.content.has_new_information_for(self._user)
+        if self._get_ids_with_new_information:
+            return self.content_id not in self._get_ids_with_new_information()
+        from tracim_backend.lib.core.content import ContentApi
+
+        content_api = ContentApi(
+            current_user=self._user, session=self.dbsession, config=self.config
+        )
+        return self.content_id not in content_api.get_ids_with_new_information([self.content_id])
 
     @property
     def frontend_url(self) -> str:
@@ -1612,9 +1630,21 @@ def filename(self) -> str:
         return core_convert_file_name_to_display(self.content.file_name)
 
     def get_b64_file(self) -> Optional[str]:
-        if self.content.depot_file:
-            return base64.b64encode(self.content.depot_file.file.read()).decode("ascii")
-        return None
+        if not self.content.depot_file:
+            return None
+        # INFO - 2026-10-18 - encode the file by chunks instead of keeping both the file
+        # and its encoded version in memory, only multiples of 3 bytes are encoded
+        # before the end of the file to avoid padding.
+        file = self.content.depot_file.file
+        encoded_parts = []
+        remaining = b""
+        for chunk in iter(lambda: file.read(3 * 64 * 1024), b""):
+            data = remaining + chunk
+            encoded_length = len(data) - len(data) % 3
+            encoded_parts.append(base64.b64encode(data[:encoded_length]).decode("ascii"))
+            remaining = data[encoded_length:]
+        encoded_parts.append(base64.b64encode(remaining).decode("ascii"))
+        return "".join(encoded_parts)
 
     @property
     def actives_shares(self) -> int:
@@ -1634,6 +1664,34 @@ def content_path(self) -> List["ContentInContext"]:
             for component in self.content.content_path
         ]
 
+    @classmethod
+    def get_content_paths(
+        cls, contents: List["ContentInContext"]
+    ) -> Dict[int, List["ContentInContext"]]:
+        """
+        Same as content_path for several contents, parents of all contents
+        are loaded at once.
+        :return: dict of content_id: content path
+        """
+        if not contents:
+            return {}
+        parents_by_content_id = Content.get_recursive_parents_of(
+            contents[0].dbsession, [content.content for content in contents]
+        )
+        return {
+            content.content_id: [
+                ContentInContext(
+                    content=component,
+                    dbsession=content.dbsession,
+                    config=content.config,
+                    user=content._user,
+                )
+                for component in reversed(parents_by_content_id[content.content.id])
+            ]
+            + [content]
+            for content in contents
+        }
+
     @property
     def version_number(self) -> int:
         return self.content.version_number
@@ -17,16 +17,19 @@
 from sqlakeyset import get_page
 import sqlalchemy
 from sqlalchemy import JSON
+from sqlalchemy import BigInteger
 from sqlalchemy import Column
 from sqlalchemy import Enum
 from sqlalchemy import ForeignKey
 from sqlalchemy import Index
 from sqlalchemy import Sequence
+from sqlalchemy import and_
 from sqlalchemy import inspect
 from sqlalchemy import text
 from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Query
+from sqlalchemy.orm import Session
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm import backref
 from sqlalchemy.orm import object_session
@@ -139,31 +142,45 @@ class Workspace(CreationDateMixin, UpdateDateMixin, TrashableMixin, DeclarativeB
     owner_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)
     owner = relationship("User", remote_side=[User.user_id])
 
+    # INFO - 2026-10-18 - Size of the active files of the workspace, maintained by
+    # WorkspaceUsageHooks. NULL means unknown (not computed yet), see WorkspaceUsageLib.
+    used_space = Column(BigInteger, nullable=True, default=0)
+
     @property
     def recursive_children(self) -> List["Workspace"]:
         """
         :return: list of children Workspace
         """
-        # TODO - G.M - 2020-10-06 - Use SQLAlchemy SQL Expression Language instead of raw sql here,
-        # see https://github.com/tracim/tracim/issues/3670
-        statement = text(
-            """
-            with RECURSIVE children_id as (
-                select workspaces.workspace_id as id from workspaces
-                where workspaces.parent_id = :workspace_id
-                union all
-                select workspaces.workspace_id as id from workspaces
-                join children_id c on c.id = workspaces.parent_id
+        if is_hierarchy_index_enabled(object_session(self)):
+            children_ids = [
+                elem[0]
+                for elem in object_session(self)
+                .query(WorkspaceClosure.descendant_id)
+                .filter(
+                    WorkspaceClosure.ancestor_id == self.workspace_id, WorkspaceClosure.depth > 0
+                )
+            ]
+        else:
+            # TODO - G.M - 2020-10-06 - Use SQLAlchemy SQL Expression Language instead of raw sql
+            # here, see https://github.com/tracim/tracim/issues/3670
+            statement = text(
+                """
+                with RECURSIVE children_id as (
+                    select workspaces.workspace_id as id from workspaces
+                    where workspaces.parent_id = :workspace_id
+                    union all
+                    select workspaces.workspace_id as id from workspaces
+                    join children_id c on c.id = workspaces.parent_id
+                )
+                select children_id.id as workspace_id from children_id;
+                """
             )
-            select children_id.id as workspace_id from children_id;
-            """
-        )
-        children_ids = [
-            elem[0]
-            for elem in object_session(self)
-            .execute(statement, {"workspace_id": self.workspace_id})
-            .fetchall()
-        ]
+            children_ids = [
+                elem[0]
+                for elem in object_session(self)
+                .execute(statement, {"workspace_id": self.workspace_id})
+                .fetchall()
+            ]
         if children_ids:
             return (
                 object_session(self)
@@ -207,20 +224,39 @@ def contents(self) -> List["Content"]:
         return contents
 
     def get_size(self, include_deleted: bool = False, include_archived: bool = False) -> int:
-        size = 0
-        for revision in self.revisions:
-            # INFO - G.M - 2019-09-02 - Don't count deleted and archived file.
-            if not include_deleted and revision.node.is_deleted:
-                continue
-            if not include_archived and revision.node.is_archived:
-                continue
-            if revision.depot_file:
-                try:
-                    size += revision.depot_file.file.content_length
-                except IOError:
-                    logger.warning(
-                        self, "Cannot get depot_file {}".format(revision.depot_file.file_id)
-                    )
+        """
+        Compute the size of the files of all revisions of the workspace.
+        Use WorkspaceUsageLib to get the cached value instead.
+        """
+        current_revision = aliased(ContentRevisionRO)
+        query = (
+            object_session(self)
+            .query(ContentRevisionRO)
+            .join(Content, ContentRevisionRO.content_id == Content.id)
+            .join(current_revision, Content.cached_revision_id == current_revision.revision_id)
+            .filter(
+                ContentRevisionRO.workspace_id == self.workspace_id,
+                ContentRevisionRO.depot_file.isnot(None),
+            )
+        )
+        # INFO - G.M - 2019-09-02 - Don't count deleted and archived file.
+        if not include_deleted:
+            query = query.filter(current_revision.is_deleted == False)  # noqa: E712
+        if not include_archived:
+            query = query.filter(current_revision.is_archived == False)  # noqa: E712
+
+        size = (
+            query.filter(ContentRevisionRO.file_size.isnot(None))
+            .with_entities(func.coalesce(func.sum(ContentRevisionRO.file_size), 0))
+            .scalar()
+        )
+        # INFO - 2026-10-18 - revisions created before file sizes were stored,
+        # see "tracimcli space usage reconcile"
+        for revision in query.filter(ContentRevisionRO.file_size.is_(None)):
+            try:
+                size += revision.depot_file.file.content_length
+            except IOError:
+                logger.warning(self, "Cannot get depot_file {}".format(revision.depot_file.file_id))
         return size
 
     def get_user_role(self, user: User) -> int:
@@ -495,6 +531,15 @@ class ContentRevisionRO(CreationDateMixin, UpdateDateMixin, TrashableMixin, Decl
     # http://depot.readthedocs.io/en/latest/#attaching-files-to-models
     # http://depot.readthedocs.io/en/latest/api.html#module-depot.fields
     depot_file = Column(TracimUploadedFileField, unique=False, nullable=True)
+    # INFO - 2026-10-18 - size of depot_file, set when depot_file is set.
+    # NULL for revisions without file or created before this column existed.
+    file_size = Column(BigInteger, unique=False, nullable=True)
+    # INFO - 2026-10-18 - preview metadata of depot_file, computed once by PreviewMetadataLib
+    # instead of reading the file each time. preview_has_jpeg is NULL when not computed yet.
+    preview_mimetype = Column(Unicode(MAX_FILE_MIMETYPE_LENGTH), unique=False, nullable=True)
+    preview_page_nb = Column(Integer, unique=False, nullable=True)
+    preview_has_pdf = Column(Boolean, unique=False, nullable=True)
+    preview_has_jpeg = Column(Boolean, unique=False, nullable=True)
     properties = Column("properties", JSON, unique=False, nullable=False, default={})
 
     # INFO - G.M - same type are used for FavoriteContent.
@@ -602,9 +647,7 @@ def new_from(cls, revision: "ContentRevisionRO") -> "ContentRevisionRO":
         new_rev.updated = datetime.utcnow()
         if revision.depot_file:
             try:
-                new_rev.depot_file = FileIntent(
-                    revision.depot_file.file, revision.file_name, revision.file_mimetype
-                )
+                new_rev._copy_depot_file(revision)
             except IOError as exc:
                 raise NewRevisionAbortedDepotCorrupted(
                     "IOError. Can't create new revision by copying another one "
@@ -645,9 +688,7 @@ def copy(
         # copy attached_file
         if revision.depot_file:
             try:
-                copy_rev.depot_file = FileIntent(
-                    revision.depot_file.file, revision.file_name, revision.file_mimetype
-                )
+                copy_rev._copy_depot_file(revision)
             except IOError as exc:
                 raise CopyRevisionAbortedDepotCorrupted(
                     "IOError. Can't create new revision by copying another one"
@@ -683,6 +724,50 @@ def __setattr__(self, key: str, value: Any):
             )
 
         super().__setattr__(key, value)
+        if key == "depot_file" and not getattr(self, "_copying_depot_file", False):
+            self._update_file_size()
+            self._copy_preview_metadata(None)
+
+    def _copy_depot_file(self, revision: "ContentRevisionRO") -> None:
+        """
+        Set the file of the given revision as file of this revision.
+        Size and preview metadata of the file are copied from the given revision
+        instead of being read from the storage.
+        """
+        self._copying_depot_file = True
+        try:
+            self.depot_file = FileIntent(
+                revision.depot_file.file, revision.file_name, revision.file_mimetype
+            )
+        finally:
+            self._copying_depot_file = False
+        if revision.file_size is None:
+            # INFO - 2026-10-18 - revisions created before file_size existed
+            self._update_file_size()
+        else:
+            self.file_size = revision.file_size
+        self._copy_preview_metadata(revision)
+
+    def _update_file_size(self) -> None:
+        file_size = None
+        if self.depot_file:
+            try:
+                file_size = self.depot_file.file.content_length
+            except IOError:
+                logger.warning(self, "Cannot get depot_file {}".format(self.depot_file.file_id))
+        self.file_size = file_size
+
+    def _copy_preview_metadata(self, revision: Optional["ContentRevisionRO"]) -> None:
+        """
+        Copy preview metadata of a revision with the same file, reset them if revision is None.
+        """
+        for column_name in (
+            "preview_mimetype",
+            "preview_page_nb",
+            "preview_has_pdf",
+            "preview_has_jpeg",
+        ):
+            setattr(self, column_name, getattr(revision, column_name) if revision else None)
 
     @property
     def is_active(self) -> bool:
@@ -831,6 +916,10 @@ def revision_id(cls) -> InstrumentedAttribute:
 
     @property
     def revision(self) -> ContentRevisionRO:
+        # INFO - 2026-10-18 - a content whose current revision is stored has revisions,
+        # do not load all of them to check it.
+        if self.current_revision is not None and inspect(self.current_revision).has_identity:
+            return self.current_revision
         if not self.revisions:
             self.current_revision = ContentRevisionRO()
             self.current_revision.node = self
@@ -1183,25 +1272,33 @@ def recursive_children(self) -> List["Content"]:
         :return: list of children Content
         :rtype Content
         """
-        # TODO - G.M - 2020-10-06 - Use SQLAlchemy SQL Expression Language instead of raw sql here,
-        # see https://github.com/tracim/tracim/issues/3670
-        statement = text(
-            """
-    with RECURSIVE children_id as (
-    select content.id as id from content join content_revisions cr on content.cached_revision_id = cr.revision_id
-    where cr.parent_id = :content_id
-    union all
-    select content.id as id
-    from content join content_revisions cr on content.cached_revision_id = cr.revision_id
-        join children_id c on c.id = cr.parent_id
-    )
-    select content.id from content join content_revisions on content.cached_revision_id = content_revisions.revision_id
-        join children_id c on c.id = content.id;
-            """
+        if is_hierarchy_index_enabled(object_session(self)):
+            children_ids = [
+                elem[0]
+                for elem in object_session(self)
+                .query(ContentClosure.descendant_id)
+                .filter(ContentClosure.ancestor_id == self.id, ContentClosure.depth > 0)
+            ]
+        else:
+            # TODO - G.M - 2020-10-06 - Use SQLAlchemy SQL Expression Language instead of raw sql
+            # here, see https://github.com/tracim/tracim/issues/3670
+            statement = text(
+                """
+        with RECURSIVE children_id as (
+        select content.id as id from content join content_revisions cr on content.cached_revision_id = cr.revision_id
+        where cr.parent_id = :content_id
+        union all
+        select content.id as id
+        from content join content_revisions cr on content.cached_revision_id = cr.revision_id
+            join children_id c on c.id = cr.parent_id
         )
-        children_ids = [
-            elem[0] for elem in object_session(self).execute(statement, {"content_id": self.id})
-        ]
+        select content.id from content join content_revisions on content.cached_revision_id = content_revisions.revision_id
+            join children_id c on c.id = content.id;
+                """
+            )
+            children_ids = [
+                elem[0] for elem in object_session(self).execute(statement, {"content_id": self.id})
+            ]
         if children_ids:
             return (
                 object_session(self)
@@ -1219,15 +1316,70 @@ def recursive_parents(self) -> List["Content"]:
         """
         :return: list of parent Content order from the direct parent to the last ancestor
         """
+        return self.get_recursive_parents_of(object_session(self), [self])[self.id]
 
-        # TODO - G.M - 2020-10-06 - Explore the idea of recursive CTE here, it's not so trivial as
-        # we should keep tree order between id query retriever and content query.
-        parents = []
-        current_parent = self.parent
-        while current_parent:
-            parents.append(current_parent)
-            current_parent = current_parent.parent
-        return parents
+    @classmethod
+    def get_recursive_parents_of(
+        cls, session: Optional[Session], contents: typing.Iterable["Content"]
+    ) -> typing.Dict[int, List["Content"]]:
+        """
+        Load the parents of all given contents with one recursive CTE query.
+        :return: dict of content id: list of parent Content ordered from the direct parent
+        to the last ancestor (as recursive_parents)
+        """
+        contents = list(contents)
+        parents_by_content_id = {content.id: [] for content in contents}
+        # INFO - 2026-10-18 - the query only sees flushed data: walk the parents in memory
+        # when pending changes may not be flushed (no_autoflush block, e.g. new_revision())
+        # or when contents are not persisted yet.
+        if (
+            session is None
+            or not session.autoflush
+            or any(content.id is None for content in contents)
+        ):
+            for content in contents:
+                current_parent = content.parent
+                while current_parent:
+                    parents_by_content_id[content.id].append(current_parent)
+                    current_parent = current_parent.parent
+            return parents_by_content_id
+        if not contents:
+            return parents_by_content_id
+
+        ancestors = (
+            session.query(
+                Content.id.label("content_id"),
+                ContentRevisionRO.parent_id.label("ancestor_id"),
+                sqlalchemy.literal_column("1", Integer).label("depth"),
+            )
+            .join(ContentRevisionRO, Content.cached_revision_id == ContentRevisionRO.revision_id)
+            .filter(Content.id.in_(parents_by_content_id.keys()))
+            .filter(ContentRevisionRO.parent_id != None)  # noqa: E711
+            .cte("ancestors", recursive=True)
+        )
+        ancestors_alias = ancestors.alias()
+        ancestor = aliased(Content)
+        ancestor_revision = aliased(ContentRevisionRO)
+        ancestors = ancestors.union_all(
+            session.query(
+                ancestors_alias.c.content_id,
+                ancestor_revision.parent_id,
+                ancestors_alias.c.depth + 1,
+            )
+            .select_from(ancestors_alias)
+            .join(ancestor, ancestor.id == ancestors_alias.c.ancestor_id)
+            .join(ancestor_revision, ancestor.cached_revision_id == ancestor_revision.revision_id)
+            .filter(ancestor_revision.parent_id != None)  # noqa: E711
+        )
+        query = (
+            session.query(ancestors.c.content_id, Content)
+            .select_from(ancestors)
+            .join(Content, Content.id == ancestors.c.ancestor_id)
+            .order_by(ancestors.c.content_id, ancestors.c.depth)
+        )
+        for content_id, parent in query:
+            parents_by_content_id[content_id].append(parent)
+        return parents_by_content_id
 
     @property
     def content_path(self) -> List["Content"]:
@@ -1350,10 +1502,22 @@ def has_new_information_for(self, user: User, recursive: bool = True) -> bool:
             return True
 
         if recursive:
-            for child in self.recursive_children:
-                if child.has_new_information_for(user, recursive=False):
-                    # The user did not read this item, so yes!
-                    return True
+            children = self.recursive_children
+            # INFO - 2026-10-18 - look for one unread child with one query instead of
+            # loading the read statuses of every child.
+            if children and (
+                children.outerjoin(
+                    RevisionReadStatus,
+                    and_(
+                        RevisionReadStatus.revision_id == Content.cached_revision_id,
+                        RevisionReadStatus.user_id == user.user_id,
+                    ),
+                )
+                .filter(RevisionReadStatus.revision_id == None)  # noqa: E711
+                .first()
+            ):
+                # The user did not read this item, so yes!
+                return True
 
         return False
 
@@ -1577,6 +1741,93 @@ class RevisionReadStatus(DeclarativeBase):
     user = relationship("User")
 
 
+# INFO - 2026-10-18 - key of session.info set when the hierarchy index tables below are
+# maintained for the session, see tracim_backend.lib.core.hierarchy.HierarchyIndexHooks
+HIERARCHY_INDEX_SESSION_INFO_KEY = "hierarchy_index_enabled"
+# INFO - 2026-10-18 - key of session.info caching whether the hierarchy index tables
+# have been filled, see HierarchyIndexBackfill
+HIERARCHY_INDEX_BACKFILLED_SESSION_INFO_KEY = "hierarchy_index_backfilled"
+
+
+def is_hierarchy_index_enabled(session: Optional[Session]) -> bool:
+    """
+    Whether the hierarchy index can be used to query the content and workspace trees:
+    it is maintained for the session and its tables have been filled. Recursive queries
+    must be used otherwise.
+    """
+    if session is None or not session.info.get(HIERARCHY_INDEX_SESSION_INFO_KEY):
+        return False
+    is_backfilled = session.info.get(HIERARCHY_INDEX_BACKFILLED_SESSION_INFO_KEY)
+    if is_backfilled is None:
+        with session.no_autoflush:
+            backfilled_count = (
+                session.query(HierarchyIndexBackfill)
+                .filter(HierarchyIndexBackfill.table_name.in_(HIERARCHY_INDEX_TABLE_NAMES))
+                .count()
+            )
+        is_backfilled = backfilled_count == len(HIERARCHY_INDEX_TABLE_NAMES)
+        session.info[HIERARCHY_INDEX_BACKFILLED_SESSION_INFO_KEY] = is_backfilled
+    return is_backfilled
+
+
+class ContentClosure(DeclarativeBase):
+    """
+    Closure table of the content tree: one row for each (ancestor, descendant) couple,
+    each content being its own ancestor with a depth of 0.
+    """
+
+    __tablename__ = "content_closure"
+
+    ancestor_id = Column(
+        Integer, ForeignKey("content.id", onupdate="CASCADE", ondelete="CASCADE"), primary_key=True,
+    )
+    descendant_id = Column(
+        Integer, ForeignKey("content.id", onupdate="CASCADE", ondelete="CASCADE"), primary_key=True,
+    )
+    depth = Column(Integer, nullable=False)
+
+
+Index("idx__content_closure__descendant_id", ContentClosure.descendant_id)
+
+
+class WorkspaceClosure(DeclarativeBase):
+    """
+    Closure table of the workspace tree: one row for each (ancestor, descendant) couple,
+    each workspace being its own ancestor with a depth of 0.
+    """
+
+    __tablename__ = "workspace_closure"
+
+    ancestor_id = Column(
+        Integer,
+        ForeignKey("workspaces.workspace_id", onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    descendant_id = Column(
+        Integer,
+        ForeignKey("workspaces.workspace_id", onupdate="CASCADE", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    depth = Column(Integer, nullable=False)
+
+
+Index("idx__workspace_closure__descendant_id", WorkspaceClosure.descendant_id)
+
+HIERARCHY_INDEX_TABLE_NAMES = (ContentClosure.__tablename__, WorkspaceClosure.__tablename__)
+
+
+class HierarchyIndexBackfill(DeclarativeBase):
+    """
+    Last fill of a hierarchy index table, see "tracimcli db hierarchy-index backfill".
+    The index is not used to query the trees until all its tables have been filled.
+    """
+
+    __tablename__ = "hierarchy_index_backfills"
+
+    table_name = Column(Unicode(255), primary_key=True)
+    completed = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
 # TODO - G.M - 2020-09-29 - [Cleanup] Should probably be dropped, see issue #704
 class VirtualEvent(object):
     @classmethod
@@ -0,0 +1,24 @@
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import Unicode
+
+from tracim_backend.models.meta import DeclarativeBase
+from tracim_backend.models.mixins import UpdateDateMixin
+
+
+class SearchIndexCheckpoint(UpdateDateMixin, DeclarativeBase):
+    """
+    Last event whose changes are indexed by a search engine, see
+    "tracimcli search catch-up".
+    """
+
+    __tablename__ = "search_index_checkpoints"
+
+    name = Column(Unicode(255), primary_key=True)
+    event_id = Column(Integer, nullable=False)
+
+    def __repr__(self):
+        return "<SearchIndexCheckpoint(name=%s, event_id=%s)>" % (
+            repr(self.name),
+            repr(self.event_id),
+        )
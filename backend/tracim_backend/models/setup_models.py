@@ -22,6 +22,7 @@
 from tracim_backend.models.favorites import FavoriteContent  # noqa: F401
 from tracim_backend.models.meta import DeclarativeBase  # noqa: F401
 from tracim_backend.models.reaction import Reaction  # noqa: F401
+from tracim_backend.models.search_index import SearchIndexCheckpoint  # noqa: F401
 from tracim_backend.models.tracim_session import TracimSession
 
 if typing.TYPE_CHECKING:
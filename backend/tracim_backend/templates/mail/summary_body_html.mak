@@ -41,6 +41,19 @@
     </ul>
   % endif
 
+  % if len(content_updates) > 0:
+    <p>${_('Here are the contents updated in the last 24h:')}</p>
+    <ul>
+    % for content_update in content_updates:
+      <li>
+        <% content_link = config.WEBSITE__BASE_URL + "/ui/contents/" + str(content_update.content_id) %>
+        <a href="${content_link}" target="_blank">${content_update.label} (${content_update.workspace_label})</a>
+        ${_('{event_count} update(s) by {authors}').format(event_count=content_update.event_count, authors=", ".join(content_update.author_names))}
+      </li>
+    % endfor
+    </ul>
+  % endif
+
   <p>${_("Suricat', your digital assistant")}</p>
   <p>---</p>
   <p>
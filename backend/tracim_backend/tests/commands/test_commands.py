@@ -46,6 +46,7 @@ def test_func__check_commands_list__ok__nominal_case(self) -> None:
 
         # space
         assert output.find("space move") > 0
+        assert output.find("space usage reconcile") > 0
         # user
         assert output.find("user create") > 0
         assert output.find("user update") > 0
@@ -56,11 +57,19 @@ def test_func__check_commands_list__ok__nominal_case(self) -> None:
         assert output.find("db delete") > 0
         assert output.find("db update-naming-conventions") > 0
         assert output.find("db migrate-mysql-charset") > 0
+        assert output.find("db hierarchy-index backfill") > 0
+        assert output.find("db hierarchy-index verify") > 0
+        assert output.find("db preview-metadata backfill") > 0
+        # preview
+        assert output.find("preview cache warm") > 0
+        assert output.find("preview cache stats") > 0
+        assert output.find("preview cache prune") > 0
         # search
         assert output.find("search index-create") > 0
         assert output.find("search index-populate") > 0
         assert output.find("search index-upgrade-experimental") > 0
         assert output.find("search index-drop") > 0
+        assert output.find("search catch-up") > 0
         # webdav
         assert output.find("webdav start") > 0
         # caldav
@@ -71,6 +80,7 @@ def test_func__check_commands_list__ok__nominal_case(self) -> None:
         assert output.find("dev parameters value") > 0
         assert output.find("dev test live-messages") > 0
         assert output.find("dev test smtp") > 0
+        assert output.find("dev benchmark webdav-upload") > 0
         assert output.find("dev custom-properties extract-translation-source") > 0
         assert output.find("dev custom-properties checker") > 0
 
@@ -24,12 +24,15 @@
 from tracim_backend.fixtures.content import Content as ContentFixture
 from tracim_backend.fixtures.users import Base as BaseFixture
 from tracim_backend.fixtures.users import Test as FixtureTest
+from tracim_backend.lib.core.receiver_cache import ReceiverIdsCache
 from tracim_backend.lib.rq import RqQueueName
 from tracim_backend.lib.rq import get_redis_connection
 from tracim_backend.lib.rq import get_rq_queue
+from tracim_backend.lib.search.database_search.database_search_api import DatabaseSearchApi
 from tracim_backend.lib.utils.logger import logger
 from tracim_backend.lib.webdav import TracimDavProvider
 from tracim_backend.lib.webdav import WebdavAppFactory
+from tracim_backend.lib.webdav.path_cache import WebdavPathCache
 from tracim_backend.models.auth import Profile
 from tracim_backend.models.auth import User
 from tracim_backend.models.meta import DeclarativeBase
@@ -282,6 +285,9 @@ def session(request, engine, session_factory, app_config, test_logger, test_cont
         except Exception as e:
             transaction.abort()
             raise e
+    # INFO - 2026-10-18 - ids are reused between tests, do not keep cached receivers
+    ReceiverIdsCache.clear()
+    WebdavPathCache.clear_shared()
     yield context.dbsession
 
     context.dbsession.rollback()
@@ -464,6 +470,17 @@ def mailhog() -> MailHogHelper:
     mailhog_helper.cleanup_mailhog()
 
 
+@pytest.fixture
+def database_search(app_config, session) -> DatabaseSearchApi:
+    search_api = DatabaseSearchApi(session=session, current_user=None, config=app_config)
+    with transaction.manager:
+        search_api.delete_indices()
+        search_api.create_indices()
+    yield search_api
+    with transaction.manager:
+        search_api.delete_indices()
+
+
 @pytest.fixture
 def elasticsearch(app_config, session) -> ElasticSearchHelper:
     elasticsearch_helper = ElasticSearchHelper(app_config, session)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import io
+from unittest.mock import patch
 from urllib.parse import quote
 
 from PIL import Image
@@ -11,6 +12,7 @@
 
 from tracim_backend.app_models.contents import ContentTypeSlug
 from tracim_backend.error import ErrorCode
+from tracim_backend.lib.core.storage import StorageLib
 from tracim_backend.lib.translate.services.systran import FILE_TRANSLATION_ENDPOINT
 from tracim_backend.models.data import Content
 from tracim_backend.models.revision_protection import new_revision
@@ -2630,6 +2632,58 @@ def test_api__get_file_raw__ok_200__force_download_case(
         assert res.last_modified.month == test_file.updated.month
         assert res.last_modified.year == test_file.updated.year
 
+    def test_api__get_file_raw__ok_304__not_modified(
+        self, workspace_api_factory, content_api_factory, session, web_testapp, content_type_list
+    ) -> None:
+        """
+        Get one file of a content already known by the client
+        """
+        workspace_api = workspace_api_factory.get()
+        content_api = content_api_factory.get()
+        business_workspace = workspace_api.get_one(1)
+        with session.no_autoflush:
+            test_file = content_api.create(
+                content_type_slug=content_type_list.File.slug,
+                workspace=business_workspace,
+                label="Test file",
+                do_save=False,
+                do_notify=False,
+            )
+            content_api.update_file_data(test_file, "Test_file.txt", "text/plain", b"Test file")
+        content_api.save(test_file)
+        transaction.commit()
+        content_id = test_file.content_id
+        revision_id = test_file.cached_revision_id
+        web_testapp.authorization = ("Basic", ("admin@admin.admin", "admin@admin.admin"))
+        url = "/api/workspaces/1/files/{}/raw/Test_file.txt".format(content_id)
+        res = web_testapp.get(url, status=200)
+        assert res.headers["Cache-Control"] == "private, no-cache"
+        etag = res.headers["ETag"]
+        last_modified = res.headers["Last-Modified"]
+
+        with patch.object(StorageLib, "get_raw_file") as get_raw_file:
+            res = web_testapp.get(url, headers={"If-None-Match": etag}, status=304)
+            assert res.headers["ETag"] == etag
+            assert res.headers["Cache-Control"] == "private, no-cache"
+            web_testapp.get(url, headers={"If-Modified-Since": last_modified}, status=304)
+            get_raw_file.assert_not_called()
+
+        revision_url = "/api/workspaces/1/files/{}/revisions/{}/raw/Test_file.txt".format(
+            content_id, revision_id
+        )
+        res = web_testapp.get(revision_url, status=200)
+        assert res.headers["Cache-Control"] == "private, max-age=31536000, immutable"
+        web_testapp.get(revision_url, headers={"If-None-Match": res.headers["ETag"]}, status=304)
+
+        test_file = content_api.get_one(content_id, content_type=ContentTypeSlug.ANY)
+        with new_revision(session=session, tm=transaction.manager, content=test_file):
+            content_api.update_file_data(test_file, "Test_file.txt", "text/plain", b"New file")
+        content_api.save(test_file)
+        transaction.commit()
+        res = web_testapp.get(url, headers={"If-None-Match": etag}, status=200)
+        assert res.body == b"New file"
+        assert res.headers["ETag"] != etag
+
     @pytest.mark.parametrize(
         "content_namespace, content_type",
         [("content", "file"), ("publication", "file"), ("content", "kanban")],
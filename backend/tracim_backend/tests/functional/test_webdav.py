@@ -2,6 +2,8 @@
 from urllib.parse import quote
 
 import pytest
+from sqlalchemy import event as sqlalchemy_event
+from sqlalchemy.engine import Engine
 import transaction
 
 from tracim_backend.app_models.contents import ContentTypeSlug
@@ -2010,3 +2012,84 @@ def test_functional__webdav_move_file__ok__different_workspace_root_to_root(
             ),
             status=200,
         )
+
+
+@pytest.fixture
+def query_counter():
+    counter = {"count": 0}
+
+    def count_query(*args, **kwargs) -> None:
+        counter["count"] += 1
+
+    sqlalchemy_event.listen(Engine, "before_cursor_execute", count_query)
+    yield counter
+    sqlalchemy_event.remove(Engine, "before_cursor_execute", count_query)
+
+
+@pytest.mark.usefixtures("base_fixture")
+@pytest.mark.parametrize("config_section", [{"name": "functional_webdav_test"}], indirect=True)
+class TestFunctionalWebdavPropfindLoad(object):
+    """
+    Load test of depth-1 PROPFIND: the number of queries must not depend on the number of
+    members of the listed folder.
+    """
+
+    def _create_files(self, session, content_api_factory, workspace, parent, count) -> None:
+        api = content_api_factory.get()
+        for index in range(count):
+            with session.no_autoflush:
+                file = api.create(
+                    content_type_slug=ContentTypeSlug.FILE.value,
+                    workspace=workspace,
+                    parent=parent,
+                    filename="file_{}.txt".format(index),
+                    do_save=False,
+                    do_notify=False,
+                )
+                api.update_file_data(file, "file_{}.txt".format(index), "text/plain", b"content")
+                api.save(file)
+        transaction.commit()
+
+    def _propfind(self, webdav_testapp, query_counter, path: str) -> int:
+        query_counter["count"] = 0
+        res = webdav_testapp.request(path, method="PROPFIND", headers={"Depth": "1"}, status=207)
+        assert "getcontentlength>7</" in res.text
+        return query_counter["count"]
+
+    def test_functional__webdav_propfind__ok__queries_independent_of_member_count(
+        self,
+        session,
+        workspace_api_factory,
+        content_api_factory,
+        admin_user,
+        webdav_testapp,
+        query_counter,
+    ) -> None:
+        workspace_api = workspace_api_factory.get(current_user=admin_user)
+        small_workspace = workspace_api.create_workspace("small", save_now=True)
+        big_workspace = workspace_api.create_workspace("big", save_now=True)
+        api = content_api_factory.get()
+        folders = []
+        for workspace in (small_workspace, big_workspace):
+            folders.append(
+                api.create(
+                    content_type_slug=ContentTypeSlug.FOLDER.value,
+                    workspace=workspace,
+                    label="folder",
+                    do_save=True,
+                    do_notify=False,
+                )
+            )
+        transaction.commit()
+        self._create_files(session, content_api_factory, small_workspace, folders[0], 2)
+        self._create_files(session, content_api_factory, big_workspace, folders[1], 40)
+        self._create_files(session, content_api_factory, small_workspace, None, 2)
+        self._create_files(session, content_api_factory, big_workspace, None, 40)
+
+        webdav_testapp.authorization = ("Basic", ("admin@admin.admin", "admin@admin.admin"))
+        for path in ("/{}.space/", "/{}.space/folder/"):
+            small_count = self._propfind(webdav_testapp, query_counter, path.format("small"))
+            big_count = self._propfind(webdav_testapp, query_counter, path.format("big"))
+            assert big_count == small_count, "{}: {} queries for 3 members, {} for 41".format(
+                path, small_count, big_count
+            )
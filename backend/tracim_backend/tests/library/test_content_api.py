@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import typing
+from unittest.mock import patch
 
 import pytest
 import transaction
@@ -1946,6 +1947,198 @@ def test_mark_read(
         for rev in page_1.revisions:
             eq_(user_b in rev.read_by.keys(), True)
 
+    def test_unit__get_ids_with_new_information__ok__nominal_case(
+        self,
+        user_api_factory,
+        workspace_api_factory,
+        session,
+        app_config,
+        content_type_list,
+        role_api_factory,
+    ):
+        uapi = user_api_factory.get()
+        user_a = uapi.create_minimal_user(
+            email="this.is@user", profile=Profile.ADMIN, save_now=True
+        )
+        user_b = uapi.create_minimal_user(
+            email="this.is@another.user", profile=Profile.ADMIN, save_now=True
+        )
+        workspace = workspace_api_factory.get(current_user=user_a).create_workspace(
+            "test workspace", save_now=True
+        )
+        role_api_factory.get(current_user=user_a).create_one(
+            user=user_b,
+            workspace=workspace,
+            role_level=UserRoleInWorkspace.READER,
+            email_notification_type=EmailNotificationType.NONE,
+        )
+        cont_api_a = ContentApi(current_user=user_a, session=session, config=app_config)
+        cont_api_b = ContentApi(current_user=user_b, session=session, config=app_config)
+        folder = cont_api_a.create(
+            content_type_slug=content_type_list.Folder.slug,
+            workspace=workspace,
+            label="folder",
+            do_save=True,
+        )
+        subfolder = cont_api_a.create(
+            content_type_slug=content_type_list.Folder.slug,
+            workspace=workspace,
+            parent=folder,
+            label="subfolder",
+            do_save=True,
+        )
+        page = cont_api_a.create(
+            content_type_slug=content_type_list.Page.slug,
+            workspace=workspace,
+            parent=subfolder,
+            label="page",
+            do_save=True,
+        )
+        content_ids = [folder.content_id, subfolder.content_id, page.content_id]
+        assert cont_api_b.get_ids_with_new_information(content_ids) == set(content_ids)
+
+        cont_api_b.mark_read(folder, recursive=False)
+        cont_api_b.mark_read(subfolder, recursive=False)
+        # INFO - 2026-10-18 - the page is not read: so are not its parents
+        assert cont_api_b.get_ids_with_new_information(content_ids) == set(content_ids)
+        assert folder.has_new_information_for(user_b)
+        assert not folder.has_new_information_for(user_b, recursive=False)
+
+        cont_api_b.mark_read(page)
+        assert cont_api_b.get_ids_with_new_information(content_ids) == set()
+        assert not folder.has_new_information_for(user_b)
+
+        other_page = cont_api_a.create(
+            content_type_slug=content_type_list.Page.slug,
+            workspace=workspace,
+            parent=subfolder,
+            label="other page",
+            do_save=True,
+        )
+        assert cont_api_b.get_ids_with_new_information(content_ids + [other_page.content_id]) == {
+            folder.content_id,
+            subfolder.content_id,
+            other_page.content_id,
+        }
+        assert folder.has_new_information_for(user_b)
+
+    def test_unit__get_read_status__ok__cost_independent_of_unrelated_contents(
+        self, user_api_factory, workspace_api_factory, session, app_config, content_type_list,
+    ):
+        if session.connection().dialect.name != "sqlite":
+            pytest.skip("virtual machine steps are only counted with sqlite")
+        uapi = user_api_factory.get()
+        user = uapi.create_minimal_user(email="this.is@user", profile=Profile.ADMIN, save_now=True)
+        workspace = workspace_api_factory.get(current_user=user).create_workspace(
+            "test workspace", save_now=True
+        )
+        api = ContentApi(current_user=user, session=session, config=app_config)
+        folder = api.create(
+            content_type_slug=content_type_list.Folder.slug,
+            workspace=workspace,
+            label="folder",
+            do_save=True,
+        )
+        api.create(
+            content_type_slug=content_type_list.Page.slug,
+            workspace=workspace,
+            parent=folder,
+            label="page",
+            do_save=True,
+        )
+
+        def create_unrelated_folders(start: int, stop: int) -> None:
+            for index in range(start, stop):
+                unrelated_folder = api.create(
+                    content_type_slug=content_type_list.Folder.slug,
+                    workspace=workspace,
+                    label="unrelated folder {}".format(index),
+                    do_save=True,
+                )
+                api.create(
+                    content_type_slug=content_type_list.Page.slug,
+                    workspace=workspace,
+                    parent=unrelated_folder,
+                    label="unrelated page {}".format(index),
+                    do_save=True,
+                )
+
+        def count_steps() -> int:
+            # INFO - 2026-10-18 - sqlite calls the progress handler every n virtual machine
+            # instructions, this gives the cost of the query
+            counter = {"steps": 0}
+
+            def progress_handler() -> int:
+                counter["steps"] += 1
+                return 0
+
+            dbapi_connection = session.connection().connection
+            dbapi_connection.set_progress_handler(progress_handler, 10)
+            try:
+                read_statuses = api.get_read_status(user, content_ids=[folder.content_id])
+            finally:
+                dbapi_connection.set_progress_handler(None, 10)
+            assert [read_status["content_id"] for read_status in read_statuses] == [
+                folder.content_id
+            ]
+            return counter["steps"]
+
+        create_unrelated_folders(0, 20)
+        steps_with_some_unrelated_contents = count_steps()
+        create_unrelated_folders(20, 80)
+        steps_with_many_unrelated_contents = count_steps()
+        # INFO - 2026-10-18 - computing the read status of every content would need about
+        # four times more steps with four times more unrelated contents
+        assert steps_with_many_unrelated_contents < 2 * steps_with_some_unrelated_contents
+
+    def test_unit__get_contents_in_context__ok__read_statuses_computed_once(
+        self,
+        user_api_factory,
+        workspace_api_factory,
+        session,
+        app_config,
+        content_type_list,
+        role_api_factory,
+    ):
+        uapi = user_api_factory.get()
+        user_a = uapi.create_minimal_user(
+            email="this.is@user", profile=Profile.ADMIN, save_now=True
+        )
+        user_b = uapi.create_minimal_user(
+            email="this.is@another.user", profile=Profile.ADMIN, save_now=True
+        )
+        workspace = workspace_api_factory.get(current_user=user_a).create_workspace(
+            "test workspace", save_now=True
+        )
+        role_api_factory.get(current_user=user_a).create_one(
+            user=user_b,
+            workspace=workspace,
+            role_level=UserRoleInWorkspace.READER,
+            email_notification_type=EmailNotificationType.NONE,
+        )
+        cont_api_a = ContentApi(current_user=user_a, session=session, config=app_config)
+        cont_api_b = ContentApi(current_user=user_b, session=session, config=app_config)
+        pages = [
+            cont_api_a.create(
+                content_type_slug=content_type_list.Page.slug,
+                workspace=workspace,
+                label="page {}".format(index),
+                do_save=True,
+            )
+            for index in range(3)
+        ]
+        cont_api_b.mark_read(pages[1])
+        with patch.object(
+            ContentApi, "get_read_status", autospec=True, side_effect=ContentApi.get_read_status
+        ) as get_read_status_mock:
+            contents_in_context = cont_api_b.get_contents_in_context(pages)
+            assert [content.read_by_user for content in contents_in_context] == [
+                False,
+                True,
+                False,
+            ]
+        assert get_read_status_mock.call_count == 1
+
     def test_mark_read__all(
         self,
         user_api_factory,
@@ -0,0 +1,199 @@
+from unittest.mock import patch
+
+import pytest
+import transaction
+
+from tracim_backend.lib.search.database_search.database_search_api import DatabaseContentIndexer
+from tracim_backend.lib.search.database_search.database_search_api import DatabaseSearchApi
+from tracim_backend.models.auth import Profile
+from tracim_backend.models.revision_protection import new_revision
+from tracim_backend.tests.fixtures import *  # noqa F403,F401
+from tracim_backend.views.search_api.schemas import ContentSearchQuery
+
+
+@pytest.fixture
+def search_user(user_api_factory):
+    return user_api_factory.get().create_minimal_user(
+        email="this.is@user", profile=Profile.ADMIN, save_now=True
+    )
+
+
+@pytest.fixture
+def search_workspace(workspace_api_factory, search_user):
+    return workspace_api_factory.get(current_user=search_user).create_workspace(
+        "test workspace", save_now=True
+    )
+
+
+@pytest.mark.usefixtures("base_fixture", "database_search")
+@pytest.mark.parametrize("config_section", [{"name": "test_database_search"}], indirect=True)
+class TestDatabaseSearchApi(object):
+    def test_unit__search_content__ok__best_matches_first(
+        self, search_user, search_workspace, content_api_factory, content_type_list
+    ):
+        api = content_api_factory.get(search_user)
+        in_description = api.create(
+            content_type_slug=content_type_list.Page.slug,
+            workspace=search_workspace,
+            label="a page",
+            do_save=True,
+        )
+        with new_revision(session=api._session, tm=transaction.manager, content=in_description):
+            in_description.description = "about potatoes"
+        api.save(in_description)
+        in_label = api.create(
+            content_type_slug=content_type_list.Page.slug,
+            workspace=search_workspace,
+            label="potatoes",
+            do_save=True,
+        )
+        api.create(
+            content_type_slug=content_type_list.Page.slug,
+            workspace=search_workspace,
+            label="carrots",
+            do_save=True,
+        )
+        transaction.commit()
+
+        search_api = DatabaseSearchApi(
+            session=api._session, current_user=search_user, config=api._config
+        )
+        response = search_api.search_content(ContentSearchQuery(search_string="potato"))
+
+        assert response.total_hits == 2
+        assert response.is_total_hits_accurate
+        assert [content.content_id for content in response.contents] == [
+            in_label.content_id,
+            in_description.content_id,
+        ]
+        assert response.contents[0].score > response.contents[1].score
+
+    def test_unit__search_content__ok__pagination(
+        self, search_user, search_workspace, content_api_factory, content_type_list
+    ):
+        api = content_api_factory.get(search_user)
+        for index in range(5):
+            api.create(
+                content_type_slug=content_type_list.Page.slug,
+                workspace=search_workspace,
+                label="report {}".format(index),
+                do_save=True,
+            )
+        transaction.commit()
+
+        search_api = DatabaseSearchApi(
+            session=api._session, current_user=search_user, config=api._config
+        )
+        first_page = search_api.search_content(
+            ContentSearchQuery(search_string="report", size=2, page_nb=1)
+        )
+        last_page = search_api.search_content(
+            ContentSearchQuery(search_string="report", size=2, page_nb=3)
+        )
+
+        assert first_page.total_hits == 5
+        assert len(first_page.contents) == 2
+        assert last_page.total_hits == 5
+        assert len(last_page.contents) == 1
+
+    def test_unit__search_content__ok__comments_found_with_their_content(
+        self, search_user, search_workspace, content_api_factory, content_type_list
+    ):
+        api = content_api_factory.get(search_user)
+        thread = api.create(
+            content_type_slug=content_type_list.Thread.slug,
+            workspace=search_workspace,
+            label="a thread",
+            do_save=True,
+        )
+        api.create_comment(
+            workspace=search_workspace, parent=thread, content="<p>strawberries</p>", do_save=True
+        )
+        transaction.commit()
+
+        search_api = DatabaseSearchApi(
+            session=api._session, current_user=search_user, config=api._config
+        )
+        response = search_api.search_content(ContentSearchQuery(search_string="strawberries"))
+
+        assert [content.content_id for content in response.contents] == [thread.content_id]
+
+    def test_unit__search_content__ok__content_of_deleted_folder_not_shown(
+        self, search_user, search_workspace, content_api_factory, content_type_list
+    ):
+        api = content_api_factory.get(search_user)
+        folder = api.create(
+            content_type_slug=content_type_list.Folder.slug,
+            workspace=search_workspace,
+            label="a folder",
+            do_save=True,
+        )
+        page = api.create(
+            content_type_slug=content_type_list.Page.slug,
+            workspace=search_workspace,
+            parent=folder,
+            label="tomatoes",
+            do_save=True,
+        )
+        transaction.commit()
+        with new_revision(session=api._session, tm=transaction.manager, content=folder):
+            api.delete(folder)
+        api.save(folder)
+        transaction.commit()
+
+        search_api = DatabaseSearchApi(
+            session=api._session, current_user=search_user, config=api._config
+        )
+        response = search_api.search_content(ContentSearchQuery(search_string="tomatoes"))
+        assert response.total_hits == 0
+        response = search_api.search_content(
+            ContentSearchQuery(search_string="tomatoes", show_deleted=1)
+        )
+        assert [content.content_id for content in response.contents] == [page.content_id]
+
+    def test_unit__index_contents__ok__children_only_reindexed_on_state_change(
+        self, search_user, search_workspace, content_api_factory, content_type_list
+    ):
+        api = content_api_factory.get(search_user)
+        folder = api.create(
+            content_type_slug=content_type_list.Folder.slug,
+            workspace=search_workspace,
+            label="a folder",
+            do_save=True,
+        )
+        page = api.create(
+            content_type_slug=content_type_list.Page.slug,
+            workspace=search_workspace,
+            parent=folder,
+            label="tomatoes",
+            do_save=True,
+        )
+        transaction.commit()
+
+        with patch.object(
+            DatabaseContentIndexer, "sync_index_contents", autospec=True, return_value=0
+        ) as sync_index_contents:
+            with new_revision(session=api._session, tm=transaction.manager, content=folder):
+                api.update_content(folder, new_label="renamed folder", new_description="about")
+            api.save(folder)
+            transaction.commit()
+        indexed_content_ids = [
+            content.content_id
+            for call in sync_index_contents.call_args_list
+            for content in call[0][1]
+        ]
+        assert indexed_content_ids == [folder.content_id]
+
+        with patch.object(
+            DatabaseContentIndexer, "sync_index_contents", autospec=True, return_value=0
+        ) as sync_index_contents:
+            with new_revision(session=api._session, tm=transaction.manager, content=folder):
+                api.archive(folder)
+            api.save(folder)
+            transaction.commit()
+        indexed_content_ids = [
+            content.content_id
+            for call in sync_index_contents.call_args_list
+            for content in call[0][1]
+        ]
+        assert sorted(indexed_content_ids) == sorted([folder.content_id, page.content_id])
@@ -1,3 +1,4 @@
+import io
 import typing
 from unittest.mock import MagicMock
 from unittest.mock import PropertyMock
@@ -5,18 +6,26 @@
 
 import elasticsearch_dsl as es_dsl
 import pytest
+from sqlalchemy import event as sqlalchemy_event
+from sqlalchemy.engine import Engine
 import transaction
 
+from tracim_backend.lib.core.tag import TagLib
 from tracim_backend.lib.rq import RqQueueName
 from tracim_backend.lib.rq import get_rq_queue2
 from tracim_backend.lib.rq.worker import DatabaseWorker
 from tracim_backend.lib.search.elasticsearch_search.elasticsearch_search import ESContentIndexer
+from tracim_backend.lib.search.elasticsearch_search.elasticsearch_search import ESSearchApi
 from tracim_backend.lib.search.elasticsearch_search.elasticsearch_search import ESUserIndexer
 from tracim_backend.lib.search.elasticsearch_search.elasticsearch_search import ESWorkspaceIndexer
 from tracim_backend.lib.search.elasticsearch_search.es_models import HtmlText
 from tracim_backend.lib.search.elasticsearch_search.es_models import JsonSchemaDict
 from tracim_backend.lib.search.elasticsearch_search.es_models import SimpleText
 from tracim_backend.lib.search.elasticsearch_search.es_models import get_es_field_from_json_schema
+from tracim_backend.lib.search.elasticsearch_search.indexed_content_builder import (
+    IndexedContentBuilder,
+)
+from tracim_backend.lib.search.elasticsearch_search.text_extractor import FileTextExtractor
 from tracim_backend.lib.utils.request import TracimContext
 from tracim_backend.models.auth import User
 from tracim_backend.models.data import Content
@@ -53,13 +62,24 @@ def a_workspace() -> Workspace:
 def content_indexer_with_api_mock() -> typing.Iterator[ContentIndexerWithApiMock]:
     """Create an ESContentIndexer instance with mocked ESSearchApi and ContentApi.
 
-    Return a (ESContentIndexer, ESSearchApi.index_content_mock, ContentApi_mock) tuple.
+    Return a (ESContentIndexer, ESSearchApi.create_indexed_content_mock, ContentApi_mock) tuple.
+    The documents of several contents are created by calling the mock for each content.
+    Documents are not sent to elasticsearch.
     """
+    index_content_mock = MagicMock(return_value=(MagicMock(), None))
+
+    def create_indexed_contents(contents: typing.List[Content]) -> dict:
+        return {content.content_id: index_content_mock(content) for content in contents}
+
     with patch(
-        "tracim_backend.lib.search.elasticsearch_search.elasticsearch_search.ESSearchApi.index_content"
-    ) as index_content_mock, patch(
+        "tracim_backend.lib.search.elasticsearch_search.elasticsearch_search.ESSearchApi.create_indexed_contents",
+        side_effect=create_indexed_contents,
+    ), patch(
+        "tracim_backend.lib.search.elasticsearch_search.elasticsearch_search.ESSearchApi._send_bulk_actions"
+    ) as send_bulk_actions_mock, patch(
         "tracim_backend.lib.search.elasticsearch_search.elasticsearch_search.ContentApi"
     ) as content_api_class_mock:
+        send_bulk_actions_mock.return_value = []
         content_api_mock = MagicMock()
         content_api_class_mock.return_value = content_api_mock
         yield (ESContentIndexer(), index_content_mock, content_api_mock)
@@ -213,9 +233,10 @@ def test_unit__index_contents__ok__async(
         session,
     ) -> None:
         content = html_document()
-        (indexer, index_content_mock, _) = content_indexer_with_api_mock
+        (indexer, index_content_mock, content_api_mock) = content_indexer_with_api_mock
         test_context_without_plugins.dbsession.add(content)
         test_context_without_plugins.dbsession.flush()
+        content_api_mock.get_all_by_ids.return_value = [content]
         indexer.index_contents([content], test_context_without_plugins)
         transaction.commit()
         queue = get_rq_queue2(
@@ -253,10 +274,11 @@ def test_unit__sync_index_contents__err__async_indexing_error(
         content_indexer_with_api_mock: ContentIndexerWithApiMock,
     ) -> None:
         content = html_document()
-        (indexer, index_content_mock, _) = content_indexer_with_api_mock
+        (indexer, index_content_mock, content_api_mock) = content_indexer_with_api_mock
         index_content_mock.side_effect = Exception("indexing error")
         test_context_without_plugins.dbsession.add(content)
         test_context_without_plugins.dbsession.flush()
+        content_api_mock.get_all_by_ids.return_value = [content]
         indexer.index_contents([content], test_context_without_plugins)
         transaction.commit()
         queue = get_rq_queue2(
@@ -396,6 +418,211 @@ def test_unit__index_user__ok__async(
         assert index_workspace_mock.call_count == 1
 
 
+def indexed_document(content: Content) -> typing.Tuple[MagicMock, None]:
+    document = MagicMock()
+    document.to_dict.return_value = {"_id": content.content_id, "_source": {}}
+    return (document, None)
+
+
+def bulk_results(*statuses: int) -> typing.List[typing.Tuple[bool, dict]]:
+    return [
+        (status == 201, {"index": {"status": status, "error": "error {}".format(status)}})
+        for status in statuses
+    ]
+
+
+@pytest.mark.parametrize("config_section", [{"name": "test_elasticsearch_search"}], indirect=True)
+class TestElasticSearchBulkIndexing:
+    @pytest.fixture
+    def search_api(self, session, app_config) -> typing.Iterator[ESSearchApi]:
+        app_config.SEARCH__ELASTICSEARCH__BULK__CHUNK_SIZE = 2
+        app_config.SEARCH__ELASTICSEARCH__BULK__WORKERS = 2
+        app_config.SEARCH__ELASTICSEARCH__BULK__MAX_RETRIES = 2
+        search_api = ESSearchApi(session=session, current_user=None, config=app_config)
+        with patch.object(
+            search_api,
+            "create_indexed_contents",
+            side_effect=lambda contents: {
+                content.content_id: indexed_document(content) for content in contents
+            },
+        ), patch("tracim_backend.lib.search.elasticsearch_search.elasticsearch_search.time.sleep"):
+            yield search_api
+
+    def test_unit__index_contents__ok__by_chunks(self, search_api: ESSearchApi) -> None:
+        contents = [Content(content_id=content_id) for content_id in range(1, 6)]
+        progress_content_ids = []
+        with patch(
+            "tracim_backend.lib.search.elasticsearch_search.elasticsearch_search.streaming_bulk"
+        ) as streaming_bulk_mock:
+            streaming_bulk_mock.side_effect = lambda es, actions, **kwargs: bulk_results(
+                *(201 for _ in actions)
+            )
+            results = search_api.index_contents(
+                contents,
+                on_progress=lambda results: progress_content_ids.append(
+                    list(results.content_ids_to_index)
+                ),
+            )
+        assert results.content_ids_to_index == [1, 2, 3, 4, 5]
+        assert results.get_nb_index_errors() == 0
+        assert [
+            [action["_id"] for action in call[0][1]] for call in streaming_bulk_mock.call_args_list
+        ] == [[1, 2], [3, 4], [5]]
+        assert progress_content_ids == [[1, 2], [1, 2, 3, 4], [1, 2, 3, 4, 5]]
+
+    def test_unit__index_contents__ok__retry_failed_items(self, search_api: ESSearchApi) -> None:
+        contents = [Content(content_id=content_id) for content_id in range(1, 3)]
+        with patch(
+            "tracim_backend.lib.search.elasticsearch_search.elasticsearch_search.streaming_bulk"
+        ) as streaming_bulk_mock:
+            # INFO - 2026-10-18 - content 1 is rejected (429) then indexed, 2 is invalid (400)
+            streaming_bulk_mock.side_effect = [bulk_results(429, 400), bulk_results(201)]
+            results = search_api.index_contents(contents)
+        assert streaming_bulk_mock.call_count == 2
+        assert [action["_id"] for action in streaming_bulk_mock.call_args[0][1]] == [1]
+        assert results.errored_indexed_contents_ids == [2]
+
+    def test_unit__index_contents__err__max_retries(self, search_api: ESSearchApi) -> None:
+        contents = [Content(content_id=1)]
+        with patch(
+            "tracim_backend.lib.search.elasticsearch_search.elasticsearch_search.streaming_bulk"
+        ) as streaming_bulk_mock:
+            streaming_bulk_mock.side_effect = lambda es, actions, **kwargs: bulk_results(503)
+            results = search_api.index_contents(contents)
+        assert streaming_bulk_mock.call_count == 3
+        assert results.errored_indexed_contents_ids == [1]
+
+
+@pytest.fixture
+def query_counter() -> typing.Iterator[typing.Dict[str, int]]:
+    counter = {"count": 0}
+
+    def count_query(*args, **kwargs) -> None:
+        counter["count"] += 1
+
+    sqlalchemy_event.listen(Engine, "before_cursor_execute", count_query)
+    yield counter
+    sqlalchemy_event.remove(Engine, "before_cursor_execute", count_query)
+
+
+@pytest.mark.usefixtures("base_fixture")
+class TestIndexedContentBuilder:
+    def _create_pages(
+        self, session, content_api_factory, workspace_api_factory, admin_user, count: int
+    ) -> typing.List[int]:
+        workspace = workspace_api_factory.get().create_workspace("workspace", save_now=True)
+        api = content_api_factory.get()
+        folder = api.create(
+            content_type_slug="folder", workspace=workspace, label="Folder", do_save=True
+        )
+        page_ids = []
+        for index in range(count):
+            page = api.create(
+                content_type_slug="html-document",
+                workspace=workspace,
+                parent=folder,
+                label="Page {}".format(index),
+                do_save=True,
+            )
+            api.create_comment(
+                workspace=workspace, parent=page, content="Comment {}".format(index), do_save=True
+            )
+            TagLib(session).add_tag_to_content(
+                user=admin_user, content=page, tag_name="tag {}".format(index)
+            )
+            page_ids.append(page.content_id)
+        transaction.commit()
+        return page_ids
+
+    def _count_queries(self, session, app_config, query_counter, content_ids) -> int:
+        session.expunge_all()
+        query_counter["count"] = 0
+        documents = IndexedContentBuilder(session, app_config).create_indexed_contents(content_ids)
+        assert sorted(documents) == sorted(content_ids)
+        return query_counter["count"]
+
+    def test_unit__create_indexed_contents__ok__nominal_case(
+        self, session, app_config, content_api_factory, workspace_api_factory, admin_user
+    ) -> None:
+        page_ids = self._create_pages(
+            session, content_api_factory, workspace_api_factory, admin_user, 2
+        )
+        admin_user_id = admin_user.user_id
+        session.expunge_all()
+        documents = IndexedContentBuilder(session, app_config).create_indexed_contents(
+            page_ids + [424242]
+        )
+        assert sorted(documents) == page_ids
+        document, pipeline_id = documents[page_ids[1]]
+        assert pipeline_id is None
+        assert document.label == "Page 1"
+        assert [component.label for component in document.path] == ["Folder", "Page 1"]
+        assert [comment.raw_content for comment in document.comments] == ["Comment 1"]
+        assert document.comment_count == 1
+        assert document.tags == ["tag 1"]
+        assert document.author.user_id == admin_user_id
+        assert document.last_modifier.user_id == admin_user_id
+        assert document.workspace.label == "workspace"
+        assert document.active_shares == 0
+        assert document.deleted_through_parent_id == 0
+
+    def test_unit__create_indexed_contents__ok__constant_query_count(
+        self,
+        session,
+        app_config,
+        content_api_factory,
+        workspace_api_factory,
+        admin_user,
+        query_counter,
+    ) -> None:
+        page_ids = self._create_pages(
+            session, content_api_factory, workspace_api_factory, admin_user, 6
+        )
+        assert self._count_queries(
+            session, app_config, query_counter, page_ids[:2]
+        ) == self._count_queries(session, app_config, query_counter, page_ids)
+
+
+class TestFileTextExtractor:
+    @pytest.mark.parametrize(
+        "mimetype,can_extract",
+        [
+            ("text/plain", True),
+            ("text/markdown", True),
+            ("application/json", True),
+            ("application/pdf", True),
+            ("image/png", False),
+            ("application/vnd.oasis.opendocument.text", False),
+            (None, False),
+        ],
+    )
+    def test_unit__can_extract__ok__nominal_cases(
+        self, mimetype: typing.Optional[str], can_extract: bool
+    ) -> None:
+        extractor = FileTextExtractor(config=MagicMock(), max_chars=10)
+        assert extractor.can_extract(mimetype) == can_extract
+
+    @pytest.mark.parametrize(
+        "text,max_chars,expected_text",
+        [
+            ("héllo wörld", 100, "héllo wörld"),
+            ("héllo wörld", 5, "héllo"),
+            ("ééééééééé", 4, "éééé"),
+            ("", 4, ""),
+        ],
+    )
+    def test_unit__extract__ok__text_read_by_chunks(
+        self, text: str, max_chars: int, expected_text: str
+    ) -> None:
+        extractor = FileTextExtractor(config=MagicMock(), max_chars=max_chars)
+        extractor.CHUNK_SIZE = 3
+        depot_file = MagicMock()
+        depot_file.file = io.BytesIO(text.encode("utf-8"))
+        assert extractor.extract(depot_file, "text/plain") == expected_text
+        # INFO - 2026-10-18 - reading stops once enough text is read
+        assert depot_file.file.tell() <= len(expected_text.encode("utf-8")) + 2 * 3
+
+
 class TestUtils:
     @pytest.mark.parametrize(
         "schema,expected_field",
@@ -0,0 +1,119 @@
+from unittest.mock import MagicMock
+
+import pytest
+import transaction
+
+from tracim_backend.exceptions import IndexingError
+from tracim_backend.lib.search.elasticsearch_search.catch_up import ESIndexCatchUp
+from tracim_backend.lib.search.search import IndexedContentsResults
+from tracim_backend.models.revision_protection import new_revision
+from tracim_backend.tests.fixtures import *  # noqa F403,F401
+
+
+@pytest.fixture
+def search_api_mock() -> MagicMock:
+    search_api = MagicMock()
+    search_api.index_contents.return_value = IndexedContentsResults([], [])
+    return search_api
+
+
+@pytest.fixture
+def catch_up(session, app_config, search_api_mock) -> ESIndexCatchUp:
+    app_config.SEARCH__ELASTICSEARCH__CATCH_UP__SETTLE_DELAY = 0
+    return ESIndexCatchUp(session, app_config, search_api=search_api_mock)
+
+
+@pytest.mark.usefixtures("base_fixture")
+class TestESIndexCatchUp:
+    def test_unit__catch_up_batch__err__no_checkpoint(self, catch_up: ESIndexCatchUp) -> None:
+        with pytest.raises(IndexingError):
+            catch_up.catch_up_batch()
+
+    def test_unit__catch_up_batch__ok__index_changes_since_checkpoint(
+        self,
+        catch_up: ESIndexCatchUp,
+        search_api_mock: MagicMock,
+        workspace_api_factory,
+        content_api_factory,
+        content_type_list,
+        admin_user,
+    ) -> None:
+        workspace = workspace_api_factory.get().create_workspace("test workspace", save_now=True)
+        content_api = content_api_factory.get()
+        folder = content_api.create(
+            content_type_slug=content_type_list.Folder.slug,
+            workspace=workspace,
+            label="folder",
+            do_save=True,
+        )
+        page = content_api.create(
+            content_type_slug=content_type_list.Page.slug,
+            workspace=workspace,
+            parent=folder,
+            label="page",
+            do_save=True,
+        )
+        transaction.commit()
+        catch_up.set_checkpoint(catch_up.get_last_event_id())
+        with new_revision(session=content_api._session, tm=transaction.manager, content=folder):
+            content_api.update_content(folder, new_label="renamed folder")
+        content_api.save(folder)
+        transaction.commit()
+
+        result = catch_up.catch_up_batch()
+
+        assert result.event_count == 1
+        assert result.last_event_id == catch_up.get_last_event_id()
+        assert catch_up.get_checkpoint() == result.last_event_id
+        (indexed_contents,), _ = search_api_mock.index_contents.call_args
+        assert [content.content_id for content in indexed_contents] == [
+            folder.content_id,
+            page.content_id,
+        ]
+        search_api_mock.index_user.assert_called_once_with(admin_user)
+        search_api_mock.index_workspace.assert_not_called()
+        assert catch_up.catch_up_batch().event_count == 0
+
+    def test_unit__catch_up_batch__ok__batch_size(
+        self, catch_up: ESIndexCatchUp, app_config, workspace_api_factory,
+    ) -> None:
+        catch_up.set_checkpoint(catch_up.get_last_event_id())
+        workspace_api = workspace_api_factory.get()
+        workspace_api.create_workspace("workspace 1", save_now=True)
+        workspace_api.create_workspace("workspace 2", save_now=True)
+        transaction.commit()
+        app_config.SEARCH__ELASTICSEARCH__CATCH_UP__BATCH_SIZE = 1
+
+        first_result = catch_up.catch_up_batch()
+        second_result = catch_up.catch_up_batch()
+
+        assert first_result.event_count == 1
+        assert first_result.workspace_count == 1
+        assert second_result.last_event_id > first_result.last_event_id
+
+    def test_unit__catch_up_batch__err__checkpoint_not_moved_on_error(
+        self,
+        catch_up: ESIndexCatchUp,
+        search_api_mock: MagicMock,
+        workspace_api_factory,
+        content_api_factory,
+        content_type_list,
+    ) -> None:
+        workspace = workspace_api_factory.get().create_workspace("test workspace", save_now=True)
+        transaction.commit()
+        checkpoint = catch_up.get_last_event_id()
+        catch_up.set_checkpoint(checkpoint)
+        page = content_api_factory.get().create(
+            content_type_slug=content_type_list.Page.slug,
+            workspace=workspace,
+            label="page",
+            do_save=True,
+        )
+        transaction.commit()
+        search_api_mock.index_contents.return_value = IndexedContentsResults(
+            [page.content_id], [page.content_id]
+        )
+
+        with pytest.raises(IndexingError):
+            catch_up.catch_up_batch()
+        assert catch_up.get_checkpoint() == checkpoint
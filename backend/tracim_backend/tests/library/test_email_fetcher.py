@@ -7,6 +7,7 @@
 
 from tracim_backend.exceptions import AutoReplyEmailNotAllowed
 from tracim_backend.exceptions import BadStatusCode
+from tracim_backend.lib.mail_fetcher.comment_creator import MailComment
 from tracim_backend.lib.mail_fetcher.email_fetcher import DecodedMail
 from tracim_backend.lib.mail_fetcher.email_fetcher import MailFetcher
 
@@ -390,9 +391,6 @@ def test_unit__send_request__ok__nominal_case(self):
             references_pattern="",
             user="imap_user",
         )
-        imapc_mock = MagicMock()
-        imapc_mock_add_flags = MagicMock()
-        imapc_mock.add_flags = imapc_mock_add_flags
         email_mock = MagicMock()
         auth_headers = {"Tracim-Api-Key": "apikey", "Tracim-Api-Login": "mymailadress@mydomain.com"}
         header_mock = Mock()
@@ -402,11 +400,46 @@ def test_unit__send_request__ok__nominal_case(self):
             endpoint="http://127.0.0.1:6543/api/workspaces/4/contents/1/comments",
             json_body_dict={"raw_content": "CONTENT"},
             method="POST",
-            imapc=imapc_mock,
             mail=email_mock,
         )
+        assert len(responses.calls) == 1
 
-        assert imapc_mock_add_flags.call_count == 2
+    @responses.activate
+    def test_unit__send_request__err__bad_status_code(self):
+        responses.add(
+            responses.POST,
+            "http://127.0.0.1:6543/api/workspaces/4/contents/1/comments",
+            status=403,
+            json={"code": None, "details": {}, "message": "more info..."},
+        )
+        mf = MailFetcher(
+            host="host_imap",
+            port="993",
+            use_ssl=True,
+            password="imap_password",
+            folder="INBOX",
+            use_idle=True,
+            use_html_parsing=True,
+            use_txt_parsing=True,
+            lockfile_path="email_fetcher.lock",
+            api_base_url="http://127.0.0.1:6543/api/",
+            burst=True,
+            api_key="apikey",
+            connection_max_lifetime=60,
+            heartbeat=60,
+            reply_to_pattern="",
+            references_pattern="",
+            user="imap_user",
+        )
+        mail = MagicMock()
+        mail.get_from_address.return_value = "useremailaddress@mydomain.com"
+        with pytest.raises(BadStatusCode):
+            mf._send_request(
+                endpoint="http://127.0.0.1:6543/api/workspaces/4/contents/1/comments",
+                json_body_dict={"raw_content": "CONTENT"},
+                method="POST",
+                mail=mail,
+            )
 
     def test_unit__notify_tracim(self):
         mf = MailFetcher(
@@ -431,11 +464,11 @@ def test_unit__notify_tracim(self):
         imapc_mock = MagicMock()
         imapc_mock_add_flags = MagicMock()
         imapc_mock.add_flags = imapc_mock_add_flags
-        mail = Mock()
+        mail = Mock(uid=1)
         mail.get_body.return_value = "CONTENT"
         mail.get_key.return_value = "1"
         mail.get_from_address.return_value = "useremailaddress@mydomain.com"
-        mail2 = Mock()
+        mail2 = Mock(uid=2)
         mail2.get_body.return_value = "CONTENT2"
         mail2.get_key.return_value = "2"
         mail2.get_from_address.return_value = "useremailaddress2@mydomain.com"
@@ -456,3 +489,111 @@ def test_unit__notify_tracim(self):
         ]
         mf._notify_tracim(mails=mails, imapc=imapc_mock)
         assert mf._send_request.call_count == 2
+        imapc_mock_add_flags.assert_called_once()
+        flagged_uids, flags = imapc_mock_add_flags.call_args[0]
+        assert sorted(flagged_uids) == [1, 2]
+
+    def test_unit__notify_tracim__ok__same_content_requests_stop_at_failure(self):
+        mf = MailFetcher(
+            host="host_imap",
+            port="993",
+            use_ssl=True,
+            password="imap_password",
+            folder="INBOX",
+            use_idle=True,
+            use_html_parsing=True,
+            use_txt_parsing=True,
+            lockfile_path="email_fetcher.lock",
+            api_base_url="http://127.0.0.1:6543/api/",
+            burst=True,
+            api_key="apikey",
+            connection_max_lifetime=60,
+            heartbeat=60,
+            reply_to_pattern="",
+            references_pattern="",
+            user="imap_user",
+        )
+        imapc_mock = MagicMock()
+        mails = [Mock(uid=uid) for uid in (1, 2, 3)]
+        endpoints = {
+            1: "http://127.0.0.1:6543/api/workspaces/4/contents/1/comments",
+            2: "http://127.0.0.1:6543/api/workspaces/4/contents/1/comments",
+            3: "http://127.0.0.1:6543/api/workspaces/4/contents/2/comments",
+        }
+        mf._create_comment_request = Mock(
+            side_effect=lambda mail: ("POST", endpoints[mail.uid], {"raw_content": "CONTENT"})
+        )
+        mf._send_request = Mock(side_effect=[BadStatusCode(), None])
+        mf._notify_tracim(mails=mails, imapc=imapc_mock)
+        # INFO - 2026-10-18 - second mail of content 1 is not sent after the first one failed
+        assert mf._send_request.call_count == 2
+        imapc_mock.add_flags.assert_called_once()
+        assert imapc_mock.add_flags.call_args[0][0] == [3]
+
+    def test_unit__check_mail__ok__fetch_by_batches(self, tmp_path):
+        mf = MailFetcher(
+            host="host_imap",
+            port="993",
+            use_ssl=True,
+            password="imap_password",
+            folder="INBOX",
+            use_idle=True,
+            use_html_parsing=True,
+            use_txt_parsing=True,
+            lockfile_path=str(tmp_path / "email_fetcher.lock"),
+            api_base_url="http://127.0.0.1:6543/api/",
+            burst=True,
+            api_key="apikey",
+            connection_max_lifetime=60,
+            heartbeat=60,
+            reply_to_pattern="",
+            references_pattern="",
+            user="imap_user",
+            fetch_batch_size=2,
+        )
+        imapc_mock = MagicMock()
+        imapc_mock.search.return_value = [1, 2, 3, 4, 5]
+        mf._fetch = Mock(return_value=[])
+        mf._notify_tracim = Mock()
+        mf._check_mail(imapc_mock)
+        assert [call[0][1] for call in mf._fetch.call_args_list] == [[1, 2], [3, 4], [5]]
+        assert mf._notify_tracim.call_count == 3
+
+    def test_unit__notify_tracim__ok__direct_ingestion(self):
+        comment_creator = Mock()
+        comment_creator.create_comments.return_value = [2]
+        mf = MailFetcher(
+            host="host_imap",
+            port="993",
+            use_ssl=True,
+            password="imap_password",
+            folder="INBOX",
+            use_idle=True,
+            use_html_parsing=True,
+            use_txt_parsing=True,
+            lockfile_path="email_fetcher.lock",
+            api_base_url="http://127.0.0.1:6543/api/",
+            burst=True,
+            api_key="apikey",
+            connection_max_lifetime=60,
+            heartbeat=60,
+            reply_to_pattern="",
+            references_pattern="",
+            user="imap_user",
+            comment_creator=comment_creator,
+        )
+        imapc_mock = MagicMock()
+        mail = Mock(uid=1)
+        mail.check_validity_for_comment_content.side_effect = AutoReplyEmailNotAllowed()
+        mail2 = Mock(uid=2)
+        mail2.get_body.return_value = "CONTENT2"
+        mail2.get_key.return_value = "2"
+        mail2.get_from_address.return_value = "useremailaddress2@mydomain.com"
+        mf._send_request = Mock()
+        mf._notify_tracim(mails=[mail, mail2], imapc=imapc_mock)
+        mf._send_request.assert_not_called()
+        comment_creator.create_comments.assert_called_once_with(
+            [MailComment(2, "useremailaddress2@mydomain.com", 2, "CONTENT2")]
+        )
+        imapc_mock.add_flags.assert_called_once()
+        assert imapc_mock.add_flags.call_args[0][0] == [2]
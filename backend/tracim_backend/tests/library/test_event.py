@@ -1,8 +1,16 @@
+from datetime import datetime
+
+from mock import Mock
+from mock import patch
 import pytest
 import transaction
 
+from tracim_backend.lib.core.event import AsyncLiveMessageBuilder
 from tracim_backend.lib.core.event import BaseLiveMessageBuilder
 from tracim_backend.lib.core.event import EventApi
+from tracim_backend.lib.core.event import SyncLiveMessageBuilder
+from tracim_backend.lib.core.live_messages import LiveMessagesLib
+from tracim_backend.lib.core.userworkspace import RoleApi
 from tracim_backend.models.auth import Profile
 from tracim_backend.models.auth import User
 from tracim_backend.models.data import EmailNotificationType
@@ -10,6 +18,7 @@
 from tracim_backend.models.data import WorkspaceAccessType
 from tracim_backend.models.event import EntityType
 from tracim_backend.models.event import Event
+from tracim_backend.models.event import Message
 from tracim_backend.models.event import OperationType
 from tracim_backend.models.revision_protection import new_revision
 from tracim_backend.models.tracim_session import TracimSession
@@ -913,3 +922,196 @@ def test__create_messages_history_for_user_ok__not_positive_max_message(
             assert len(last_messages) == 4
         elif not max_message_generated:
             assert len(last_messages) == 0
+
+    def test_unit__get_content_updates_digest__ok__nominal_case(
+        self, session, app_config, workspace_and_users, content_api_factory, content_type_list,
+    ):
+        (my_workspace, same_workspace_user, role, _, event_initiator) = workspace_and_users
+        role.email_notification_type = EmailNotificationType.INDIVIDUAL
+        transaction.commit()
+        before_creation = datetime.utcnow()
+        content_api = content_api_factory.get(current_user=event_initiator)
+        first_page = content_api.create(
+            content_type_slug=content_type_list.Page.slug,
+            workspace=my_workspace,
+            label="first page",
+            do_save=True,
+        )
+        content_api.create(
+            content_type_slug=content_type_list.Page.slug,
+            workspace=my_workspace,
+            label="second page",
+            do_save=True,
+        )
+        transaction.commit()
+        content_api.create_comment(
+            workspace=my_workspace, parent=first_page, content="<p>a comment</p>", do_save=True
+        )
+        transaction.commit()
+
+        event_api = EventApi(current_user=None, session=session, config=app_config)
+        digest = event_api.get_content_updates_digest(
+            same_workspace_user.user_id, created_after=before_creation
+        )
+
+        assert [content_update.label for content_update in digest] == [
+            "first page",
+            "second page",
+        ]
+        assert digest[0].content_id == first_page.content_id
+        assert digest[0].event_count == 2
+        assert digest[0].workspace_label == "test workspace"
+        assert digest[1].event_count == 1
+
+
+@pytest.mark.usefixtures("base_fixture")
+class TestLiveMessageBuilder:
+    def test_unit__bulk_create_and_publish_messages__ok__nominal_case(
+        self, session, test_context, workspace_and_users, admin_user
+    ):
+        (my_workspace, same_workspace_user, _, other_user, event_initiator) = workspace_and_users
+        receiver_ids = {admin_user.user_id, same_workspace_user.user_id, other_user.user_id}
+        event = Event(
+            entity_type=EntityType.WORKSPACE,
+            operation=OperationType.MODIFIED,
+            fields={Event.WORKSPACE_FIELD: {"workspace_id": my_workspace.workspace_id}},
+            workspace_id=my_workspace.workspace_id,
+        )
+        session.add(event)
+        session.flush()
+        message_builder = SyncLiveMessageBuilder(context=test_context)
+        with patch.object(LiveMessagesLib, "publish_dict_to_users") as publish_mock:
+            message_builder._bulk_create_and_publish_messages(event, receiver_ids, session)
+        messages = session.query(Message).filter(Message.event_id == event.event_id).all()
+        assert {message.receiver_id for message in messages} == receiver_ids
+        assert all(message.sent and not message.read for message in messages)
+        publish_mock.assert_called_once()
+        published_receiver_ids, published_dict = publish_mock.call_args[0]
+        assert set(published_receiver_ids) == receiver_ids
+        # the message published once for everyone is the one each receiver would get
+        assert published_dict == LiveMessagesLib.message_as_dict(messages[0])
+
+    @pytest.mark.parametrize("bulk_fanout_threshold,bulk_expected", [(0, False), (2, True)])
+    def test_unit__publish_messages_for_event__ok__bulk_fanout_threshold(
+        self,
+        session,
+        test_context,
+        app_config,
+        workspace_and_users,
+        bulk_fanout_threshold,
+        bulk_expected,
+    ):
+        (my_workspace, _, _, _, _) = workspace_and_users
+        app_config.LIVE_MESSAGES__BULK_FANOUT_THRESHOLD = bulk_fanout_threshold
+        event = Event(
+            entity_type=EntityType.CONTENT,
+            operation=OperationType.MODIFIED,
+            fields={},
+            workspace_id=my_workspace.workspace_id,
+        )
+        session.add(event)
+        session.flush()
+        message_builder = SyncLiveMessageBuilder(context=test_context)
+        with patch.object(
+            SyncLiveMessageBuilder, "_bulk_create_and_publish_messages"
+        ) as bulk_mock, patch.object(
+            SyncLiveMessageBuilder, "_create_and_publish_messages"
+        ) as single_mock:
+            message_builder.publish_messages_for_event(event.event_id)
+        assert bulk_mock.called == bulk_expected
+        assert single_mock.called != bulk_expected
+
+    def test_unit__publish_messages_for_events__ok__receivers_computed_once_per_workspace(
+        self, session, test_context, workspace_and_users
+    ):
+        (my_workspace, same_workspace_user, _, _, event_initiator) = workspace_and_users
+        events = [
+            Event(
+                entity_type=EntityType.CONTENT,
+                operation=OperationType.MODIFIED,
+                fields={},
+                workspace_id=my_workspace.workspace_id,
+            )
+            for _ in range(3)
+        ]
+        session.add_all(events)
+        session.flush()
+        event_ids = [event.event_id for event in events]
+        message_builder = SyncLiveMessageBuilder(context=test_context)
+        with patch.object(
+            RoleApi,
+            "get_workspace_member_ids",
+            autospec=True,
+            side_effect=RoleApi.get_workspace_member_ids,
+        ) as get_workspace_member_ids_mock:
+            message_builder.publish_messages_for_events(event_ids)
+        assert get_workspace_member_ids_mock.call_count == 1
+        messages = session.query(Message).filter(Message.event_id.in_(event_ids)).all()
+        assert {(message.event_id, message.receiver_id) for message in messages} == {
+            (event_id, user_id)
+            for event_id in event_ids
+            for user_id in (same_workspace_user.user_id, event_initiator.user_id)
+        }
+
+    def test_unit__publish_messages_for_events__ok__failed_event_ignored(
+        self, session, test_context, workspace_and_users
+    ):
+        (my_workspace, _, _, _, _) = workspace_and_users
+        events = [
+            Event(
+                entity_type=entity_type,
+                operation=OperationType.MODIFIED,
+                fields={},
+                workspace_id=my_workspace.workspace_id,
+            )
+            for entity_type in (EntityType.CONTENT, EntityType.USER, EntityType.CONTENT)
+        ]
+        session.add_all(events)
+        session.flush()
+        event_ids = [event.event_id for event in events]
+        message_builder = SyncLiveMessageBuilder(context=test_context)
+        # INFO - 2026-10-18 - the user event has no user field, its receivers cannot be computed
+        message_builder.publish_messages_for_events(event_ids)
+        messages = session.query(Message).filter(Message.event_id.in_(event_ids)).all()
+        assert {message.event_id for message in messages} == {event_ids[0], event_ids[2]}
+
+    @pytest.mark.parametrize("bulk_fanout_threshold", [0, 1])
+    def test_unit__publish_messages_for_events__ok__database_error_ignored(
+        self, session, test_context, app_config, workspace_and_users, bulk_fanout_threshold
+    ):
+        (my_workspace, same_workspace_user, _, _, _) = workspace_and_users
+        app_config.LIVE_MESSAGES__BULK_FANOUT_THRESHOLD = bulk_fanout_threshold
+        events = [
+            Event(
+                entity_type=EntityType.CONTENT,
+                operation=OperationType.MODIFIED,
+                fields={},
+                workspace_id=my_workspace.workspace_id,
+            )
+            for _ in range(3)
+        ]
+        session.add_all(events)
+        session.flush()
+        event_ids = [event.event_id for event in events]
+        # INFO - 2026-10-18 - the messages of the second event cannot be inserted
+        # as one of them already exists
+        session.add(Message(receiver_id=same_workspace_user.user_id, event_id=event_ids[1]))
+        transaction.commit()
+        message_builder = SyncLiveMessageBuilder(context=test_context)
+        message_builder.publish_messages_for_events(event_ids)
+        transaction.commit()
+        messages = session.query(Message).filter(Message.event_id.in_(event_ids)).all()
+        assert {message.event_id for message in messages if message.sent} == {
+            event_ids[0],
+            event_ids[2],
+        }
+
+    def test_unit__async_publish_messages_for_events__ok__one_job_per_batch(
+        self, test_context, app_config
+    ):
+        app_config.JOBS__ASYNC__EVENTS_BATCH_SIZE = 2
+        queue = Mock()
+        message_builder = AsyncLiveMessageBuilder(context=test_context)
+        with patch("tracim_backend.lib.core.event.get_rq_queue", return_value=queue):
+            message_builder.publish_messages_for_events([1, 2, 3, 4, 5])
+        assert [call[0][1] for call in queue.enqueue.call_args_list] == [[1, 2], [3, 4], [5]]
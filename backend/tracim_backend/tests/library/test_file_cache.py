@@ -0,0 +1,81 @@
+import os
+
+import pytest
+
+from tracim_backend.lib.utils.file_cache import LocalFileCache
+
+
+def fill_with(content: bytes, filled: list):
+    def fill(cache_file):
+        filled.append(content)
+        cache_file.write(content)
+
+    return fill
+
+
+def get_entry_names(cache: LocalFileCache) -> list:
+    return sorted(
+        name
+        for name in os.listdir(cache.directory_path)
+        if not name.startswith(LocalFileCache.LOCK_FILE_PREFIX)
+    )
+
+
+class TestLocalFileCache:
+    def test_unit__get_filepath__ok__hit_and_miss(self, tmp_path):
+        cache = LocalFileCache(str(tmp_path / "cache"), max_size=100, max_count=10)
+        filled = []
+        for _ in range(2):
+            with cache.get_filepath("1.txt", fill_with(b"content", filled)) as file_path:
+                with open(file_path, "rb") as cache_file:
+                    assert cache_file.read() == b"content"
+        assert filled == [b"content"]
+        assert get_entry_names(cache) == ["1.txt"]
+
+    def test_unit__get_filepath__ok__least_recently_used_evicted(self, tmp_path):
+        cache = LocalFileCache(str(tmp_path), max_size=100, max_count=2)
+        filled = []
+        for key, mtime in (("1", 1000), ("2", 2000)):
+            with cache.get_filepath(key, fill_with(b"a", filled)) as file_path:
+                pass
+            os.utime(file_path, (mtime, mtime))
+        with cache.get_filepath("1", fill_with(b"a", filled)):
+            pass
+        with cache.get_filepath("3", fill_with(b"a", filled)):
+            pass
+        assert get_entry_names(cache) == ["1", "3"]
+
+        cache.max_size = 1
+        with cache.get_filepath("4", fill_with(b"a", filled)):
+            pass
+        assert get_entry_names(cache) == ["4"]
+
+    def test_unit__get_filepath__ok__entry_in_use_not_evicted(self, tmp_path):
+        cache = LocalFileCache(str(tmp_path), max_size=100, max_count=1)
+        filled = []
+        with cache.get_filepath("1", fill_with(b"a", filled)) as first_file_path:
+            with cache.get_filepath("2", fill_with(b"b", filled)):
+                assert get_entry_names(cache) == ["1", "2"]
+            assert get_entry_names(cache) == ["1"]
+            with open(first_file_path, "rb") as cache_file:
+                assert cache_file.read() == b"a"
+
+    def test_unit__get_filepath__ok__no_lock_file_per_entry(self, tmp_path):
+        cache = LocalFileCache(str(tmp_path), max_size=10000, max_count=1000)
+        filled = []
+        for key in range(100):
+            with cache.get_filepath(str(key), fill_with(b"a", filled)):
+                pass
+        assert len(get_entry_names(cache)) == 100
+        assert len(os.listdir(str(tmp_path))) <= 100 + LocalFileCache.LOCK_COUNT
+
+    def test_unit__get_filepath__err__fill_error(self, tmp_path):
+        cache = LocalFileCache(str(tmp_path), max_size=100, max_count=10)
+
+        def fill(cache_file):
+            raise IOError("download failed")
+
+        with pytest.raises(IOError):
+            with cache.get_filepath("1", fill):
+                pass
+        assert get_entry_names(cache) == []
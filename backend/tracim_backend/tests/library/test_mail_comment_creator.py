@@ -0,0 +1,124 @@
+from unittest.mock import patch
+
+import pytest
+import transaction
+
+from tracim_backend.lib.mail_fetcher.comment_creator import MailComment
+from tracim_backend.lib.mail_fetcher.comment_creator import MailCommentCreator
+from tracim_backend.models.auth import Profile
+from tracim_backend.models.data import EmailNotificationType
+from tracim_backend.models.data import UserRoleInWorkspace
+from tracim_backend.tests.fixtures import *  # noqa F403,F401
+
+
+@pytest.fixture
+def page_and_users(
+    admin_user,
+    user_api_factory,
+    workspace_api_factory,
+    role_api_factory,
+    content_api_factory,
+    content_type_list,
+):
+    """
+    Create a page in a workspace of admin, a reader of the workspace and a non member user
+    Return a tuple (page, reader, non_member)
+    """
+    user_api = user_api_factory.get()
+    reader = user_api.create_user(
+        "reader@test.test",
+        password="password",
+        do_save=True,
+        do_notify=False,
+        profile=Profile.USER,
+    )
+    non_member = user_api.create_user(
+        "non_member@test.test",
+        password="password",
+        do_save=True,
+        do_notify=False,
+        profile=Profile.USER,
+    )
+    workspace = workspace_api_factory.get().create_workspace("test workspace", save_now=True)
+    role_api_factory.get().create_one(
+        reader, workspace, UserRoleInWorkspace.READER, EmailNotificationType.NONE
+    )
+    page = content_api_factory.get().create(
+        content_type_slug=content_type_list.Page.slug,
+        workspace=workspace,
+        label="page",
+        do_save=True,
+    )
+    transaction.commit()
+    return page, reader, non_member
+
+
+def get_comment_contents(content_api_factory, page_id):
+    page = content_api_factory.get().get_one(page_id)
+    return [comment.raw_content for comment in page.get_children()]
+
+
+@pytest.mark.usefixtures("base_fixture")
+class TestMailCommentCreator(object):
+    def test_unit__create_comments__ok__nominal_case(
+        self, session, app_config, admin_user, page_and_users, content_api_factory
+    ):
+        page, _, _ = page_and_users
+        page_id = page.content_id
+        creator = MailCommentCreator(app_config)
+        created_uids = creator.create_comments(
+            [
+                MailComment(1, admin_user.email, page_id, "<p>first</p>"),
+                MailComment(2, admin_user.email, page_id, "<p>second</p>"),
+            ]
+        )
+        assert created_uids == [1, 2]
+        session.expire_all()
+        assert get_comment_contents(content_api_factory, page_id) == [
+            "<p>first</p>",
+            "<p>second</p>",
+        ]
+
+    def test_unit__create_comments__ok__unauthorized_authors_skipped(
+        self, session, app_config, admin_user, page_and_users, content_api_factory
+    ):
+        page, reader, non_member = page_and_users
+        page_id = page.content_id
+        creator = MailCommentCreator(app_config)
+        created_uids = creator.create_comments(
+            [
+                MailComment(1, reader.email, page_id, "<p>reader</p>"),
+                MailComment(2, non_member.email, page_id, "<p>non member</p>"),
+                MailComment(3, "unknown@test.test", page_id, "<p>unknown</p>"),
+                MailComment(4, admin_user.email, page_id + 1000, "<p>unknown content</p>"),
+                MailComment(5, admin_user.email, page_id, ""),
+                MailComment(6, admin_user.email, page_id, "<p>admin</p>"),
+            ]
+        )
+        assert created_uids == [6]
+        session.expire_all()
+        assert get_comment_contents(content_api_factory, page_id) == ["<p>admin</p>"]
+
+    def test_unit__create_comments__ok__batch_failure_retried_one_by_one(
+        self, session, app_config, admin_user, page_and_users, content_api_factory
+    ):
+        page, _, _ = page_and_users
+        page_id = page.content_id
+        creator = MailCommentCreator(app_config)
+        create_comment = creator._create_comment
+
+        def failing_create_comment(context, comment):
+            if comment.uid == 1:
+                raise RuntimeError("unexpected error")
+            create_comment(context, comment)
+
+        with patch.object(creator, "_create_comment", side_effect=failing_create_comment):
+            created_uids = creator.create_comments(
+                [
+                    MailComment(1, admin_user.email, page_id, "<p>first</p>"),
+                    MailComment(2, admin_user.email, page_id, "<p>second</p>"),
+                ]
+            )
+        assert created_uids == [2]
+        session.expire_all()
+        assert get_comment_contents(content_api_factory, page_id) == ["<p>second</p>"]
@@ -1,10 +1,20 @@
 # -*- coding: utf-8 -*-
+from unittest.mock import patch
+
+import pytest
+import transaction
 
 from tracim_backend.lib.core.notifications import DummyNotifier
 from tracim_backend.lib.core.notifications import NotifierFactory
+from tracim_backend.lib.mail_notifier.notifier import EmailManager
 from tracim_backend.lib.mail_notifier.notifier import EmailNotifier
+from tracim_backend.lib.mail_notifier.notifier import get_email_manager
+from tracim_backend.models.auth import AuthType
+from tracim_backend.models.auth import Profile
 from tracim_backend.models.auth import User
 from tracim_backend.models.data import Content
+from tracim_backend.models.data import EmailNotificationType
+from tracim_backend.models.roles import WorkspaceRoles
 from tracim_backend.tests.fixtures import *  # noqa: F403,F40
 
 
@@ -32,3 +42,83 @@ def test_notifier_factory_method(self, app_config):
 class TestEmailNotifier(object):
     # TODO - G.M - 04-03-2017 -  [emailNotif] - Restore test for email Notif
     pass
+
+
+@pytest.fixture
+def notified_page(
+    session,
+    admin_user,
+    user_api_factory,
+    workspace_api_factory,
+    role_api_factory,
+    content_api_factory,
+) -> Content:
+    workspace = workspace_api_factory.get().create_workspace("test workspace", save_now=True)
+    role_api = role_api_factory.get()
+    user_api = user_api_factory.get()
+    for index, lang in enumerate(("en", "en", "fr")):
+        user = user_api.create_user(
+            email="member{}@test.test".format(index),
+            lang=lang,
+            auth_type=AuthType.INTERNAL,
+            profile=Profile.USER,
+            do_notify=False,
+            do_save=True,
+        )
+        role_api.create_one(
+            user, workspace, WorkspaceRoles.READER.level, EmailNotificationType.INDIVIDUAL
+        )
+    page = content_api_factory.get().create(
+        content_type_slug="html-document", workspace=workspace, label="a page", do_save=True,
+    )
+    transaction.commit()
+    return page
+
+
+@pytest.mark.usefixtures("base_fixture")
+@pytest.mark.parametrize("config_section", [{"name": "mail_test"}], indirect=True)
+class TestEmailManager(object):
+    def test_unit__notify_content_update__ok__body_rendered_once_per_language(
+        self, session, app_config, admin_user, notified_page
+    ):
+        email_manager = get_email_manager(app_config, session)
+        with patch(
+            "tracim_backend.lib.mail_notifier.notifier.send_email_through"
+        ) as send, patch.object(
+            EmailManager, "_render_template", autospec=True, return_value="body"
+        ) as render:
+            email_manager.notify_content_update(admin_user.user_id, notified_page.content_id)
+        assert send.call_count == 3
+        assert render.call_count == 2
+
+    def test_unit__notify_content_update__ok__body_rendered_per_recipient_using_user(
+        self, session, app_config, admin_user, notified_page
+    ):
+        email_manager = get_email_manager(app_config, session)
+        with patch(
+            "tracim_backend.lib.mail_notifier.notifier.send_email_through"
+        ) as send, patch.object(
+            EmailManager, "_get_template_variables", return_value={"user", "content_in_context"}
+        ), patch.object(
+            EmailManager, "_render_template", autospec=True, return_value="body"
+        ) as render:
+            email_manager.notify_content_update(admin_user.user_id, notified_page.content_id)
+        assert send.call_count == 3
+        assert render.call_count == 3
+
+    def test_unit__notify_content_update__ok__nothing_sent_with_digest(
+        self, session, app_config, admin_user, notified_page
+    ):
+        app_config.EMAIL__NOTIFICATION__CONTENT_UPDATE__DIGEST = True
+        email_manager = get_email_manager(app_config, session)
+        with patch("tracim_backend.lib.mail_notifier.notifier.send_email_through") as send:
+            email_manager.notify_content_update(admin_user.user_id, notified_page.content_id)
+        send.assert_not_called()
+
+    def test_unit__get_template_variables__ok__default_template(self, session, app_config):
+        email_manager = get_email_manager(app_config, session)
+        variables = email_manager._get_template_variables(
+            app_config.EMAIL__NOTIFICATION__CONTENT_UPDATE__TEMPLATE__HTML
+        )
+        assert "content_in_context" in variables
+        assert "user" not in variables
@@ -0,0 +1,122 @@
+import hashlib
+import os
+import time
+
+import pytest
+import transaction
+
+from tracim_backend.lib.cleanup.cleanup import CleanupLib
+from tracim_backend.lib.core.preview_cache import PreviewCacheLib
+from tracim_backend.lib.core.storage import StorageLib
+from tracim_backend.models.revision_protection import new_revision
+from tracim_backend.tests.fixtures import *  # noqa F403,F401
+
+HASH_1 = "1" * 32
+HASH_2 = "2" * 32
+
+
+def create_cache_file(directory, name: str, size: int = 10, age: int = 3600) -> str:
+    path = os.path.join(str(directory), name)
+    with open(path, "wb") as cache_file:
+        cache_file.write(b"a" * size)
+    last_use = time.time() - age
+    os.utime(path, (last_use, last_use))
+    return path
+
+
+@pytest.fixture
+def preview_cache_config(app_config, tmp_path):
+    app_config.PREVIEW_CACHE_DIR = str(tmp_path)
+    app_config.PREVIEW__CACHE__MAX_SIZE = 0
+    app_config.PREVIEW__CACHE__MAX_AGE = 0
+    return app_config
+
+
+@pytest.mark.usefixtures("base_fixture")
+class TestPreviewCacheLib:
+    def test_unit__prune__ok__max_size(self, preview_cache_config, tmp_path):
+        old_preview = create_cache_file(tmp_path, HASH_1 + "-256x256.jpeg", age=3000)
+        old_lock_file = create_cache_file(tmp_path, HASH_1 + ".lock", size=0, age=3000)
+        create_cache_file(tmp_path, HASH_2 + "-256x256.jpeg", age=2000)
+        create_cache_file(tmp_path, HASH_2 + ".lock", size=0, age=2000)
+        create_cache_file(tmp_path, HASH_2 + "-512x512.jpeg", age=0)
+        preview_cache_config.PREVIEW__CACHE__MAX_SIZE = 25
+        preview_cache_lib = PreviewCacheLib(preview_cache_config)
+        assert preview_cache_lib.get_stats().file_count == 5
+        assert preview_cache_lib.get_stats().size == 30
+
+        assert preview_cache_lib.prune(dry_run=True).file_count == 2
+        assert preview_cache_lib.get_stats().file_count == 5
+        removed = preview_cache_lib.prune()
+        assert (removed.file_count, removed.size) == (2, 10)
+        assert not os.path.exists(old_preview)
+        assert not os.path.exists(old_lock_file)
+
+        # INFO - 2026-10-18 - recently used previews are kept
+        preview_cache_config.PREVIEW__CACHE__MAX_SIZE = 1
+        assert preview_cache_lib.prune().file_count == 1
+        assert sorted(os.listdir(str(tmp_path))) == [HASH_2 + "-512x512.jpeg", HASH_2 + ".lock"]
+
+    def test_unit__prune__ok__max_age(self, preview_cache_config, tmp_path):
+        create_cache_file(tmp_path, HASH_1 + "-256x256.jpeg", age=3000)
+        recent_preview = create_cache_file(tmp_path, HASH_2 + "-256x256.jpeg", age=1000)
+        preview_cache_config.PREVIEW__CACHE__MAX_AGE = 2000
+        assert PreviewCacheLib(preview_cache_config).prune().file_count == 1
+        assert os.listdir(str(tmp_path)) == [os.path.basename(recent_preview)]
+
+    def test_unit__prune_if_due__ok__once_per_interval(self, preview_cache_config, tmp_path):
+        preview_cache_config.PREVIEW__CACHE__MAX_AGE = 2000
+        preview_cache_config.PREVIEW__CACHE__PRUNE_INTERVAL = 3600
+        preview_cache_lib = PreviewCacheLib(preview_cache_config)
+        first_preview = create_cache_file(tmp_path, HASH_1 + "-256x256.jpeg", age=3000)
+        preview_cache_lib.prune_if_due()
+        assert not os.path.exists(first_preview)
+        second_preview = create_cache_file(tmp_path, HASH_2 + "-256x256.jpeg", age=3000)
+        preview_cache_lib.prune_if_due()
+        assert os.path.exists(second_preview)
+
+    def test_unit__delete_revision__ok__previews_deleted(
+        self,
+        session,
+        preview_cache_config,
+        tmp_path,
+        workspace_api_factory,
+        content_api_factory,
+        content_type_list,
+    ):
+        workspace = workspace_api_factory.get().create_workspace("test workspace", save_now=True)
+        content_api = content_api_factory.get()
+        with session.no_autoflush:
+            file_content = content_api.create(
+                content_type_slug=content_type_list.File.slug,
+                workspace=workspace,
+                label="file",
+                do_save=False,
+            )
+            content_api.update_file_data(file_content, "file.txt", "text/plain", b"first")
+        content_api.save(file_content)
+        transaction.commit()
+        first_revision = file_content.current_revision
+        with new_revision(session=session, tm=transaction.manager, content=file_content):
+            content_api.update_file_data(file_content, "file.txt", "text/plain", b"second")
+        content_api.save(file_content)
+        transaction.commit()
+
+        storage_lib = StorageLib(preview_cache_config)
+        source_hash = hashlib.md5(
+            storage_lib.get_preview_source_filepath(first_revision.depot_file, ".txt").encode(
+                "utf-8"
+            )
+        ).hexdigest()
+        pdf_preview_hash = hashlib.md5(
+            os.path.join(str(tmp_path), source_hash + ".pdf").encode("utf-8")
+        ).hexdigest()
+        create_cache_file(tmp_path, source_hash + ".pdf")
+        create_cache_file(tmp_path, source_hash + ".lock")
+        create_cache_file(tmp_path, pdf_preview_hash + "-256x256-page0.jpeg")
+        other_preview = create_cache_file(tmp_path, HASH_1 + "-256x256.jpeg")
+
+        CleanupLib(session, preview_cache_config, dry_run_mode=True).delete_revision(first_revision)
+        assert len(os.listdir(str(tmp_path))) == 4
+        CleanupLib(session, preview_cache_config).delete_revision(first_revision)
+        assert os.listdir(str(tmp_path)) == [os.path.basename(other_preview)]
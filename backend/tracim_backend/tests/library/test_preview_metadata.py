@@ -0,0 +1,100 @@
+from unittest.mock import patch
+
+import pytest
+import transaction
+
+from tracim_backend.lib.core.preview_metadata import PreviewMetadataLib
+from tracim_backend.lib.core.storage import StorageLib
+from tracim_backend.models.data import ContentRevisionRO
+from tracim_backend.models.revision_protection import new_revision
+from tracim_backend.tests.fixtures import *  # noqa F403,F401
+from tracim_backend.tests.utils import create_png_test_image
+
+
+@pytest.fixture
+def image_file(session, admin_user, workspace_api_factory, content_api_factory, content_type_list):
+    workspace = workspace_api_factory.get().create_workspace("test workspace", save_now=True)
+    content_api = content_api_factory.get()
+    with session.no_autoflush:
+        image_file = content_api.create(
+            content_type_slug=content_type_list.File.slug,
+            workspace=workspace,
+            label="image",
+            do_save=False,
+        )
+        content_api.update_file_data(
+            image_file, "image.png", "image/png", create_png_test_image(100, 100).getvalue()
+        )
+    content_api.save(image_file)
+    transaction.commit()
+    return image_file
+
+
+def count_file_reads():
+    return patch.object(
+        StorageLib, "get_filepath", autospec=True, side_effect=StorageLib.get_filepath
+    )
+
+
+@pytest.mark.usefixtures("base_fixture")
+class TestPreviewMetadataLib(object):
+    def test_unit__get__ok__computed_once(
+        self, session, app_config, image_file, content_api_factory
+    ):
+        content_api = content_api_factory.get()
+        revision_id = image_file.cached_revision_id
+        assert image_file.current_revision.preview_mimetype is None
+        assert image_file.current_revision.preview_has_jpeg is None
+        with count_file_reads() as get_filepath:
+            has_jpeg = content_api.has_jpeg_preview(revision_id, ".png")
+            page_nb = content_api.get_preview_page_nb(revision_id, ".png")
+            has_pdf = content_api.has_pdf_preview(revision_id, ".png")
+        assert get_filepath.call_count == 1
+        transaction.commit()
+
+        session.expire_all()
+        revision = session.query(ContentRevisionRO).get(revision_id)
+        assert revision.preview_mimetype == "image/png"
+        assert revision.preview_page_nb == page_nb
+        assert revision.preview_has_pdf == has_pdf
+        assert revision.preview_has_jpeg == has_jpeg
+        with count_file_reads() as get_filepath:
+            metadata = PreviewMetadataLib(session, app_config).get(revision)
+        get_filepath.assert_not_called()
+        assert metadata == ("image/png", page_nb, has_pdf, has_jpeg)
+
+    def test_unit__get__ok__metadata_follow_revision_file(
+        self, session, app_config, image_file, content_api_factory
+    ):
+        content_api = content_api_factory.get()
+        content_api.has_jpeg_preview(image_file.cached_revision_id, ".png")
+        transaction.commit()
+        image_file = content_api.get_one(image_file.content_id)
+
+        # INFO - 2026-10-18 - same file: metadata copied from the previous revision
+        with new_revision(session=session, tm=transaction.manager, content=image_file):
+            content_api.update_content(image_file, new_label="renamed image")
+        content_api.save(image_file)
+        transaction.commit()
+        assert image_file.current_revision.preview_mimetype == "image/png"
+        assert image_file.current_revision.preview_has_jpeg is not None
+
+        # INFO - 2026-10-18 - new file: metadata computed again
+        with new_revision(session=session, tm=transaction.manager, content=image_file):
+            content_api.update_file_data(image_file, "image.txt", "text/plain", b"some text")
+        content_api.save(image_file)
+        transaction.commit()
+        assert image_file.current_revision.preview_mimetype is None
+        assert image_file.current_revision.preview_has_jpeg is None
+
+    def test_unit__backfill__ok__nominal_case(self, session, app_config, image_file):
+        preview_metadata_lib = PreviewMetadataLib(session, app_config)
+        assert preview_metadata_lib.backfill() == 1
+        transaction.commit()
+        assert preview_metadata_lib.backfill() == 0
+        assert preview_metadata_lib.backfill(only_missing=False) == 1
+        transaction.commit()
+        session.expire_all()
+        revision = session.query(ContentRevisionRO).get(image_file.cached_revision_id)
+        assert revision.preview_mimetype == "image/png"
+        assert revision.preview_has_jpeg is not None
@@ -0,0 +1,144 @@
+from unittest.mock import MagicMock
+from unittest.mock import call
+from unittest.mock import patch
+
+from preview_generator.manager import PreviewManager
+import pytest
+import transaction
+
+from tracim_backend.lib.core.preview_metadata import PreviewMetadataLib
+from tracim_backend.lib.core.preview_metadata import RevisionPreviewMetadata
+from tracim_backend.lib.preview_pregeneration.pregeneration import PreviewPregenerationHooks
+from tracim_backend.lib.preview_pregeneration.pregeneration import PreviewPregenerationLib
+from tracim_backend.lib.preview_pregeneration.pregeneration import pregenerate_revision_previews
+from tracim_backend.lib.rq import RqQueueName
+from tracim_backend.models.revision_protection import new_revision
+from tracim_backend.tests.fixtures import *  # noqa F403,F401
+from tracim_backend.tests.utils import create_png_test_image
+
+THREE_PAGES_METADATA = RevisionPreviewMetadata("application/pdf", 3, True, True)
+
+
+@pytest.fixture
+def queues():
+    """Mock the RQ queues used by the preview pregeneration, return them by name"""
+    queues = {}
+
+    def get_queue(config, queue_name):
+        return queues.setdefault(queue_name, MagicMock())
+
+    with patch(
+        "tracim_backend.lib.preview_pregeneration.pregeneration.get_rq_queue2",
+        side_effect=get_queue,
+    ):
+        yield queues
+
+
+@pytest.fixture
+def preview_pregeneration_hooks(test_context):
+    test_context.plugin_manager.register(PreviewPregenerationHooks())
+
+
+@pytest.fixture
+def image_file(session, admin_user, workspace_api_factory, content_api_factory, content_type_list):
+    workspace = workspace_api_factory.get().create_workspace("test workspace", save_now=True)
+    content_api = content_api_factory.get()
+    with session.no_autoflush:
+        image_file = content_api.create(
+            content_type_slug=content_type_list.File.slug,
+            workspace=workspace,
+            label="image",
+            do_save=False,
+        )
+        content_api.update_file_data(
+            image_file, "image.png", "image/png", create_png_test_image(100, 100).getvalue()
+        )
+    content_api.save(image_file)
+    transaction.commit()
+    return image_file
+
+
+@pytest.mark.usefixtures("base_fixture")
+class TestPreviewPregeneration(object):
+    @pytest.mark.usefixtures("preview_pregeneration_hooks")
+    def test_unit__hooks__ok__new_files_enqueued(
+        self, session, app_config, queues, image_file, content_api_factory
+    ):
+        revision_id = image_file.cached_revision_id
+        assert queues[RqQueueName.PREVIEW_GENERATOR].enqueue.call_args_list == [
+            call(
+                pregenerate_revision_previews,
+                revision_id,
+                job_timeout=app_config.PREVIEW__PREGENERATION__JOB_TIMEOUT,
+            )
+        ]
+        content_api = content_api_factory.get()
+        content_api.get_revision_preview_metadata(revision_id)
+        transaction.commit()
+        image_file = content_api.get_one(image_file.content_id)
+
+        # INFO - 2026-10-18 - same file, previews already generated
+        with new_revision(session=session, tm=transaction.manager, content=image_file):
+            content_api.update_content(image_file, new_label="renamed image")
+        content_api.save(image_file)
+        transaction.commit()
+        assert queues[RqQueueName.PREVIEW_GENERATOR].enqueue.call_count == 1
+
+        # INFO - 2026-10-18 - big file, low priority
+        app_config.PREVIEW__PREGENERATION__SMALL_FILE_SIZE = 5
+        with new_revision(session=session, tm=transaction.manager, content=image_file):
+            content_api.update_file_data(image_file, "image.txt", "text/plain", b"some text")
+        content_api.save(image_file)
+        transaction.commit()
+        queues[RqQueueName.PREVIEW_GENERATOR_LOW_PRIORITY].enqueue.assert_called_once_with(
+            pregenerate_revision_previews,
+            image_file.cached_revision_id,
+            job_timeout=app_config.PREVIEW__PREGENERATION__JOB_TIMEOUT,
+        )
+
+    def test_unit__pregenerate__ok__existing_pages(self, session, app_config, image_file):
+        app_config.PREVIEW__JPG__ALLOWED_DIMS = app_config.PREVIEW__JPG__ALLOWED_DIMS * 2
+        with patch.object(
+            PreviewMetadataLib, "get", return_value=THREE_PAGES_METADATA
+        ), patch.object(PreviewManager, "get_jpeg_preview") as get_jpeg_preview, patch.object(
+            PreviewManager, "get_pdf_preview"
+        ) as get_pdf_preview:
+            generated_pages = PreviewPregenerationLib(session, app_config).pregenerate(
+                image_file.current_revision, range(5)
+            )
+        assert generated_pages == [0, 1, 2]
+        assert get_jpeg_preview.call_count == 6
+        assert [kwargs["page"] for _, kwargs in get_pdf_preview.call_args_list] == [0, 1, 2]
+
+    def test_unit__pregenerate_from_job__ok__next_pages_enqueued(
+        self, session, app_config, queues, image_file
+    ):
+        revision_id = image_file.cached_revision_id
+        preview_pregeneration_lib = PreviewPregenerationLib(session, app_config)
+        with patch.object(
+            PreviewMetadataLib, "get", return_value=THREE_PAGES_METADATA
+        ), patch.object(PreviewPregenerationLib, "pregenerate", return_value=[0]) as pregenerate:
+            preview_pregeneration_lib.pregenerate_from_job(revision_id, first_page=True)
+            assert pregenerate.call_args[0][1] == [0]
+            queues[RqQueueName.PREVIEW_GENERATOR_LOW_PRIORITY].enqueue.assert_called_once_with(
+                pregenerate_revision_previews,
+                revision_id,
+                first_page=False,
+                job_timeout=app_config.PREVIEW__PREGENERATION__JOB_TIMEOUT,
+            )
+            preview_pregeneration_lib.pregenerate_from_job(revision_id, first_page=False)
+            assert list(pregenerate.call_args[0][1]) == [1, 2, 3, 4]
+
+    def test_unit__warm__ok__enqueue(self, session, app_config, queues, image_file):
+        revision_count, error_count = PreviewPregenerationLib(session, app_config).warm(
+            enqueue=True
+        )
+        assert (revision_count, error_count) == (1, 0)
+        queues[RqQueueName.PREVIEW_GENERATOR].enqueue.assert_called_once_with(
+            pregenerate_revision_previews,
+            image_file.cached_revision_id,
+            job_timeout=app_config.PREVIEW__PREGENERATION__JOB_TIMEOUT,
+        )
+        assert PreviewPregenerationLib(session, app_config).warm(
+            workspace_ids=[image_file.workspace_id + 1], enqueue=True
+        ) == (0, 0)
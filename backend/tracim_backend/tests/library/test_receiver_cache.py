@@ -0,0 +1,131 @@
+import pytest
+import transaction
+
+from tracim_backend.lib.core.event import _get_administrator_ids
+from tracim_backend.lib.core.event import _get_workspace_member_ids
+from tracim_backend.lib.core.receiver_cache import ReceiverIdsCache
+from tracim_backend.lib.core.receiver_cache import ReceiverIdsCacheHooks
+from tracim_backend.models.auth import Profile
+from tracim_backend.models.data import EmailNotificationType
+from tracim_backend.models.data import UserRoleInWorkspace
+from tracim_backend.tests.fixtures import *  # noqa F403,F401
+
+
+@pytest.fixture
+def receiver_cache_config(app_config):
+    app_config.LIVE_MESSAGES__RECEIVER_CACHE__ENABLED = True
+    return app_config
+
+
+@pytest.mark.usefixtures("base_fixture")
+class TestReceiverIdsCache:
+    def test_unit__get_or_fetch__ok__hit_and_miss(self, receiver_cache_config):
+        cache = ReceiverIdsCache(receiver_cache_config)
+        fetched = []
+
+        def fetch():
+            fetched.append(True)
+            return [1, 2]
+
+        assert cache.get_or_fetch("key", ["scope"], fetch) == [1, 2]
+        assert cache.get_or_fetch("key", ["scope"], fetch) == [1, 2]
+        assert len(fetched) == 1
+        assert ReceiverIdsCache.get_stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+        cache.invalidate("other_scope")
+        cache.get_or_fetch("key", ["scope"], fetch)
+        assert len(fetched) == 1
+
+        cache.invalidate("scope")
+        cache.get_or_fetch("key", ["scope"], fetch)
+        assert len(fetched) == 2
+        assert ReceiverIdsCache.get_stats() == {"hits": 2, "misses": 2, "entries": 1}
+
+    def test_unit__get_or_fetch__ok__disabled(self, app_config):
+        app_config.LIVE_MESSAGES__RECEIVER_CACHE__ENABLED = False
+        cache = ReceiverIdsCache(app_config)
+        cache.get_or_fetch("key", ["scope"], lambda: [1])
+        cache.get_or_fetch("key", ["scope"], lambda: [1])
+        assert ReceiverIdsCache.get_stats() == {"hits": 0, "misses": 0, "entries": 0}
+
+    def test_unit__get_or_fetch__ok__max_entries(self, receiver_cache_config):
+        cache = ReceiverIdsCache(receiver_cache_config)
+        cache.MAX_ENTRIES = 2
+        for key in ("1", "2", "3"):
+            cache.get_or_fetch(key, ["scope"], lambda: [1])
+        assert ReceiverIdsCache.get_stats()["entries"] == 2
+        cache.get_or_fetch("1", ["scope"], lambda: [1])
+        assert ReceiverIdsCache.get_stats()["misses"] == 4
+
+    def test_unit__hooks__ok__one_listener_per_transaction(
+        self, session, receiver_cache_config, user_api_factory
+    ):
+        user_api = user_api_factory.get()
+        for index in range(3):
+            user_api.create_user("user{}@test.test".format(index), do_save=True, do_notify=False)
+        listeners = session.dispatch.after_commit
+        listener_count = len(listeners) if listeners else 0
+        user_api.create_user("other@test.test", do_save=True, do_notify=False)
+        assert (len(listeners) if listeners else 0) == listener_count
+        transaction.commit()
+        assert ReceiverIdsCacheHooks.SESSION_INFO_KEY not in session.info
+
+    def test_unit__workspace_member_ids__ok__invalidated_by_role_hooks(
+        self,
+        session,
+        receiver_cache_config,
+        admin_user,
+        user_api_factory,
+        workspace_api_factory,
+        role_api_factory,
+    ):
+        workspace = workspace_api_factory.get().create_workspace("test workspace", save_now=True)
+        transaction.commit()
+        member_ids = _get_workspace_member_ids(
+            workspace.workspace_id, session, receiver_cache_config
+        )
+        assert member_ids == [admin_user.user_id]
+        # INFO - 2026-10-18 - publishing the events above may already have used the cache
+        hits = ReceiverIdsCache.get_stats()["hits"]
+        assert _get_workspace_member_ids(
+            workspace.workspace_id, session, receiver_cache_config
+        ) == [admin_user.user_id]
+        assert ReceiverIdsCache.get_stats()["hits"] == hits + 1
+
+        user = user_api_factory.get().create_user(
+            "member@test.test", do_save=True, do_notify=False, profile=Profile.USER
+        )
+        role_api_factory.get().create_one(
+            user,
+            workspace,
+            UserRoleInWorkspace.READER,
+            email_notification_type=EmailNotificationType.NONE,
+        )
+        transaction.commit()
+        assert set(
+            _get_workspace_member_ids(workspace.workspace_id, session, receiver_cache_config)
+        ) == {admin_user.user_id, user.user_id}
+
+        role_api_factory.get().delete_one(user.user_id, workspace.workspace_id)
+        transaction.commit()
+        assert _get_workspace_member_ids(
+            workspace.workspace_id, session, receiver_cache_config
+        ) == [admin_user.user_id]
+
+    def test_unit__administrator_ids__ok__invalidated_by_user_hooks(
+        self, session, receiver_cache_config, admin_user, user_api_factory
+    ):
+        assert _get_administrator_ids(session, receiver_cache_config) == [admin_user.user_id]
+        user_api = user_api_factory.get()
+        user = user_api.create_user(
+            "other_admin@test.test", do_save=True, do_notify=False, profile=Profile.USER
+        )
+        transaction.commit()
+        assert _get_administrator_ids(session, receiver_cache_config) == [admin_user.user_id]
+
+        user_api.update(user, profile=Profile.ADMIN, do_save=True)
+        transaction.commit()
+        assert set(_get_administrator_ids(session, receiver_cache_config)) == {
+            admin_user.user_id,
+            user.user_id,
+        }
@@ -0,0 +1,88 @@
+from email.mime.multipart import MIMEMultipart
+import smtplib
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from tracim_backend.lib.mail_notifier.smtp_pool import RateLimiter
+from tracim_backend.lib.mail_notifier.smtp_pool import SmtpConnectionPool
+from tracim_backend.lib.mail_notifier.utils import SmtpConfiguration
+from tracim_backend.lib.mail_notifier.utils import SmtpEncryption
+
+
+@pytest.fixture
+def smtp_pool() -> SmtpConnectionPool:
+    smtp_config = SmtpConfiguration(
+        "localhost", 1025, None, None, SmtpEncryption.UNSECURE, authentication=False
+    )
+    return SmtpConnectionPool(smtp_config, size=2)
+
+
+def new_connection(send_message_side_effect=None) -> MagicMock:
+    connection = MagicMock(spec=smtplib.SMTP)
+    connection.send_message.return_value = {}
+    connection.send_message.side_effect = send_message_side_effect
+    return connection
+
+
+class TestRateLimiter(object):
+    def test_unit__wait__ok__no_limit(self):
+        rate_limiter = RateLimiter(0)
+        assert rate_limiter.wait() == 0
+        assert rate_limiter.wait() == 0
+
+    def test_unit__wait__ok__calls_spaced_out(self):
+        rate_limiter = RateLimiter(20)
+        assert rate_limiter.wait() == 0
+        assert 0 < rate_limiter.wait() <= 0.05
+
+
+class TestSmtpConnectionPool(object):
+    def test_unit__send_message__ok__connection_reused(self, smtp_pool: SmtpConnectionPool):
+        connection = new_connection()
+        with patch(
+            "tracim_backend.lib.mail_notifier.smtp_pool.open_smtp_connection",
+            return_value=connection,
+        ) as open_connection:
+            for _ in range(3):
+                assert smtp_pool.send_message(MIMEMultipart()) == {}
+        open_connection.assert_called_once()
+        assert connection.send_message.call_count == 3
+        assert smtp_pool.stats.sent_count == 3
+        assert smtp_pool.stats.opened_connection_count == 1
+        smtp_pool.close()
+        connection.quit.assert_called_once()
+
+    def test_unit__send_message__ok__reconnect_when_disconnected(
+        self, smtp_pool: SmtpConnectionPool
+    ):
+        lost_connection = new_connection(smtplib.SMTPServerDisconnected())
+        connection = new_connection()
+        with patch(
+            "tracim_backend.lib.mail_notifier.smtp_pool.open_smtp_connection",
+            side_effect=[lost_connection, connection],
+        ):
+            assert smtp_pool.send_message(MIMEMultipart()) == {}
+        lost_connection.quit.assert_called_once()
+        connection.send_message.assert_called_once()
+        assert smtp_pool.stats.sent_count == 1
+        assert smtp_pool.stats.opened_connection_count == 2
+
+    def test_unit__send_message__err__recipient_refused_connection_kept(
+        self, smtp_pool: SmtpConnectionPool
+    ):
+        connection = new_connection(
+            [smtplib.SMTPRecipientsRefused({"bob@bob": (550, b"unknown")}), None]
+        )
+        with patch(
+            "tracim_backend.lib.mail_notifier.smtp_pool.open_smtp_connection",
+            return_value=connection,
+        ) as open_connection:
+            with pytest.raises(smtplib.SMTPRecipientsRefused):
+                smtp_pool.send_message(MIMEMultipart())
+            smtp_pool.send_message(MIMEMultipart())
+        open_connection.assert_called_once()
+        connection.quit.assert_not_called()
+        assert smtp_pool.stats.failed_count == 1
+        assert smtp_pool.stats.sent_count == 1
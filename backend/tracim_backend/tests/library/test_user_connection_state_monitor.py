@@ -0,0 +1,94 @@
+from unittest.mock import patch
+
+import pytest
+import tnetstring
+import transaction
+
+from tracim_backend.lib.user_connection_state_monitor.monitor import UserConnectionStateMonitor
+from tracim_backend.models.auth import Profile
+from tracim_backend.models.auth import UserConnectionStatus
+from tracim_backend.tests.fixtures import *  # noqa F403,F401
+
+
+def stats_message(channel: bytes, subscribers: int) -> bytes:
+    return b"sub T" + tnetstring.dumps({b"channel": channel, b"subscribers": subscribers})
+
+
+@pytest.fixture
+def user_ids(user_api_factory):
+    user_api = user_api_factory.get()
+    user_ids = [
+        user_api.create_user(
+            "user{}@test.test".format(index),
+            password="password",
+            do_save=True,
+            do_notify=False,
+            profile=Profile.USER,
+        ).user_id
+        for index in range(3)
+    ]
+    transaction.commit()
+    return user_ids
+
+
+def get_connection_statuses(user_api_factory, user_ids):
+    user_api = user_api_factory.get()
+    return [user_api.get_one(user_id).connection_status for user_id in user_ids]
+
+
+@pytest.mark.usefixtures("base_fixture")
+class TestUserConnectionStateMonitor(object):
+    def test_unit__flush_pending_statuses__ok__one_transaction_per_batch(
+        self, session, app_config, user_ids, user_api_factory
+    ):
+        monitor = UserConnectionStateMonitor(app_config)
+        monitor.flush_interval = 60
+        for user_id in user_ids:
+            monitor.handle_stats_message(stats_message(b"user_%d" % user_id, 1))
+        monitor.handle_stats_message(stats_message(b"user_%d" % user_ids[2], 0))
+        monitor.handle_stats_message(stats_message(b"workspace_1", 1))
+        monitor.handle_pending_offline_users(online_timeout=0)
+        # INFO - 2026-10-18 - the flush interval is not elapsed
+        monitor.flush_pending_statuses(force=False)
+        assert len(monitor.pending_statuses) == 3
+
+        with patch.object(
+            monitor, "_write_statuses", wraps=monitor._write_statuses
+        ) as write_statuses:
+            monitor.flush_pending_statuses()
+        write_statuses.assert_called_once_with(
+            {UserConnectionStatus.ONLINE: user_ids[:2], UserConnectionStatus.OFFLINE: user_ids[2:]}
+        )
+        assert not monitor.pending_statuses
+        assert monitor.stats.received_message_count == 5
+        assert monitor.stats.flush_count == 1
+        assert monitor.stats.last_batch_size == 3
+        session.expire_all()
+        assert get_connection_statuses(user_api_factory, user_ids) == [
+            UserConnectionStatus.ONLINE,
+            UserConnectionStatus.ONLINE,
+            UserConnectionStatus.OFFLINE,
+        ]
+
+    def test_unit__queue_user_connection_status__ok__no_flush_interval(
+        self, session, app_config, user_ids, user_api_factory
+    ):
+        monitor = UserConnectionStateMonitor(app_config)
+        monitor.flush_interval = 0
+        monitor.queue_user_connection_status(user_ids[0], UserConnectionStatus.ONLINE)
+        assert not monitor.pending_statuses
+        session.expire_all()
+        assert get_connection_statuses(user_api_factory, user_ids[:1]) == [
+            UserConnectionStatus.ONLINE
+        ]
+
+    def test_unit__flush_pending_statuses__err__statuses_kept_on_failure(
+        self, session, app_config, user_ids
+    ):
+        monitor = UserConnectionStateMonitor(app_config)
+        monitor.flush_interval = 60
+        monitor.queue_user_connection_status(user_ids[0], UserConnectionStatus.ONLINE)
+        with patch.object(monitor, "_write_statuses", side_effect=RuntimeError()):
+            monitor.flush_pending_statuses()
+        assert monitor.pending_statuses == {user_ids[0]: UserConnectionStatus.ONLINE}
+        assert monitor.stats.flush_count == 0
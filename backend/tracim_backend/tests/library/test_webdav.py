@@ -1,17 +1,24 @@
 # -*- coding: utf-8 -*-
+import hashlib
 from unittest.mock import MagicMock
 
 import pytest
+import transaction
+from wsgidav.dav_error import HTTP_REQUEST_ENTITY_TOO_LARGE
+from wsgidav.dav_error import DAVError
 
 from tracim_backend import WebdavAppFactory
 from tracim_backend.lib.core.notifications import DummyNotifier
 from tracim_backend.lib.webdav import TracimDavProvider
 from tracim_backend.lib.webdav import TracimDomainController
+from tracim_backend.lib.webdav.path_cache import WebdavPathCache
 from tracim_backend.lib.webdav.resources import FolderResource
 from tracim_backend.lib.webdav.resources import RootResource
 from tracim_backend.lib.webdav.resources import WorkspaceResource
+from tracim_backend.lib.webdav.utils import UploadStream
 from tracim_backend.models.data import Content
 from tracim_backend.models.data import ContentRevisionRO
+from tracim_backend.models.revision_protection import new_revision
 from tracim_backend.tests.fixtures import *  # noqa: F403,F40
 from tracim_backend.tests.utils import eq_
 from tracim_backend.tests.utils import webdav_put_new_test_file_helper
@@ -43,6 +50,44 @@ def test_unit__initConfig__ok__nominal_case(self, settings):
         assert isinstance(config["domaincontroller"], TracimDomainController)
 
 
+class TestUploadStream(object):
+    def test_unit__read__ok__nominal_case(self):
+        stream = UploadStream(iter([b"abc", b"", b"defgh", b"ij"]))
+        assert stream.readable()
+        assert not stream.seekable()
+        assert stream.read(2) == b"ab"
+        assert stream.read(4) == b"cdef"
+        assert stream.read() == b"ghij"
+        assert stream.read(10) == b""
+        assert stream.size == 10
+        assert stream.hexdigest == hashlib.sha256(b"abcdefghij").hexdigest()
+
+
+class TestWebdavPathCache(object):
+    def test_unit__invalidate__ok__sub_paths(self):
+        cache = WebdavPathCache(user_id=1)
+        cache.set("/a.space", [1], [])
+        cache.set("/a.space/b/", [1], [2])
+        cache.set("/a.space/b/c", [1], [2, 3])
+        cache.set("/a.space/bc", [1], [4])
+        assert cache.get("a.space/b").content_ids == (2,)
+        cache.invalidate("/a.space/b")
+        assert cache.get("/a.space/b") is None
+        assert cache.get("/a.space/b/c") is None
+        assert cache.get("/a.space/bc").content_ids == (4,)
+        assert cache.get("/a.space").workspace_ids == (1,)
+
+    def test_unit__get__ok__shared_between_requests(self):
+        WebdavPathCache.clear_shared()
+        WebdavPathCache(user_id=1, ttl=60).set("/a.space/b", [1], [2])
+        cached_path = WebdavPathCache(user_id=1, ttl=60).get("/a.space/b")
+        assert cached_path.shared
+        assert cached_path.content_ids == (2,)
+        assert WebdavPathCache(user_id=2, ttl=60).get("/a.space/b") is None
+        assert WebdavPathCache(user_id=1).get("/a.space/b") is None
+        WebdavPathCache.clear_shared()
+
+
 @pytest.mark.usefixtures("base_fixture")
 @pytest.mark.usefixtures("default_content_fixture")
 class TestWebDav(object):
@@ -206,6 +251,58 @@ def test_unit__delete_content__ok(
         )
         eq_(None, result, msg="Result should be None instead {0}".format(result))
 
+    def test_unit__path_cache__ok__invalidated_on_delete(
+        self, app_config, user_api_factory, webdav_provider, webdav_environ_factory
+    ):
+        environ = webdav_environ_factory.get(
+            user_api_factory.get().get_one_by_email("bob@fsf.local")
+        )
+        pie = webdav_provider.getResourceInst("/Recipes.space/Desserts/Apple_Pie.txt", environ)
+        path_cache = environ["tracim_context"].path_cache
+        assert path_cache.get("/Recipes.space/Desserts/Apple_Pie.txt").content_ids == (
+            pie.content.parent_id,
+            pie.content.content_id,
+        )
+        assert webdav_provider.getResourceInst("/Recipes.space/Desserts/Apple_Pie.txt", environ)
+
+        pie.delete()
+        assert path_cache.get("/Recipes.space/Desserts/Apple_Pie.txt") is None
+        assert path_cache.get("/Recipes.space/Desserts")
+        assert not webdav_provider.getResourceInst("/Recipes.space/Desserts/Apple_Pie.txt", environ)
+
+    def test_unit__path_cache__ok__shared_path_checked(
+        self,
+        app_config,
+        user_api_factory,
+        webdav_provider,
+        webdav_environ_factory,
+        content_api_factory,
+        session,
+    ):
+        app_config.WEBDAV__PATH_CACHE__TTL = 60
+        bob = user_api_factory.get().get_one_by_email("bob@fsf.local")
+        pie = webdav_provider.getResourceInst(
+            "/Recipes.space/Desserts/Apple_Pie.txt", webdav_environ_factory.get(bob)
+        )
+        environ = webdav_environ_factory.get(bob)
+        cached_path = environ["tracim_context"].path_cache.get(
+            "/Recipes.space/Desserts/Apple_Pie.txt"
+        )
+        assert cached_path.shared
+        assert webdav_provider.getResourceInst("/Recipes.space/Desserts/Apple_Pie.txt", environ)
+
+        # INFO - 2026-10-18 - renamed without WebDAV: the shared path is not invalidated
+        content_api = content_api_factory.get()
+        content = content_api.get_one(pie.content.content_id)
+        with new_revision(session=session, tm=transaction.manager, content=content):
+            content_api.update_content(content, new_label="Pear_Pie")
+            content_api.save(content)
+        transaction.commit()
+
+        environ = webdav_environ_factory.get(bob)
+        assert not webdav_provider.getResourceInst("/Recipes.space/Desserts/Apple_Pie.txt", environ)
+        assert webdav_provider.getResourceInst("/Recipes.space/Desserts/Pear_Pie.txt", environ)
+
     def test_unit__create_content__ok(
         self, app_config, webdav_provider, webdav_environ_factory, user_api_factory
     ):
@@ -230,6 +327,42 @@ def test_unit__create_content__ok(
             ),
         )
 
+    def test_unit__create_content__ok__streamed_without_content_length(
+        self, app_config, webdav_provider, webdav_environ_factory, user_api_factory
+    ):
+        environ = webdav_environ_factory.get(
+            user_api_factory.get().get_one_by_email("bob@fsf.local")
+        )
+        # INFO - 2026-10-18 - chunked transfer encoding: no content length given
+        parent = webdav_provider.getResourceInst("/Recipes.space/Salads", environ)
+        new_resource = parent.createEmptyResource("greek_salad.txt")
+        write_object = new_resource.beginWrite(contentType="application/octet-stream")
+        write_object.writelines(iter([b"Greek ", b"Salad", b"\n"]))
+        write_object.close()
+        new_resource.endWrite(withErrors=False)
+
+        result = webdav_provider.getResourceInst("/Recipes.space/Salads/greek_salad.txt", environ)
+        assert result.content.depot_file.file.read() == b"Greek Salad\n"
+        assert result.content.current_revision.file_size == 12
+
+    def test_unit__create_content__err__streamed_file_too_big(
+        self, app_config, webdav_provider, webdav_environ_factory, user_api_factory
+    ):
+        environ = webdav_environ_factory.get(
+            user_api_factory.get().get_one_by_email("bob@fsf.local")
+        )
+        app_config.LIMITATION__CONTENT_LENGTH_FILE_SIZE = 5
+        parent = webdav_provider.getResourceInst("/Recipes.space/Salads", environ)
+        new_resource = parent.createEmptyResource("greek_salad.txt")
+        write_object = new_resource.beginWrite(contentType="application/octet-stream")
+        with pytest.raises(DAVError) as exc_info:
+            write_object.writelines(iter([b"Greek ", b"Salad", b"\n"]))
+        assert exc_info.value.value == HTTP_REQUEST_ENTITY_TOO_LARGE
+        new_resource.endWrite(withErrors=True)
+
+        result = webdav_provider.getResourceInst("/Recipes.space/Salads/greek_salad.txt", environ)
+        assert result is None
+
     def test_unit__create_delete_and_create_file__ok(
         self, app_config, webdav_provider, webdav_environ_factory, user_api_factory, session
     ):
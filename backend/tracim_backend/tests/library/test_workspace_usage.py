@@ -0,0 +1,162 @@
+from unittest.mock import patch
+
+import pytest
+import transaction
+
+from tracim_backend.lib.core.workspace_usage import WorkspaceUsageLib
+from tracim_backend.models.data import ContentRevisionRO
+from tracim_backend.models.data import Workspace
+from tracim_backend.models.revision_protection import new_revision
+from tracim_backend.tests.fixtures import *  # noqa F403,F401
+
+
+@pytest.fixture
+def create_file(session, content_api_factory, content_type_list):
+    def _create_file(workspace, label, data):
+        api = content_api_factory.get()
+        with session.no_autoflush:
+            content = api.create(
+                content_type_slug=content_type_list.File.slug,
+                workspace=workspace,
+                label=label,
+                do_save=False,
+                do_notify=False,
+            )
+            api.update_file_data(content, "{}.txt".format(label), "text/plain", data)
+        api.save(content)
+        transaction.commit()
+        return content
+
+    return _create_file
+
+
+def get_stored_used_space(session, workspace_id):
+    return (
+        session.query(Workspace.used_space).filter(Workspace.workspace_id == workspace_id).scalar()
+    )
+
+
+@pytest.mark.usefixtures("base_fixture")
+class TestWorkspaceUsageLib:
+    def test_unit__file_size__ok__set_on_write(
+        self, session, workspace_api_factory, create_file, content_api_factory
+    ):
+        workspace = workspace_api_factory.get().create_workspace("test", save_now=True)
+        content = create_file(workspace, "file", b"12345")
+        assert content.current_revision.file_size == 5
+
+        api = content_api_factory.get()
+        with new_revision(content=content, tm=transaction.manager, session=session):
+            api.update_file_data(content, "file.txt", "text/plain", b"12")
+        api.save(content)
+        transaction.commit()
+        assert [revision.file_size for revision in content.revisions] == [5, 2]
+
+    def test_unit__file_size__ok__copied_with_file(
+        self, session, workspace_api_factory, create_file, content_api_factory, test_context
+    ):
+        workspace = workspace_api_factory.get().create_workspace("test", save_now=True)
+        content = create_file(workspace, "file", b"12345")
+        api = content_api_factory.get()
+        with patch.object(ContentRevisionRO, "_update_file_size") as update_file_size_mock:
+            with new_revision(content=content, tm=transaction.manager, session=session):
+                api.update_content(content, new_label="renamed")
+            api.save(content)
+            copied_content = api.copy(content, context=test_context, new_label="copy")
+            transaction.commit()
+        update_file_size_mock.assert_not_called()
+        assert [revision.file_size for revision in content.revisions] == [5, 5]
+        assert copied_content.current_revision.file_size == 5
+
+    def test_unit__used_space__ok__maintained_on_content_changes(
+        self, session, workspace_api_factory, create_file, content_api_factory
+    ):
+        workspace = workspace_api_factory.get().create_workspace("test", save_now=True)
+        transaction.commit()
+        workspace_id = workspace.workspace_id
+        assert get_stored_used_space(session, workspace_id) == 0
+
+        content = create_file(workspace, "file", b"12345")
+        other_content = create_file(workspace, "other", b"123")
+        assert get_stored_used_space(session, workspace_id) == 8
+
+        api = content_api_factory.get()
+        with new_revision(content=content, tm=transaction.manager, session=session):
+            api.update_file_data(content, "file.txt", "text/plain", b"12")
+        api.save(content)
+        transaction.commit()
+        assert get_stored_used_space(session, workspace_id) == 10
+
+        with new_revision(content=content, tm=transaction.manager, session=session):
+            api.delete(content)
+        transaction.commit()
+        assert get_stored_used_space(session, workspace_id) == 3
+
+        with new_revision(content=content, tm=transaction.manager, session=session):
+            api.undelete(content)
+        transaction.commit()
+        # INFO - 2026-10-18 - 5 + 2 + 2 (the revisions of delete and undelete keep the file)
+        assert get_stored_used_space(session, workspace_id) == 3 + 5 + 2 + 2 + 2
+
+        with new_revision(content=other_content, tm=transaction.manager, session=session):
+            api.archive(other_content)
+        transaction.commit()
+        workspace = session.query(Workspace).get(workspace_id)
+        assert get_stored_used_space(session, workspace_id) == workspace.get_size() == 11
+
+    def test_unit__get_workspace_used_space__ok__unknown_counter(
+        self, session, workspace_api_factory, create_file
+    ):
+        workspace = workspace_api_factory.get().create_workspace("test", save_now=True)
+        create_file(workspace, "file", b"12345")
+        workspace_id = workspace.workspace_id
+        WorkspaceUsageLib(session).invalidate(workspace_id)
+        transaction.commit()
+        assert get_stored_used_space(session, workspace_id) is None
+
+        workspace = session.query(Workspace).get(workspace_id)
+        assert WorkspaceUsageLib(session).get_workspace_used_space(workspace) == 5
+        transaction.commit()
+        assert get_stored_used_space(session, workspace_id) == 5
+
+    def test_unit__get_owner_used_space__ok__nominal_case(
+        self, session, workspace_api_factory, create_file, admin_user
+    ):
+        workspace_api = workspace_api_factory.get()
+        workspace = workspace_api.create_workspace("test", save_now=True)
+        other_workspace = workspace_api.create_workspace("other", save_now=True)
+        deleted_workspace = workspace_api.create_workspace("deleted", save_now=True)
+        create_file(workspace, "file", b"12345")
+        create_file(other_workspace, "file", b"123")
+        create_file(deleted_workspace, "file", b"1")
+        workspace_api.delete(deleted_workspace, flush=True)
+        transaction.commit()
+        assert WorkspaceUsageLib(session).get_owner_used_space(admin_user) == 8
+
+    def test_unit__reconcile__ok__nominal_case(self, session, workspace_api_factory, create_file):
+        workspace = workspace_api_factory.get().create_workspace("test", save_now=True)
+        content = create_file(workspace, "file", b"12345")
+        workspace_id = workspace.workspace_id
+        table = ContentRevisionRO.__table__
+        session.execute(
+            table.update()
+            .where(table.c.revision_id == content.cached_revision_id)
+            .values(file_size=None)
+        )
+        session.execute(
+            Workspace.__table__.update()
+            .where(Workspace.__table__.c.workspace_id == workspace_id)
+            .values(used_space=42)
+        )
+        transaction.commit()
+
+        result = WorkspaceUsageLib(session).reconcile(only_missing_file_sizes=True)
+        transaction.commit()
+        assert result[workspace_id] == (42, 5)
+        assert get_stored_used_space(session, workspace_id) == 5
+        assert (
+            session.query(ContentRevisionRO.file_size)
+            .filter(ContentRevisionRO.revision_id == content.cached_revision_id)
+            .scalar()
+            == 5
+        )
@@ -277,6 +277,73 @@ def test_unit__get_children__ok__nominal_case(sel, admin_user, session, content_
         session.flush()
         assert parent_folder.children.all() == []
 
+    def test_unit__recursive_parents__ok__nominal_case(
+        self, admin_user, session, content_type_list
+    ):
+        workspace = Workspace(label="TEST_WORKSPACE_1", owner=admin_user)
+        session.add(workspace)
+        session.flush()
+        parent = None
+        folders = []
+        for level in range(4):
+            parent = Content(
+                owner=admin_user,
+                workspace=workspace,
+                type=content_type_list.Folder.slug,
+                label="folder_{}".format(level),
+                revision_type=ActionDescription.CREATION,
+                parent=parent,
+            )
+            session.add(parent)
+            folders.append(parent)
+        session.flush()
+        root_folder, folder_1, folder_2, folder_3 = folders
+
+        assert root_folder.recursive_parents == []
+        assert folder_3.recursive_parents == [folder_2, folder_1, root_folder]
+        assert folder_3.content_path == [root_folder, folder_1, folder_2, folder_3]
+
+        with new_revision(session=session, tm=transaction.manager, content=folder_2):
+            folder_2.parent = None
+            # INFO - 2026-10-18 - not flushed yet, parents are walked in memory
+            assert folder_3.recursive_parents == [folder_2]
+        session.flush()
+        assert folder_3.recursive_parents == [folder_2]
+        assert folder_1.recursive_parents == [root_folder]
+
+    def test_unit__get_recursive_parents_of__ok__nominal_case(
+        self, admin_user, session, content_type_list
+    ):
+        workspace = Workspace(label="TEST_WORKSPACE_1", owner=admin_user)
+        session.add(workspace)
+        session.flush()
+
+        def create_folder(label: str, parent: Content = None) -> Content:
+            folder = Content(
+                owner=admin_user,
+                workspace=workspace,
+                type=content_type_list.Folder.slug,
+                label=label,
+                revision_type=ActionDescription.CREATION,
+                parent=parent,
+            )
+            session.add(folder)
+            return folder
+
+        root_folder = create_folder("root")
+        folder_a = create_folder("a", root_folder)
+        folder_b = create_folder("b", root_folder)
+        folder_a_a = create_folder("a_a", folder_a)
+        session.flush()
+
+        parents = Content.get_recursive_parents_of(session, [root_folder, folder_b, folder_a_a])
+        assert parents == {
+            root_folder.id: [],
+            folder_b.id: [root_folder],
+            folder_a_a.id: [folder_a, root_folder],
+        }
+        assert Content.get_recursive_parents_of(session, []) == {}
+
     def test_unit__query_content__ok__nominal_case(self, admin_user, session, content_type_list):
         workspace = Workspace(label="TEST_WORKSPACE_1", owner=admin_user)
         session.add(workspace)
@@ -211,7 +211,7 @@ def webdav_put_new_test_file_helper(
 
     new_resource = parentRes.createEmptyResource(wsgidav_util.getUriName(file_path))
     write_object = new_resource.beginWrite(contentType="application/octet-stream")
-    write_object.write(file_content)
+    write_object.writelines([file_content])
     write_object.close()
     new_resource.endWrite(withErrors=False)
 
@@ -314,6 +314,7 @@ def __init__(
             # mock event publishing to avoid requiring a working
             # pushpin instance for every test
             LiveMessagesLib.publish_message_to_user = mock.Mock()
+            LiveMessagesLib.publish_dict_to_users = mock.Mock()
         else:
             self._plugin_manager = create_plugin_manager()
         self._dbsession = create_dbsession_for_context(session_factory, transaction.manager, self)
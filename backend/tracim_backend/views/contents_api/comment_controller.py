@@ -121,7 +121,7 @@ def content_comments(self, context, request: TracimRequest, hapic_data=None):
             count=hapic_data.query["count"],
             sort_order=hapic_data.query["sort"],
         )
-        comments = [api.get_content_in_context(comment) for comment in comments_page]
+        comments = api.get_contents_in_context(comments_page)
         return PaginatedObject(comments_page, comments)
 
     @hapic.with_api_doc(tags=[SWAGGER_TAG__CONTENT_COMMENT_ENDPOINTS])
@@ -55,6 +55,9 @@
 from tracim_backend.lib.utils.authorization import has_personal_access
 from tracim_backend.lib.utils.authorization import is_administrator
 from tracim_backend.lib.utils.authorization import knows_candidate_user
+from tracim_backend.lib.utils.http_cache import HttpCachePolicy
+from tracim_backend.lib.utils.http_cache import get_depot_file_etag
+from tracim_backend.lib.utils.http_cache import use_http_cache
 from tracim_backend.lib.utils.logger import logger
 from tracim_backend.lib.utils.request import TracimRequest
 from tracim_backend.lib.utils.utils import generate_documentation_swagger_tag
@@ -1170,6 +1173,19 @@ def about_user(self, context, request: TracimRequest, hapic_data: HapicData) ->
     def sized_preview_avatar(
         self, context, request: TracimRequest, hapic_data: HapicData
     ) -> HapicFile:
+        if request.candidate_user.cropped_avatar:
+            not_modified_response = use_http_cache(
+                request,
+                HttpCachePolicy.REVALIDATE,
+                etag=get_depot_file_etag(
+                    request.candidate_user.cropped_avatar,
+                    "jpg",
+                    hapic_data.path.width,
+                    hapic_data.path.height,
+                ),
+            )
+            if not_modified_response:
+                return not_modified_response
         user_api = UserApi(
             current_user=request.current_user, session=request.dbsession, config=request.app_config
         )
@@ -1199,6 +1215,16 @@ def get_preview_avatar(
     ) -> HapicFile:
         width = DEFAULT_AVATAR_SIZE.width
         height = DEFAULT_AVATAR_SIZE.height
+        if request.candidate_user.cropped_avatar:
+            not_modified_response = use_http_cache(
+                request,
+                HttpCachePolicy.REVALIDATE,
+                etag=get_depot_file_etag(
+                    request.candidate_user.cropped_avatar, "jpg", width, height
+                ),
+            )
+            if not_modified_response:
+                return not_modified_response
         user_api = UserApi(
             current_user=request.current_user, session=request.dbsession, config=request.app_config
         )
@@ -1219,6 +1245,14 @@ def get_preview_avatar(
     @hapic.handle_exception(UserImageNotFound, HTTPStatus.BAD_REQUEST)
     @hapic.output_file([])
     def get_raw_avatar(self, context, request: TracimRequest, hapic_data: HapicData) -> HapicFile:
+        if request.candidate_user.avatar:
+            not_modified_response = use_http_cache(
+                request,
+                HttpCachePolicy.REVALIDATE,
+                etag=get_depot_file_etag(request.candidate_user.avatar, "raw"),
+            )
+            if not_modified_response:
+                return not_modified_response
         try:
             user_api = UserApi(
                 current_user=request.current_user,
@@ -1274,6 +1308,19 @@ def put_raw_avatar(self, context, request: TracimRequest, hapic_data: HapicData)
     def sized_preview_cover(
         self, context, request: TracimRequest, hapic_data: HapicData
     ) -> HapicFile:
+        if request.candidate_user.cropped_cover:
+            not_modified_response = use_http_cache(
+                request,
+                HttpCachePolicy.REVALIDATE,
+                etag=get_depot_file_etag(
+                    request.candidate_user.cropped_cover,
+                    "jpg",
+                    hapic_data.path.width,
+                    hapic_data.path.height,
+                ),
+            )
+            if not_modified_response:
+                return not_modified_response
         user_api = UserApi(
             current_user=request.current_user, session=request.dbsession, config=request.app_config
         )
@@ -1303,6 +1350,16 @@ def get_preview_cover(
     ) -> HapicFile:
         width = DEFAULT_COVER_SIZE.width
         height = DEFAULT_COVER_SIZE.height
+        if request.candidate_user.cropped_cover:
+            not_modified_response = use_http_cache(
+                request,
+                HttpCachePolicy.REVALIDATE,
+                etag=get_depot_file_etag(
+                    request.candidate_user.cropped_cover, "jpg", width, height
+                ),
+            )
+            if not_modified_response:
+                return not_modified_response
         user_api = UserApi(
             current_user=request.current_user, session=request.dbsession, config=request.app_config
         )
@@ -1323,6 +1380,14 @@ def get_preview_cover(
     @hapic.handle_exception(UserImageNotFound, HTTPStatus.BAD_REQUEST)
     @hapic.output_file([])
     def get_raw_cover(self, context, request: TracimRequest, hapic_data: HapicData) -> HapicFile:
+        if request.candidate_user.cover:
+            not_modified_response = use_http_cache(
+                request,
+                HttpCachePolicy.REVALIDATE,
+                etag=get_depot_file_etag(request.candidate_user.cover, "raw"),
+            )
+            if not_modified_response:
+                return not_modified_response
         try:
             user_api = UserApi(
                 current_user=request.current_user,
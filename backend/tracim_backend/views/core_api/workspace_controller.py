@@ -519,7 +519,7 @@ def workspace_content(
             count=content_filter.count,
             page_token=content_filter.page_token,
         )
-        contents = [content_api.get_content_in_context(content) for content in contents_page]
+        contents = content_api.get_contents_in_context(contents_page)
         return PaginatedObject(contents_page, contents)
 
     @hapic.with_api_doc(tags=[SWAGGER_TAG__CONTENT_ENDPOINTS])